@@ -0,0 +1,82 @@
+"""Benchmark of reference parsing throughput.
+
+Parses a stream of range addresses three ways: with the former helpers (a
+regex looked up per call, then a split and a letter loop per corner), with the
+compiled patterns of ``src.utils.a1`` without its cache, and through
+``parse_ref`` with its cache. The stream draws from a pool of distinct
+addresses, as tools do when they address the same ranges over and over.
+
+Usage:
+    python -m benchmarks.bench_a1 [--calls 200000] [--distinct 1000]
+"""
+
+import argparse
+import random
+import re
+import time
+from collections.abc import Callable
+
+from src.utils.a1 import column_letters, parse_ref
+
+
+def legacy_parse(address: str) -> tuple[int, int, int, int]:
+    """Parse a range like the helpers did before the reference module."""
+    if not re.match(r"^[A-Z]{1,3}[0-9]+:[A-Z]{1,3}[0-9]+$", address.upper()):
+        raise ValueError(address)
+    corners = []
+    for cell in address.split(":"):
+        match = re.match(r"([A-Z]+)([0-9]+)", cell.upper())
+        number = 0
+        for char in match.group(1):
+            number = number * 26 + (ord(char) - ord("A") + 1)
+        corners.append((int(match.group(2)), number))
+    (r1, c1), (r2, c2) = corners
+    return min(r1, r2), min(c1, c2), max(r1, r2), max(c1, c2)
+
+
+def make_addresses(calls: int, distinct: int) -> list[str]:
+    """Draw the addresses parsed by the benchmark."""
+    rng = random.Random(0)
+    pool = []
+    for _ in range(distinct):
+        row, col = rng.randint(1, 100_000), rng.randint(1, 700)
+        pool.append(f"{column_letters(col)}{row}:{column_letters(col + 9)}{row + 999}")
+    return [rng.choice(pool) for _ in range(calls)]
+
+
+def measure(parse: Callable[[str], object], addresses: list[str]) -> float:
+    """Parse every address and return the elapsed seconds."""
+    start = time.perf_counter()
+    for address in addresses:
+        parse(address)
+    return time.perf_counter() - start
+
+
+def run(calls: int, distinct: int) -> None:
+    """Run every parser and print the throughputs."""
+    addresses = make_addresses(calls, distinct)
+    parse_ref.cache_clear()
+    modes = (
+        ("helpers (re per call)", legacy_parse),
+        ("a1 compiled, no cache", parse_ref.__wrapped__),
+        ("a1 parse_ref (cached)", parse_ref),
+    )
+    print(f"{calls} parses of {distinct} distinct addresses")
+    print(f"{'parser':<24} {'seconds':>8} {'parses/s':>12}")
+    for name, parse in modes:
+        elapsed = measure(parse, addresses)
+        print(f"{name:<24} {elapsed:>8.3f} {calls / elapsed:>12.0f}")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--distinct", type=int, default=1000)
+    args = parser.parse_args()
+
+    run(args.calls, args.distinct)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark of the group-by aggregation.
+
+Aggregates 100k and 1M rows (a 50-value group column, a 1000-value group
+column and an amount column) with NumPy, when it is installed, and with the
+pure-Python reduction, then times a repeated query answered by the result
+cache of ``ExcelService.aggregate_range`` on an .xlsx file.
+
+Usage:
+    python -m benchmarks.bench_aggregate [--groups 1000]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from src.excel import aggregate as aggregate_module
+from src.excel.aggregate import aggregate, parse_spec
+from src.excel.excel_service import ExcelService
+from src.excel.xlsx_writer import XlsxWriter
+from src.fake_com.factory import FakeApplicationFactory
+
+HEADER = ["Region", "Customer", "Amount"]
+SIZES = (100_000, 1_000_000)
+AGGREGATIONS = [
+    {"column": "Amount", "function": "sum"},
+    {"column": "Amount", "function": "mean"},
+    {"column": "Amount", "function": "max"},
+    {"column": "Customer", "function": "distinct"},
+]
+
+
+def make_rows(count: int, groups: int) -> list[list[Any]]:
+    """Build rows of regions, customers and amounts."""
+    rng = random.Random(0)
+    return [
+        [f"region {rng.randrange(50)}", f"customer {rng.randrange(groups)}", rng.random() * 100]
+        for _ in range(count)
+    ]
+
+
+def timed(rows: list[list[Any]], group_by: str) -> float:
+    """Aggregate the rows and return the elapsed seconds."""
+    spec = parse_spec(group_by, AGGREGATIONS, HEADER, 1, len(HEADER))
+    start = time.perf_counter()
+    aggregate(rows, spec)
+    return time.perf_counter() - start
+
+
+def run(groups: int) -> None:
+    """Run every size and print the timings."""
+    numpy = aggregate_module.np
+    print(f"{'rows':>8} {'group by':>9} {'numpy s':>8} {'python s':>9}")
+    for count in SIZES:
+        rows = make_rows(count, groups)
+        for group_by in ("Region", "Customer"):
+            with_numpy = timed(rows, group_by) if numpy is not None else float("nan")
+            aggregate_module.np = None
+            try:
+                without = timed(rows, group_by)
+            finally:
+                aggregate_module.np = numpy
+            print(f"{count:>8} {group_by:>9} {with_numpy:>8.3f} {without:>9.3f}")
+
+    excel = ExcelService(application_factory=FakeApplicationFactory())
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "sales.xlsx"
+        rows = make_rows(SIZES[0], groups)
+        with XlsxWriter(path) as writer:
+            writer.write_rows([HEADER, *rows])
+        address = f"A1:C{len(rows) + 1}"
+        for _ in range(2):
+            start = time.perf_counter()
+            result = excel.aggregate_range(
+                "Sheet1", address, AGGREGATIONS, "Region", file_path=str(path)
+            )
+            elapsed = time.perf_counter() - start
+            print(f"file query (cached={result['cached']}): {elapsed:.3f} s")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=1000)
+    args = parser.parse_args()
+
+    run(args.groups)
+
+
+if __name__ == "__main__":
+    main()
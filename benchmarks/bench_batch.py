@@ -0,0 +1,86 @@
+"""Benchmark of office_batch against individual tool calls.
+
+Runs N Excel formatting calls through the service worker, either one request
+per call or as a single office_batch request. The Excel application is a stub
+with a configurable per-call latency, so the benchmark runs without Office.
+
+``--rtt-ms`` adds a simulated client/server round-trip per MCP request, which
+is what the batch endpoint saves in practice.
+
+Usage:
+    python -m benchmarks.bench_batch [--calls 500] [--latency-ms 0.05] [--rtt-ms 1]
+"""
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.stubs import make_stub_service
+from src.core.dispatch import ToolDispatcher
+from src.core.service_manager import ServiceManager
+from src.core.sta_worker import STAWorker
+from src.server_tools import ServerToolsService
+from src.tools_configs import EXCEL_TOOLS_CONFIG
+
+TOOLS = ("excel_write_cell", "excel_set_cell_color", "excel_set_borders")
+
+
+def make_steps(calls: int) -> list[dict]:
+    """Build the list of tool calls."""
+    return [
+        {
+            "tool": TOOLS[i % len(TOOLS)],
+            "arguments": {"sheet_name": "Sheet1", "cell": f"A{i + 1}", "range_addr": f"A{i + 1}"},
+        }
+        for i in range(calls)
+    ]
+
+
+async def run(calls: int, latency: float, rtt: float) -> None:
+    """Run both scenarios and print the timings."""
+    dispatcher = ToolDispatcher()
+    stub = make_stub_service(EXCEL_TOOLS_CONFIG, latency)
+    services = ServiceManager(
+        {"excel": lambda: stub},
+        worker_factory=lambda prefix: STAWorker(prefix, com_apartment=False),
+    )
+
+    def execute(service, name, arguments):
+        dispatcher.bind_service("excel", service, EXCEL_TOOLS_CONFIG)
+        return dispatcher.dispatch(name, arguments)
+
+    tools = ServerToolsService(services, execute, dispatcher.dispatch)
+    steps = make_steps(calls)
+    await services.start("excel")
+
+    start = time.perf_counter()
+    for step in steps:
+        await asyncio.sleep(rtt)
+        await services.run("excel", execute, step["tool"], step["arguments"])
+    individual = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await asyncio.sleep(rtt)
+    result = await tools.batch(steps)
+    batched = time.perf_counter() - start
+
+    await services.shutdown()
+
+    print(f"{'individual calls':<20} {calls:>6} requests  {individual * 1000:9.1f} ms")
+    print(f"{'office_batch':<20} {1:>6} request   {batched * 1000:9.1f} ms")
+    print(f"speedup: {individual / batched:.1f}x  ({result['succeeded']}/{calls} steps ok)")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=0.05)
+    parser.add_argument("--rtt-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.calls, args.latency_ms / 1000, args.rtt_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark of the workbook comparison.
+
+Writes two .xlsx files of 100k and 500k cells (10 columns of mixed numbers
+and text) differing in about 1% of their cells, then compares them with
+``compare_sheets`` (bulk grids compared a row at a time) and with a cell by cell
+loop reading each value by address, as a conversation reading both files
+with ``read_range`` would. Reading the files is timed separately.
+
+Usage:
+    python -m benchmarks.bench_workbook_diff [--changed 0.01]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from src.excel.workbook_diff import SheetGrid, compare_sheets, read_sheet_xlsx
+from src.excel.xlsx_reader import XlsxReader
+from src.excel.xlsx_writer import XlsxWriter
+from src.utils.a1 import column_letters
+
+COLUMNS = 10
+SIZES = (100_000, 500_000)
+
+
+def make_rows(cells: int, changed: float, seed: int) -> list[list[Any]]:
+    """Build rows of numbers and strings, a fraction of them changed by the seed."""
+    rng = random.Random(seed)
+    rows = []
+    for r in range(cells // COLUMNS):
+        row = [float(r * COLUMNS + c) if c % 2 else f"item {r}-{c}" for c in range(COLUMNS)]
+        for c in range(COLUMNS):
+            if seed and rng.random() < changed:
+                row[c] = -1.0
+        rows.append(row)
+    return rows
+
+
+def cell_by_cell(old: SheetGrid, new: SheetGrid) -> int:
+    """Compare two grids one addressed cell at a time."""
+    values = [
+        {
+            f"{column_letters(c + 1)}{r + 1}": value
+            for r, row in enumerate(grid.values)
+            for c, value in enumerate(row)
+        }
+        for grid in (old, new)
+    ]
+    return sum(1 for cell, value in values[0].items() if values[1].get(cell) != value)
+
+
+def run(changed: float) -> None:
+    """Run every size and print the timings."""
+    print(f"{'cells':>8} {'read s':>7} {'diff s':>7} {'loop s':>7} {'changes':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for cells in SIZES:
+            paths = []
+            for seed in (0, 1):
+                path = Path(directory) / f"{cells}-{seed}.xlsx"
+                with XlsxWriter(path) as writer:
+                    writer.write_rows(make_rows(cells, changed, seed))
+                paths.append(path)
+
+            start = time.perf_counter()
+            old, new = (read_sheet_xlsx(XlsxReader(p), "Sheet1") for p in paths)
+            read = time.perf_counter() - start
+
+            start = time.perf_counter()
+            _, changes = compare_sheets("Sheet1", old, new)
+            diff = time.perf_counter() - start
+
+            start = time.perf_counter()
+            cell_by_cell(old, new)
+            loop = time.perf_counter() - start
+            print(f"{cells:>8} {read:>7.2f} {diff:>7.3f} {loop:>7.2f} {len(changes):>8}")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--changed", type=float, default=0.01)
+    args = parser.parse_args()
+
+    run(args.changed)
+
+
+if __name__ == "__main__":
+    main()
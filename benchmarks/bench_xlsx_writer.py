@@ -0,0 +1,76 @@
+"""Benchmark of the streaming .xlsx writer.
+
+Writes generated rows (8 columns: numbers, dates, repeated and unique
+strings) with ``XlsxWriter`` and prints the throughput, the file size and the
+peak resident memory. With ``--inline-strings`` the memory stays flat as the
+row count grows; by default it grows with the number of distinct strings
+(one per row here). Runs without Excel.
+
+Usage:
+    python -m benchmarks.bench_xlsx_writer [--rows 100000 1000000] [--no-compression]
+        [--inline-strings]
+"""
+
+import argparse
+import resource
+import tempfile
+import time
+from collections.abc import Iterator
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from src.excel.xlsx_writer import XlsxWriter
+
+CATEGORIES = ("north", "south", "east", "west")
+HEADER = ["id", "day", "region", "label", "qty", "price", "total", "flag"]
+
+
+def make_rows(count: int) -> Iterator[list[Any]]:
+    """Generate rows lazily."""
+    start = date(2024, 1, 1)
+    for i in range(count):
+        qty = i % 97
+        price = (i % 1000) / 10
+        yield [
+            i,
+            start + timedelta(days=i % 365),
+            CATEGORIES[i % 4],
+            f"item {i}",
+            qty,
+            price,
+            qty * price,
+            i % 2 == 0,
+        ]
+
+
+def run(counts: list[int], compression: bool, shared_strings: bool) -> None:
+    """Write one workbook per row count and print the results."""
+    print(f"{'rows':>9} {'seconds':>8} {'rows/s':>9} {'size MB':>8} {'peak RSS MB':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in counts:
+            path = Path(tmp) / f"bench_{count}.xlsx"
+            start = time.perf_counter()
+            with XlsxWriter(path, compression, shared_strings) as writer:
+                writer.add_sheet("Data", column_formats={"F": "0.00", "G": "#,##0.00"})
+                writer.write_row(HEADER, bold=True)
+                writer.write_rows(make_rows(count))
+            elapsed = time.perf_counter() - start
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            size = path.stat().st_size / 1024 / 1024
+            print(f"{count:>9} {elapsed:>8.2f} {count / elapsed:>9.0f} {size:>8.1f} {peak:>12.0f}")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--no-compression", action="store_true")
+    parser.add_argument("--inline-strings", action="store_true")
+    args = parser.parse_args()
+
+    run(args.rows, not args.no_compression, not args.inline_strings)
+
+
+if __name__ == "__main__":
+    main()
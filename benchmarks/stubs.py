@@ -0,0 +1,24 @@
+"""Stub services shared by the benchmarks."""
+
+import time
+from typing import Any
+
+
+def make_stub_service(service_config: dict, latency: float = 0.0) -> Any:
+    """Create a service object exposing every configured tool as a no-op method.
+
+    Args:
+        service_config: ``*_TOOLS_CONFIG`` mapping
+        latency: Simulated COM latency per call, in seconds
+
+    Returns:
+        Instance of a generated stub class
+    """
+
+    def stub_method(self: Any, **kwargs: Any) -> dict[str, Any]:
+        if latency:
+            time.sleep(latency)
+        return {"success": True, "message": "ok"}
+
+    namespace = dict.fromkeys(service_config, stub_method)
+    return type("StubService", (), namespace)()
@@ -9,24 +9,125 @@ This module implements the base class for all Office services following SOLID pr
 """
 
 import atexit
+import functools
 from abc import ABC, abstractmethod
-from contextlib import contextmanager
+from collections.abc import Callable, Collection, Iterator
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
 from typing import Any, Generic, TypeVar
 
-import pythoncom
-import win32com.client
-
+from ..utils.helpers import dict_to_result
+from ..utils.validators import validate_bool
+from .com_profiler import get_com_profiler
 from .exceptions import (
     COMInitializationError,
     COMOperationError,
     DocumentNotOpenError,
     ResourceCleanupError,
 )
+from .pagination import Paginator
 from .types import ApplicationType
 
 # Type variable for the COM application object
 TApp = TypeVar("TApp")
+T = TypeVar("T")
+
+
+class ApplicationFactory:
+    """Creates the application objects driven by the services.
+
+    The default implementation starts the real Office applications through
+    pywin32. Alternative backends (such as the in-process simulation of
+    ``src.fake_com``) subclass it and override ``create``/``release``.
+    """
+
+    #: Whether the applications live in a COM apartment of the calling thread
+    uses_com = True
+
+    def create(self, app_type: ApplicationType) -> Any:
+        """Create (or attach to) an application.
+
+        Args:
+            app_type: Type of Office application
+
+        Returns:
+            The application object
+        """
+        import pythoncom
+        import win32com.client
+
+        # Initialize COM for this thread
+        pythoncom.CoInitialize()
+        return win32com.client.Dispatch(app_type.value)
+
+    def create_instance(self, app_type: ApplicationType) -> Any:
+        """Start a new, separate instance of an application (its own process).
+
+        Unlike create(), never attaches to an instance already running, so
+        several threads can each drive their own application in parallel.
+
+        Args:
+            app_type: Type of Office application
+
+        Returns:
+            The application object
+        """
+        import pythoncom
+        import win32com.client
+
+        pythoncom.CoInitialize()
+        return win32com.client.DispatchEx(app_type.value)
+
+    def release(self, app_type: ApplicationType) -> None:
+        """Release the resources acquired by create() on this thread.
+
+        Args:
+            app_type: Type of Office application
+        """
+        import pythoncom
+
+        pythoncom.CoUninitialize()
+
+
+class InstanceFactory(ApplicationFactory):
+    """Factory starting a separate application instance for each service.
+
+    Used by worker pools, where each thread drives its own Office process.
+
+    Args:
+        factory: Factory whose ``create_instance`` starts the applications
+    """
+
+    def __init__(self, factory: ApplicationFactory) -> None:
+        """Initialize the factory."""
+        self._factory = factory
+        self.uses_com = factory.uses_com
+
+    def create(self, app_type: ApplicationType) -> Any:
+        """Start a new instance of the application."""
+        return self._factory.create_instance(app_type)
+
+    def release(self, app_type: ApplicationType) -> None:
+        """Release the resources of the wrapped factory on this thread."""
+        self._factory.release(app_type)
+
+
+_default_factory: ApplicationFactory = ApplicationFactory()
+
+
+def get_default_application_factory() -> ApplicationFactory:
+    """Get the factory used by services created without an explicit one."""
+    return _default_factory
+
+
+def set_default_application_factory(factory: ApplicationFactory | None) -> None:
+    """Set the factory used by services created without an explicit one.
+
+    Args:
+        factory: New default factory (None restores the pywin32 factory)
+    """
+    global _default_factory
+    _default_factory = factory if factory is not None else ApplicationFactory()
 
 
 class BaseOfficeService(ABC, Generic[TApp]):
@@ -36,21 +137,34 @@ class BaseOfficeService(ABC, Generic[TApp]):
     while enforcing a consistent interface through abstract methods.
     """
 
-    def __init__(self, application_type: ApplicationType, visible: bool = False) -> None:
+    def __init__(
+        self,
+        application_type: ApplicationType,
+        visible: bool = False,
+        application_factory: ApplicationFactory | None = None,
+    ) -> None:
         """Initialize the Office service.
 
         Args:
             application_type: Type of Office application
             visible: Whether to make the application window visible
+            application_factory: Factory creating the application object
+                (the default factory when None)
 
         Raises:
             COMInitializationError: If COM initialization fails
         """
         self._app_type = application_type
         self._visible = visible
+        self._factory = application_factory
         self._app: TApp | None = None
         self._current_document: Any | None = None
         self._is_initialized = False
+        # Pending pages of paginated tools (cursors prefixed with "word", "excel"...)
+        self.pages = Paginator(application_type.name.lower())
+        # Fast mode: settings saved on entry (until restored), session toggle
+        self._fast_saved: dict[str, Any] = {}
+        self._fast_session: ExitStack | None = None
 
         # Register cleanup on exit
         atexit.register(self.cleanup)
@@ -84,6 +198,11 @@ class BaseOfficeService(ABC, Generic[TApp]):
             raise DocumentNotOpenError("access current document")
         return self._current_document
 
+    @property
+    def application_factory(self) -> ApplicationFactory:
+        """Get the factory creating the application object."""
+        return self._factory or get_default_application_factory()
+
     @property
     def is_initialized(self) -> bool:
         """Check if the service is initialized."""
@@ -100,12 +219,12 @@ class BaseOfficeService(ABC, Generic[TApp]):
         if self._is_initialized:
             return
 
-        try:
-            # Initialize COM for this thread
-            pythoncom.CoInitialize()
+        # Bind the factory for the lifetime of the application
+        self._factory = self.application_factory
 
-            # Create the COM application
-            self._app = win32com.client.Dispatch(self._app_type.value)
+        try:
+            # Create the COM application (behind a recording proxy when profiling)
+            self._app = get_com_profiler().wrap(self._factory.create(self._app_type))
             self._app.Visible = self._visible
             self._app.DisplayAlerts = False  # Prevent popup dialogs
 
@@ -132,6 +251,92 @@ class BaseOfficeService(ABC, Generic[TApp]):
         except Exception as e:
             raise COMOperationError(operation_name, e) from e
 
+    def _fast_mode_settings(self) -> dict[str, Any]:
+        """Application properties set while in fast mode, in the order they are set.
+
+        Services whose application has nothing to suspend keep the default
+        (no settings), which makes fast mode a no-op.
+        """
+        return {}
+
+    @contextmanager
+    def fast_mode(self, keep: Collection[str] = ()) -> Iterator[None]:
+        """Suspend repainting (and, per application, recalculation and events).
+
+        Fast mode nests: each context only changes the settings that no
+        enclosing context has already suspended, and restores the values it
+        found on entry, in reverse order, including on errors. A setting the
+        application refuses is left as it is. Does nothing until the
+        application is initialized.
+
+        Args:
+            keep: Settings left as they are (an inner context may still
+                suspend them for its own duration)
+
+        Raises:
+            ResourceCleanupError: If a setting cannot be restored
+        """
+        if not self._is_initialized:
+            yield
+            return
+        changed = []
+        for name, value in self._fast_mode_settings().items():
+            if name in keep or name in self._fast_saved:
+                continue
+            try:
+                previous = getattr(self._app, name)
+                setattr(self._app, name, value)
+            except Exception:
+                continue
+            self._fast_saved[name] = previous
+            changed.append(name)
+        try:
+            yield
+        finally:
+            self._restore_settings(changed)
+
+    def _restore_settings(self, names: list[str]) -> None:
+        """Restore settings saved on entry into fast mode, in reverse order."""
+        errors = []
+        for name in reversed(names):
+            try:
+                setattr(self._app, name, self._fast_saved.pop(name))
+            except Exception as e:
+                errors.append(f"{name}: {e}")
+        if errors:
+            raise ResourceCleanupError(self._app_type.value, "; ".join(errors))
+
+    def set_fast_mode(self, enabled: Any = True) -> dict[str, Any]:
+        """Keep the application in fast mode between tool calls.
+
+        While enabled, the settings suspended by ``fast_mode`` stay suspended
+        for the whole session; disabling restores the values found when it
+        was enabled.
+
+        Args:
+            enabled: Enter (True) or leave (False) session fast mode
+
+        Returns:
+            Result dictionary with the current values of the settings
+        """
+        with self.com_operation("set_fast_mode"):
+            enabled = validate_bool("enabled", enabled)
+            app = self.application
+            if enabled and self._fast_session is None:
+                session = ExitStack()
+                session.enter_context(self.fast_mode())
+                self._fast_session = session
+            elif not enabled and self._fast_session is not None:
+                session, self._fast_session = self._fast_session, None
+                session.close()
+            settings = {name: getattr(app, name) for name in self._fast_mode_settings()}
+        return dict_to_result(
+            success=True,
+            message=f"Fast mode {'enabled' if enabled else 'disabled'}",
+            enabled=enabled,
+            settings=settings,
+        )
+
     def cleanup(self) -> None:
         """Clean up COM resources.
 
@@ -139,6 +344,7 @@ class BaseOfficeService(ABC, Generic[TApp]):
         It's automatically called on program exit via atexit.
         """
         errors = []
+        self.pages.clear()
 
         try:
             # Close current document if any
@@ -157,7 +363,7 @@ class BaseOfficeService(ABC, Generic[TApp]):
 
             # Uninitialize COM
             try:
-                pythoncom.CoUninitialize()
+                self.application_factory.release(self._app_type)
             except Exception as e:
                 errors.append(f"COM uninitialize: {e}")
 
@@ -167,6 +373,8 @@ class BaseOfficeService(ABC, Generic[TApp]):
             self._app = None
             self._current_document = None
             self._is_initialized = False
+            self._fast_saved = {}
+            self._fast_session = None
 
         if errors:
             raise ResourceCleanupError(self._app_type.value, "; ".join(errors))
@@ -243,6 +451,21 @@ class BaseOfficeService(ABC, Generic[TApp]):
         """
 
 
+def in_fast_mode(method: Callable[..., T]) -> Callable[..., T]:
+    """Decorator running a service method inside the service's fast mode.
+
+    Meant for bulk methods, whose many writes would otherwise each trigger a
+    repaint (and in Excel a recalculation and events).
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: BaseOfficeService, *args: Any, **kwargs: Any) -> T:
+        with self.fast_mode():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class DocumentOperationMixin:
     """Mixin providing common document operations.
 
@@ -0,0 +1,138 @@
+"""Batched tool execution.
+
+A batch is an ordered list of ``{"tool": ..., "arguments": {...}}`` steps.
+Consecutive steps targeting the same service are executed together in a single
+job on that service's worker thread, so the whole run holds the service for one
+queue round-trip instead of one per step. Each step produces a compact result
+entry; execution can optionally stop at the first failing step.
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, NamedTuple
+
+from ..utils.validators import validate_json_argument
+from .exceptions import InvalidParameterError
+
+# Keys of service results that are noise in a per-step summary
+_DROPPED_KEYS = frozenset({"success", "timestamp"})
+
+
+class BatchStep(NamedTuple):
+    """One step of a batch.
+
+    Attributes:
+        index: Position of the step in the batch (0-based)
+        tool: Full tool name
+        arguments: Tool arguments
+    """
+
+    index: int
+    tool: str
+    arguments: dict[str, Any]
+
+
+def parse_batch(steps: Any) -> list[BatchStep]:
+    """Validate and normalize the steps of a batch.
+
+    Args:
+        steps: List of ``{"tool", "arguments"}`` entries, or its JSON text
+
+    Returns:
+        Parsed steps
+
+    Raises:
+        InvalidParameterError: If the batch is malformed
+    """
+    entries = validate_json_argument("steps", steps, list)
+    parsed = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not isinstance(entry.get("tool"), str):
+            raise InvalidParameterError(
+                f"steps[{index}]", entry, "Each step must be an object with a 'tool' name"
+            )
+        arguments = validate_json_argument(
+            f"steps[{index}].arguments", entry.get("arguments") or {}, dict
+        )
+        parsed.append(BatchStep(index, entry["tool"], arguments))
+    return parsed
+
+
+def group_consecutive(
+    steps: Iterable[BatchStep], key: Callable[[str], Any]
+) -> list[tuple[Any, list[BatchStep]]]:
+    """Group consecutive steps sharing the same key, preserving order.
+
+    Args:
+        steps: Steps to group
+        key: Computes the group key from a tool name (e.g. its service prefix)
+
+    Returns:
+        List of (key, steps) runs
+    """
+    groups: list[tuple[Any, list[BatchStep]]] = []
+    for step in steps:
+        group_key = key(step.tool)
+        if groups and groups[-1][0] == group_key:
+            groups[-1][1].append(step)
+        else:
+            groups.append((group_key, [step]))
+    return groups
+
+
+def step_result(step: BatchStep, result: Any) -> dict[str, Any]:
+    """Build the compact result entry of a completed step."""
+    if isinstance(result, dict):
+        ok = bool(result.get("success", True))
+        data = {k: v for k, v in result.items() if k not in _DROPPED_KEYS and v is not None}
+    else:
+        ok = result is not None
+        data = {"value": result}
+    return {"index": step.index, "tool": step.tool, "ok": ok, **data}
+
+
+def step_error(step: BatchStep, error: Exception) -> dict[str, Any]:
+    """Build the compact result entry of a step that raised."""
+    return {
+        "index": step.index,
+        "tool": step.tool,
+        "ok": False,
+        "error": f"{type(error).__name__}: {error}",
+    }
+
+
+def run_steps(
+    steps: Sequence[BatchStep],
+    execute: Callable[[str, dict[str, Any]], Any],
+    stop_on_error: bool = False,
+) -> list[dict[str, Any]]:
+    """Execute steps sequentially in the calling thread.
+
+    Args:
+        steps: Steps to execute
+        execute: Runs one tool: ``execute(tool, arguments) -> result``
+        stop_on_error: Stop after the first failing step
+
+    Returns:
+        Result entries of the executed steps
+    """
+    results = []
+    for step in steps:
+        try:
+            entry = step_result(step, execute(step.tool, step.arguments))
+        except Exception as e:
+            entry = step_error(step, e)
+        results.append(entry)
+        if stop_on_error and not entry["ok"]:
+            break
+    return results
+
+
+def summarize(results: Sequence[dict[str, Any]], total: int) -> dict[str, int]:
+    """Count executed, failed and skipped steps."""
+    failed = sum(1 for r in results if not r["ok"])
+    return {
+        "executed": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "skipped": total - len(results),
+    }
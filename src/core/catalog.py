@@ -0,0 +1,144 @@
+"""Precomputed MCP tool catalog.
+
+Tool definitions are derived from the static ``*_TOOLS_CONFIG`` tables, so they
+never change while the server runs. This module builds them once, keeps them as
+immutable tuples and memoizes every filtered view (per service or per tool name
+prefix), so answering ``tools/list`` is a dictionary lookup.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
+from typing import Any, Generic, NamedTuple, TypeVar
+
+T = TypeVar("T")
+
+
+class ToolSpec(NamedTuple):
+    """Static description of one tool.
+
+    Attributes:
+        service: Service prefix the tool belongs to (word, excel, ...)
+        name: Full tool name (``<service>_<method>``)
+        description: Human readable description
+        input_schema: JSON schema of the arguments (read-only view)
+    """
+
+    service: str
+    name: str
+    description: str
+    input_schema: Mapping[str, Any]
+
+
+def build_spec(service_prefix: str, name: str, config: dict) -> ToolSpec:
+    """Build the spec of one tool from its configuration.
+
+    Args:
+        service_prefix: Service prefix (word, excel, ...)
+        name: Method name
+        config: Tool configuration (required, optional, desc)
+
+    Returns:
+        The tool spec
+    """
+    required = list(config.get("required", []))
+    properties = {param: {"type": "string"} for param in required + config.get("optional", [])}
+    schema = {"type": "object", "properties": properties, "required": required}
+    return ToolSpec(
+        service_prefix, f"{service_prefix}_{name}", config["desc"], MappingProxyType(schema)
+    )
+
+
+def parse_tool_filter(value: str | None) -> dict[str, tuple[str, ...] | None]:
+    """Parse a comma-separated tool filter such as ``"excel,word_insert"``.
+
+    Bare service names select whole services; entries containing an underscore
+    are treated as tool name prefixes.
+
+    Args:
+        value: Filter string, or None/empty for no filtering
+
+    Returns:
+        Keyword arguments for ``ToolCatalog.tools``
+    """
+    entries = [e.strip().lower() for e in (value or "").split(",") if e.strip()]
+    services = tuple(e for e in entries if "_" not in e)
+    prefixes = tuple(e for e in entries if "_" in e)
+    return {"services": services or None, "prefixes": prefixes or None}
+
+
+class ToolCatalog(Generic[T]):
+    """Immutable, memoized catalog of tool definitions.
+
+    Args:
+        service_configs: Mapping of service prefix to ``*_TOOLS_CONFIG``
+        factory: Converts a ToolSpec into the object served to clients
+            (``mcp.types.Tool`` in the server); identity by default
+    """
+
+    def __init__(
+        self,
+        service_configs: Mapping[str, Mapping[str, dict]],
+        factory: Callable[[ToolSpec], T] | None = None,
+    ) -> None:
+        """Build every tool once."""
+        self._specs = tuple(
+            build_spec(prefix, name, config)
+            for prefix, configs in service_configs.items()
+            for name, config in configs.items()
+        )
+        make = factory or (lambda spec: spec)
+        self._tools: tuple[T, ...] = tuple(make(spec) for spec in self._specs)
+        self._counts = MappingProxyType(
+            {prefix: len(configs) for prefix, configs in service_configs.items()}
+        )
+        self._views: dict[tuple, tuple[T, ...]] = {}
+
+    @property
+    def specs(self) -> tuple[ToolSpec, ...]:
+        """All tool specs, in registration order."""
+        return self._specs
+
+    @property
+    def counts(self) -> Mapping[str, int]:
+        """Number of tools per service."""
+        return self._counts
+
+    def tools(
+        self,
+        services: Iterable[str] | None = None,
+        prefixes: Iterable[str] | None = None,
+    ) -> tuple[T, ...]:
+        """Get the (optionally filtered) tools.
+
+        A tool is kept when it matches either filter (``"excel,word_insert"``
+        serves every Excel tool plus the Word tools starting with ``insert``).
+
+        Args:
+            services: Keep the tools of these services
+            prefixes: Keep the tools whose name starts with one of these
+
+        Returns:
+            Cached tuple of tools; the same object is returned for equal filters
+        """
+        key = (
+            frozenset(services) if services else None,
+            tuple(sorted(prefixes)) if prefixes else None,
+        )
+        view = self._views.get(key)
+        if view is None:
+            wanted, starts = key
+            if wanted is None and starts is None:
+                view = self._tools
+            else:
+                view = tuple(
+                    tool
+                    for spec, tool in zip(self._specs, self._tools, strict=True)
+                    if (wanted and spec.service in wanted)
+                    or (starts and spec.name.startswith(starts))
+                )
+            self._views[key] = view
+        return view
+
+    def __len__(self) -> int:
+        """Total number of tools."""
+        return len(self._specs)
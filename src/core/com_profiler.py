@@ -0,0 +1,398 @@
+"""Instrumentation of the COM round trips made by each tool.
+
+Every property get, property put and method call on an Office automation
+object is a cross-process IDispatch call, and their number per tool dominates
+the cost of the server. When profiling is enabled, the application object
+created by ``BaseOfficeService.initialize`` is wrapped in a recording proxy.
+The proxy wraps every automation object reached from it, and records each
+round trip (count and elapsed time per member) against the tool invocation
+running on the current thread.
+
+Member names are qualified by the member that produced the object, e.g.
+``Range.Value`` or ``Worksheets().Range``: late-bound objects do not cheaply
+expose their type name.
+"""
+
+import datetime
+import inspect
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+#: Tool name used for the calls made outside of any tool (application startup)
+NO_TOOL = "(no tool)"
+
+#: Keys accepted to rank the tools of a report
+SORT_KEYS = ("calls_per_invocation", "com_calls", "com_ms", "ms_per_invocation")
+
+# Values returned by COM that are plain data, not automation objects
+_PLAIN_TYPES = (
+    str,
+    bytes,
+    bool,
+    int,
+    float,
+    complex,
+    tuple,
+    list,
+    dict,
+    Decimal,
+    memoryview,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    type(None),
+)
+
+
+class MemberStats:
+    """Round trips recorded for one member of one tool."""
+
+    __slots__ = ("count", "seconds")
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.count = 0
+        self.seconds = 0.0
+
+
+class ToolStats:
+    """Round trips recorded for all invocations of one tool."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.invocations = 0
+        self.max_calls = 0
+        self.members: dict[tuple[str, str], MemberStats] = {}
+
+    def merge(self, members: dict[tuple[str, str], MemberStats], invocations: int = 1) -> None:
+        """Add the round trips of one invocation (or of calls made outside any tool)."""
+        self.invocations += invocations
+        calls = 0
+        for key, run in members.items():
+            stats = self.members.get(key)
+            if stats is None:
+                stats = self.members[key] = MemberStats()
+            stats.count += run.count
+            stats.seconds += run.seconds
+            calls += run.count
+        self.max_calls = max(self.max_calls, calls)
+
+    def to_dict(self, name: str, top_members: int) -> dict[str, Any]:
+        """Summarize the tool for a report."""
+        by_kind = {"get": 0, "set": 0, "call": 0}
+        for (_, kind), stats in self.members.items():
+            by_kind[kind] += stats.count
+        com_calls = sum(by_kind.values())
+        com_ms = sum(stats.seconds for stats in self.members.values()) * 1000
+        invocations = max(self.invocations, 1)
+        members = sorted(self.members.items(), key=lambda item: item[1].seconds, reverse=True)
+        return {
+            "tool": name,
+            "invocations": self.invocations,
+            "com_calls": com_calls,
+            "gets": by_kind["get"],
+            "sets": by_kind["set"],
+            "calls": by_kind["call"],
+            "calls_per_invocation": round(com_calls / invocations, 1),
+            "max_calls": self.max_calls,
+            "com_ms": round(com_ms, 3),
+            "ms_per_invocation": round(com_ms / invocations, 3),
+            "top_members": [
+                {
+                    "member": member,
+                    "kind": kind,
+                    "count": stats.count,
+                    "ms": round(stats.seconds * 1000, 3),
+                }
+                for (member, kind), stats in members[:top_members]
+            ],
+        }
+
+
+class ComProfiler:
+    """Aggregates the COM round trips made by each tool.
+
+    Args:
+        enabled: Whether ``wrap`` instruments the application objects
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        """Initialize the profiler."""
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._tools: dict[str, ToolStats] = {}
+
+    def wrap(self, application: Any, label: str = "Application") -> Any:
+        """Wrap an application object in a recording proxy when enabled.
+
+        Args:
+            application: COM application object
+            label: Name under which the members of the application are recorded
+
+        Returns:
+            The proxy, or the application itself when profiling is disabled
+        """
+        if not self.enabled or isinstance(application, ComProxy):
+            return application
+        return ComProxy(application, self, label)
+
+    @contextmanager
+    def tool(self, name: str) -> Iterator[None]:
+        """Attribute the round trips made on this thread to a tool invocation.
+
+        Args:
+            name: Tool name
+        """
+        if not self.enabled or getattr(self._local, "members", None) is not None:
+            # Disabled, or nested invocation (recorded by the outer one)
+            yield
+            return
+
+        self._local.members = members = {}
+        try:
+            yield
+        finally:
+            self._local.members = None
+            self._merge(name, members)
+
+    def record(self, member: str, kind: str, seconds: float) -> None:
+        """Record one round trip on the current thread.
+
+        Args:
+            member: Qualified member name (``Range.Value``)
+            kind: ``get``, ``set`` or ``call``
+            seconds: Time spent in the round trip
+        """
+        members = getattr(self._local, "members", None)
+        if members is None:
+            self._merge(NO_TOOL, {(member, kind): _single(seconds)}, invocations=0)
+            return
+        stats = members.get((member, kind))
+        if stats is None:
+            stats = members[(member, kind)] = MemberStats()
+        stats.count += 1
+        stats.seconds += seconds
+
+    def _merge(
+        self,
+        name: str,
+        members: dict[tuple[str, str], MemberStats],
+        invocations: int = 1,
+    ) -> None:
+        """Merge the round trips of one invocation into the totals."""
+        with self._lock:
+            stats = self._tools.get(name)
+            if stats is None:
+                stats = self._tools[name] = ToolStats()
+            stats.merge(members, invocations)
+
+    def reset(self) -> None:
+        """Forget all recorded round trips."""
+        with self._lock:
+            self._tools.clear()
+
+    def report(
+        self,
+        top: int | None = None,
+        sort_by: str = "calls_per_invocation",
+        top_members: int = 10,
+    ) -> dict[str, Any]:
+        """Build the ranking of the tools.
+
+        Args:
+            top: Number of tools to keep (all when None)
+            sort_by: Ranking key, one of SORT_KEYS
+            top_members: Number of members kept per tool, by time spent
+
+        Returns:
+            JSON-serializable report
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"sort_by must be one of {', '.join(SORT_KEYS)}")
+        with self._lock:
+            tools = [stats.to_dict(name, top_members) for name, stats in self._tools.items()]
+        outside = next((tool for tool in tools if tool["tool"] == NO_TOOL), None)
+        ranked = sorted(
+            (tool for tool in tools if tool is not outside),
+            key=lambda tool: tool[sort_by],
+            reverse=True,
+        )
+        return {
+            "enabled": self.enabled,
+            "sort_by": sort_by,
+            "total_com_calls": sum(tool["com_calls"] for tool in tools),
+            "total_com_ms": round(sum(tool["com_ms"] for tool in tools), 3),
+            "tools": ranked if top is None else ranked[:top],
+            "outside_tools": outside,
+        }
+
+    def save(self, path: str | Path, **report_options: Any) -> Path:
+        """Write the report as JSON.
+
+        Args:
+            path: Destination file
+            **report_options: Options passed to ``report``
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(**report_options), indent=2), encoding="utf-8")
+        return path
+
+
+def _single(seconds: float) -> MemberStats:
+    """Stats of a single round trip."""
+    stats = MemberStats()
+    stats.count = 1
+    stats.seconds = seconds
+    return stats
+
+
+def is_automation_object(value: Any) -> bool:
+    """Check whether a value returned by COM is an automation object."""
+    return not isinstance(value, _PLAIN_TYPES)
+
+
+def unwrap(value: Any) -> Any:
+    """Get the real COM object behind a proxy (other values are unchanged)."""
+    if isinstance(value, ComProxy):
+        return object.__getattribute__(value, "_target")
+    return value
+
+
+class ComProxy:
+    """Recording proxy of an automation object.
+
+    Attribute reads and writes, method calls, default-member calls and
+    iteration are forwarded to the wrapped object and recorded by the
+    profiler. Automation objects returned by the wrapped object are wrapped
+    in turn; proxies passed as arguments are unwrapped.
+
+    Args:
+        target: Wrapped automation object
+        profiler: Profiler recording the round trips
+        label: Name of the member that produced the object
+    """
+
+    __slots__ = ("_target", "_profiler", "_label")
+
+    def __init__(self, target: Any, profiler: ComProfiler, label: str) -> None:
+        """Initialize the proxy."""
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_profiler", profiler)
+        object.__setattr__(self, "_label", label)
+
+    def _wrap(self, value: Any, label: str) -> Any:
+        """Wrap a returned automation object."""
+        if is_automation_object(value) and not isinstance(value, ComProxy):
+            return ComProxy(value, self._profiler, label)
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        """Read a property, or get a recording wrapper of a method."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        start = time.perf_counter()
+        value = getattr(self._target, name)
+        elapsed = time.perf_counter() - start
+        if inspect.ismethod(value) or inspect.isbuiltin(value):
+            return _ProxyMethod(self, name, value, elapsed)
+        self._profiler.record(f"{self._label}.{name}", "get", elapsed)
+        return self._wrap(value, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Write a property."""
+        start = time.perf_counter()
+        setattr(self._target, name, unwrap(value))
+        self._profiler.record(f"{self._label}.{name}", "set", time.perf_counter() - start)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Call the default member (indexed access of collections)."""
+        start = time.perf_counter()
+        value = self._target(*_unwrap_args(args), **_unwrap_kwargs(kwargs))
+        self._profiler.record(f"{self._label}()", "call", time.perf_counter() - start)
+        return self._wrap(value, f"{self._label}()")
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over a collection, one recorded round trip per item."""
+        iterator = iter(self._target)
+        member = f"{self._label}[]"
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            self._profiler.record(member, "get", time.perf_counter() - start)
+            yield self._wrap(item, member)
+
+    def __len__(self) -> int:
+        """Number of items of a collection."""
+        start = time.perf_counter()
+        count = len(self._target)
+        self._profiler.record(f"{self._label}.Count", "get", time.perf_counter() - start)
+        return count
+
+    def __bool__(self) -> bool:
+        """Automation objects are always true (like pywin32 dispatch objects)."""
+        return True
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the wrapped objects."""
+        return bool(self._target == unwrap(other))
+
+    def __hash__(self) -> int:
+        """Hash of the wrapped object."""
+        return hash(self._target)
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"<ComProxy {self._label} {self._target!r}>"
+
+
+class _ProxyMethod:
+    """Recording wrapper of a method of a proxied object."""
+
+    __slots__ = ("_proxy", "_name", "_method", "_lookup")
+
+    def __init__(self, proxy: ComProxy, name: str, method: Any, lookup: float) -> None:
+        """Initialize the wrapper (``lookup`` is the time spent resolving it)."""
+        self._proxy = proxy
+        self._name = name
+        self._method = method
+        self._lookup = lookup
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Call the method."""
+        start = time.perf_counter()
+        value = self._method(*_unwrap_args(args), **_unwrap_kwargs(kwargs))
+        elapsed = self._lookup + time.perf_counter() - start
+        self._proxy._profiler.record(f"{self._proxy._label}.{self._name}", "call", elapsed)
+        return self._proxy._wrap(value, self._name)
+
+
+def _unwrap_args(args: tuple[Any, ...]) -> tuple[Any, ...]:
+    """Unwrap the proxies of positional arguments."""
+    return tuple(unwrap(arg) for arg in args)
+
+
+def _unwrap_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Unwrap the proxies of keyword arguments."""
+    return {name: unwrap(value) for name, value in kwargs.items()}
+
+
+_default_profiler = ComProfiler()
+
+
+def get_com_profiler() -> ComProfiler:
+    """Get the profiler instrumenting the applications of the services."""
+    return _default_profiler
@@ -0,0 +1,163 @@
+"""Compiled tool dispatch registry for the MCP server.
+
+The server exposes every public service method as an MCP tool named
+``<prefix>_<method>``. This module compiles those tools once into a flat
+``name -> ToolEntry`` table so that a tool invocation costs a single dict
+lookup plus the argument extraction, instead of rebuilding every handler of
+the service on each call.
+"""
+
+import threading
+from collections.abc import Callable, Mapping
+from typing import Any, NamedTuple
+
+
+class ToolEntry(NamedTuple):
+    """A compiled tool: bound service method plus its precomputed parameters.
+
+    Attributes:
+        method: Bound service method to invoke
+        params: Accepted parameter names (required + optional), in config order
+        accepted: Same names as a frozenset, used for the no-copy fast path
+    """
+
+    method: Callable[..., Any]
+    params: tuple[str, ...]
+    accepted: frozenset[str]
+
+    def __call__(self, arguments: Mapping[str, Any]) -> Any:
+        """Invoke the method with the arguments it accepts.
+
+        Unknown keys are dropped, exactly like the original dynamic handlers.
+
+        Args:
+            arguments: Raw MCP arguments
+
+        Returns:
+            Whatever the service method returns
+        """
+        if self.accepted.issuperset(arguments):
+            return self.method(**arguments)
+        return self.method(**{p: arguments[p] for p in self.params if p in arguments})
+
+
+def compile_entries(
+    service: Any, service_config: Mapping[str, dict], service_prefix: str
+) -> dict[str, ToolEntry]:
+    """Compile the tool entries of one service.
+
+    Args:
+        service: Service instance providing the methods
+        service_config: ``*_TOOLS_CONFIG`` mapping for the service
+        service_prefix: Tool name prefix (word, excel, ...)
+
+    Returns:
+        Mapping of full tool name to compiled entry
+    """
+    entries = {}
+    for method_name, config in service_config.items():
+        params = tuple(config.get("required", [])) + tuple(config.get("optional", []))
+        entries[f"{service_prefix}_{method_name}"] = ToolEntry(
+            getattr(service, method_name), params, frozenset(params)
+        )
+    return entries
+
+
+class ToolDispatcher:
+    """Registry of compiled tools, grouped by service prefix.
+
+    Each service is compiled when it is bound. Binding the same instance again
+    is a no-op, so callers can re-bind on every request and only pay for a
+    recompilation when a service has actually been re-created.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._entries: dict[str, ToolEntry] = {}
+        self._services: dict[str, Any] = {}
+        self._names: dict[str, tuple[str, ...]] = {}
+        self._lock = threading.RLock()
+
+    def bind_service(self, prefix: str, service: Any, service_config: Mapping[str, dict]) -> bool:
+        """Bind a service instance to a prefix, compiling its tools if needed.
+
+        Args:
+            prefix: Tool name prefix (word, excel, ...)
+            service: Service instance, or None to unbind the prefix
+            service_config: ``*_TOOLS_CONFIG`` mapping for the service
+
+        Returns:
+            True if the tool table was rebuilt, False if it was already current
+        """
+        if service is None:
+            return self.unbind_service(prefix)
+        if self._services.get(prefix) is service:
+            return False
+
+        with self._lock:
+            if self._services.get(prefix) is service:
+                return False
+            self.unbind_service(prefix)
+            entries = compile_entries(service, service_config, prefix)
+            self._entries.update(entries)
+            self._services[prefix] = service
+            self._names[prefix] = tuple(entries)
+        return True
+
+    def unbind_service(self, prefix: str) -> bool:
+        """Remove all tools of a prefix.
+
+        Args:
+            prefix: Tool name prefix
+
+        Returns:
+            True if something was removed
+        """
+        with self._lock:
+            if prefix not in self._services:
+                return False
+            for name in self._names.pop(prefix):
+                self._entries.pop(name, None)
+            del self._services[prefix]
+        return True
+
+    def service_for(self, prefix: str) -> Any | None:
+        """Get the service instance currently bound to a prefix."""
+        return self._services.get(prefix)
+
+    def lookup(self, name: str) -> ToolEntry:
+        """Get the compiled entry of a tool.
+
+        Args:
+            name: Full tool name
+
+        Returns:
+            The compiled entry
+
+        Raises:
+            NotImplementedError: If no bound service provides the tool
+        """
+        try:
+            return self._entries[name]
+        except KeyError:
+            raise NotImplementedError(name) from None
+
+    def dispatch(self, name: str, arguments: Mapping[str, Any]) -> Any:
+        """Invoke a tool by name.
+
+        Args:
+            name: Full tool name
+            arguments: Raw MCP arguments
+
+        Returns:
+            The service method result
+        """
+        return self.lookup(name)(arguments)
+
+    def __contains__(self, name: object) -> bool:
+        """Check whether a tool is registered."""
+        return name in self._entries
+
+    def __len__(self) -> int:
+        """Number of registered tools."""
+        return len(self._entries)
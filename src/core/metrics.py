@@ -0,0 +1,281 @@
+"""Per-tool and per-service call metrics.
+
+Every tool call records its outcome and its duration, split into the time
+spent waiting for the service worker (queue wait, including the lazy start of
+the application) and the time spent executing the tool. Latencies go into
+fixed-memory histograms with logarithmic buckets, from which p50/p95/p99 are
+derived with a bounded relative error, however many calls are recorded.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .exceptions import COMOperationError
+
+T = TypeVar("T")
+
+logger = logging.getLogger("mcp_office")
+
+#: Error class recorded for tools returning ``success: false`` without raising
+UNSUCCESSFUL_RESULT = "UnsuccessfulResult"
+
+
+def error_class(error: BaseException) -> str:
+    """Get the error class to record for a failed call.
+
+    ``@com_safe`` wraps every error of a service method in a COMOperationError,
+    so the class of its cause is recorded instead, when there is one.
+
+    Args:
+        error: Exception raised by the call
+
+    Returns:
+        Exception class name
+    """
+    if isinstance(error, COMOperationError) and error.__cause__ is not None:
+        error = error.__cause__
+    return type(error).__name__
+
+
+class LatencyHistogram:
+    """Fixed-memory latency histogram with logarithmic buckets.
+
+    Bucket ``i`` holds the durations in ``(MIN_SECONDS * GROWTH**(i - 1),
+    MIN_SECONDS * GROWTH**i]``, so percentiles are within ``GROWTH - 1`` (10%)
+    of the exact value. The last bucket also holds anything slower.
+    """
+
+    MIN_SECONDS = 1e-6
+    GROWTH = 1.1
+    BUCKETS = 256  # up to ~10 hours
+
+    __slots__ = ("_counts", "count", "total", "max")
+
+    _LOG_GROWTH = math.log(GROWTH)
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Record one duration.
+
+        Args:
+            seconds: Duration in seconds
+        """
+        if seconds <= self.MIN_SECONDS:
+            index = 0
+        else:
+            index = math.ceil(math.log(seconds / self.MIN_SECONDS) / self._LOG_GROWTH)
+            index = min(index, self.BUCKETS - 1)
+        self._counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """Get an upper bound of a percentile.
+
+        Args:
+            q: Percentile, between 0 and 100
+
+        Returns:
+            Upper bound of the bucket holding the percentile, in seconds
+            (0.0 when the histogram is empty)
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(self.MIN_SECONDS * self.GROWTH**index, self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the histogram (durations in milliseconds)."""
+        mean = self.total / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "mean_ms": round(mean * 1000, 3),
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p95_ms": round(self.percentile(95) * 1000, 3),
+            "p99_ms": round(self.percentile(99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class CallStats:
+    """Counters and latency histograms of one tool or one service."""
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self.calls = 0
+        self.errors: dict[str, int] = {}
+        self.queue_wait = LatencyHistogram()
+        self.execution = LatencyHistogram()
+        self.total = LatencyHistogram()
+
+    def record(self, wait: float, execution: float, total: float, error: str | None) -> None:
+        """Record one call."""
+        self.calls += 1
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+        self.queue_wait.record(wait)
+        self.execution.record(execution)
+        self.total.record(total)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the counters."""
+        return {
+            "calls": self.calls,
+            "errors": sum(self.errors.values()),
+            "errors_by_class": dict(self.errors),
+            "queue_wait": self.queue_wait.to_dict(),
+            "execution": self.execution.to_dict(),
+            "total": self.total.to_dict(),
+        }
+
+
+class CallTimer:
+    """Splits the duration of a tool call into queue wait and execution.
+
+    Created when the call is submitted; ``wrap`` marks the beginning and the
+    end of the execution on the worker thread. Calls that never go through
+    ``wrap`` count as executed from the start.
+    """
+
+    def __init__(self) -> None:
+        """Start timing a call."""
+        self.submitted = time.perf_counter()
+        self.started: float | None = None
+        self.finished: float | None = None
+
+    def wrap(self, fn: Callable[..., T]) -> Callable[..., T]:
+        """Wrap the function executing the call."""
+
+        def timed(*args: Any) -> T:
+            self.started = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                self.finished = time.perf_counter()
+
+        return timed
+
+    def split(self) -> tuple[float, float, float]:
+        """Get the (queue wait, execution, total) durations, in seconds."""
+        now = time.perf_counter()
+        total = now - self.submitted
+        if self.started is None:
+            return 0.0, total, total
+        finished = self.finished if self.finished is not None else now
+        return self.started - self.submitted, finished - self.started, total
+
+
+class MetricsRegistry:
+    """Thread-safe registry of the call metrics, per tool and per service."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._since = time.time()
+        self._tools: dict[str, CallStats] = {}
+        self._services: dict[str, CallStats] = {}
+
+    def record(
+        self,
+        tool: str,
+        service: str,
+        timer: CallTimer,
+        error: str | None = None,
+    ) -> None:
+        """Record a finished tool call.
+
+        Args:
+            tool: Tool name
+            service: Service prefix of the tool
+            timer: Timer of the call
+            error: Exception class name (or UNSUCCESSFUL_RESULT) when the call failed
+        """
+        wait, execution, total = timer.split()
+        with self._lock:
+            for registry, key in ((self._tools, tool), (self._services, service)):
+                stats = registry.get(key)
+                if stats is None:
+                    stats = registry[key] = CallStats()
+                stats.record(wait, execution, total, error)
+
+    def snapshot(self, tool_prefix: str | None = None) -> dict[str, Any]:
+        """Get the current metrics.
+
+        Args:
+            tool_prefix: Only report the tools starting with this prefix
+
+        Returns:
+            JSON-serializable metrics, per tool and per service
+        """
+        with self._lock:
+            tools = {
+                name: stats.to_dict()
+                for name, stats in sorted(self._tools.items())
+                if not tool_prefix or name.startswith(tool_prefix)
+            }
+            services = {name: stats.to_dict() for name, stats in sorted(self._services.items())}
+        return {
+            "since": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self._since)),
+            "uptime_s": round(time.time() - self._since, 3),
+            "calls": sum(s["calls"] for s in services.values()),
+            "errors": sum(s["errors"] for s in services.values()),
+            "services": services,
+            "tools": tools,
+        }
+
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        with self._lock:
+            self._since = time.time()
+            self._tools.clear()
+            self._services.clear()
+
+    def save(self, path: str | Path) -> Path:
+        """Write a snapshot as JSON, atomically.
+
+        Args:
+            path: Destination file
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.tmp")
+        tmp.write_text(json.dumps(self.snapshot(), indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+        return path
+
+    async def dump_periodically(self, path: str | Path, interval: float) -> None:
+        """Write a snapshot every ``interval`` seconds until cancelled.
+
+        Args:
+            path: Destination file (overwritten at each dump)
+            interval: Delay between dumps, in seconds
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.save(path)
+            except OSError as e:
+                logger.error(f"Failed to write metrics to {path}: {e}")
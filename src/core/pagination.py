@@ -0,0 +1,220 @@
+"""Server-side state resumed through opaque cursors.
+
+A tool answer too large for one response keeps its remainder on the server
+under a random cursor; a follow-up call hands the cursor back to resume it.
+The store is bounded: cursors expire after a time-to-live and the least
+recently created ones are evicted first.
+
+Paginated tools keep the iterator producing their results (or a snapshot of
+them), so the next page continues where the previous one stopped instead of
+re-running the COM query from the start.
+"""
+
+import itertools
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, Generic, NamedTuple, TypeVar
+
+from ..utils.helpers import dict_to_result
+from ..utils.validators import validate_positive_number
+from .exceptions import InvalidParameterError
+
+T = TypeVar("T")
+
+#: Default lifetime of a cursor, in seconds
+DEFAULT_TTL = 600.0
+
+_END = object()
+
+
+class CursorStore(Generic[T]):
+    """Bounded, thread-safe mapping of cursors to resumable state (TTL + LRU).
+
+    Args:
+        max_entries: Number of cursors kept before evicting the oldest
+        ttl: Lifetime of a cursor in seconds (None for no expiry)
+        clock: Monotonic clock, in seconds
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        ttl: float | None = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty store."""
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, T]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of live cursors."""
+        with self._lock:
+            self._expire()
+            return len(self._entries)
+
+    def put(self, state: T) -> str:
+        """Store state under a new cursor.
+
+        Args:
+            state: State needed to resume
+
+        Returns:
+            Opaque cursor
+        """
+        cursor = secrets.token_urlsafe(12)
+        deadline = self._clock() + self._ttl if self._ttl is not None else float("inf")
+        with self._lock:
+            self._expire()
+            self._entries[cursor] = (deadline, state)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return cursor
+
+    def pop(self, cursor: str) -> T:
+        """Remove and return the state of a cursor.
+
+        Args:
+            cursor: Cursor returned by put()
+
+        Returns:
+            The stored state
+
+        Raises:
+            InvalidParameterError: If the cursor is unknown, expired or was evicted
+        """
+        with self._lock:
+            self._expire()
+            entry = self._entries.pop(cursor, None)
+        if entry is None:
+            raise InvalidParameterError("cursor", cursor, "Unknown or expired cursor")
+        return entry[1]
+
+    def clear(self) -> None:
+        """Drop every cursor."""
+        with self._lock:
+            self._entries.clear()
+
+    def _expire(self) -> None:
+        """Drop the expired cursors (the oldest come first)."""
+        now = self._clock()
+        while self._entries:
+            cursor, (deadline, _) = next(iter(self._entries.items()))
+            if deadline > now:
+                break
+            del self._entries[cursor]
+
+
+class PageState(NamedTuple):
+    """Remainder of a paginated result.
+
+    Attributes:
+        iterator: Iterator producing the remaining items
+        offset: Number of items already returned
+        page_size: Number of items per page
+        key: Result member holding the items
+        fields: Additional members repeated on every page
+        pending: Items read ahead of the iterator (to detect the last page)
+    """
+
+    iterator: Iterator[Any]
+    offset: int
+    page_size: int
+    key: str
+    fields: dict[str, Any]
+    pending: tuple[Any, ...] = ()
+
+
+class Paginator:
+    """Cuts the results of a service's tools into pages.
+
+    Cursors are prefixed with the service prefix (``outlook:...``) so that the
+    server resumes them on the worker thread owning the service, where the
+    iterators and the COM objects they hold were created.
+
+    Args:
+        prefix: Service prefix
+        store: Store of the page states (TTL + LRU)
+    """
+
+    def __init__(self, prefix: str, store: CursorStore[PageState] | None = None) -> None:
+        """Initialize the paginator."""
+        self.prefix = prefix
+        self._store = store if store is not None else CursorStore()
+
+    def owns(self, cursor: str) -> bool:
+        """Check whether a cursor was issued by this paginator."""
+        return cursor.startswith(f"{self.prefix}:")
+
+    def page(
+        self,
+        items: Iterable[Any],
+        page_size: Any,
+        key: str = "results",
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """Return the first page of a result and keep the rest.
+
+        Args:
+            items: Items of the result, preferably produced lazily
+            page_size: Number of items per page
+            key: Result member holding the items
+            **fields: Additional members repeated on every page
+
+        Returns:
+            Result dictionary with the page, ``offset``, ``has_more`` and ``cursor``
+        """
+        page_size = validate_positive_number("page_size", int(page_size))
+        return self._next(PageState(iter(items), 0, page_size, key, fields))
+
+    def resume(self, cursor: str) -> dict[str, Any]:
+        """Return the next page of a paginated result.
+
+        Args:
+            cursor: Cursor of the previous page
+
+        Returns:
+            Result dictionary with the next page
+
+        Raises:
+            InvalidParameterError: If the cursor is unknown or expired
+        """
+        if not self.owns(cursor):
+            raise InvalidParameterError("cursor", cursor, "Unknown or expired cursor")
+        return self._next(self._store.pop(cursor.split(":", 1)[1]))
+
+    def clear(self) -> None:
+        """Drop every pending page (e.g. before the application quits)."""
+        self._store.clear()
+
+    def _next(self, state: PageState) -> dict[str, Any]:
+        """Take one page from the iterator and store the remainder."""
+        source = itertools.chain(state.pending, state.iterator)
+        items = list(itertools.islice(source, state.page_size))
+        peeked = next(source, _END)
+
+        cursor = None
+        if peeked is not _END:
+            rest = state._replace(offset=state.offset + len(items), pending=(peeked,))
+            cursor = f"{self.prefix}:{self._store.put(rest)}"
+
+        if items:
+            message = f"Items {state.offset + 1}-{state.offset + len(items)}"
+            message += " (more available)" if cursor else " (end of results)"
+        else:
+            message = "No items"
+        return dict_to_result(
+            success=True,
+            message=message,
+            **state.fields,
+            **{state.key: items},
+            count=len(items),
+            offset=state.offset,
+            has_more=cursor is not None,
+            cursor=cursor,
+        )
@@ -0,0 +1,213 @@
+"""Size-bounded JSON serialization of tool results.
+
+Results are encoded member by member and, for sequences, item by item, with
+a byte budget per response. Encoding stops as soon as the budget is reached:
+a 100k-row range is never stringified as a whole just to find out it is too
+large. What did not fit stays on the server; the response ends with a
+``continuation`` member holding the cursor that resumes it.
+"""
+
+import base64
+import datetime
+import enum
+import json
+from collections.abc import Mapping
+from decimal import Decimal
+from pathlib import PurePath
+from typing import Any, NamedTuple
+
+from .pagination import CursorStore
+
+#: Default byte budget of one response
+DEFAULT_BUDGET = 64 * 1024
+
+# Room kept for the continuation member of a truncated response
+_TRAILER_RESERVE = 256
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert a value returned by COM (or a service) to a JSON type.
+
+    Used as the ``default`` hook of the encoder: only called for values that
+    the json module cannot encode natively.
+    """
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(bytes(value)).decode("ascii")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, PurePath):
+        return str(value)
+    return str(value)
+
+
+_encoder = json.JSONEncoder(default=to_jsonable, ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_bounded(value: Any, limit: int | None) -> str | None:
+    """Encode a value, giving up as soon as it exceeds a byte budget.
+
+    Args:
+        value: Value to encode
+        limit: Maximum size in UTF-8 bytes (None for no limit)
+
+    Returns:
+        The JSON text, or None if it does not fit
+    """
+    if limit is None:
+        return _encoder.encode(value)
+    pieces = []
+    size = 0
+    for piece in _encoder.iterencode(value):
+        size += len(piece.encode("utf-8"))
+        if limit is not None and size > limit:
+            return None
+        pieces.append(piece)
+    return "".join(pieces)
+
+
+class ResumePoint(NamedTuple):
+    """Position where a truncated result resumes.
+
+    Attributes:
+        key: Member of the result being written
+        offset: Index of the first item of that member not yet written
+            (0 for members that are not sequences)
+    """
+
+    key: str
+    offset: int
+
+
+class JSONText(str):
+    """JSON text already serialized within the budget (passed through as is)."""
+
+
+def serialize_members(
+    result: Mapping[str, Any], budget: int, resume: ResumePoint | None = None
+) -> tuple[list[str], ResumePoint | None]:
+    """Encode the members of a result up to a byte budget.
+
+    Lists and tuples are split between items; other values are atomic. The
+    first member or item is always written, even when larger than the budget,
+    so that every response makes progress.
+
+    Args:
+        result: Result mapping
+        budget: Byte budget of the members
+        resume: Position to resume from (None to start at the beginning)
+
+    Returns:
+        Encoded ``"key":value`` members, and the position where to resume
+        (None when the result is complete)
+    """
+    keys = list(result)
+    start = keys.index(resume.key) if resume else 0
+    members: list[str] = []
+    used = 0
+
+    for key in keys[start:]:
+        value = result[key]
+        name = encode_bounded(str(key), None) + ":"
+        room = budget - used - len(name.encode("utf-8")) - (1 if members else 0)
+
+        if isinstance(value, (list, tuple)):
+            offset = resume.offset if resume and key == resume.key else 0
+            items: list[str] = []
+            room -= 2
+            for index in range(offset, len(value)):
+                empty = not members and not items
+                item = encode_bounded(value[index], None if empty else room - (1 if items else 0))
+                if item is None:
+                    if items:
+                        members.append(f"{name}[{','.join(items)}]")
+                    return members, ResumePoint(key, index)
+                items.append(item)
+                room -= len(item.encode("utf-8")) + (1 if len(items) > 1 else 0)
+            member = f"{name}[{','.join(items)}]"
+        else:
+            encoded = encode_bounded(value, room if members else None)
+            if encoded is None:  # never None for the first member
+                return members, ResumePoint(key, 0)
+            member = name + encoded
+
+        members.append(member)
+        used += len(member.encode("utf-8")) + (1 if len(members) > 1 else 0)
+
+    return members, None
+
+
+class ResultSerializer:
+    """Serializes tool results as JSON text within a byte budget.
+
+    Args:
+        budget: Byte budget of one response
+        cursors: Store keeping the remainder of truncated results
+    """
+
+    def __init__(
+        self,
+        budget: int = DEFAULT_BUDGET,
+        cursors: CursorStore[tuple[Mapping[str, Any], ResumePoint]] | None = None,
+    ) -> None:
+        """Initialize the serializer."""
+        self.budget = budget
+        self._cursors = cursors if cursors is not None else CursorStore()
+
+    def serialize(self, result: Any) -> JSONText:
+        """Serialize a result, truncating it with a continuation cursor if needed.
+
+        Args:
+            result: Result dictionary (other values are wrapped in ``{"result": ...}``)
+
+        Returns:
+            JSON text of the (first page of the) result
+        """
+        if isinstance(result, JSONText):
+            return result
+        if not isinstance(result, Mapping):
+            result = {"result": result}
+        return self._page(result, None)
+
+    def resume(self, cursor: str) -> JSONText:
+        """Serialize the next page of a truncated result.
+
+        Args:
+            cursor: Cursor of the ``continuation`` member of the previous page
+
+        Returns:
+            JSON text of the next page
+
+        Raises:
+            InvalidParameterError: If the cursor is unknown or expired
+        """
+        result, resume = self._cursors.pop(cursor)
+        return self._page(result, resume)
+
+    def _page(self, result: Mapping[str, Any], resume: ResumePoint | None) -> JSONText:
+        """Serialize one page of a result."""
+        members = []
+        budget = self.budget - _TRAILER_RESERVE
+        if resume is not None:
+            # Tell the client where the data of this page belongs
+            header = encode_bounded({"key": resume.key, "offset": resume.offset}, None)
+            members.append(f'"continued_from":{header}')
+            budget -= len(members[0])
+
+        body, next_point = serialize_members(result, budget, resume)
+        members.extend(body)
+        if next_point is not None:
+            value = result[next_point.key]
+            trailer = {
+                "cursor": self._cursors.put((result, next_point)),
+                "key": next_point.key,
+                "offset": next_point.offset,
+                "length": len(value) if isinstance(value, (list, tuple)) else None,
+            }
+            members.append(f'"continuation":{encode_bounded(trailer, None)}')
+        return JSONText("{" + ",".join(members) + "}")
@@ -0,0 +1,279 @@
+"""Lifecycle management of the Office services.
+
+Services are created and initialized on demand, on their own STA worker
+thread, the first time one of their tools is invoked. A configurable subset can
+be started eagerly at boot, sequentially or concurrently (each application
+starts on its own worker thread). A failure to start one application never
+prevents the others from starting, and the cold-start time of every
+application is recorded.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, TypeVar
+
+from .exceptions import COMInitializationError
+from .sta_worker import STAWorker
+
+T = TypeVar("T")
+
+logger = logging.getLogger("mcp_office")
+
+
+def parse_service_list(value: str | None, known: Iterable[str]) -> tuple[str, ...]:
+    """Parse a comma-separated list of service prefixes.
+
+    Args:
+        value: List such as ``"excel,word"``; ``"all"`` selects every service
+        known: Valid service prefixes, in their canonical order
+
+    Returns:
+        Selected prefixes in canonical order (unknown names are ignored)
+    """
+    known = tuple(known)
+    entries = {e.strip().lower() for e in (value or "").split(",") if e.strip()}
+    if "all" in entries:
+        return known
+    return tuple(prefix for prefix in known if prefix in entries)
+
+
+class ServiceSlot:
+    """State of one service managed by the ServiceManager."""
+
+    def __init__(self, prefix: str, factory: Callable[[], Any], worker: STAWorker) -> None:
+        """Initialize an empty slot."""
+        self.prefix = prefix
+        self.factory = factory
+        self.worker = worker
+        self.service: Any | None = None
+        self.instance: Any | None = None
+        self.mode: str | None = None
+        self.cold_start_ms: float | None = None
+        self.last_error: str | None = None
+        self.start_attempts = 0
+
+    @property
+    def state(self) -> str:
+        """Slot state: stopped, started or failed."""
+        if self.service is not None:
+            return "started"
+        return "failed" if self.last_error else "stopped"
+
+
+class ServiceManager:
+    """Creates, starts and stops services on their dedicated worker threads.
+
+    Args:
+        factories: Mapping of service prefix to a zero-argument service factory
+        worker_factory: Builds the worker of a prefix (STAWorker by default)
+    """
+
+    def __init__(
+        self,
+        factories: Mapping[str, Callable[[], Any]],
+        worker_factory: Callable[[str], STAWorker] = STAWorker,
+    ) -> None:
+        """Create one (not yet started) slot per service."""
+        self._slots = {
+            prefix: ServiceSlot(prefix, factory, worker_factory(prefix))
+            for prefix, factory in factories.items()
+        }
+        self._lock = threading.Lock()
+
+    @property
+    def prefixes(self) -> tuple[str, ...]:
+        """Managed service prefixes."""
+        return tuple(self._slots)
+
+    def slot(self, prefix: str) -> ServiceSlot:
+        """Get the slot of a service.
+
+        Raises:
+            KeyError: If the prefix is unknown
+        """
+        return self._slots[prefix]
+
+    def worker(self, prefix: str) -> STAWorker:
+        """Get the worker thread of a service."""
+        return self._slots[prefix].worker
+
+    def service(self, prefix: str) -> Any | None:
+        """Get a service instance if it is started, without starting it."""
+        return self._slots[prefix].service
+
+    def set_factory(self, prefix: str, factory: Callable[[], Any]) -> None:
+        """Replace the factory of a service (the running instance is kept)."""
+        slot = self._slots[prefix]
+        slot.factory = factory
+        slot.instance = None
+
+    def instance(self, prefix: str) -> Any:
+        """Get a service without starting its application.
+
+        The started service when there is one, else an instance created but
+        not initialized, kept until the service is started. Must be called on
+        the service worker thread.
+
+        Args:
+            prefix: Service prefix
+
+        Returns:
+            The service
+        """
+        slot = self._slots[prefix]
+        if slot.service is not None:
+            return slot.service
+        if slot.instance is None:
+            slot.instance = slot.factory()
+        return slot.instance
+
+    def ensure_started(self, prefix: str, mode: str = "lazy") -> Any:
+        """Create and initialize a service if needed.
+
+        Must be called on the service worker thread, which owns the COM
+        apartment of the application.
+
+        Args:
+            prefix: Service prefix
+            mode: Start mode recorded in the statistics (lazy or eager)
+
+        Returns:
+            The started service
+
+        Raises:
+            COMInitializationError: If the application cannot be started
+        """
+        slot = self._slots[prefix]
+        if slot.service is not None:
+            return slot.service
+
+        slot.start_attempts += 1
+        start = time.perf_counter()
+        try:
+            service = slot.instance if slot.instance is not None else slot.factory()
+            if hasattr(service, "initialize"):
+                service.initialize()
+        except Exception as e:
+            slot.last_error = f"{type(e).__name__}: {e}"
+            logger.error(f"❌ {prefix} service failed to start: {e}")
+            if isinstance(e, COMInitializationError):
+                raise
+            raise COMInitializationError(prefix, str(e)) from e
+
+        with self._lock:
+            slot.service = service
+            slot.instance = None
+            slot.mode = mode
+            slot.cold_start_ms = round((time.perf_counter() - start) * 1000, 3)
+            slot.last_error = None
+        logger.info(f"✅ {prefix} service started ({mode}) in {slot.cold_start_ms} ms")
+        return service
+
+    async def start(self, prefix: str, mode: str = "eager") -> Any:
+        """Start a service on its worker thread.
+
+        Args:
+            prefix: Service prefix
+            mode: Start mode recorded in the statistics
+
+        Returns:
+            The started service
+        """
+        return await self.worker(prefix).run(self.ensure_started, prefix, mode)
+
+    async def start_many(
+        self, prefixes: Iterable[str], parallel: bool = True
+    ) -> dict[str, str | None]:
+        """Start several services eagerly, isolating failures.
+
+        Args:
+            prefixes: Services to start
+            parallel: Start them concurrently on their own threads
+
+        Returns:
+            Mapping of prefix to error message (None when started)
+        """
+        prefixes = tuple(prefixes)
+        start = time.perf_counter()
+
+        async def attempt(prefix: str) -> str | None:
+            try:
+                await self.start(prefix, "eager")
+            except Exception as e:
+                return str(e)
+            return None
+
+        if parallel:
+            errors = await asyncio.gather(*(attempt(p) for p in prefixes))
+        else:
+            errors = [await attempt(p) for p in prefixes]
+
+        elapsed = round((time.perf_counter() - start) * 1000, 3)
+        logger.info(
+            f"Eager start of {', '.join(prefixes) or 'no service'} "
+            f"({'parallel' if parallel else 'sequential'}) took {elapsed} ms"
+        )
+        return dict(zip(prefixes, errors, strict=True))
+
+    async def run(self, prefix: str, fn: Callable[..., T], *args: Any, start: bool = True) -> T:
+        """Run ``fn(service, *args)`` on the service worker, starting it if needed.
+
+        Args:
+            prefix: Service prefix
+            fn: Callable receiving the service as first argument
+            *args: Additional positional arguments
+            start: Start the application first; when False, fn receives the
+                service without its application unless it is already started
+                (a service initializing itself is then recorded as started)
+
+        Returns:
+            The call result
+        """
+        return await self.worker(prefix).run(self._invoke, prefix, fn, args, start)
+
+    def _invoke(self, prefix: str, fn: Callable[..., T], args: tuple, start: bool) -> T:
+        """Worker-side body of run()."""
+        if start:
+            return fn(self.ensure_started(prefix), *args)
+        service = self.instance(prefix)
+        try:
+            return fn(service, *args)
+        finally:
+            if self._slots[prefix].service is None and getattr(service, "is_initialized", False):
+                self.ensure_started(prefix)
+
+    async def shutdown(self) -> None:
+        """Clean up every started service and stop all workers."""
+        for slot in self._slots.values():
+            cleanup = getattr(slot.service, "cleanup", None)
+            if cleanup is not None:
+                try:
+                    await slot.worker.run(cleanup)
+                except Exception as e:
+                    logger.error(f"Error during {slot.prefix} cleanup: {e}")
+            slot.service = None
+            slot.instance = None
+            slot.worker.stop()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Get the lifecycle and worker statistics of every service.
+
+        Returns:
+            Mapping of prefix to a compact statistics dictionary
+        """
+        result = {}
+        for prefix, slot in self._slots.items():
+            worker = slot.worker.stats()
+            result[prefix] = {
+                "state": slot.state,
+                "mode": slot.mode,
+                "cold_start_ms": slot.cold_start_ms,
+                "error": slot.last_error,
+                "queue_depth": worker["queue_depth"],
+                "wait_ms_avg": worker["wait_ms_avg"],
+                "exec_ms_avg": worker["exec_ms_avg"],
+            }
+        return result
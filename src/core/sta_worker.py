@@ -0,0 +1,269 @@
+"""Dedicated single-threaded apartment (STA) worker threads.
+
+Office COM objects live in a single-threaded apartment: every call on an
+application object must come from the thread that created it. Each Office
+service therefore gets its own worker thread that initializes COM, owns the
+application object and executes queued calls one at a time. The asyncio event
+loop only awaits futures, so a slow Word export no longer blocks Excel or
+Outlook requests.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_STOP = object()
+
+
+def _co_initialize() -> None:
+    """Enter a single-threaded COM apartment on the current thread."""
+    import pythoncom
+
+    pythoncom.CoInitialize()
+
+
+def _co_uninitialize() -> None:
+    """Leave the COM apartment of the current thread."""
+    import pythoncom
+
+    pythoncom.CoUninitialize()
+
+
+def _pump_messages() -> None:
+    """Dispatch pending window messages, as required by STA threads."""
+    import pythoncom
+
+    pythoncom.PumpWaitingMessages()
+
+
+class STAWorker:
+    """Worker thread executing callables inside its own COM apartment.
+
+    Calls are executed in submission order. The worker keeps counters on the
+    queue depth and on the time spent waiting in the queue versus executing.
+    If the thread cannot enter its COM apartment, the queued calls and every
+    call submitted afterwards fail with the initialization error.
+
+    Args:
+        name: Worker name (usually the service prefix)
+        com_apartment: Whether to initialize COM on the worker thread
+        pump_interval: Idle delay in seconds between message pumps
+    """
+
+    def __init__(self, name: str, com_apartment: bool = True, pump_interval: float = 0.1) -> None:
+        """Create the worker (the thread is started lazily)."""
+        self.name = name
+        self._com_apartment = com_apartment
+        self._pump_interval = pump_interval
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        # Guards the error against calls being queued while the worker dies
+        self._queue_lock = threading.Lock()
+        self._error: BaseException | None = None
+        self._pending = 0
+        self._max_pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._exec_total = 0.0
+        self._exec_max = 0.0
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the worker thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def thread_id(self) -> int | None:
+        """Identifier of the worker thread, if started."""
+        return self._thread.ident if self._thread else None
+
+    def start(self) -> None:
+        """Start the worker thread if it is not running yet."""
+        with self._start_lock:
+            if self.is_alive:
+                return
+            self._thread = threading.Thread(target=self._run, name=f"sta-{self.name}", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = 10.0) -> None:
+        """Stop the worker after the already queued calls have run.
+
+        Args:
+            timeout: Maximum time to wait for the thread to exit
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+        self._error = None
+
+    def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> "Future[T]":
+        """Queue a call for execution on the worker thread.
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Future resolved with the call result or exception (failed at once
+            if the worker could not initialize COM)
+        """
+        if self._error is None:
+            self.start()
+        future: Future[T] = Future()
+        with self._stats_lock:
+            self._submitted += 1
+            self._pending += 1
+            self._max_pending = max(self._max_pending, self._pending)
+        with self._queue_lock:
+            if self._error is None:
+                self._queue.put((fn, args, kwargs, future, time.perf_counter()))
+                return future
+        self._reject(future, self._error)
+        return future
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a call on the worker thread and await its result.
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The call result
+        """
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a call on the worker thread and block until it completes.
+
+        Calls made from the worker thread itself run inline.
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The call result
+        """
+        if threading.get_ident() == self.thread_id:
+            return fn(*args, **kwargs)
+        return self.submit(fn, *args, **kwargs).result()
+
+    def stats(self) -> dict[str, Any]:
+        """Get the worker counters.
+
+        Returns:
+            Dictionary with queue depth, call counts and wait/execution times (ms)
+        """
+        with self._stats_lock:
+            done = self._completed + self._failed
+            return {
+                "worker": self.name,
+                "alive": self.is_alive,
+                "queue_depth": self._pending,
+                "max_queue_depth": self._max_pending,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "wait_ms_total": round(self._wait_total * 1000, 3),
+                "wait_ms_avg": round(self._wait_total * 1000 / done, 3) if done else 0.0,
+                "wait_ms_max": round(self._wait_max * 1000, 3),
+                "exec_ms_total": round(self._exec_total * 1000, 3),
+                "exec_ms_avg": round(self._exec_total * 1000 / done, 3) if done else 0.0,
+                "exec_ms_max": round(self._exec_max * 1000, 3),
+                "error": None if self._error is None else repr(self._error),
+            }
+
+    def _run(self) -> None:
+        """Worker thread main loop."""
+        if self._com_apartment:
+            try:
+                _co_initialize()
+            except BaseException as e:
+                self._fail(e)
+                return
+        try:
+            while True:
+                try:
+                    item = self._queue.get(timeout=self._pump_interval)
+                except queue.Empty:
+                    if self._com_apartment:
+                        _pump_messages()
+                    continue
+                if item is _STOP:
+                    break
+                self._execute(*item)
+        finally:
+            if self._com_apartment:
+                _co_uninitialize()
+
+    def _fail(self, error: BaseException) -> None:
+        """Fail the queued calls, and the later ones, with an initialization error."""
+        with self._queue_lock:
+            self._error = error
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                self._reject(item[3], error)
+
+    def _reject(self, future: Future, error: BaseException) -> None:
+        """Fail a call that will never run."""
+        if future.set_running_or_notify_cancel():
+            future.set_exception(error)
+        with self._stats_lock:
+            self._pending -= 1
+            self._failed += 1
+
+    def _execute(
+        self,
+        fn: Callable[..., Any],
+        args: tuple,
+        kwargs: dict,
+        future: Future,
+        enqueued: float,
+    ) -> None:
+        """Execute one queued call and record its timings."""
+        started = time.perf_counter()
+        ok = False
+        if future.set_running_or_notify_cancel():
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+                ok = True
+        finished = time.perf_counter()
+
+        with self._stats_lock:
+            self._pending -= 1
+            if ok:
+                self._completed += 1
+            else:
+                self._failed += 1
+            wait, spent = started - enqueued, finished - started
+            self._wait_total += wait
+            self._wait_max = max(self._wait_max, wait)
+            self._exec_total += spent
+            self._exec_max = max(self._exec_max, spent)
@@ -0,0 +1,504 @@
+"""Find and replace across many workbooks.
+
+Every sheet of every workbook matched by a directory or glob gets an ordered
+list of find -> replace pairs applied, with the number of replacements counted
+per file and per pair.
+
+Two engines are used. .xlsx/.xlsm files whose formulas and numbers are not
+affected are rewritten directly: the replacement only touches the shared
+string table and inline strings, so the other parts of the archive are copied
+byte for byte, without starting Excel. The other files (.xls, matches in
+formulas, numbers or table column names, which only Excel can recalculate,
+retype or rename, or changed
+workbooks holding formulas, whose cached results may depend on the replaced
+strings) are spread over a pool of worker threads, each driving its own Excel
+process. When Excel must not be started, such workbooks are rewritten with a
+flag making Excel recalculate every formula when it next opens them.
+"""
+
+import html
+import os
+import queue
+import re
+import shutil
+import zipfile
+from collections import Counter
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import suppress
+from pathlib import Path
+from typing import IO, Any, NamedTuple
+from xml.etree.ElementTree import ParseError, iterparse
+from xml.sax.saxutils import escape
+
+from ..core.base_office import ApplicationFactory, BaseOfficeService, InstanceFactory
+from ..core.exceptions import InvalidParameterError, ResourceCleanupError
+from ..core.sta_worker import STAWorker
+
+#: Workbook extensions processed when a directory is given
+WORKBOOK_EXTENSIONS = (".xlsx", ".xlsm", ".xls")
+
+#: Extensions the XML engine can rewrite
+XML_EXTENSIONS = (".xlsx", ".xlsm")
+
+#: Engines of the bulk replace
+ENGINES = ("auto", "xml", "excel")
+
+#: Excel processes started by default (each one is a full Excel instance)
+DEFAULT_WORKERS = 4
+
+XL_PART = 2
+
+_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+_SHARED_ITEM = re.compile(r"<si(?:\s[^>]*)?(?:/>|>(.*?)</si>)", re.DOTALL)
+_INLINE_STRING = re.compile(r"<is>(.*?)</is>", re.DOTALL)
+_TEXT = re.compile(r"<t(\s[^>]*)?>(.*?)</t>", re.DOTALL)
+_PHONETIC = re.compile(r"(<rPh\b.*?</rPh>)", re.DOTALL)
+_TABLE_COLUMN = re.compile(r'<tableColumn\b[^>]*?\sname="([^"]*)"')
+_CALC_PR = re.compile(r"<calcPr\b[^>]*>")
+_FULL_CALC_ON_LOAD = re.compile(r'\sfullCalcOnLoad="[^"]*"')
+# Elements following calcPr in a workbook part, in schema order
+_AFTER_CALC_PR = re.compile(
+    r"<(?:oleSize|customWorkbookViews|pivotCaches|smartTagPr|smartTagTypes|webPublishing"
+    r"|fileRecoveryPr|webPublishObjects|extLst)\b"
+)
+
+
+class ReplacePair(NamedTuple):
+    """A find -> replace pair and its compiled pattern.
+
+    Attributes:
+        find: Text to find
+        replace: Replacement text
+        pattern: Compiled pattern of the find text
+    """
+
+    find: str
+    replace: str
+    pattern: re.Pattern
+
+
+class FileResult(NamedTuple):
+    """Outcome of the replace on one workbook.
+
+    Attributes:
+        file: Workbook path
+        engine: ``"xml"`` or ``"excel"``
+        counts: Replacements per pair
+        error: Error message when the file could not be processed
+    """
+
+    file: str
+    engine: str
+    counts: tuple[int, ...]
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Result entry of the tool."""
+        entry: dict[str, Any] = {
+            "file": self.file,
+            "engine": self.engine,
+            "replacements": sum(self.counts),
+            "counts": list(self.counts),
+        }
+        if self.error:
+            entry["error"] = self.error
+        return entry
+
+
+def parse_pairs(pairs: Any, match_case: bool = False) -> list[ReplacePair]:
+    """Validate find -> replace pairs.
+
+    Args:
+        pairs: ``[{"find": ..., "replace": ...}]``, ``[[find, replace]]`` or
+            ``{find: replace}``
+        match_case: Whether the search is case-sensitive (Excel's default is not)
+
+    Returns:
+        Pairs in application order
+
+    Raises:
+        InvalidParameterError: If a pair is malformed or has an empty find text
+    """
+    items = pairs.items() if isinstance(pairs, dict) else pairs
+    if not isinstance(items, Iterable) or isinstance(items, str):
+        raise InvalidParameterError("pairs", type(pairs).__name__, "Expected a list of pairs")
+    flags = 0 if match_case else re.IGNORECASE
+    parsed = []
+    for index, item in enumerate(items):
+        if isinstance(item, dict):
+            item = (item.get("find"), item.get("replace", ""))
+        if not isinstance(item, (list, tuple)) or len(item) != 2 or not item[0]:
+            raise InvalidParameterError(
+                f"pairs[{index}]", str(item)[:50], "Expected a find text and a replacement"
+            )
+        find, replace = str(item[0]), "" if item[1] is None else str(item[1])
+        parsed.append(ReplacePair(find, replace, re.compile(re.escape(find), flags)))
+    if not parsed:
+        raise InvalidParameterError("pairs", "[]", "At least one pair is required")
+    return parsed
+
+
+def resolve_files(path: str) -> list[Path]:
+    """List the workbooks of a directory (recursively) or matched by a glob.
+
+    Raises:
+        InvalidParameterError: If nothing matches
+    """
+    target = Path(path).expanduser()
+    if target.is_dir():
+        files = [p for p in target.rglob("*") if p.suffix.lower() in WORKBOOK_EXTENSIONS]
+    elif target.is_file():
+        files = [target]
+    else:
+        anchor = Path(target.anchor) if target.is_absolute() else Path()
+        pattern = str(target.relative_to(anchor)) if target.is_absolute() else str(target)
+        files = [p for p in anchor.glob(pattern) if p.suffix.lower() in WORKBOOK_EXTENSIONS]
+    # Skip the lock files Excel leaves next to open workbooks
+    files = sorted(p for p in files if p.is_file() and not p.name.startswith("~$"))
+    if not files:
+        raise InvalidParameterError("path", path, "No workbook found")
+    return files
+
+
+def apply_pairs(text: str, pairs: Sequence[ReplacePair]) -> tuple[str, list[int]]:
+    """Apply the pairs in order to a text.
+
+    Returns:
+        The new text and the number of replacements of each pair
+    """
+    counts = []
+    for pair in pairs:
+        text, count = pair.pattern.subn(lambda _, r=pair.replace: r, text)
+        counts.append(count)
+    return text, counts
+
+
+def _add(total: list[int], counts: Iterable[int], times: int = 1) -> None:
+    for i, count in enumerate(counts):
+        total[i] += count * times
+
+
+# -- XML engine ------------------------------------------------------------------
+
+
+def _rewrite_texts(fragment: str, pairs: Sequence[ReplacePair]) -> tuple[str, list[int]]:
+    """Apply the pairs to the ``<t>`` elements of a string item (phonetic runs excluded)."""
+    counts = [0] * len(pairs)
+
+    def text(match: re.Match) -> str:
+        attributes, content = match.group(1) or "", match.group(2)
+        new, found = apply_pairs(html.unescape(content), pairs)
+        if not any(found):
+            return match.group(0)
+        _add(counts, found)
+        if new != new.strip() and "xml:space" not in attributes:
+            attributes += ' xml:space="preserve"'
+        return f"<t{attributes}>{escape(new)}</t>"
+
+    parts = _PHONETIC.split(fragment)
+    for i in range(0, len(parts), 2):
+        parts[i] = _TEXT.sub(text, parts[i])
+    return "".join(parts), counts
+
+
+def _scan_sheet(
+    f: IO[bytes], pairs: Sequence[ReplacePair], references: Counter
+) -> tuple[str | None, bool]:
+    """Count the shared string references of a sheet and find what blocks the XML engine.
+
+    Returns:
+        Why Excel is needed (a formula or a number matches) or None, and
+        whether the sheet holds formulas
+    """
+    sheet_data = None
+    formulas = False
+    for event, element in iterparse(f, events=("start", "end")):
+        if event == "start":
+            if element.tag == f"{_MAIN}sheetData":
+                sheet_data = element
+            continue
+        if element.tag != f"{_MAIN}c":
+            if element.tag == f"{_MAIN}row" and sheet_data is not None:
+                sheet_data.clear()
+            continue
+        kind = element.get("t", "n")
+        # Cells of a shared formula other than the first one have an empty <f/>
+        has_formula = element.find(f"{_MAIN}f") is not None
+        formula = element.findtext(f"{_MAIN}f")
+        value = element.findtext(f"{_MAIN}v")
+        formulas = formulas or has_formula
+        if formula and any(pair.pattern.search(formula) for pair in pairs):
+            return f"formula in {element.get('r')} matches", formulas
+        if kind == "s" and value is not None:
+            references[int(value)] += 1
+        elif (
+            kind in ("n", "b", "e", "d")
+            and value
+            and not has_formula
+            and any(pair.pattern.search(value) for pair in pairs)
+        ):
+            return f"value of {element.get('r')} matches", formulas
+    return None, formulas
+
+
+def full_calc_on_load(xml: str) -> str:
+    """Flag a workbook part so that Excel recalculates every formula when opening it."""
+    match = _CALC_PR.search(xml)
+    if match:
+        element = _FULL_CALC_ON_LOAD.sub("", match.group(0))
+        element = element.replace("<calcPr", '<calcPr fullCalcOnLoad="1"', 1)
+        return xml[: match.start()] + element + xml[match.end() :]
+    after = _AFTER_CALC_PR.search(xml)
+    position = after.start() if after else xml.rindex("</workbook>")
+    return xml[:position] + '<calcPr fullCalcOnLoad="1"/>' + xml[position:]
+
+
+def replace_in_xlsx(
+    path: Path, pairs: Sequence[ReplacePair], output: Path, recalculate_on_load: bool = False
+) -> tuple[list[int], str | None]:
+    """Apply the pairs to the strings of an .xlsx file, without Excel.
+
+    The cached results of formulas are not updated. A changed workbook
+    holding formulas is left to Excel, unless recalculate_on_load is set.
+
+    Args:
+        path: Workbook
+        pairs: Pairs to apply
+        output: File written (the workbook itself to replace in place)
+        recalculate_on_load: Rewrite changed workbooks holding formulas too,
+            flagged to be fully recalculated when Excel next opens them
+
+    Returns:
+        (replacements per pair, None), or (zeros, reason) when the file needs
+        Excel (matching formulas, numbers or table column names, formulas that
+        may depend on the replaced strings, or a file the engine cannot
+        read); nothing is written in that case
+    """
+    try:
+        return _replace_in_xlsx(path, pairs, output, recalculate_on_load)
+    except (OSError, zipfile.BadZipFile, ParseError, UnicodeDecodeError, ValueError) as e:
+        return [0] * len(pairs), f"{type(e).__name__}: {e}"
+
+
+def _replace_in_xlsx(
+    path: Path, pairs: Sequence[ReplacePair], output: Path, recalculate_on_load: bool
+) -> tuple[list[int], str | None]:
+    counts = [0] * len(pairs)
+    parts: dict[str, bytes] = {}
+    with zipfile.ZipFile(path) as archive:
+        names = set(archive.namelist())
+        sheets = sorted(n for n in names if n.startswith("xl/worksheets/") and n.endswith(".xml"))
+        references: Counter = Counter()
+        formulas = False
+        for name in sheets:
+            with archive.open(name) as f:
+                reason, sheet_formulas = _scan_sheet(f, pairs, references)
+            if reason:
+                return [0] * len(pairs), reason
+            formulas = formulas or sheet_formulas
+
+        # Table column names repeat their header cells: Excel renames them on Replace
+        for name in sorted(n for n in names if n.startswith("xl/tables/") and n.endswith(".xml")):
+            columns = _TABLE_COLUMN.findall(archive.read(name).decode("utf-8"))
+            if any(pair.pattern.search(html.unescape(c)) for c in columns for pair in pairs):
+                return [0] * len(pairs), f"table column name in {name} matches"
+
+        if "xl/sharedStrings.xml" in names:
+            xml = archive.read("xl/sharedStrings.xml").decode("utf-8")
+            if not re.search(r"<sst\b", xml):
+                return [0] * len(pairs), "unsupported shared string table"
+            index = -1
+
+            def shared_item(match: re.Match) -> str:
+                nonlocal index
+                index += 1
+                if match.group(1) is None or not references[index]:
+                    return match.group(0)
+                new, found = _rewrite_texts(match.group(1), pairs)
+                if not any(found):
+                    return match.group(0)
+                _add(counts, found, references[index])
+                return match.group(0)[: match.start(1) - match.start()] + new + "</si>"
+
+            new_xml = _SHARED_ITEM.sub(shared_item, xml)
+            if new_xml != xml:
+                parts["xl/sharedStrings.xml"] = new_xml.encode("utf-8")
+
+        for name in sheets:
+            xml = archive.read(name).decode("utf-8")
+            if "<is>" not in xml:
+                continue
+
+            def inline_string(match: re.Match) -> str:
+                new, found = _rewrite_texts(match.group(1), pairs)
+                _add(counts, found)
+                return f"<is>{new}</is>" if any(found) else match.group(0)
+
+            new_xml = _INLINE_STRING.sub(inline_string, xml)
+            if new_xml != xml:
+                parts[name] = new_xml.encode("utf-8")
+
+        if parts and formulas:
+            if not recalculate_on_load:
+                return [0] * len(pairs), "formulas may depend on the replaced strings"
+            workbook = archive.read("xl/workbook.xml").decode("utf-8")
+            parts["xl/workbook.xml"] = full_calc_on_load(workbook).encode("utf-8")
+
+    if parts:
+        _write_archive(path, output, parts)
+    elif output != path:
+        shutil.copy2(path, output)
+    return counts, None
+
+
+def _write_archive(path: Path, output: Path, parts: dict[str, bytes]) -> None:
+    """Copy an archive with some parts replaced, then move it into place."""
+    temporary = output.with_name(f"~{output.name}.tmp")
+    try:
+        with zipfile.ZipFile(path) as source, zipfile.ZipFile(temporary, "w") as target:
+            for info in source.infolist():
+                target.writestr(info, parts.get(info.filename) or source.read(info.filename))
+        os.replace(temporary, output)
+    finally:
+        temporary.unlink(missing_ok=True)
+
+
+# -- Excel engine ----------------------------------------------------------------
+
+
+def replace_in_sheet(ws: Any, pairs: Sequence[ReplacePair]) -> list[int]:
+    """Apply the pairs to a worksheet with ``Range.Replace``.
+
+    Replacements are counted on the formulas of the used range (the cell
+    contents ``Replace`` works on) in one read, and ``Replace`` is only
+    called for the pairs that match.
+
+    Returns:
+        Replacements per pair
+    """
+    formulas = ws.UsedRange.Formula
+    rows = formulas if isinstance(formulas, tuple) else ((formulas,),)
+    counts = [0] * len(pairs)
+    for row in rows:
+        for cell in row:
+            if isinstance(cell, str) and cell:
+                _add(counts, apply_pairs(cell, pairs)[1])
+    for pair, count in zip(pairs, counts, strict=True):
+        if count:
+            ws.Cells.Replace(
+                What=pair.find,
+                Replacement=pair.replace,
+                LookAt=XL_PART,
+                MatchCase=not pair.pattern.flags & re.IGNORECASE,
+            )
+    return counts
+
+
+def replace_with_excel(
+    service: BaseOfficeService, path: Path, pairs: Sequence[ReplacePair], output: Path
+) -> list[int]:
+    """Apply the pairs to every sheet of a workbook opened in Excel.
+
+    Args:
+        service: Started Excel service owning its own application
+        path: Workbook
+        pairs: Pairs to apply
+        output: File written (the workbook itself to replace in place)
+
+    Returns:
+        Replacements per pair
+    """
+    counts = [0] * len(pairs)
+    wb = service.application.Workbooks.Open(str(path), UpdateLinks=0)
+    try:
+        with service.fast_mode():
+            for ws in wb.Worksheets:
+                _add(counts, replace_in_sheet(ws, pairs))
+        if output != path:
+            wb.SaveAs(str(output))
+        elif any(counts):
+            wb.Save()
+    finally:
+        wb.Close(SaveChanges=False)
+    return counts
+
+
+def run_excel_pool(
+    files: Sequence[tuple[Path, Path]],
+    pairs: Sequence[ReplacePair],
+    make_service: Callable[[ApplicationFactory], BaseOfficeService],
+    factory: ApplicationFactory,
+    workers: int,
+) -> list[FileResult]:
+    """Process workbooks with a pool of Excel processes.
+
+    Each worker is an STA thread starting its own Excel instance, then taking
+    files from a shared queue until it is empty. A worker whose Excel does
+    not start takes no file; files no worker could process are reported
+    with the error instead of raising.
+
+    Args:
+        files: (workbook, output) paths
+        pairs: Pairs to apply
+        make_service: Creates an Excel service from an application factory
+        factory: Factory whose ``create_instance`` starts the applications
+        workers: Number of Excel processes
+
+    Returns:
+        Results, in completion order
+    """
+    pending: queue.SimpleQueue = queue.SimpleQueue()
+    for item in files:
+        pending.put(item)
+
+    failures: list[str] = []
+
+    def drain() -> list[FileResult]:
+        results = []
+        service = None
+        try:
+            service = make_service(InstanceFactory(factory))
+            service.initialize()
+            while True:
+                try:
+                    path, output = pending.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    counts = replace_with_excel(service, path, pairs, output)
+                    results.append(FileResult(str(path), "excel", tuple(counts)))
+                except Exception as e:
+                    error = f"{type(e).__name__}: {e}"
+                    results.append(FileResult(str(path), "excel", (0,) * len(pairs), error))
+        except Exception as e:
+            # Excel did not start: the files left go to the other workers
+            failures.append(f"{type(e).__name__}: {e}")
+        finally:
+            if service is not None:
+                with suppress(ResourceCleanupError):
+                    service.cleanup()
+        return results
+
+    pool = [
+        STAWorker(f"excel-replace-{i}", com_apartment=factory.uses_com)
+        for i in range(max(1, min(workers, len(files))))
+    ]
+    results: list[FileResult] = []
+    try:
+        for future in [worker.submit(drain) for worker in pool]:
+            try:
+                results += future.result()
+            except Exception as e:
+                failures.append(f"{type(e).__name__}: {e}")
+        # Files left when every worker failed are reported with the first failure
+        while True:
+            try:
+                path, _ = pending.get_nowait()
+            except queue.Empty:
+                break
+            results.append(FileResult(str(path), "excel", (0,) * len(pairs), failures[0]))
+        return results
+    finally:
+        for worker in pool:
+            worker.stop()
@@ -0,0 +1,237 @@
+"""Columnar snapshots of worksheet ranges (Arrow IPC, Parquet, NPZ).
+
+Rows read in blocks are accumulated column by column, each column gets one
+inferred type, and the result is written in a format analytics jobs can
+memory-map instead of parsing JSON. pyarrow (Arrow IPC and Parquet) and NumPy
+(NPZ) are optional dependencies, imported when installed.
+"""
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ..core.exceptions import InvalidParameterError
+from .dates import EXCEL_EPOCH
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = feather = pq = None
+
+#: File extensions of the supported formats
+FORMAT_EXTENSIONS = {
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
+    ".parquet": "parquet",
+    ".npz": "npz",
+}
+
+#: Column types, as named in Arrow and NumPy
+DTYPES = ("bool", "int64", "float64", "timestamp[ms]", "string")
+
+_MS_PER_DAY = 86_400_000
+_EPOCH_UNIX_MS = (EXCEL_EPOCH - datetime(1970, 1, 1)) // timedelta(milliseconds=1)
+
+
+class Column(NamedTuple):
+    """A typed column of a snapshot.
+
+    Attributes:
+        name: Column name (from the header row, or ``column_<n>``)
+        dtype: One of ``DTYPES``
+        values: Values, None for empty cells (timestamps as Excel serials)
+    """
+
+    name: str
+    dtype: str
+    values: list[Any]
+
+
+def detect_header(rows: Sequence[Sequence[Any]]) -> bool:
+    """Guess whether the first row of a block holds column names.
+
+    It does when every cell of the first row is a non-empty string and at
+    least one column holds something else below it.
+
+    Args:
+        rows: First rows of the range
+
+    Returns:
+        True if the first row looks like a header
+    """
+    if len(rows) < 2 or not all(isinstance(v, str) and v.strip() for v in rows[0]):
+        return False
+    return any(v is not None and not isinstance(v, str) for row in rows[1:] for v in row)
+
+
+def column_names(header: Sequence[Any] | None, width: int) -> list[str]:
+    """Build unique column names from a header row (or ``column_<n>``)."""
+    names: list[str] = []
+    for i in range(width):
+        name = str(header[i]).strip() if header and header[i] is not None else ""
+        name = name or f"column_{i + 1}"
+        unique, n = name, 2
+        while unique in names:
+            unique, n = f"{name}_{n}", n + 1
+        names.append(unique)
+    return names
+
+
+def infer_dtype(values: Iterable[Any], is_date: bool = False) -> str:
+    """Infer the type of a column from its non-empty values.
+
+    Args:
+        values: Values read through ``Value2``
+        is_date: Whether the column has a date NumberFormat
+
+    Returns:
+        ``"timestamp[ms]"`` for numeric date columns, ``"bool"``, ``"int64"``
+        or ``"float64"`` when every value has that type, ``"string"`` otherwise
+    """
+    seen = set()
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            seen.add("bool")
+        elif isinstance(value, int) or (isinstance(value, float) and value.is_integer()):
+            seen.add("int64")
+        elif isinstance(value, float):
+            seen.add("float64")
+        else:
+            return "string"
+    if not seen:
+        return "string"
+    if seen <= {"int64", "float64"}:
+        if is_date:
+            return "timestamp[ms]"
+        return "int64" if seen == {"int64"} else "float64"
+    return "bool" if seen == {"bool"} else "string"
+
+
+def build_columns(
+    blocks: Iterable[Sequence[Sequence[Any]]],
+    header: bool | None = None,
+    date_columns: Iterable[int] = (),
+) -> list[Column]:
+    """Accumulate blocks of rows into typed columns.
+
+    Args:
+        blocks: Blocks of rows read through ``Value2``
+        header: Whether the first row holds the column names (None to detect)
+        date_columns: 0-based indexes of the columns with a date format
+
+    Returns:
+        Typed columns (no rows when the blocks are empty)
+    """
+    values: list[list[Any]] = []
+    names: list[str] = []
+    for block in blocks:
+        if not block:
+            continue
+        if not values:
+            first = header if header is not None else detect_header(block)
+            names = column_names(block[0] if first else None, len(block[0]))
+            values = [[] for _ in names]
+            block = block[1:] if first else block
+        for column, cells in zip(values, zip(*block, strict=True), strict=False):
+            column.extend(cells)
+
+    dates = set(date_columns)
+    return [
+        Column(name, infer_dtype(column, i in dates), column)
+        for i, (name, column) in enumerate(zip(names, values, strict=True))
+    ]
+
+
+def resolve_format(path: Path, file_format: str | None = None) -> str:
+    """Get the format of an export from its name or the file extension.
+
+    Raises:
+        InvalidParameterError: If the format is unknown or its library is not installed
+    """
+    fmt = (file_format or FORMAT_EXTENSIONS.get(path.suffix.lower(), "")).lower()
+    if fmt not in ("arrow", "parquet", "npz"):
+        raise InvalidParameterError(
+            "file_format", file_format or path.suffix, "Expected arrow, parquet or npz"
+        )
+    missing = "numpy" if fmt == "npz" and np is None else None
+    if fmt in ("arrow", "parquet") and pa is None:
+        missing = "pyarrow"
+    if missing:
+        raise InvalidParameterError(
+            "file_format", fmt, f"Requires the {missing} package (pip install {missing})"
+        )
+    return fmt
+
+
+def _to_string(value: Any) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _arrow_array(column: Column) -> Any:
+    values = column.values
+    if column.dtype == "timestamp[ms]":
+        ms = [None if v is None else round(v * _MS_PER_DAY) + _EPOCH_UNIX_MS for v in values]
+        return pa.array(ms, pa.timestamp("ms"))
+    if column.dtype == "int64":
+        return pa.array([None if v is None else int(v) for v in values], pa.int64())
+    if column.dtype == "string":
+        return pa.array([_to_string(v) for v in values], pa.string())
+    return pa.array(values, pa.bool_() if column.dtype == "bool" else pa.float64())
+
+
+def _numpy_array(column: Column) -> Any:
+    values = column.values
+    has_nulls = any(v is None for v in values)
+    if column.dtype == "timestamp[ms]":
+        ms = np.array([np.nan if v is None else v for v in values], dtype=float) * _MS_PER_DAY
+        stamps = np.datetime64(EXCEL_EPOCH, "ms") + np.rint(np.nan_to_num(ms)).astype(np.int64)
+        stamps[np.isnan(ms)] = np.datetime64("NaT")
+        return stamps
+    if column.dtype == "string":
+        return np.array(["" if v is None else _to_string(v) for v in values], dtype=str)
+    if column.dtype == "float64" or has_nulls:
+        # NPZ has no null mask: empty cells become NaN
+        return np.array([np.nan if v is None else v for v in values], dtype=float)
+    return np.array(values, dtype=column.dtype)
+
+
+def write_columns(
+    columns: Sequence[Column], path: Path, fmt: str, compression: str | None = None
+) -> None:
+    """Write typed columns to a file.
+
+    Args:
+        columns: Columns to write
+        path: Destination file
+        fmt: ``"arrow"``, ``"parquet"`` or ``"npz"``
+        compression: Codec (``"lz4"``/``"zstd"`` for Arrow IPC, ``"snappy"``,
+            ``"gzip"``, ``"zstd"``... for Parquet); for NPZ any value
+            compresses the archive
+    """
+    if fmt == "npz":
+        arrays = {column.name: _numpy_array(column) for column in columns}
+        save = np.savez_compressed if compression else np.savez
+        with path.open("wb") as f:
+            save(f, **arrays)
+        return
+
+    table = pa.table({column.name: _arrow_array(column) for column in columns})
+    if fmt == "parquet":
+        pq.write_table(table, path, compression=compression or "none")
+    else:
+        feather.write_feather(table, path, compression=compression or "uncompressed")
@@ -0,0 +1,154 @@
+"""Streaming CSV parsing for imports into Excel.
+
+The file is read lazily, so files larger than memory can be imported: the
+encoding and the dialect are detected from a sample of the first bytes, and
+fields are converted to typed values (numbers, booleans, ISO dates) as the
+rows are produced, ready to be written in large ``Value2`` blocks.
+"""
+
+import codecs
+import csv
+import re
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .range_io import parse_field
+
+#: Bytes read to detect the encoding and the dialect
+SAMPLE_BYTES = 64 * 1024
+
+#: Delimiters considered when sniffing the dialect
+DELIMITERS = ",;\t|"
+
+# Fallback for files that are not UTF-8 (the usual ANSI code page of Windows)
+_FALLBACK_ENCODING = "cp1252"
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}([T ]\d{2}:\d{2}(:\d{2}(\.\d+)?)?)?")
+
+# Text that Excel would evaluate as a formula when written to a cell
+_FORMULA_PREFIXES = ("=", "+", "-", "@")
+
+
+def detect_encoding(sample: bytes) -> str:
+    """Detect the encoding of a file from its first bytes.
+
+    Args:
+        sample: First bytes of the file
+
+    Returns:
+        The encoding of the byte order mark, else ``utf-8`` if the sample
+        decodes as UTF-8, else ``cp1252``
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    try:
+        sample.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut at the end of the sample is still UTF-8
+        if e.start < len(sample) - 3:
+            return _FALLBACK_ENCODING
+    return "utf-8"
+
+
+def sniff_dialect(text: str, delimiter: str | None = None) -> type[csv.Dialect] | csv.Dialect:
+    """Detect the CSV dialect (delimiter and quoting) of a sample.
+
+    Args:
+        text: Decoded sample of the file
+        delimiter: Delimiter to use instead of detecting it
+
+    Returns:
+        The detected dialect, or the Excel dialect when detection fails
+    """
+    if delimiter:
+        return type("Dialect", (csv.excel,), {"delimiter": delimiter})
+    # Only complete lines are sniffed
+    text = text[: text.rfind("\n") + 1] or text
+    try:
+        return csv.Sniffer().sniff(text, delimiters=DELIMITERS)
+    except csv.Error:
+        return csv.excel
+
+
+def convert_field(text: str) -> Any:
+    """Convert a CSV field to a typed cell value.
+
+    Numbers become numbers (codes with leading zeros stay text), ``TRUE`` and
+    ``FALSE`` booleans, ISO 8601 dates datetimes, and empty fields None. Text
+    that Excel would evaluate as a formula is prefixed with an apostrophe.
+    """
+    value = parse_field(text)
+    if not isinstance(value, str):
+        return value
+    upper = value.upper()
+    if upper in ("TRUE", "FALSE"):
+        return upper == "TRUE"
+    if _ISO_DATE.fullmatch(value):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    if value.startswith(_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def _text_field(text: str) -> str | None:
+    """Keep a CSV field as text, guarding against formula evaluation."""
+    if not text:
+        return None
+    return f"'{text}" if text.startswith(_FORMULA_PREFIXES) else text
+
+
+class CsvSource:
+    """A CSV file opened for streaming, with its detected encoding and dialect.
+
+    Args:
+        path: CSV file
+        encoding: Encoding (detected by default)
+        delimiter: Delimiter (detected by default)
+        convert_types: Convert fields to numbers, booleans and dates
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        encoding: str | None = None,
+        delimiter: str | None = None,
+        convert_types: bool = True,
+    ) -> None:
+        """Detect the encoding and the dialect from a sample of the file."""
+        self.path = path
+        self.size = path.stat().st_size
+        with path.open("rb") as f:
+            sample = f.read(SAMPLE_BYTES)
+        self.encoding = encoding or detect_encoding(sample)
+        text = sample.decode(self.encoding, errors="ignore")
+        self.dialect = sniff_dialect(text.lstrip("\ufeff"), delimiter)
+        self.convert_types = convert_types
+
+    @property
+    def delimiter(self) -> str:
+        """Delimiter of the fields."""
+        return self.dialect.delimiter
+
+    def rows(self) -> Iterator[list[Any]]:
+        """Stream the rows of the file, converted when convert_types is set."""
+        encoding = "utf-8-sig" if self.encoding == "utf-8" else self.encoding
+        with self.path.open(encoding=encoding, newline="", errors="replace") as f:
+            reader = csv.reader(f, self.dialect)
+            if self.convert_types:
+                for row in reader:
+                    yield [convert_field(field) for field in row]
+            else:
+                for row in reader:
+                    yield [_text_field(field) for field in row]
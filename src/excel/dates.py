@@ -0,0 +1,113 @@
+"""Conversion of Excel date serial numbers read through ``Value2``.
+
+``Range.Value`` makes Excel convert every date cell to a VARIANT date on the
+way out (and pywin32 to a ``datetime``). ``Value2`` returns the raw serial
+numbers instead; the columns that hold dates are converted afterwards, one
+column at a time, to ISO 8601 strings. NumPy is used for the conversion when
+it is installed, with a pure-Python fallback giving identical results.
+"""
+
+import re
+from collections.abc import Iterable, Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+#: Day 0 of the Excel 1900 date system, valid from serial 61 (1900-03-01). Excel counts
+#: a 1900-02-29 that did not exist, so earlier serials convert one day early (serial 1
+#: gives 1899-12-31, as through COM ``Range.Value``): dates before 1900-03-01 are unsupported.
+EXCEL_EPOCH = datetime(1899, 12, 30)
+
+_SECONDS_PER_DAY = 86400
+
+# Literals, colours/conditions and escaped characters of a number format
+_FORMAT_LITERALS = re.compile(r'"[^"]*"|\[(?![hms]+\])[^\]]*\]|\\.|_.|\*.', re.IGNORECASE)
+_DATE_TOKENS = re.compile(r"[dmyhs]", re.IGNORECASE)
+
+
+def is_date_format(number_format: Any) -> bool:
+    """Check whether a NumberFormat displays a date or a time.
+
+    Args:
+        number_format: ``Range.NumberFormat`` (None for mixed formats)
+
+    Returns:
+        True for formats such as ``"yyyy-mm-dd"``, ``"m/d/yyyy h:mm"`` or ``"[h]:mm"``
+    """
+    if not isinstance(number_format, str) or number_format.lower() == "general":
+        return False
+    # Only the first section (positive numbers) matters
+    section = _FORMAT_LITERALS.sub("", number_format).split(";", 1)[0]
+    return bool(_DATE_TOKENS.search(section))
+
+
+def _is_serial(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def serial_to_datetime(serial: float) -> datetime:
+    """Convert an Excel serial number to a datetime (rounded to the second)."""
+    return EXCEL_EPOCH + timedelta(seconds=round(serial * _SECONDS_PER_DAY))
+
+
+def serial_to_iso(serial: float) -> str:
+    """Convert an Excel serial number to ``"YYYY-MM-DD"`` or ``"YYYY-MM-DDTHH:MM:SS"``."""
+    moment = serial_to_datetime(serial)
+    if moment.hour == moment.minute == moment.second == 0:
+        return moment.date().isoformat()
+    return moment.isoformat()
+
+
+def serials_to_iso(values: Sequence[Any]) -> list[Any]:
+    """Convert the serial numbers of a column to ISO 8601 strings.
+
+    Whole days become ``"YYYY-MM-DD"``, other serials ``"YYYY-MM-DDTHH:MM:SS"``
+    (rounded to the second). Values that are not numbers (headers, empty
+    cells, text) are kept as they are.
+
+    Args:
+        values: Column of values read through ``Value2``
+
+    Returns:
+        Converted column
+    """
+    if np is None:
+        return [serial_to_iso(v) if _is_serial(v) else v for v in values]
+
+    column = list(values)
+    index = [i for i, v in enumerate(column) if _is_serial(v)]
+    if not index:
+        return column
+    seconds = np.rint(np.array([column[i] for i in index], dtype=float) * _SECONDS_PER_DAY)
+    moments = np.datetime64(EXCEL_EPOCH, "s") + seconds.astype(np.int64).astype("timedelta64[s]")
+    text = np.datetime_as_string(moments, unit="s")
+    whole_days = seconds % _SECONDS_PER_DAY == 0
+    for i, iso, day in zip(index, text.tolist(), whole_days.tolist(), strict=True):
+        column[i] = iso[:10] if day else iso
+    return column
+
+
+def convert_date_columns(
+    rows: Iterable[Sequence[Any]], columns: Iterable[int]
+) -> tuple[tuple[Any, ...], ...]:
+    """Convert the date columns of a block of rows.
+
+    Args:
+        rows: Rows read through ``Value2``
+        columns: 0-based indexes of the columns holding dates
+
+    Returns:
+        Rows with the serials of those columns replaced by ISO strings
+    """
+    rows = rows if isinstance(rows, tuple) else tuple(rows)
+    columns = [c for c in columns if rows and c < len(rows[0])]
+    if not columns:
+        return rows
+    transposed = [list(column) for column in zip(*rows, strict=True)]
+    for c in columns:
+        transposed[c] = serials_to_iso(transposed[c])
+    return tuple(zip(*transposed, strict=True))
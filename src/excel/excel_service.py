@@ -4,22 +4,97 @@ This service provides comprehensive Excel automation capabilities following
 SOLID principles and design patterns.
 """
 
+import codecs
+import csv
+import json
+import math
+import os
+import tempfile
+import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from win32com.client import constants as win_constants
-
-from ..core.base_office import BaseOfficeService, DocumentOperationMixin
+from ..core.base_office import (
+    ApplicationFactory,
+    BaseOfficeService,
+    DocumentOperationMixin,
+    in_fast_mode,
+)
+from ..core.exceptions import InvalidParameterError
 from ..core.types import ApplicationType
 from ..utils.com_wrapper import COMConstants, com_safe, rgb_to_office_color
 from ..utils.helpers import dict_to_result, ensure_directory_exists
 from ..utils.validators import (
+    validate_bool,
     validate_cell_address,
+    validate_choice,
     validate_file_path,
+    validate_json_argument,
     validate_positive_number,
     validate_range_address,
     validate_string_not_empty,
 )
+from .aggregate import ResultCache, aggregate, data_digest, parse_spec
+from .bulk_replace import (
+    DEFAULT_WORKERS,
+    ENGINES,
+    WORKBOOK_EXTENSIONS,
+    XML_EXTENSIONS,
+    FileResult,
+    parse_pairs,
+    replace_in_sheet,
+    replace_in_xlsx,
+    resolve_files,
+    run_excel_pool,
+)
+from .columnar import build_columns, resolve_format, write_columns
+from .csv_import import CsvSource
+from .dates import convert_date_columns, is_date_format
+from .formatting import apply_call, parse_entries, plan_calls
+from .range_io import (
+    DEFAULT_BLOCK_ROWS,
+    DEFAULT_CHUNK_BYTES,
+    block_address,
+    csv_field,
+    iter_range_blocks,
+    parse_payload,
+    range_bounds,
+    read_source_rows,
+    resolve_columns,
+    sample_date_columns,
+    spill_rows,
+    used_range_address,
+    write_rows,
+)
+from .solver import (
+    DEFAULT_MAX_EVALUATIONS,
+    DEFAULT_TOLERANCE,
+    SOLVER_GOALS,
+    WorkbookFunction,
+    parse_bounds,
+    solve,
+    variable_blocks,
+)
+from .sweep import (
+    CHUNKS_PER_WORKER,
+    evaluate_points,
+    parse_inputs,
+    run_sweep_pool,
+    sweep_points,
+)
+from .workbook_diff import (
+    CHANGE_KINDS,
+    DEFAULT_MAX_CHANGES,
+    Change,
+    SheetDiff,
+    SheetGrid,
+    compare_sheets,
+    read_sheet_com,
+    read_sheet_xlsx,
+)
+from .xlsx_reader import XlsxReader
+from .xlsx_writer import XlsxWriter
 
 
 class ExcelService(BaseOfficeService, DocumentOperationMixin):
@@ -44,9 +119,21 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
     - Advanced features (14 methods)
     """
 
-    def __init__(self, visible: bool = False) -> None:
+    def __init__(
+        self, visible: bool = False, application_factory: ApplicationFactory | None = None
+    ) -> None:
         """Initialize Excel service."""
-        super().__init__(ApplicationType.EXCEL, visible)
+        super().__init__(ApplicationType.EXCEL, visible, application_factory)
+        #: Results of aggregate_range, per range and data version
+        self._aggregates = ResultCache()
+
+    def _fast_mode_settings(self) -> dict[str, Any]:
+        """Suspend repainting, automatic recalculation and events."""
+        return {
+            "ScreenUpdating": False,
+            "Calculation": COMConstants.XL_CALCULATION_MANUAL,
+            "EnableEvents": False,
+        }
 
     def _close_document(self) -> None:
         """Close the current workbook."""
@@ -124,6 +211,84 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
             saved=save_changes,
         )
 
+    @com_safe("create_workbook_offline")
+    def create_workbook_offline(
+        self,
+        output_path: str,
+        values: Any = None,
+        source_path: str | None = None,
+        sheet_name: str = "Sheet1",
+        header: bool = False,
+        column_formats: Any = None,
+        column_widths: Any = None,
+        data_format: str = "auto",
+        inline_strings: bool = False,
+        open_after: bool = False,
+    ) -> dict[str, Any]:
+        """Write a workbook from tabular data without Excel.
+
+        Rows are streamed to the .xlsx file one at a time, so source files of
+        millions of rows are written at disk speed in constant memory.
+
+        Args:
+            output_path: Destination .xlsx file
+            values: Rows, a mapping of column name to values, or their JSON
+                or CSV text (see write_range_bulk)
+            source_path: .csv or JSON Lines file to stream instead of values
+            sheet_name: Worksheet name
+            header: Write the first row in bold
+            column_formats: Number format per column (letter or 1-based
+                number), or a list of formats in column order
+            column_widths: Width per column, or a list in column order
+            data_format: Format of values ("auto", "json", "csv" or "columns")
+            inline_strings: Write strings inline instead of in the shared
+                string table (constant memory with many distinct strings)
+            open_after: Open the workbook in Excel afterwards (e.g. to add
+                charts or pivot tables)
+
+        Returns:
+            Result dictionary with the file, the row count and the throughput
+        """
+        path = validate_file_path(output_path, extensions=[".xlsx"])
+        if (values is None) == (source_path is None):
+            raise InvalidParameterError("values", values, "Provide either values or source_path")
+        if source_path is not None:
+            source = validate_file_path(source_path, must_exist=True)
+            rows = read_source_rows(source)
+        else:
+            rows = iter(parse_payload(values, data_format))
+        if column_formats is not None:
+            column_formats = validate_json_argument("column_formats", column_formats, object)
+        if column_widths is not None:
+            column_widths = validate_json_argument("column_widths", column_widths, object)
+
+        ensure_directory_exists(path)
+        start = time.perf_counter()
+        shared_strings = not validate_bool("inline_strings", inline_strings)
+        with XlsxWriter(path, shared_strings=shared_strings) as writer:
+            writer.add_sheet(sheet_name, column_formats, column_widths)
+            if validate_bool("header", header):
+                first = next(rows, None)
+                if first is not None:
+                    writer.write_row(first, bold=True)
+            writer.write_rows(rows)
+        elapsed = time.perf_counter() - start
+
+        result = dict_to_result(
+            success=True,
+            message=f"{writer.rows_written} rows written to {path}",
+            output_path=str(path),
+            sheet_name=sheet_name,
+            rows=writer.rows_written,
+            seconds=round(elapsed, 6),
+            rows_per_second=round(writer.rows_written / elapsed) if elapsed > 0 else None,
+            file_size=path.stat().st_size,
+            opened=validate_bool("open_after", open_after),
+        )
+        if result["opened"]:
+            result["workbook_name"] = self.open_workbook(str(path))["workbook_name"]
+        return result
+
     @com_safe("export_to_pdf")
     def export_to_pdf(self, output_path: str) -> dict[str, Any]:
         """Export workbook to PDF."""
@@ -139,12 +304,36 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message="Workbook exported to PDF", pdf_path=str(path))
 
     @com_safe("convert_to_csv")
-    def convert_to_csv(self, output_path: str) -> dict[str, Any]:
-        """Convert workbook to CSV."""
+    def convert_to_csv(
+        self, output_path: str, file_path: str | None = None, sheet_name: str | None = None
+    ) -> dict[str, Any]:
+        """Convert workbook to CSV.
+
+        Args:
+            output_path: Destination .csv file
+            file_path: Workbook to convert instead of the current one (read
+                directly, without Excel, unless Excel has it open)
+            sheet_name: Worksheet to convert (the active one by default)
+
+        Returns:
+            Dictionary with the CSV file path
+        """
         path = validate_file_path(output_path, extensions=[".csv"])
         ensure_directory_exists(path)
 
-        wb = self.current_document
+        wb, reader = self._workbook_or_reader(file_path)
+        if reader is not None:
+            sheet = sheet_name or reader.active_sheet or reader.sheet_names[0]
+            with path.open("w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                for row in reader.iter_rows(sheet, dates="iso"):
+                    writer.writerow([csv_field(v) for v in row])
+            return dict_to_result(
+                success=True, message="Workbook converted to CSV", csv_path=str(path), engine="xlsx"
+            )
+
+        if sheet_name:
+            wb.Worksheets(sheet_name).Activate()
         wb.SaveAs(str(path), FileFormat=COMConstants.XL_FILE_FORMAT_CSV)
 
         return dict_to_result(success=True, message="Workbook converted to CSV", csv_path=str(path))
@@ -177,7 +366,7 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         ensure_directory_exists(path)
 
         wb = self.current_document
-        wb.SaveAs(str(path), FileFormat=win_constants.xlOpenXMLTemplate)
+        wb.SaveAs(str(path), FileFormat=COMConstants.XL_FILE_FORMAT_XLTX)
 
         return dict_to_result(
             success=True,
@@ -310,6 +499,7 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message=f"Cell {cell_addr} updated", cell=cell_addr)
 
     @com_safe("write_range")
+    @in_fast_mode
     def write_range(
         self, sheet_name: str, range_addr: str, values: list[list[Any]]
     ) -> dict[str, Any]:
@@ -323,29 +513,179 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
 
         return dict_to_result(success=True, message=f"Range {range_address} updated")
 
+    @com_safe("write_range_bulk")
+    def write_range_bulk(
+        self,
+        sheet_name: str,
+        start_cell: str,
+        values: Any,
+        data_format: str = "auto",
+        chunk_bytes: int | None = None,
+    ) -> dict[str, Any]:
+        """Write a large 2D payload from its top-left cell.
+
+        The destination range is inferred from the shape of the payload, which
+        is written in chunks of whole rows (one Value2 assignment per chunk)
+        with screen updating, recalculation and events suspended.
+
+        Args:
+            sheet_name: Worksheet name
+            start_cell: Top-left cell of the destination (A1)
+            values: Rows, a mapping of column name to values, or their JSON or
+                CSV text
+            data_format: "auto", "json", "csv" or "columns"
+            chunk_bytes: Estimated size of the array sent per COM call
+
+        Returns:
+            Result dictionary with the range written and the throughput
+        """
+        validate_string_not_empty("sheet_name", sheet_name)
+        anchor = validate_cell_address(start_cell)
+        first_row, first_col, _, _ = range_bounds(f"{anchor}:{anchor}")
+        chunk_bytes = validate_positive_number(
+            "chunk_bytes", int(chunk_bytes) if chunk_bytes is not None else DEFAULT_CHUNK_BYTES
+        )
+        rows = parse_payload(values, data_format)
+
+        ws = self.current_document.Worksheets(sheet_name)
+        start = time.perf_counter()
+        with self.fast_mode():
+            written = write_rows(ws, first_row, first_col, rows, chunk_bytes)
+        elapsed = time.perf_counter() - start
+
+        range_address = block_address(
+            first_row, first_col, first_row + written.rows - 1, first_col + written.columns - 1
+        )
+        return dict_to_result(
+            success=True,
+            message=f"Range {range_address} updated",
+            range=range_address,
+            rows=written.rows,
+            columns=written.columns,
+            cells=written.rows * written.columns,
+            chunks=written.chunks,
+            seconds=round(elapsed, 6),
+            rows_per_second=round(written.rows / elapsed) if elapsed > 0 else None,
+        )
+
     @com_safe("read_cell")
-    def read_cell(self, sheet_name: str, cell: str) -> dict[str, Any]:
-        """Read value from a cell."""
+    def read_cell(
+        self, sheet_name: str, cell: str, raw: bool = False, file_path: str | None = None
+    ) -> dict[str, Any]:
+        """Read value from a cell.
+
+        Args:
+            sheet_name: Worksheet name
+            cell: Cell address (A1)
+            raw: Read Value2, converting the value to an ISO string if the
+                cell has a date format
+            file_path: Workbook to read instead of the current one (read
+                directly, without Excel, unless Excel has it open)
+
+        Returns:
+            Dictionary with the value
+        """
         validate_string_not_empty("sheet_name", sheet_name)
         cell_addr = validate_cell_address(cell)
 
-        wb = self.current_document
-        ws = wb.Worksheets(sheet_name)
-        value = ws.Range(cell_addr).Value
+        raw = validate_bool("raw", raw)
+        wb, reader = self._workbook_or_reader(file_path)
+        if reader is not None:
+            row, col, _, _ = range_bounds(f"{cell_addr}:{cell_addr}")
+            rows = reader.iter_rows(sheet_name, (row, col, row, col), "iso" if raw else "datetime")
+            value = next(rows, (None,))[0]
+            return dict_to_result(
+                success=True,
+                message="Cell value retrieved",
+                cell=cell_addr,
+                value=value,
+                engine="xlsx",
+            )
+
+        ws = wb.Worksheets(sheet_name)
+        if raw:
+            cell_range = ws.Range(cell_addr)
+            value = cell_range.Value2
+            if is_date_format(cell_range.NumberFormat):
+                value = convert_date_columns(((value,),), [0])[0][0]
+        else:
+            value = ws.Range(cell_addr).Value
 
         return dict_to_result(
             success=True, message="Cell value retrieved", cell=cell_addr, value=value
         )
 
     @com_safe("read_range")
-    def read_range(self, sheet_name: str, range_addr: str) -> dict[str, Any]:
-        """Read values from a range."""
+    def read_range(
+        self,
+        sheet_name: str,
+        range_addr: str,
+        page_size: int | None = None,
+        block_rows: int | None = None,
+        spill_path: str | None = None,
+        raw: bool = False,
+        date_columns: Any = None,
+        file_path: str | None = None,
+    ) -> dict[str, Any]:
+        """Read values from a range.
+
+        Args:
+            sheet_name: Worksheet name
+            range_addr: Range address (A1:B10)
+            page_size: Return the rows in pages of this size, with a cursor
+                for server_next_page
+            block_rows: Stream the range in blocks of this many rows (one
+                Value2 call per block, dates as serial numbers)
+            spill_path: Stream the rows to this file (.csv, or JSON Lines
+                otherwise) instead of returning them
+            raw: Read Value2 and convert the date columns to ISO strings
+            date_columns: Date columns for raw reads (letters or 1-based
+                positions in the range); sampled from NumberFormat if omitted
+            file_path: Workbook to read instead of the current one (read
+                directly, without Excel, unless Excel has it open)
+
+        Returns:
+            Dictionary with the values, a page of them, or the spill file
+        """
         validate_string_not_empty("sheet_name", sheet_name)
         range_address = validate_range_address(range_addr)
+        raw = validate_bool("raw", raw)
+
+        wb, reader = self._workbook_or_reader(file_path)
+        if reader is not None:
+            # Date cells are known from the styles of the file: no sampling needed
+            rows = reader.iter_rows(
+                sheet_name, range_bounds(range_address), "iso" if raw else "datetime"
+            )
+            return self._rows_result(rows, range_address, page_size, spill_path, engine="xlsx")
+
+        ws = wb.Worksheets(sheet_name)
+        dates = self._date_columns(ws, range_address, date_columns) if raw else []
+
+        if block_rows or spill_path:
+            block_rows = validate_positive_number(
+                "block_rows", int(block_rows or DEFAULT_BLOCK_ROWS)
+            )
+            # Blocks are read as the rows are consumed
+            rows = (
+                row
+                for block in iter_range_blocks(ws, range_address, block_rows)
+                for row in convert_date_columns(block, dates)
+            )
+            return self._rows_result(rows, range_address, page_size, spill_path)
+
+        if raw:
+            values = ws.Range(range_address).Value2
+            values = convert_date_columns(
+                values if isinstance(values, tuple) else ((values,),), dates
+            )
+        else:
+            values = ws.Range(range_address).Value
 
-        wb = self.current_document
-        ws = wb.Worksheets(sheet_name)
-        values = ws.Range(range_address).Value
+        if page_size:
+            # Pages are served from this snapshot, without reading the range again
+            rows = values if isinstance(values, tuple) else ((values,),)
+            return self.pages.page(rows, page_size, key="values", range=range_address)
 
         return dict_to_result(
             success=True,
@@ -354,7 +694,68 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
             values=values,
         )
 
+    def _rows_result(
+        self,
+        rows: Iterator[tuple[Any, ...]],
+        range_address: str,
+        page_size: int | None,
+        spill_path: str | None,
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """Return streamed rows as a spill file, a first page, or all at once."""
+        if spill_path:
+            path = validate_file_path(spill_path)
+            ensure_directory_exists(path)
+            count = spill_rows(rows, path)
+            return dict_to_result(
+                success=True,
+                message=f"{count} rows written to {path}",
+                range=range_address,
+                rows=count,
+                spill_path=str(path),
+                **fields,
+            )
+        if page_size:
+            return self.pages.page(rows, page_size, key="values", range=range_address, **fields)
+        return dict_to_result(
+            success=True,
+            message="Range values retrieved",
+            range=range_address,
+            values=tuple(rows),
+            **fields,
+        )
+
+    def _workbook_or_reader(self, file_path: str | None) -> tuple[Any, XlsxReader | None]:
+        """Source of a read-only tool: a workbook, or an offline reader of file_path.
+
+        Without file_path the current workbook is used. A file_path open in
+        Excel is read from that workbook; any other file is parsed directly,
+        without starting Excel.
+        """
+        if not file_path:
+            return self.current_document, None
+        path = validate_file_path(file_path, must_exist=True, extensions=[".xlsx", ".xlsm"])
+        wb = self._open_workbook(path) if self.is_initialized else None
+        return (wb, None) if wb is not None else (None, XlsxReader(path))
+
+    def _open_workbook(self, path: Path) -> Any:
+        """The workbook of a file if it is open in Excel, else None."""
+        target = os.path.normcase(os.path.abspath(path))
+        for wb in self.application.Workbooks:
+            if os.path.normcase(os.path.abspath(wb.FullName)) == target:
+                return wb
+        return None
+
+    @staticmethod
+    def _date_columns(ws: Any, range_address: str, date_columns: Any) -> list[int]:
+        """Indexes of the date columns of a raw read (given, or sampled from NumberFormat)."""
+        if date_columns is None:
+            return sample_date_columns(ws, range_address)
+        _, first_col, _, last_col = range_bounds(range_address)
+        return resolve_columns(date_columns, first_col, last_col - first_col + 1)
+
     @com_safe("copy_paste_cells")
+    @in_fast_mode
     def copy_paste_cells(
         self, sheet_name: str, source_range: str, dest_range: str
     ) -> dict[str, Any]:
@@ -372,6 +773,7 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message=f"Copied {source} to {dest}")
 
     @com_safe("clear_contents")
+    @in_fast_mode
     def clear_contents(self, sheet_name: str, range_addr: str) -> dict[str, Any]:
         """Clear cell contents."""
         validate_string_not_empty("sheet_name", sheet_name)
@@ -384,6 +786,7 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message=f"Range {range_address} cleared")
 
     @com_safe("find_and_replace")
+    @in_fast_mode
     def find_and_replace(
         self, sheet_name: str, find_text: str, replace_text: str
     ) -> dict[str, Any]:
@@ -394,9 +797,205 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         wb = self.current_document
         ws = wb.Worksheets(sheet_name)
 
-        ws.Cells.Replace(What=find_text, Replacement=replace_text)
+        (count,) = replace_in_sheet(ws, parse_pairs([(find_text, replace_text)]))
+
+        return dict_to_result(
+            success=True, message=f"{count} replacements made", replacements=count
+        )
+
+    @com_safe("bulk_find_replace")
+    def bulk_find_replace(
+        self,
+        path: str,
+        pairs: Any,
+        match_case: Any = False,
+        engine: str = "auto",
+        workers: int | None = None,
+        output_dir: str | None = None,
+    ) -> dict[str, Any]:
+        """Find and replace in every sheet of many workbooks.
+
+        With the ``auto`` engine, .xlsx/.xlsm files are rewritten directly
+        (strings only, without Excel) when no formula or number matches and,
+        if strings change, when the workbook holds no formula whose result
+        could depend on them; the other files are spread over a pool of
+        separate Excel processes. The ``xml`` engine rewrites such workbooks
+        too, flagged to be fully recalculated when Excel next opens them. The
+        open document of the service is not touched.
+
+        Args:
+            path: Directory (searched recursively) or glob of workbooks
+            pairs: List (or JSON text) of ``{"find": ..., "replace": ...}``
+                applied in order
+            match_case: Whether the search is case-sensitive
+            engine: auto, xml (never start Excel; formulas are recalculated
+                when Excel next opens the workbook) or excel (always)
+            workers: Number of Excel processes (default 4)
+            output_dir: Directory receiving the modified copies (in place by default)
+
+        Returns:
+            Result dictionary with the replacements per file and per pair
+        """
+        validate_string_not_empty("path", path)
+        if engine not in ENGINES:
+            raise InvalidParameterError("engine", engine, f"Expected one of {', '.join(ENGINES)}")
+        parsed = parse_pairs(
+            validate_json_argument("pairs", pairs, list),
+            validate_bool("match_case", match_case),
+        )
+        workers = validate_positive_number(
+            "workers", int(workers) if workers is not None else DEFAULT_WORKERS
+        )
+        files = resolve_files(path)
+        root = Path(path)
+        if not root.is_dir():
+            root = Path(os.path.commonpath([f.parent for f in files]))
+        outputs = {
+            f: ensure_directory_exists(Path(output_dir) / f.relative_to(root)) if output_dir else f
+            for f in files
+        }
+
+        start = time.perf_counter()
+        results: list[FileResult] = []
+        for_excel = []
+        for f in files:
+            if engine == "excel" or f.suffix.lower() not in XML_EXTENSIONS:
+                for_excel.append(f)
+                continue
+            counts, reason = replace_in_xlsx(f, parsed, outputs[f], engine == "xml")
+            if reason is None:
+                results.append(FileResult(str(f), "xml", tuple(counts)))
+            elif engine == "xml":
+                results.append(FileResult(str(f), "xml", (0,) * len(parsed), reason))
+            else:
+                for_excel.append(f)
+        if for_excel:
+            results += run_excel_pool(
+                [(f, outputs[f]) for f in for_excel],
+                parsed,
+                lambda factory: ExcelService(application_factory=factory),
+                self.application_factory,
+                workers,
+            )
+        elapsed = time.perf_counter() - start
+
+        results.sort(key=lambda r: r.file)
+        totals = [sum(r.counts[i] for r in results) for i in range(len(parsed))]
+        failed = sum(1 for r in results if r.error)
+        return dict_to_result(
+            success=not failed,
+            message=(
+                f"{sum(totals)} replacements in {len(files) - failed} workbooks"
+                + (f", {failed} failed" if failed else "")
+            ),
+            files=[r.to_dict() for r in results],
+            replacements=sum(totals),
+            counts=[
+                {"find": pair.find, "replace": pair.replace, "replacements": total}
+                for pair, total in zip(parsed, totals, strict=True)
+            ],
+            excel_files=len(for_excel),
+            seconds=round(elapsed, 6),
+        )
 
-        return dict_to_result(success=True, message="Find and replace completed")
+    @com_safe("compare_workbooks")
+    def compare_workbooks(
+        self,
+        old_path: str,
+        new_path: str,
+        sheets: Any = None,
+        max_changes: int | None = None,
+    ) -> dict[str, Any]:
+        """Compare the values and formulas of two workbooks, cell by cell.
+
+        Worksheets are matched by name and their cells by address. Workbooks
+        open in Excel are read from Excel (unsaved changes included); other
+        .xlsx/.xlsm files are parsed without starting Excel, and .xls files
+        are opened read-only for the comparison.
+
+        Args:
+            old_path: Reference workbook
+            new_path: Workbook compared to it
+            sheets: Worksheet names to compare (list or JSON text; all by default)
+            max_changes: Changes listed (default 1000); the counts cover all changes
+
+        Returns:
+            Result dictionary with the summary per sheet, the change counts and
+            the (cell, kind, old, new) change list
+        """
+        paths = [
+            validate_file_path(p, must_exist=True, extensions=[".xlsx", ".xlsm", ".xls"])
+            for p in (old_path, new_path)
+        ]
+        names = validate_json_argument("sheets", sheets, list) if sheets is not None else None
+        max_changes = validate_positive_number(
+            "max_changes", int(max_changes) if max_changes is not None else DEFAULT_MAX_CHANGES
+        )
+
+        start = time.perf_counter()
+        old, new = (self._read_sheets(path, names) for path in paths)
+        read_seconds = time.perf_counter() - start
+
+        summaries: list[SheetDiff] = []
+        changes: list[Change] = []
+        for name in [*old, *(n for n in new if n not in old)]:
+            if name not in new:
+                summaries.append(SheetDiff(name, "removed", old[name].cells, {}))
+            elif name not in old:
+                summaries.append(SheetDiff(name, "added", new[name].cells, {}))
+            else:
+                summary, sheet_changes = compare_sheets(name, old[name], new[name])
+                summaries.append(summary)
+                changes.extend(sheet_changes)
+        elapsed = time.perf_counter() - start
+
+        counts = {kind: sum(s.counts.get(kind, 0) for s in summaries) for kind in CHANGE_KINDS}
+        changed_sheets = sum(1 for s in summaries if s.status != "unchanged")
+        return dict_to_result(
+            success=True,
+            message=(
+                f"{len(changes)} cells differ"
+                + (f" in {changed_sheets} of {len(summaries)} worksheets" if summaries else "")
+            ),
+            identical=not changed_sheets,
+            sheets=[s.to_dict() for s in summaries],
+            changes=[c.to_dict() for c in changes[:max_changes]],
+            total_changes=len(changes),
+            truncated=len(changes) > max_changes,
+            cells_compared=sum(s.cells for s in summaries if s.status in ("changed", "unchanged")),
+            read_seconds=round(read_seconds, 6),
+            seconds=round(elapsed, 6),
+            **counts,
+        )
+
+    def _read_sheets(self, path: Path, names: list[str] | None) -> dict[str, SheetGrid]:
+        """Read the worksheets of a workbook for a comparison.
+
+        Raises:
+            InvalidParameterError: If a requested worksheet does not exist
+        """
+        opened = False
+        if path.suffix.lower() == ".xls":
+            if not self.is_initialized:
+                self.initialize()
+            wb, reader = self._open_workbook(path), None
+            opened = wb is None
+            if opened:
+                wb = self.application.Workbooks.Open(str(path), ReadOnly=True, UpdateLinks=0)
+        else:
+            wb, reader = self._workbook_or_reader(str(path))
+        try:
+            available = reader.sheet_names if reader else [ws.Name for ws in wb.Worksheets]
+            for name in names or []:
+                if name not in available:
+                    raise InvalidParameterError("sheets", name, f"Not a worksheet of {path.name}")
+            selected = [name for name in available if names is None or name in names]
+            if reader:
+                return {name: read_sheet_xlsx(reader, name) for name in selected}
+            return {name: read_sheet_com(wb.Worksheets(name)) for name in selected}
+        finally:
+            if opened:
+                wb.Close(SaveChanges=False)
 
     # ========================================================================
     # FORMULAS AND CALCULATIONS (5 methods)
@@ -479,6 +1078,7 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
     # ========================================================================
 
     @com_safe("set_number_format")
+    @in_fast_mode
     def set_number_format(
         self, sheet_name: str, range_addr: str, format_code: str
     ) -> dict[str, Any]:
@@ -521,6 +1121,7 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message="Font color set")
 
     @com_safe("set_borders")
+    @in_fast_mode
     def set_borders(
         self, sheet_name: str, range_addr: str, border_style: int = 1
     ) -> dict[str, Any]:
@@ -560,6 +1161,43 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
 
         return dict_to_result(success=True, message="Alignment set")
 
+    @com_safe("apply_formatting_batch")
+    @in_fast_mode
+    def apply_formatting_batch(self, sheet_name: str, entries: Any) -> dict[str, Any]:
+        """Apply many formatting entries with as few COM calls as possible.
+
+        The entries are decomposed into single properties, the ranges ending
+        with the same value of a property are merged into multi-area
+        addresses, and each value is set once per address. The result is the
+        same as applying the entries one after the other.
+
+        Args:
+            sheet_name: Worksheet name
+            entries: List (or JSON text) of ``{"range": "A1:B2", "style": {...}}``;
+                style keys: fill, font_color ([r, g, b] or "#RRGGBB"), bold,
+                italic, font_size, font_name, number_format, horizontal,
+                vertical, wrap, borders (line style of every cell border)
+
+        Returns:
+            Result dictionary with the number of range calls and property sets
+        """
+        validate_string_not_empty("sheet_name", sheet_name)
+        parsed = parse_entries(validate_json_argument("entries", entries, list), sheet_name)
+        calls = plan_calls(parsed)
+
+        ws = self.current_document.Worksheets(sheet_name)
+        properties = sum(apply_call(ws, call) for call in calls)
+
+        requested = sum(len(entry.refs) * len(entry.properties) for entry in parsed)
+        return dict_to_result(
+            success=True,
+            message=f"{len(parsed)} formatting entries applied in {len(calls)} range calls",
+            entries=len(parsed),
+            range_calls=len(calls),
+            property_sets=properties,
+            property_sets_requested=requested,
+        )
+
     @com_safe("set_wrap_text")
     def set_wrap_text(self, sheet_name: str, range_addr: str, wrap: bool = True) -> dict[str, Any]:
         """Set text wrapping."""
@@ -609,6 +1247,7 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message=f"Row {row} height set to {height_value}")
 
     @com_safe("conditional_formatting")
+    @in_fast_mode
     def conditional_formatting(
         self, sheet_name: str, range_addr: str, condition_type: int, **kwargs: Any
     ) -> dict[str, Any]:
@@ -694,6 +1333,7 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message="Table filtered")
 
     @com_safe("sort_table")
+    @in_fast_mode
     def sort_table(
         self, sheet_name: str, table_name: str, column: int, ascending: bool = True
     ) -> dict[str, Any]:
@@ -1078,11 +1718,114 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
 
         return dict_to_result(success=True, message="Pivot table refreshed")
 
+    @com_safe("aggregate_range")
+    def aggregate_range(
+        self,
+        sheet_name: str,
+        range_addr: str,
+        aggregations: Any,
+        group_by: Any = None,
+        has_headers: Any = True,
+        dest_sheet: str | None = None,
+        dest_cell: str | None = None,
+        file_path: str | None = None,
+    ) -> dict[str, Any]:
+        """Group the rows of a range and aggregate columns, without a pivot table.
+
+        The range is read once in bulk and aggregated in Python; the workbook
+        is not modified unless dest_cell is given. Results are cached per
+        range and data version: the content of the range for an open
+        workbook (the aggregation is skipped when it has not changed), the
+        file modification time for file_path (the read is skipped too).
+
+        Args:
+            sheet_name: Worksheet name
+            range_addr: Source range (A1:D1000), header row included
+            aggregations: List (or JSON text) of ``{"column": ..., "function": ...}``;
+                functions: sum, count, mean, min, max, distinct (count of
+                distinct values); columns by header, letter or 1-based position
+            group_by: Group columns (list or comma-separated); grand totals if omitted
+            has_headers: Whether the first row of the range holds headers
+            dest_sheet: Worksheet receiving the result (sheet_name by default)
+            dest_cell: Top-left cell where the result is written in one block write
+            file_path: Workbook to read instead of the current one (read
+                directly, without Excel, unless Excel has it open)
+
+        Returns:
+            Result dictionary with the result columns and rows, one per group
+        """
+        validate_string_not_empty("sheet_name", sheet_name)
+        range_address = validate_range_address(range_addr)
+        has_headers = validate_bool("has_headers", has_headers)
+        aggregations = validate_json_argument("aggregations", aggregations, list)
+        if isinstance(group_by, str) and group_by.lstrip().startswith("["):
+            group_by = validate_json_argument("group_by", group_by, list)
+        anchor = validate_cell_address(dest_cell) if dest_cell else None
+
+        start = time.perf_counter()
+        wb, reader = self._workbook_or_reader(file_path)
+        if anchor and reader is not None:
+            raise InvalidParameterError(
+                "dest_cell", anchor, "Results can only be written to a workbook open in Excel"
+            )
+        query = json.dumps([group_by, aggregations, has_headers], sort_keys=True, default=str)
+        rows = None
+        if reader is not None:
+            stat = reader.path.stat()
+            version = (stat.st_mtime_ns, stat.st_size)
+            key = (str(reader.path), sheet_name, range_address, query, version)
+        else:
+            ws = wb.Worksheets(sheet_name)
+            rows = [
+                row
+                for block in iter_range_blocks(ws, range_address, DEFAULT_BLOCK_ROWS)
+                for row in block
+            ]
+            key = (wb.FullName, sheet_name, range_address, query, data_digest(rows))
+
+        cached = self._aggregates.get(key)
+        hit = cached is not None
+        if not hit:
+            if rows is None:
+                rows = list(reader.iter_rows(sheet_name, range_bounds(range_address), "serial"))
+            _, first_col, _, last_col = range_bounds(range_address)
+            header = rows[0] if has_headers and rows else None
+            spec = parse_spec(group_by, aggregations, header, first_col, last_col - first_col + 1)
+            data = rows[1:] if has_headers else rows
+            cached = (*aggregate(data, spec), len(data))
+            self._aggregates.put(key, cached)
+        columns, result_rows, source_rows = cached
+        elapsed = time.perf_counter() - start
+
+        fields: dict[str, Any] = {}
+        if anchor:
+            dest_ws = wb.Worksheets(dest_sheet or sheet_name)
+            first_row, first_col, _, _ = range_bounds(f"{anchor}:{anchor}")
+            block = [list(columns), *(list(row) for row in result_rows)]
+            with self.fast_mode():
+                written = write_rows(dest_ws, first_row, first_col, block, DEFAULT_CHUNK_BYTES)
+            fields["written_range"] = block_address(
+                first_row, first_col, first_row + written.rows - 1, first_col + written.columns - 1
+            )
+
+        return dict_to_result(
+            success=True,
+            message=f"{len(result_rows)} groups aggregated from {source_rows} rows",
+            columns=columns,
+            rows=result_rows,
+            groups=len(result_rows),
+            source_rows=source_rows,
+            cached=hit,
+            seconds=round(elapsed, 6),
+            **fields,
+        )
+
     # ========================================================================
     # SORT AND FILTERS (4 methods)
     # ========================================================================
 
     @com_safe("sort_ascending")
+    @in_fast_mode
     def sort_ascending(
         self, sheet_name: str, range_addr: str, key_column: int = 1
     ) -> dict[str, Any]:
@@ -1099,6 +1842,7 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message="Sorted in ascending order")
 
     @com_safe("sort_descending")
+    @in_fast_mode
     def sort_descending(
         self, sheet_name: str, range_addr: str, key_column: int = 1
     ) -> dict[str, Any]:
@@ -1436,19 +2180,193 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
 
         return dict_to_result(success=True, message="Goal seek completed")
 
-    @com_safe("use_solver")
-    def use_solver(self, sheet_name: str, **params: Any) -> dict[str, Any]:
-        """Use Solver add-in."""
-        validate_string_not_empty("sheet_name", sheet_name)
+    @com_safe("parameter_sweep")
+    def parameter_sweep(
+        self,
+        sheet_name: str,
+        inputs: Any,
+        outputs: Any,
+        calc_range: str | None = None,
+        workers: int | None = None,
+    ) -> dict[str, Any]:
+        """Evaluate output cells over a grid of input values.
+
+        Every combination of the input values is written to the input cells
+        in one loop under manual calculation, and the outputs are read back
+        after each recalculation. The input cells are restored afterwards.
+
+        Args:
+            sheet_name: Worksheet holding the input and output cells
+            inputs: List (or JSON text) of ``{"cell": ..., "values": [...]}``, or
+                ``{"cell": ..., "start": ..., "stop": ..., "step": ...}`` (stop included)
+            outputs: Output cells (list or comma-separated)
+            calc_range: Range recalculated after each point with Range.Calculate
+                (the formulas between the inputs and the outputs); by default
+                the cells made dirty by the inputs are recalculated
+            workers: Excel processes sharing the points, each opening a copy of
+                the workbook (1 by default: the workbook itself)
+
+        Returns:
+            Result dictionary with one row per point: input values then outputs
+        """
+        validate_string_not_empty("sheet_name", sheet_name)
+        parsed = parse_inputs(validate_json_argument("inputs", inputs, list))
+        if isinstance(outputs, str) and not outputs.lstrip().startswith("["):
+            outputs = outputs.split(",")
+        outputs = validate_json_argument("outputs", outputs, list)
+        output_cells = [validate_cell_address(str(c).strip()) for c in outputs if str(c).strip()]
+        if not output_cells:
+            raise InvalidParameterError("outputs", "[]", "At least one output cell is required")
+        calc_address = validate_range_address(calc_range) if calc_range else None
+        workers = validate_positive_number("workers", int(workers) if workers is not None else 1)
+
+        wb = self.current_document
+        input_cells = [i.cell for i in parsed]
+        points = sweep_points(parsed)
+        workers = min(workers, len(points))
+
+        start = time.perf_counter()
+        if workers == 1:
+            ws = wb.Worksheets(sheet_name)
+            with self.fast_mode():
+                results = evaluate_points(
+                    self.application, ws, input_cells, output_cells, points, calc_address
+                )
+        else:
+            size = math.ceil(len(points) / (workers * CHUNKS_PER_WORKER))
+            chunks = [points[i : i + size] for i in range(0, len(points), size)]
+            suffix = Path(wb.FullName).suffix.lower()
+            if suffix not in WORKBOOK_EXTENSIONS:
+                suffix = ".xlsx"
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / f"sweep{suffix}"
+                wb.SaveCopyAs(str(path))
+                results = run_sweep_pool(
+                    path,
+                    sheet_name,
+                    input_cells,
+                    output_cells,
+                    chunks,
+                    calc_address,
+                    lambda factory: ExcelService(application_factory=factory),
+                    self.application_factory,
+                    workers,
+                )
+        elapsed = time.perf_counter() - start
 
-        # Solver requires add-in to be loaded
-        # This is a placeholder for solver functionality
         return dict_to_result(
             success=True,
-            message="Solver functionality requires Excel Solver add-in",
+            message=f"{len(points)} points evaluated",
+            columns=[*input_cells, *output_cells],
+            rows=[[*point, *values] for point, values in zip(points, results, strict=True)],
+            points=len(points),
+            workers=workers,
+            seconds=round(elapsed, 6),
+        )
+
+    @com_safe("use_solver")
+    def use_solver(
+        self,
+        sheet_name: str,
+        objective_cell: str,
+        variable_cells: Any,
+        goal: str = "min",
+        target: float | None = None,
+        bounds: Any = None,
+        max_evaluations: int | None = None,
+        tolerance: float | None = None,
+        calc_range: str | None = None,
+        keep_solution: Any = True,
+    ) -> dict[str, Any]:
+        """Optimize an objective cell by changing variable cells.
+
+        Works like Solver without the add-in: the workbook is evaluated as a
+        black box under manual calculation and searched in Python (bounded
+        pattern search, no derivatives needed). Constraints other than
+        bounds on the variables are not supported.
+
+        Args:
+            sheet_name: Worksheet holding the objective and variable cells
+            objective_cell: Cell whose value is optimized
+            variable_cells: Cells changed (``"B2:B5"``, ``"B2,D4"`` or a list)
+            goal: min, max, or value (bring the objective to target)
+            target: Target value of the value goal
+            bounds: ``[low, high]`` for every variable, or one pair per
+                variable (None for no limit)
+            max_evaluations: Workbook evaluations allowed (1000 by default)
+            tolerance: Step size at which the search stops (1e-6 by default,
+                relative to values above 1)
+            calc_range: Range recalculated after each change with
+                Range.Calculate (the cells made dirty are recalculated by default)
+            keep_solution: Whether to leave the best values in the variable
+                cells (the starting values are restored otherwise)
+
+        Returns:
+            Result dictionary with the variable values, the objective value
+            and the evaluation statistics
+        """
+        validate_string_not_empty("sheet_name", sheet_name)
+        objective_cell = validate_cell_address(objective_cell)
+        goal = validate_choice("goal", str(goal).lower(), list(SOLVER_GOALS))
+        if goal == "value":
+            if target is None:
+                raise InvalidParameterError("target", "None", "The value goal needs a target")
+            target = float(target)
+        if isinstance(variable_cells, str) and variable_cells.lstrip().startswith("["):
+            variable_cells = validate_json_argument("variable_cells", variable_cells, list)
+        blocks = variable_blocks(variable_cells)
+        if isinstance(bounds, str):
+            bounds = validate_json_argument("bounds", bounds, list)
+        max_evaluations = validate_positive_number(
+            "max_evaluations",
+            int(max_evaluations) if max_evaluations is not None else DEFAULT_MAX_EVALUATIONS,
+        )
+        tolerance = float(tolerance) if tolerance is not None else DEFAULT_TOLERANCE
+        if not tolerance > 0:
+            raise InvalidParameterError("tolerance", tolerance, "Value must be positive")
+        calc_address = validate_range_address(calc_range) if calc_range else None
+        keep_solution = validate_bool("keep_solution", keep_solution)
+
+        wb = self.current_document
+        ws = wb.Worksheets(sheet_name)
+        with self.fast_mode():
+            function = WorkbookFunction(self.application, ws, blocks, objective_cell, calc_address)
+            cells = function.cells
+            limits = parse_bounds(bounds, len(cells))
+            start_values = function.read()
+            x0 = [v if isinstance(v, float) else 0.0 for v in start_values]
+            try:
+                result, elapsed = solve(
+                    function, x0, limits, goal, target, tolerance, max_evaluations
+                )
+            except Exception:
+                function.write(start_values)
+                raise
+            function.write(result.x if keep_solution else start_values)
+
+        objective = None if math.isnan(result.objective) else result.objective
+        if objective is None:
+            message = f"The objective cell {objective_cell} holds no number"
+        elif result.converged:
+            message = f"Solution found after {function.evaluations} evaluations"
+        else:
+            message = f"Stopped after {function.evaluations} evaluations"
+        return dict_to_result(
+            success=objective is not None,
+            message=message,
+            variables=dict(zip(cells, result.x, strict=True)),
+            objective=objective,
+            converged=result.converged,
+            iterations=result.iterations,
+            evaluations=function.evaluations,
+            cache_hits=function.cache_hits,
+            evaluations_per_second=round(function.evaluations / elapsed, 1) if elapsed else None,
+            seconds=round(elapsed, 6),
+            kept=keep_solution,
         )
 
     @com_safe("consolidate_data")
+    @in_fast_mode
     def consolidate_data(
         self,
         dest_sheet: str,
@@ -1471,6 +2389,7 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message="Data consolidated")
 
     @com_safe("create_subtotals")
+    @in_fast_mode
     def create_subtotals(
         self, sheet_name: str, range_addr: str, group_by: int, function: int = -4157
     ) -> dict[str, Any]:
@@ -1492,24 +2411,79 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message="Subtotals created")
 
     @com_safe("import_csv")
-    def import_csv(self, sheet_name: str, csv_path: str, dest_cell: str = "A1") -> dict[str, Any]:
-        """Import CSV data."""
-        validate_string_not_empty("sheet_name", sheet_name)
-        path = validate_file_path(csv_path, must_exist=True, extensions=[".csv", ".txt"])
-        cell_addr = validate_cell_address(dest_cell)
-
-        wb = self.current_document
-        ws = wb.Worksheets(sheet_name)
-
-        qt = ws.QueryTables.Add(
-            Connection=f"TEXT;{path}",
-            Destination=ws.Range(cell_addr),
+    def import_csv(
+        self,
+        sheet_name: str,
+        csv_path: str,
+        dest_cell: str = "A1",
+        delimiter: str | None = None,
+        encoding: str | None = None,
+        chunk_bytes: int | None = None,
+        convert_types: Any = True,
+    ) -> dict[str, Any]:
+        """Import a CSV file into a worksheet.
+
+        The file is parsed in Python as it is read, so files larger than
+        memory can be imported, and written in chunks of whole rows (one
+        Value2 assignment per chunk) with screen updating, recalculation and
+        events suspended. No query table is left in the workbook.
+
+        Args:
+            sheet_name: Worksheet name
+            csv_path: CSV file
+            dest_cell: Top-left cell of the destination (A1)
+            delimiter: Field delimiter (detected by default)
+            encoding: File encoding (detected by default)
+            chunk_bytes: Estimated size of the array sent per COM call
+            convert_types: Convert numbers, booleans and ISO dates (else text)
+
+        Returns:
+            Result dictionary with the range written, the detected dialect and
+            the throughput
+        """
+        validate_string_not_empty("sheet_name", sheet_name)
+        path = validate_file_path(csv_path, must_exist=True, extensions=[".csv", ".txt", ".tsv"])
+        anchor = validate_cell_address(dest_cell)
+        first_row, first_col, _, _ = range_bounds(f"{anchor}:{anchor}")
+        chunk_bytes = validate_positive_number(
+            "chunk_bytes", int(chunk_bytes) if chunk_bytes is not None else DEFAULT_CHUNK_BYTES
+        )
+        if delimiter is not None and len(delimiter) != 1:
+            raise InvalidParameterError("delimiter", delimiter, "Expected a single character")
+        if encoding is not None:
+            try:
+                codecs.lookup(encoding)
+            except LookupError as e:
+                raise InvalidParameterError("encoding", encoding, "Unknown encoding") from e
+        source = CsvSource(path, encoding, delimiter, validate_bool("convert_types", convert_types))
+
+        ws = self.current_document.Worksheets(sheet_name)
+        start = time.perf_counter()
+        with self.fast_mode():
+            written = write_rows(ws, first_row, first_col, source.rows(), chunk_bytes)
+        elapsed = time.perf_counter() - start
+
+        if not written.columns:
+            return dict_to_result(
+                success=True, message=f"{path.name} is empty", csv_path=str(path), rows=0
+            )
+        range_address = block_address(
+            first_row, first_col, first_row + written.rows - 1, first_col + written.columns - 1
+        )
+        return dict_to_result(
+            success=True,
+            message=f"{written.rows} rows imported from {path.name} into {range_address}",
+            csv_path=str(path),
+            range=range_address,
+            rows=written.rows,
+            columns=written.columns,
+            chunks=written.chunks,
+            encoding=source.encoding,
+            delimiter=source.delimiter,
+            seconds=round(elapsed, 6),
+            rows_per_second=round(written.rows / elapsed) if elapsed > 0 else None,
+            megabytes_per_second=round(source.size / elapsed / 2**20, 2) if elapsed > 0 else None,
         )
-        qt.TextFileParseType = 1  # xlDelimited
-        qt.TextFileCommaDelimiter = True
-        qt.Refresh()
-
-        return dict_to_result(success=True, message="CSV imported", csv_path=str(path))
 
     @com_safe("insert_hyperlink")
     def insert_hyperlink(
@@ -1564,17 +2538,48 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
         return self.write_formula(dest_sheet, dest_cell_addr, formula)
 
     @com_safe("export_to_json")
-    def export_to_json(self, sheet_name: str, range_addr: str, output_path: str) -> dict[str, Any]:
-        """Export range to JSON."""
-        import json
-
+    def export_to_json(
+        self,
+        sheet_name: str,
+        range_addr: str,
+        output_path: str,
+        raw: bool = False,
+        date_columns: Any = None,
+        file_path: str | None = None,
+    ) -> dict[str, Any]:
+        """Export range to JSON.
+
+        Args:
+            sheet_name: Worksheet name
+            range_addr: Range address (A1:B10)
+            output_path: Destination .json file
+            raw: Read Value2 and convert the date columns to ISO strings
+            date_columns: Date columns for raw reads (letters or 1-based
+                positions in the range); sampled from NumberFormat if omitted
+            file_path: Workbook to read instead of the current one (read
+                directly, without Excel, dates as ISO strings, unless Excel
+                has it open)
+
+        Returns:
+            Dictionary with the JSON file path
+        """
         validate_string_not_empty("sheet_name", sheet_name)
         range_address = validate_range_address(range_addr)
         path = validate_file_path(output_path, extensions=[".json"])
-
-        wb = self.current_document
-        ws = wb.Worksheets(sheet_name)
-        values = ws.Range(range_address).Value
+        raw = validate_bool("raw", raw)
+
+        wb, reader = self._workbook_or_reader(file_path)
+        if reader is not None:
+            values = tuple(reader.iter_rows(sheet_name, range_bounds(range_address), "iso"))
+        elif raw:
+            ws = wb.Worksheets(sheet_name)
+            values = ws.Range(range_address).Value2
+            values = convert_date_columns(
+                values if isinstance(values, tuple) else ((values,),),
+                self._date_columns(ws, range_address, date_columns),
+            )
+        else:
+            values = wb.Worksheets(sheet_name).Range(range_address).Value
 
         # Convert to list of lists
         data = [list(row) if isinstance(row, tuple) else [row] for row in values] if values else []
@@ -1585,6 +2590,65 @@ class ExcelService(BaseOfficeService, DocumentOperationMixin):
 
         return dict_to_result(success=True, message="Data exported to JSON", json_path=str(path))
 
+    @com_safe("export_range_columnar")
+    def export_range_columnar(
+        self,
+        sheet_name: str,
+        output_path: str,
+        range_addr: str | None = None,
+        file_format: str | None = None,
+        compression: str | None = None,
+        header: bool | None = None,
+        block_rows: int | None = None,
+    ) -> dict[str, Any]:
+        """Export a range to a typed columnar file (Arrow IPC, Parquet or NPZ).
+
+        The range is read in blocks of rows through Value2; each column gets
+        one type (bool, int64, float64, timestamp for date-formatted columns,
+        or string).
+
+        Args:
+            sheet_name: Worksheet name
+            output_path: Destination (.arrow/.feather/.ipc, .parquet or .npz)
+            range_addr: Range address (A1:B10), the used range by default
+            file_format: "arrow", "parquet" or "npz" (from the extension by default)
+            compression: Codec (lz4/zstd for Arrow, snappy/gzip/zstd for
+                Parquet; any value compresses NPZ archives)
+            header: Whether the first row holds the column names (detected
+                by default)
+            block_rows: Number of rows read per COM call
+
+        Returns:
+            Result dictionary with the file, the row count and the column types
+        """
+        validate_string_not_empty("sheet_name", sheet_name)
+        path = validate_file_path(output_path)
+        fmt = resolve_format(path, file_format)
+        block_rows = validate_positive_number("block_rows", int(block_rows or DEFAULT_BLOCK_ROWS))
+
+        ws = self.current_document.Worksheets(sheet_name)
+        range_address = validate_range_address(range_addr) if range_addr else used_range_address(ws)
+        columns = build_columns(
+            iter_range_blocks(ws, range_address, block_rows),
+            validate_bool("header", header) if header is not None else None,
+            sample_date_columns(ws, range_address),
+        )
+
+        ensure_directory_exists(path)
+        write_columns(columns, path, fmt, compression)
+
+        rows = len(columns[0].values) if columns else 0
+        return dict_to_result(
+            success=True,
+            message=f"{rows} rows exported to {path}",
+            output_path=str(path),
+            format=fmt,
+            range=range_address,
+            rows=rows,
+            columns=[{"name": c.name, "dtype": c.dtype} for c in columns],
+            file_size=path.stat().st_size,
+        )
+
     # Alias for document methods to match base class
     create_document = create_workbook
     open_document = open_workbook
@@ -0,0 +1,225 @@
+"""Coalesced formatting of many ranges.
+
+A formatting pass over a report typically sets a few distinct styles on
+hundreds of ranges, one COM call per property and range. Here the entries are
+decomposed into single properties; for each property the cells that end with
+the same value are merged into as few blocks as possible (later entries win
+where ranges overlap, as if the entries were applied in order), and the blocks
+are joined into multi-area addresses under Excel's reference length limit.
+Each distinct value is then set once per address instead of once per entry.
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import suppress
+from typing import Any, NamedTuple
+
+from ..core.exceptions import InvalidParameterError
+from ..utils.a1 import Ref, parse_ref, union
+from ..utils.com_wrapper import COMConstants, rgb_to_office_color
+from ..utils.validators import validate_rgb_color
+
+#: Longest reference Worksheet.Range accepts
+MAX_ADDRESS_LENGTH = 255
+
+
+def _color(value: Any) -> int:
+    """Convert ``[r, g, b]`` or ``"#RRGGBB"`` to an Office color."""
+    if isinstance(value, str) and len(value) == 7 and value.startswith("#"):
+        with suppress(ValueError):
+            value = [int(value[i : i + 2], 16) for i in (1, 3, 5)]
+    if not isinstance(value, (list, tuple)) or len(value) != 3:
+        raise InvalidParameterError("style", str(value), "Expected [r, g, b] or #RRGGBB")
+    return rgb_to_office_color(*validate_rgb_color(*(int(v) for v in value)))
+
+
+def _bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "1", "yes")
+    return bool(value)
+
+
+#: Style keys: COM property path under the range, and value conversion
+STYLE_PROPERTIES: dict[str, tuple[tuple[str, ...], Callable[[Any], Any]]] = {
+    "fill": (("Interior", "Color"), _color),
+    "font_color": (("Font", "Color"), _color),
+    "bold": (("Font", "Bold"), _bool),
+    "italic": (("Font", "Italic"), _bool),
+    "font_size": (("Font", "Size"), float),
+    "font_name": (("Font", "Name"), str),
+    "number_format": (("NumberFormat",), str),
+    "horizontal": (("HorizontalAlignment",), COMConstants.get_excel_halignment),
+    "vertical": (("VerticalAlignment",), COMConstants.get_excel_valignment),
+    "wrap": (("WrapText",), _bool),
+    "borders": (("Borders", "LineStyle"), int),
+}
+
+
+class FormatEntry(NamedTuple):
+    """A formatting request: the blocks of a range and the properties to set.
+
+    Attributes:
+        refs: Blocks of the range (several for a multi-area range)
+        properties: (style key, converted value) pairs
+    """
+
+    refs: tuple[Ref, ...]
+    properties: tuple[tuple[str, Any], ...]
+
+
+class FormatCall(NamedTuple):
+    """One multi-area range and the property values set on it.
+
+    Attributes:
+        address: Multi-area address (at most ``MAX_ADDRESS_LENGTH`` characters)
+        properties: (style key, converted value) pairs
+    """
+
+    address: str
+    properties: tuple[tuple[str, Any], ...]
+
+
+def parse_entries(entries: Sequence[Any], sheet_name: str) -> list[FormatEntry]:
+    """Validate ``{"range": ..., "style": {...}}`` entries.
+
+    Args:
+        entries: Entries; ``range`` may be multi-area (``"A1:B2,D4"``)
+        sheet_name: Worksheet the ranges belong to
+
+    Returns:
+        Parsed entries, in order
+
+    Raises:
+        InvalidParameterError: If an entry, a range or a style is invalid
+    """
+    parsed = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not isinstance(entry.get("style"), dict):
+            raise InvalidParameterError(
+                f"entries[{index}]", type(entry).__name__, "Expected {range, style}"
+            )
+        refs = []
+        for area in str(entry.get("range", "")).split(","):
+            try:
+                ref = parse_ref(area)
+            except ValueError as e:
+                raise InvalidParameterError(f"entries[{index}].range", area, str(e)) from e
+            if ref.sheet is not None and ref.sheet != sheet_name:
+                raise InvalidParameterError(
+                    f"entries[{index}].range", area, f"Not on worksheet {sheet_name}"
+                )
+            refs.append(ref._replace(sheet=None))
+        properties = []
+        for key, value in entry["style"].items():
+            if key not in STYLE_PROPERTIES:
+                raise InvalidParameterError(
+                    f"entries[{index}].style", key, f"Expected one of {', '.join(STYLE_PROPERTIES)}"
+                )
+            properties.append((key, STYLE_PROPERTIES[key][1](value)))
+        parsed.append(FormatEntry(tuple(refs), tuple(properties)))
+    return parsed
+
+
+def _extends(last: Ref, ref: Ref, vertical: bool) -> bool:
+    """Whether a block continues another one below it (or to its right)."""
+    if vertical:
+        return (last.first_col, last.last_col) == (ref.first_col, ref.last_col) and (
+            last.last_row + 1 == ref.first_row
+        )
+    return (last.first_row, last.last_row) == (ref.first_row, ref.last_row) and (
+        last.last_col + 1 == ref.first_col
+    )
+
+
+def merge_blocks(refs: Iterable[Ref]) -> list[Ref]:
+    """Merge disjoint blocks that touch into larger rectangles.
+
+    Blocks spanning the same columns on consecutive rows are merged first,
+    then blocks spanning the same rows on consecutive columns.
+    """
+    blocks = list(refs)
+    for vertical in (True, False):
+        if vertical:
+            blocks.sort(key=lambda r: (r.first_col, r.last_col, r.first_row))
+        else:
+            blocks.sort(key=lambda r: (r.first_row, r.last_row, r.first_col))
+        merged: list[Ref] = []
+        for ref in blocks:
+            if merged and _extends(merged[-1], ref, vertical):
+                last = merged[-1]
+                if vertical:
+                    merged[-1] = last._replace(last_row=ref.last_row)
+                else:
+                    merged[-1] = last._replace(last_col=ref.last_col)
+            else:
+                merged.append(ref)
+        blocks = merged
+    blocks.sort(key=lambda r: (r.first_row, r.first_col))
+    return blocks
+
+
+def join_addresses(refs: Iterable[Ref], limit: int = MAX_ADDRESS_LENGTH) -> list[str]:
+    """Join blocks into comma-separated addresses of at most ``limit`` characters."""
+    addresses: list[str] = []
+    current = ""
+    for ref in refs:
+        address = ref.address()
+        if current and len(current) + 1 + len(address) > limit:
+            addresses.append(current)
+            current = ""
+        current = f"{current},{address}" if current else address
+    if current:
+        addresses.append(current)
+    return addresses
+
+
+def plan_calls(entries: Sequence[FormatEntry]) -> list[FormatCall]:
+    """Coalesce formatting entries into as few range calls as possible.
+
+    The result leaves every cell with the value the last entry setting each
+    property would have given it.
+
+    Args:
+        entries: Entries in application order
+
+    Returns:
+        Calls: one per distinct multi-area address, with every property value
+        set on it
+    """
+    # Per property, the blocks each later entry overrides are carved out of
+    # the earlier entries setting another value
+    regions: dict[tuple[str, Any], list[Ref]] = {}
+    for key in STYLE_PROPERTIES:
+        later: list[tuple[Any, Ref]] = []
+        for entry in reversed(entries):
+            for name, value in entry.properties:
+                if name != key:
+                    continue
+                for ref in entry.refs:
+                    pieces = [ref]
+                    for other_value, other in later:
+                        if other_value != value:
+                            pieces = [p for piece in pieces for p in piece.subtract(other)]
+                    regions.setdefault((key, value), []).extend(pieces)
+                    later.append((value, ref))
+
+    calls: dict[str, list[tuple[str, Any]]] = {}
+    for prop, refs in regions.items():
+        for address in join_addresses(merge_blocks(union(refs))):
+            calls.setdefault(address, []).append(prop)
+    return [FormatCall(address, tuple(props)) for address, props in calls.items()]
+
+
+def apply_call(ws: Any, call: FormatCall) -> int:
+    """Apply one planned call to a worksheet.
+
+    Returns:
+        Number of properties set
+    """
+    cell_range = ws.Range(call.address)
+    for key, value in call.properties:
+        *parents, name = STYLE_PROPERTIES[key][0]
+        target = cell_range
+        for parent in parents:
+            target = getattr(target, parent)
+        setattr(target, name, value)
+    return len(call.properties)
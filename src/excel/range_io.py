@@ -0,0 +1,400 @@
+"""Block-wise transfer of large Excel ranges.
+
+Reading ``Range.Value`` of a 500k-cell range marshals one giant SAFEARRAY and
+converts every date and currency cell on the way. Large ranges are instead
+tiled into blocks of whole rows, each read with one ``Value2`` call (raw
+doubles, no per-cell conversion) and consumed lazily, so that peak memory is
+bounded by the block size rather than by the size of the sheet.
+
+Bulk writes go the other way: a 2D payload anchored at its top-left cell is
+cut into chunks of whole rows under a byte budget, and each chunk is assigned
+with one ``Value2`` call while screen updating, recalculation and events are
+suspended.
+"""
+
+import csv
+import io
+import itertools
+import json
+import re
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ..core.exceptions import InvalidParameterError
+from ..utils.a1 import column_letters, column_number, parse_ref
+from .dates import is_date_format
+
+#: Default number of rows read per COM call in streaming mode
+DEFAULT_BLOCK_ROWS = 1000
+
+#: Default size of the array marshalled per COM call by bulk writes
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+
+#: Payload formats accepted by bulk writes
+PAYLOAD_FORMATS = ("auto", "json", "csv", "columns")
+
+_NUMBER = re.compile(r"-?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?")
+_INTEGER = re.compile(r"-?\d{1,15}")
+_LEADING_ZERO = re.compile(r"-?0\d")
+
+# Marshalled size of a VARIANT, and of the BSTR header of a string
+_VARIANT_BYTES = 16
+_BSTR_BYTES = 8
+
+
+def range_bounds(range_address: str) -> tuple[int, int, int, int]:
+    """Get the 1-based (first row, first column, last row, last column) of a range.
+
+    Args:
+        range_address: Range address such as ``"A1:C10"`` (any form ``parse_ref`` reads)
+
+    Returns:
+        Normalized bounds (the corners may be given in any order)
+    """
+    ref = parse_ref(range_address)
+    return ref.first_row, ref.first_col, ref.last_row, ref.last_col
+
+
+def block_address(first_row: int, first_col: int, last_row: int, last_col: int) -> str:
+    """Build the A1 address of a block of cells."""
+    return f"{column_letters(first_col)}{first_row}:{column_letters(last_col)}{last_row}"
+
+
+def row_blocks(first_row: int, last_row: int, block_rows: int) -> Iterator[tuple[int, int]]:
+    """Split a row interval into blocks.
+
+    Args:
+        first_row: First row (inclusive)
+        last_row: Last row (inclusive)
+        block_rows: Maximum number of rows per block
+
+    Yields:
+        (first, last) rows of each block
+    """
+    for start in range(first_row, last_row + 1, block_rows):
+        yield start, min(start + block_rows - 1, last_row)
+
+
+def last_used_row(ws: Any) -> int:
+    """Get the last row of the used range of a worksheet."""
+    used = ws.UsedRange
+    return used.Row + used.Rows.Count - 1
+
+
+def used_range_address(ws: Any) -> str:
+    """Get the relative ``"A1:C10"`` address of the used range of a worksheet."""
+    address = ws.UsedRange.Address.replace("$", "")
+    return address if ":" in address else f"{address}:{address}"
+
+
+def iter_range_blocks(
+    ws: Any, range_address: str, block_rows: int
+) -> Iterator[tuple[tuple[Any, ...], ...]]:
+    """Read a range lazily, one block of rows per COM call.
+
+    Rows below the used range of the sheet are not read, so that ranges such
+    as ``A1:Z1048576`` stop at the last row holding data.
+
+    Args:
+        ws: Worksheet COM object
+        range_address: Range address such as ``"A1:C10"``
+        block_rows: Number of rows read per COM call
+
+    Yields:
+        Blocks of rows of raw values (``Value2``: dates as serial numbers)
+    """
+    first_row, first_col, last_row, last_col = range_bounds(range_address)
+    last_row = min(last_row, last_used_row(ws))
+
+    for start, end in row_blocks(first_row, last_row, block_rows):
+        values = ws.Range(block_address(start, first_col, end, last_col)).Value2
+        yield values if isinstance(values, tuple) else ((values,),)
+
+
+def iter_range_rows(ws: Any, range_address: str, block_rows: int) -> Iterator[tuple[Any, ...]]:
+    """Read the rows of a range lazily, one block of rows per COM call.
+
+    Args:
+        ws: Worksheet COM object
+        range_address: Range address such as ``"A1:C10"``
+        block_rows: Number of rows read per COM call
+
+    Yields:
+        Rows of raw values (``Value2``: dates as serial numbers)
+    """
+    for block in iter_range_blocks(ws, range_address, block_rows):
+        yield from block
+
+
+def resolve_columns(columns: Any, first_col: int, width: int) -> list[int]:
+    """Resolve a column selection to 0-based indexes within a range.
+
+    Args:
+        columns: Sheet column letters (``"B"``), 1-based positions within the
+            range, or a comma-separated string of either
+        first_col: First column of the range
+        width: Number of columns of the range
+
+    Returns:
+        Sorted indexes of the selected columns
+
+    Raises:
+        InvalidParameterError: If a column is outside the range
+    """
+    if isinstance(columns, str):
+        columns = [c.strip() for c in columns.strip("[]").split(",") if c.strip()]
+    elif not isinstance(columns, (list, tuple)):
+        columns = [columns]
+
+    indexes = set()
+    for column in columns:
+        column = str(column).strip().strip("\"'").upper()
+        if column.isdigit():
+            index = int(column) - 1
+        elif column.isalpha():
+            index = column_number(column) - first_col
+        else:
+            index = -1
+        if not 0 <= index < width:
+            raise InvalidParameterError("date_columns", column, "Column outside of the range")
+        indexes.add(index)
+    return sorted(indexes)
+
+
+def sample_date_columns(ws: Any, range_address: str, sample_rows: int = 5) -> list[int]:
+    """Find the columns of a range whose NumberFormat is a date format.
+
+    One ``NumberFormat`` read per column, over the first rows below the
+    header (a column with mixed formats reads as None and is left alone).
+
+    Args:
+        ws: Worksheet COM object
+        range_address: Range address such as ``"A1:C10"``
+        sample_rows: Number of rows sampled
+
+    Returns:
+        0-based indexes of the date columns
+    """
+    first_row, first_col, last_row, last_col = range_bounds(range_address)
+    if last_row > first_row:
+        first_row += 1  # skip a possible header row
+    last_row = min(last_row, first_row + sample_rows - 1)
+
+    return [
+        col - first_col
+        for col in range(first_col, last_col + 1)
+        if is_date_format(ws.Range(block_address(first_row, col, last_row, col)).NumberFormat)
+    ]
+
+
+def csv_field(value: Any) -> Any:
+    """CSV field of a cell value (empty cells blank, integral numbers without decimals)."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def parse_field(text: str) -> Any:
+    """Convert a text field to a number when it is one (empty fields to None).
+
+    Numbers with leading zeros (codes such as ``"00123"``) stay text.
+    """
+    if not text:
+        return None
+    if _NUMBER.fullmatch(text) and not _LEADING_ZERO.match(text):
+        return int(text) if _INTEGER.fullmatch(text) else float(text)
+    return text
+
+
+def read_source_rows(path: Path) -> Iterator[list[Any]]:
+    """Stream the rows of a .csv or JSON Lines file.
+
+    CSV fields holding numbers are converted to numbers; JSON Lines files
+    hold one JSON array per line (the format written by ``spill_rows``).
+
+    Args:
+        path: Source file
+
+    Yields:
+        Rows of values
+    """
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        if path.suffix.lower() == ".csv":
+            for row in csv.reader(f):
+                yield [parse_field(field) for field in row]
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def spill_rows(rows: Iterable[Iterable[Any]], path: Path) -> int:
+    """Write rows to a file as they are produced.
+
+    ``.csv`` files get one CSV record per row; any other extension gets JSON
+    Lines (one JSON array per row), which keeps numbers and empty cells apart.
+
+    Args:
+        rows: Rows to write
+        path: Destination file
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    with path.open("w", encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".csv":
+            writer = csv.writer(f)
+            for row in rows:
+                writer.writerow(["" if v is None else v for v in row])
+                count += 1
+        else:
+            for row in rows:
+                f.write(json.dumps(list(row), ensure_ascii=False, default=str))
+                f.write("\n")
+                count += 1
+    return count
+
+
+def parse_payload(values: Any, data_format: str = "auto") -> list[list[Any]]:
+    """Turn a bulk-write payload into a rectangular list of rows.
+
+    MCP clients often pass arrays as JSON text, so strings are decoded: JSON
+    when they look like an array or an object, CSV text otherwise. Columnar
+    payloads (a mapping of column name to values) are transposed, with the
+    column names as the first row. Short rows are padded with empty cells.
+
+    Args:
+        values: Rows, columns, or their JSON/CSV text
+        data_format: One of ``PAYLOAD_FORMATS``
+
+    Returns:
+        Rows of equal length
+
+    Raises:
+        InvalidParameterError: If the payload cannot be decoded or is empty
+    """
+    if data_format not in PAYLOAD_FORMATS:
+        raise InvalidParameterError(
+            "data_format", data_format, f"Expected one of: {', '.join(PAYLOAD_FORMATS)}"
+        )
+
+    if isinstance(values, str):
+        text = values.strip()
+        if data_format == "csv" or (data_format == "auto" and text[:1] not in ("[", "{")):
+            values = list(csv.reader(io.StringIO(text)))
+        else:
+            try:
+                values = json.loads(text)
+            except json.JSONDecodeError as e:
+                raise InvalidParameterError("values", values[:50], f"Invalid JSON: {e}") from e
+
+    if isinstance(values, Mapping):
+        names = list(values)
+        columns = [values[name] for name in names]
+        values = [names, *itertools.zip_longest(*columns)]
+    elif data_format == "columns":
+        raise InvalidParameterError(
+            "values", type(values).__name__, "Columnar payloads must be a mapping"
+        )
+
+    if not isinstance(values, (list, tuple)) or not values:
+        raise InvalidParameterError(
+            "values", type(values).__name__, "Expected a non-empty 2D array"
+        )
+
+    rows = [list(row) if isinstance(row, (list, tuple)) else [row] for row in values]
+    width = max(len(row) for row in rows)
+    if width == 0:
+        raise InvalidParameterError("values", "[[]]", "Expected a non-empty 2D array")
+    for row in rows:
+        row.extend([None] * (width - len(row)))
+    return rows
+
+
+def estimate_row_bytes(row: Iterable[Any]) -> int:
+    """Estimate the marshalled size of a row (VARIANTs, plus UTF-16 strings)."""
+    size = 0
+    for value in row:
+        size += _VARIANT_BYTES
+        if isinstance(value, str):
+            size += _BSTR_BYTES + 2 * len(value)
+    return size
+
+
+def chunk_rows(rows: Iterable[list[Any]], chunk_bytes: int) -> Iterator[list[list[Any]]]:
+    """Group rows into chunks whose estimated size stays under a byte budget.
+
+    A chunk always holds at least one row, even when that row is larger than
+    the budget.
+
+    Args:
+        rows: Rows to group
+        chunk_bytes: Byte budget of one chunk
+
+    Yields:
+        Lists of consecutive rows
+    """
+    chunk: list[list[Any]] = []
+    size = 0
+    for row in rows:
+        row_size = estimate_row_bytes(row)
+        if chunk and size + row_size > chunk_bytes:
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(row)
+        size += row_size
+    if chunk:
+        yield chunk
+
+
+class BlockWrite(NamedTuple):
+    """Outcome of a block-wise write.
+
+    Attributes:
+        rows: Number of rows written
+        columns: Number of columns of the widest row
+        chunks: Number of ``Value2`` assignments
+    """
+
+    rows: int
+    columns: int
+    chunks: int
+
+
+def write_rows(
+    ws: Any, first_row: int, first_col: int, rows: Iterable[list[Any]], chunk_bytes: int
+) -> BlockWrite:
+    """Write rows below an anchor cell, one ``Value2`` assignment per chunk.
+
+    Rows may have different lengths: each chunk is padded with empty cells
+    to its widest row. A chunk of empty rows only is skipped, not written.
+
+    Args:
+        ws: Worksheet COM object
+        first_row: Row of the anchor cell
+        first_col: Column of the anchor cell
+        rows: Rows to write, consumed lazily
+        chunk_bytes: Byte budget of one assignment
+
+    Returns:
+        Number of rows, columns and chunks written
+    """
+    row, columns, chunks = first_row, 0, 0
+    for chunk in chunk_rows(rows, chunk_bytes):
+        width = max(len(values) for values in chunk)
+        if not width:
+            row += len(chunk)
+            continue
+        for values in chunk:
+            if len(values) < width:
+                values.extend([None] * (width - len(values)))
+        last_col = first_col + width - 1
+        ws.Range(block_address(row, first_col, row + len(chunk) - 1, last_col)).Value2 = chunk
+        row += len(chunk)
+        columns = max(columns, width)
+        chunks += 1
+    return BlockWrite(row - first_row, columns, chunks)
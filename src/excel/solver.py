@@ -0,0 +1,308 @@
+"""Optimization of a workbook model, without the Solver add-in.
+
+The workbook is treated as a black-box function from the variable cells to
+the objective cell, and minimized (or maximized, or brought to a target
+value) in Python by a bounded pattern search: each iteration polls a batch
+of candidates, one step up and down along each variable, moves to the best
+one and tries to continue in the same direction, and halves the steps when
+no candidate improves. The method needs no derivatives, so formulas with
+lookups, thresholds or rounding are handled.
+
+The candidates of a poll are evaluated one after the other, not in a single
+pass: the workbook holds one copy of the model, and laying the candidates
+out side by side would need a copy per candidate (a data table only varies
+one or two input cells). What is batched is each evaluation: the whole
+candidate vector is written with one ``Value2`` assignment per block of
+variable cells, the workbook is recalculated, and the objective is read with
+one call. Evaluated points are cached: the halving steps of the search
+revisit the same points often.
+"""
+
+import math
+import time
+from collections.abc import Callable, Sequence
+from typing import Any, NamedTuple
+
+from ..core.exceptions import InvalidParameterError
+from ..utils.a1 import column_letters
+from .range_io import block_address, range_bounds
+
+#: Objectives of the solver: minimum, maximum, or a target value
+SOLVER_GOALS = ("min", "max", "value")
+
+#: Workbook evaluations allowed by default
+DEFAULT_MAX_EVALUATIONS = 1000
+
+#: Step size (relative to the variable values above 1) at which the search stops
+DEFAULT_TOLERANCE = 1e-6
+
+#: Initial step as a fraction of the bounds width, or of the start value
+INITIAL_STEP = 0.1
+
+
+class SolverResult(NamedTuple):
+    """Outcome of a search.
+
+    Attributes:
+        x: Best variable values
+        objective: Objective cell value at x
+        iterations: Poll iterations made
+        converged: Whether the steps fell below the tolerance
+    """
+
+    x: tuple[float, ...]
+    objective: float
+    iterations: int
+    converged: bool
+
+
+def variable_blocks(cells: Any) -> list[tuple[int, int, int, int]]:
+    """Parse variable cells (``"B2:B5"``, ``"B2,D4"`` or a list) into blocks.
+
+    Returns:
+        Bounds of each block, in order
+
+    Raises:
+        InvalidParameterError: If an address is invalid
+    """
+    parts = cells.split(",") if isinstance(cells, str) else list(cells or [])
+    blocks = []
+    for part in (str(p).strip() for p in parts):
+        if not part:
+            continue
+        try:
+            blocks.append(range_bounds(part))
+        except ValueError:
+            raise InvalidParameterError("variable_cells", part, "Invalid cell or range") from None
+    if not blocks:
+        raise InvalidParameterError("variable_cells", str(cells), "No variable cell given")
+    return blocks
+
+
+def parse_bounds(bounds: Any, count: int) -> list[tuple[float, float]]:
+    """Parse ``[low, high]`` bounds: one pair for every variable, or one per variable.
+
+    None (or a None limit) leaves a variable unbounded on that side.
+
+    Raises:
+        InvalidParameterError: If the bounds are malformed or empty
+    """
+    if bounds is None:
+        return [(-math.inf, math.inf)] * count
+    pairs = [bounds] * count if len(bounds) == 2 and not isinstance(bounds[0], list) else bounds
+    if len(pairs) != count:
+        raise InvalidParameterError(
+            "bounds", str(bounds)[:50], f"Expected {count} [low, high] pairs"
+        )
+    parsed = []
+    for i, pair in enumerate(pairs):
+        try:
+            low, high = (
+                -math.inf if pair[0] is None else float(pair[0]),
+                math.inf if pair[1] is None else float(pair[1]),
+            )
+        except (TypeError, ValueError, IndexError):
+            raise InvalidParameterError(f"bounds[{i}]", str(pair), "Expected [low, high]") from None
+        if low > high:
+            raise InvalidParameterError(f"bounds[{i}]", str(pair), "Low bound above high bound")
+        parsed.append((low, high))
+    return parsed
+
+
+class WorkbookFunction:
+    """The objective cell as a function of the variable cells.
+
+    Calculation should be manual while the function is used.
+
+    Args:
+        app: Excel application
+        ws: Worksheet holding the variable and objective cells
+        blocks: Bounds of the blocks of variable cells
+        objective_cell: Objective cell address
+        calc_range: Range recalculated after each write (the cells made
+            dirty by the variables are recalculated when None)
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        ws: Any,
+        blocks: Sequence[tuple[int, int, int, int]],
+        objective_cell: str,
+        calc_range: str | None = None,
+    ) -> None:
+        """Look up the ranges once for every evaluation."""
+        self._blocks = list(blocks)
+        self._ranges = [ws.Range(block_address(*b)) for b in blocks]
+        self._shapes = [(r2 - r1 + 1, c2 - c1 + 1) for r1, c1, r2, c2 in blocks]
+        self._objective = ws.Range(objective_cell)
+        self._calculate = ws.Range(calc_range).Calculate if calc_range else app.Calculate
+        self._cache: dict[tuple[float, ...], float] = {}
+        #: Workbook evaluations made
+        self.evaluations = 0
+        #: Evaluations answered by the cache
+        self.cache_hits = 0
+
+    @property
+    def cells(self) -> list[str]:
+        """Variable cell addresses, in vector order."""
+        return [
+            f"{column_letters(c)}{r}"
+            for r1, c1, r2, c2 in self._blocks
+            for r in range(r1, r2 + 1)
+            for c in range(c1, c2 + 1)
+        ]
+
+    def read(self) -> list[Any]:
+        """Current values of the variable cells, in vector order."""
+        values = []
+        for rng in self._ranges:
+            block = rng.Value2
+            rows = block if isinstance(block, tuple) else ((block,),)
+            values.extend(value for row in rows for value in row)
+        return values
+
+    def write(self, x: Sequence[Any]) -> None:
+        """Write a vector to the variable cells, one assignment per block."""
+        start = 0
+        for rng, (rows, columns) in zip(self._ranges, self._shapes, strict=True):
+            rng.Value2 = tuple(
+                tuple(x[start + r * columns : start + (r + 1) * columns]) for r in range(rows)
+            )
+            start += rows * columns
+
+    def __call__(self, x: Sequence[float]) -> float:
+        """Objective value at x (NaN when the cell holds no number)."""
+        key = tuple(float(f"{v:.12g}") for v in x)
+        if key in self._cache:
+            self.cache_hits += 1
+            return self._cache[key]
+        self.write(x)
+        self._calculate()
+        value = self._objective.Value2
+        self.evaluations += 1
+        # Cell errors come back as integer codes, numbers as floats
+        result = value if isinstance(value, float) else math.nan
+        self._cache[key] = result
+        return result
+
+
+def _clip(x: Sequence[float], bounds: Sequence[tuple[float, float]]) -> tuple[float, ...]:
+    return tuple(min(max(v, low), high) for v, (low, high) in zip(x, bounds, strict=True))
+
+
+def initial_steps(x0: Sequence[float], bounds: Sequence[tuple[float, float]]) -> list[float]:
+    """Starting step of each variable: a fraction of its bounds or of its value."""
+    steps = []
+    for v, (low, high) in zip(x0, bounds, strict=True):
+        if math.isfinite(low) and math.isfinite(high) and high > low:
+            steps.append(INITIAL_STEP * (high - low))
+        else:
+            steps.append(INITIAL_STEP * abs(v) or 1.0)
+    return steps
+
+
+def pattern_search(
+    f: Callable[[Sequence[float]], float],
+    x0: Sequence[float],
+    bounds: Sequence[tuple[float, float]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_evaluations: int = DEFAULT_MAX_EVALUATIONS,
+    evaluations: Callable[[], int] | None = None,
+) -> SolverResult:
+    """Minimize f within bounds by polling a batch of candidates per iteration.
+
+    Args:
+        f: Function to minimize (NaN for points where it is undefined)
+        x0: Starting point
+        bounds: ``(low, high)`` of each variable
+        tolerance: Steps (relative to values above 1) at which the search stops
+        max_evaluations: Evaluations after which the search stops
+        evaluations: Count of evaluations made so far (calls of f when None)
+
+    Returns:
+        The best point found
+    """
+    calls = 0
+
+    def score(x: Sequence[float]) -> float:
+        nonlocal calls
+        calls += 1
+        value = f(x)
+        return math.inf if math.isnan(value) else value
+
+    count = evaluations or (lambda: calls)
+    x = _clip(x0, bounds)
+    fx = score(x)
+    steps = initial_steps(x, bounds)
+    iterations = 0
+    converged = False
+    while count() < max_evaluations:
+        if all(s <= tolerance * max(1.0, abs(v)) for s, v in zip(steps, x, strict=True)):
+            converged = True
+            break
+        iterations += 1
+        candidates = {
+            _clip([*x[:i], x[i] + sign * steps[i], *x[i + 1 :]], bounds)
+            for i in range(len(x))
+            for sign in (1, -1)
+        }
+        candidates.discard(x)
+        best, best_value = x, fx
+        for candidate in sorted(candidates):
+            if count() >= max_evaluations:
+                break
+            value = score(candidate)
+            if value < best_value:
+                best, best_value = candidate, value
+        if best == x:
+            steps = [s / 2 for s in steps]
+            continue
+        # Pattern move: keep going in the direction that improved
+        ahead = _clip([2 * b - a for a, b in zip(x, best, strict=True)], bounds)
+        x, fx = best, best_value
+        if ahead != x and count() < max_evaluations:
+            value = score(ahead)
+            if value < fx:
+                x, fx = ahead, value
+    return SolverResult(x, fx, iterations, converged)
+
+
+def solve(
+    function: WorkbookFunction,
+    x0: Sequence[float],
+    bounds: Sequence[tuple[float, float]],
+    goal: str = "min",
+    target: float | None = None,
+    tolerance: float = DEFAULT_TOLERANCE,
+    max_evaluations: int = DEFAULT_MAX_EVALUATIONS,
+) -> tuple[SolverResult, float]:
+    """Optimize the objective cell of a workbook.
+
+    Args:
+        function: Objective cell as a function of the variable cells
+        x0: Starting point
+        bounds: ``(low, high)`` of each variable
+        goal: min, max, or value (bring the objective to the target)
+        target: Target of the value goal
+        tolerance: Steps (relative to values above 1) at which the search stops
+        max_evaluations: Workbook evaluations after which the search stops
+
+    Returns:
+        The best point (with its objective cell value) and the seconds spent
+    """
+
+    def objective(x: Sequence[float]) -> float:
+        value = function(x)
+        if goal == "max":
+            return -value
+        if goal == "value":
+            return abs(value - target)
+        return value
+
+    start = time.perf_counter()
+    result = pattern_search(
+        objective, x0, bounds, tolerance, max_evaluations, lambda: function.evaluations
+    )
+    elapsed = time.perf_counter() - start
+    return result._replace(objective=function(result.x)), elapsed
@@ -0,0 +1,249 @@
+"""What-if parameter sweeps.
+
+Goal seek and scenarios evaluate one set of inputs per call. A sweep
+evaluates the whole grid of input values (every combination of the values of
+each input cell) in one loop under manual calculation: for each point the
+input cells are written, the workbook is recalculated and the output cells
+are read back, with the Range objects looked up once for the whole loop and
+the outputs read in a single call when they are close to each other.
+
+Recalculation is either ``Range.Calculate`` on a given range (only the
+formulas between the inputs and the outputs) or a recalculation of the cells
+made dirty by the inputs. Large sweeps can be split over several Excel
+processes, each opening a read-only copy of the workbook.
+"""
+
+import math
+import queue
+from collections.abc import Callable, Sequence
+from contextlib import suppress
+from itertools import product
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ..core.base_office import ApplicationFactory, BaseOfficeService, InstanceFactory
+from ..core.exceptions import InvalidParameterError, ResourceCleanupError
+from ..core.sta_worker import STAWorker
+from ..utils.validators import validate_cell_address
+from .range_io import block_address, range_bounds
+
+#: Largest number of points of a sweep
+MAX_SWEEP_POINTS = 100_000
+
+#: Outputs read in one call when their bounding box has at most this many cells
+MAX_OUTPUT_BLOCK_CELLS = 1024
+
+#: Chunks of points queued per Excel process, so that faster processes take more
+CHUNKS_PER_WORKER = 4
+
+
+class SweepInput(NamedTuple):
+    """An input cell and the values it takes.
+
+    Attributes:
+        cell: Cell address
+        values: Values written to the cell, in order
+    """
+
+    cell: str
+    values: tuple[Any, ...]
+
+
+def _number(entry: dict[str, Any], key: str, name: str) -> float:
+    try:
+        return float(entry[key])
+    except (KeyError, TypeError, ValueError):
+        raise InvalidParameterError(name, str(entry.get(key)), "Expected a number") from None
+
+
+def input_values(entry: dict[str, Any], name: str) -> tuple[Any, ...]:
+    """Values of an input: a ``values`` list, or ``start``/``stop``/``step`` (stop included)."""
+    if "values" in entry:
+        values = entry["values"]
+        if not isinstance(values, list) or not values:
+            raise InvalidParameterError(f"{name}.values", str(values)[:50], "Expected a list")
+        return tuple(values)
+    start = _number(entry, "start", f"{name}.start")
+    stop = _number(entry, "stop", f"{name}.stop")
+    step = _number(entry, "step", f"{name}.step") if "step" in entry else 1.0
+    if step == 0 or (stop - start) / step < 0:
+        raise InvalidParameterError(f"{name}.step", str(step), "Step does not reach stop")
+    # Computed from the start rather than accumulated, to avoid drifting
+    count = math.floor((stop - start) / step + 1e-9) + 1
+    if count > MAX_SWEEP_POINTS:
+        raise InvalidParameterError(name, str(count), f"More than {MAX_SWEEP_POINTS} values")
+    return tuple(round(start + i * step, 12) for i in range(count))
+
+
+def parse_inputs(inputs: Sequence[Any]) -> list[SweepInput]:
+    """Validate the ``{"cell": ..., "values": [...]}`` or range entries of a sweep.
+
+    Raises:
+        InvalidParameterError: If an entry is invalid or the grid is too large
+    """
+    parsed = []
+    for i, entry in enumerate(inputs):
+        name = f"inputs[{i}]"
+        if not isinstance(entry, dict) or "cell" not in entry:
+            raise InvalidParameterError(name, str(entry)[:50], "Expected {cell, values}")
+        cell = validate_cell_address(str(entry["cell"]))
+        parsed.append(SweepInput(cell, input_values(entry, name)))
+    if not parsed:
+        raise InvalidParameterError("inputs", "[]", "At least one input is required")
+    if len({i.cell for i in parsed}) < len(parsed):
+        raise InvalidParameterError("inputs", "", "Each input cell can only be given once")
+    points = math.prod(len(i.values) for i in parsed)
+    if points > MAX_SWEEP_POINTS:
+        raise InvalidParameterError(
+            "inputs", str(points), f"The sweep has more than {MAX_SWEEP_POINTS} points"
+        )
+    return parsed
+
+
+def sweep_points(inputs: Sequence[SweepInput]) -> list[tuple[Any, ...]]:
+    """Every combination of the input values, the last input varying fastest."""
+    return list(product(*(i.values for i in inputs)))
+
+
+def output_reader(ws: Any, cells: Sequence[str]) -> Callable[[], tuple[Any, ...]]:
+    """Build a function reading the output cells.
+
+    When the bounding box of the cells is small, it is read in one COM call
+    and the outputs are picked from it; otherwise each cell is read.
+    """
+    bounds = [range_bounds(cell)[:2] for cell in cells]
+    first_row = min(r for r, _ in bounds)
+    first_col = min(c for _, c in bounds)
+    last_row = max(r for r, _ in bounds)
+    last_col = max(c for _, c in bounds)
+    if (last_row - first_row + 1) * (last_col - first_col + 1) > MAX_OUTPUT_BLOCK_CELLS:
+        ranges = [ws.Range(cell) for cell in cells]
+        return lambda: tuple(rng.Value2 for rng in ranges)
+
+    block = ws.Range(block_address(first_row, first_col, last_row, last_col))
+    positions = [(r - first_row, c - first_col) for r, c in bounds]
+
+    def read() -> tuple[Any, ...]:
+        values = block.Value2
+        rows = values if isinstance(values, tuple) else ((values,),)
+        return tuple(rows[r][c] for r, c in positions)
+
+    return read
+
+
+def _contents(rng: Any) -> Any:
+    """Formula of a cell, or its constant value."""
+    formula = rng.Formula
+    return formula if isinstance(formula, str) and formula.startswith("=") else rng.Value2
+
+
+def evaluate_points(
+    app: Any,
+    ws: Any,
+    inputs: Sequence[str],
+    outputs: Sequence[str],
+    points: Sequence[tuple[Any, ...]],
+    calc_range: str | None = None,
+) -> list[tuple[Any, ...]]:
+    """Evaluate the outputs for each point; calculation should be manual.
+
+    The input cells get their formulas or constants back afterwards.
+
+    Args:
+        app: Excel application
+        ws: Worksheet holding the input and output cells
+        inputs: Input cells
+        outputs: Output cells
+        points: Values of the inputs, one tuple per point
+        calc_range: Range recalculated after each point (the cells made
+            dirty by the inputs are recalculated when None)
+
+    Returns:
+        Output values, one tuple per point
+    """
+    input_ranges = [ws.Range(cell) for cell in inputs]
+    originals = [_contents(rng) for rng in input_ranges]
+    read = output_reader(ws, outputs)
+    calculate = ws.Range(calc_range).Calculate if calc_range else app.Calculate
+    results = []
+    try:
+        for point in points:
+            for rng, value in zip(input_ranges, point, strict=True):
+                rng.Value2 = value
+            calculate()
+            results.append(read())
+    finally:
+        for rng, original in zip(input_ranges, originals, strict=True):
+            rng.Formula = original
+    return results
+
+
+def run_sweep_pool(
+    path: Path,
+    sheet_name: str,
+    inputs: Sequence[str],
+    outputs: Sequence[str],
+    chunks: Sequence[Sequence[tuple[Any, ...]]],
+    calc_range: str | None,
+    make_service: Callable[[ApplicationFactory], BaseOfficeService],
+    factory: ApplicationFactory,
+    workers: int,
+) -> list[tuple[Any, ...]]:
+    """Evaluate chunks of points with a pool of Excel processes.
+
+    Each worker is an STA thread starting its own Excel instance, opening the
+    workbook read-only under manual calculation, then taking chunks from a
+    shared queue until it is empty.
+
+    Args:
+        path: Copy of the workbook
+        sheet_name: Worksheet holding the input and output cells
+        inputs: Input cells
+        outputs: Output cells
+        chunks: Points, split in chunks
+        calc_range: Range recalculated after each point (None for dirty cells)
+        make_service: Creates an Excel service from an application factory
+        factory: Factory whose ``create_instance`` starts the applications
+        workers: Number of Excel processes
+
+    Returns:
+        Output values, one tuple per point, in the order of the chunks
+    """
+    pending: queue.SimpleQueue = queue.SimpleQueue()
+    for item in enumerate(chunks):
+        pending.put(item)
+    results: list[list[tuple[Any, ...]]] = [[] for _ in chunks]
+
+    def drain() -> None:
+        service = make_service(InstanceFactory(factory))
+        try:
+            service.initialize()
+            wb = service.application.Workbooks.Open(str(path), UpdateLinks=0, ReadOnly=True)
+            try:
+                with service.fast_mode():
+                    ws = wb.Worksheets(sheet_name)
+                    while True:
+                        try:
+                            index, points = pending.get_nowait()
+                        except queue.Empty:
+                            break
+                        results[index] = evaluate_points(
+                            service.application, ws, inputs, outputs, points, calc_range
+                        )
+            finally:
+                wb.Close(SaveChanges=False)
+        finally:
+            with suppress(ResourceCleanupError):
+                service.cleanup()
+
+    pool = [
+        STAWorker(f"excel-sweep-{i}", com_apartment=factory.uses_com)
+        for i in range(max(1, min(workers, len(chunks))))
+    ]
+    try:
+        for future in [worker.submit(drain) for worker in pool]:
+            future.result()
+    finally:
+        for worker in pool:
+            worker.stop()
+    return [values for chunk in results for values in chunk]
@@ -0,0 +1,222 @@
+"""Cell-level comparison of two workbooks.
+
+Each worksheet is read in bulk, either through COM (``Value2`` and
+``Formula`` of the used range, one call per block of rows) or by parsing the
+.xlsx file, into a grid of values and a grid of formulas. The grids of the
+two versions of a sheet are aligned on cell addresses (the used ranges may
+start and end at different cells) and compared a whole row at a time: one
+tuple comparison, running in C, skips each equal row, and only the cells of
+the differing rows are compared and classified in Python.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Any, NamedTuple
+
+from ..utils.a1 import column_letters
+from .range_io import DEFAULT_BLOCK_ROWS, block_address, row_blocks
+from .xlsx_reader import XlsxReader
+
+#: Kinds of cell changes
+CHANGE_KINDS = ("value", "formula", "added", "removed")
+
+#: Changes listed by default (the counts always cover every change)
+DEFAULT_MAX_CHANGES = 1000
+
+
+class SheetGrid(NamedTuple):
+    """Contents of a worksheet read in bulk.
+
+    Attributes:
+        first_row: Row of the first grid row
+        first_col: Column of the first grid column
+        values: Rows of values (``Value2``: dates as serial numbers)
+        formulas: Rows of the same shape: ``"=..."`` texts, None elsewhere
+    """
+
+    first_row: int
+    first_col: int
+    values: list[tuple[Any, ...]]
+    formulas: list[tuple[Any, ...]]
+
+    @property
+    def last_row(self) -> int:
+        """Row of the last grid row."""
+        return self.first_row + len(self.values) - 1
+
+    @property
+    def last_col(self) -> int:
+        """Column of the last grid column."""
+        return self.first_col + (len(self.values[0]) if self.values else 0) - 1
+
+    @property
+    def cells(self) -> int:
+        """Number of non-empty cells."""
+        return sum(1 for row in self.values for value in row if value is not None)
+
+
+class Change(NamedTuple):
+    """A changed cell.
+
+    Attributes:
+        sheet: Worksheet name
+        cell: Cell address
+        kind: One of ``CHANGE_KINDS``
+        old: Value (or formula, for formula changes) in the old workbook
+        new: Value (or formula) in the new workbook
+    """
+
+    sheet: str
+    cell: str
+    kind: str
+    old: Any
+    new: Any
+
+    def to_dict(self) -> dict[str, Any]:
+        """Entry of the change list."""
+        return self._asdict()
+
+
+class SheetDiff(NamedTuple):
+    """Summary of the comparison of one worksheet.
+
+    Attributes:
+        sheet: Worksheet name
+        status: ``"changed"``, ``"unchanged"``, ``"added"`` or ``"removed"``
+        cells: Cells compared (non-empty cells for added and removed sheets)
+        counts: Changes per kind
+    """
+
+    sheet: str
+    status: str
+    cells: int
+    counts: dict[str, int]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Entry of the sheet summary."""
+        return {"sheet": self.sheet, "status": self.status, "cells": self.cells, **self.counts}
+
+
+def _rows(values: Any) -> tuple[tuple[Any, ...], ...]:
+    """Rows of a COM array read (a single cell comes back as a scalar)."""
+    return values if isinstance(values, tuple) else ((values,),)
+
+
+def read_sheet_com(ws: Any, block_rows: int = DEFAULT_BLOCK_ROWS) -> SheetGrid:
+    """Read the used range of a worksheet through COM.
+
+    Args:
+        ws: Worksheet COM object
+        block_rows: Rows read per COM call
+
+    Returns:
+        Values and formulas of the used range
+    """
+    used = ws.UsedRange
+    first_row, first_col = used.Row, used.Column
+    last_row = first_row + used.Rows.Count - 1
+    last_col = first_col + used.Columns.Count - 1
+    values: list[tuple[Any, ...]] = []
+    formulas: list[tuple[Any, ...]] = []
+    for start, end in row_blocks(first_row, last_row, block_rows):
+        block = ws.Range(block_address(start, first_col, end, last_col))
+        values.extend(_rows(block.Value2))
+        # Formula returns the constants as text too: keep the formulas only
+        formulas.extend(
+            tuple(f if isinstance(f, str) and f.startswith("=") else None for f in row)
+            for row in _rows(block.Formula)
+        )
+    return SheetGrid(first_row, first_col, values, formulas)
+
+
+def read_sheet_xlsx(reader: XlsxReader, sheet_name: str) -> SheetGrid:
+    """Read a worksheet of an .xlsx file, without Excel.
+
+    Returns:
+        Values (dates as serial numbers, like ``Value2``) and formulas from A1
+    """
+    values, formulas = reader.read_formulas(sheet_name, dates="serial")
+    return SheetGrid(1, 1, values, formulas)
+
+
+def _aligned(
+    rows: list[tuple[Any, ...]], grid: SheetGrid, bounds: tuple[int, int, int, int]
+) -> Iterator[tuple[Any, ...]]:
+    """Rows of a grid (values or formulas) padded with None to the given bounds."""
+    first_row, first_col, last_row, last_col = bounds
+    empty = (None,) * (last_col - first_col + 1)
+    before = (None,) * (grid.first_col - first_col)
+    after = (None,) * (last_col - grid.last_col)
+    yield from (empty for _ in range(grid.first_row - first_row))
+    for row in rows:
+        yield before + row + after if before or after else row
+    yield from (empty for _ in range(last_row - grid.last_row))
+
+
+def diff_positions(
+    old: Iterable[tuple[Any, ...]], new: Iterable[tuple[Any, ...]]
+) -> list[tuple[int, int]]:
+    """Positions of the cells that differ between two aligned grids.
+
+    Args:
+        old: Rows of the first grid
+        new: Rows of the second grid, same shape
+
+    Returns:
+        (row index, column index) pairs, 0-based, in row-major order
+    """
+    positions = []
+    for r, (old_row, new_row) in enumerate(zip(old, new, strict=True)):
+        if old_row != new_row:
+            positions.extend(
+                (r, c) for c, (a, b) in enumerate(zip(old_row, new_row, strict=True)) if a != b
+            )
+    return positions
+
+
+def _formula(value: Any) -> bool:
+    return isinstance(value, str) and value.startswith("=")
+
+
+def compare_sheets(name: str, old: SheetGrid, new: SheetGrid) -> tuple[SheetDiff, list[Change]]:
+    """Compare two versions of a worksheet.
+
+    Returns:
+        The summary and every changed cell, in row-major order
+    """
+    bounds = (
+        min(old.first_row, new.first_row),
+        min(old.first_col, new.first_col),
+        max(old.last_row, new.last_row),
+        max(old.last_col, new.last_col),
+    )
+    width = bounds[3] - bounds[1] + 1
+    old_values = list(_aligned(old.values, old, bounds))
+    new_values = list(_aligned(new.values, new, bounds))
+    old_formulas = list(_aligned(old.formulas, old, bounds))
+    new_formulas = list(_aligned(new.formulas, new, bounds))
+    positions = sorted(
+        set(diff_positions(old_values, new_values))
+        | set(diff_positions(old_formulas, new_formulas))
+    )
+
+    changes = []
+    counts = dict.fromkeys(CHANGE_KINDS, 0)
+    for r, c in positions:
+        old_value, new_value = old_values[r][c], new_values[r][c]
+        old_formula, new_formula = old_formulas[r][c], new_formulas[r][c]
+        if old_formula != new_formula:
+            kind = "formula"
+            old_value = old_formula if _formula(old_formula) else old_value
+            new_value = new_formula if _formula(new_formula) else new_value
+        elif old_value is None:
+            kind = "added"
+        elif new_value is None:
+            kind = "removed"
+        else:
+            kind = "value"
+        counts[kind] += 1
+        cell = f"{column_letters(bounds[1] + c)}{bounds[0] + r}"
+        changes.append(Change(name, cell, kind, old_value, new_value))
+
+    status = "changed" if changes else "unchanged"
+    return SheetDiff(name, status, len(old_values) * width, counts), changes
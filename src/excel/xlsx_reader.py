@@ -0,0 +1,317 @@
+"""Read-only access to .xlsx files without Excel.
+
+An .xlsx workbook is a zip of SpreadsheetML parts. The reader loads the
+small parts once (workbook, relationships, styles and shared strings) and
+streams worksheet XML with ``iterparse``, dropping each row once read, so
+memory stays constant whatever the size of the sheet. It only needs the
+standard library, so reads can be served on machines without Office.
+
+Formulas are not evaluated: cells return the value cached by the
+application that last saved the file.
+"""
+
+import posixpath
+import re
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+from xml.etree.ElementTree import iterparse
+
+from ..core.exceptions import InvalidParameterError
+from ..utils.a1 import column_number, shift_formula
+from .dates import is_date_format, serial_to_datetime, serial_to_iso
+
+_MAIN = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Built-in number formats that display dates or times
+_BUILTIN_DATE_FORMATS = frozenset({*range(14, 23), *range(45, 48), 27, 30, 36, 50, 57})
+
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+
+#: Values returned for date cells: datetime (like Value), Excel serial (like
+#: Value2) or ISO 8601 string
+DATE_MODES = ("datetime", "serial", "iso")
+
+
+def _text(element: Any) -> str:
+    """Text of a string item: its ``<t>``, or the ``<t>`` of its rich text runs."""
+    text = element.find(f"{_MAIN}t")
+    if text is not None:
+        return text.text or ""
+    return "".join(run.findtext(f"{_MAIN}t", "") for run in element.iter(f"{_MAIN}r"))
+
+
+def _formula(cell: Any, row: int, col: int, shared: dict[str, tuple[int, int, str]]) -> str | None:
+    """Formula of a ``<c>`` element, expanding shared formulas."""
+    f = cell.find(f"{_MAIN}f")
+    if f is None:
+        return None
+    index = f.get("si")
+    if f.text:
+        if f.get("t") == "shared" and index is not None:
+            shared[index] = (row, col, f.text)
+        return f"={f.text}"
+    if index in shared:
+        first_row, first_col, text = shared[index]
+        return f"={shift_formula(text, row - first_row, col - first_col)}"
+    return None
+
+
+class XlsxReader:
+    """Streaming reader of the worksheets of an .xlsx file.
+
+    Args:
+        path: Path of the .xlsx (or .xlsm) file
+
+    Raises:
+        InvalidParameterError: If the file is not a valid workbook
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Load the workbook structure, styles and shared strings."""
+        self.path = Path(path)
+        try:
+            with zipfile.ZipFile(self.path) as archive:
+                self._sheets, self.active_sheet = self._read_workbook(archive)
+                self._date_styles = self._read_date_styles(archive)
+                self._strings = self._read_shared_strings(archive)
+        except (zipfile.BadZipFile, KeyError) as e:
+            raise InvalidParameterError(
+                "file_path", str(path), f"Not a valid .xlsx file: {e}"
+            ) from e
+
+    @property
+    def sheet_names(self) -> list[str]:
+        """Names of the worksheets, in workbook order."""
+        return list(self._sheets)
+
+    def iter_rows(
+        self,
+        sheet_name: str,
+        bounds: tuple[int, int, int, int] | None = None,
+        dates: str = "datetime",
+    ) -> Iterator[tuple[Any, ...]]:
+        """Stream the rows of a worksheet.
+
+        Rows are rectangular: missing cells are None and missing rows are
+        all None, up to the last row holding data (rows past it are not
+        returned). Numbers are floats, like the values returned through COM.
+
+        Args:
+            sheet_name: Worksheet name
+            bounds: (first row, first column, last row, last column), 1-based;
+                from A1 to the last row and column holding data by default
+            dates: Representation of date cells (one of ``DATE_MODES``)
+
+        Yields:
+            Rows of values
+
+        Raises:
+            InvalidParameterError: If the worksheet does not exist
+        """
+        if sheet_name not in self._sheets:
+            raise InvalidParameterError("sheet_name", sheet_name, "Worksheet not found")
+        if bounds is None:
+            last_row, last_col = self.dimensions(sheet_name)
+            bounds = (1, 1, last_row, last_col)
+        first_row, first_col, last_row, last_col = bounds
+        width = last_col - first_col + 1
+
+        next_row = first_row
+        with zipfile.ZipFile(self.path) as archive, archive.open(self._sheets[sheet_name]) as f:
+            for number, cells in self._parse_rows(f, first_col, last_col, dates):
+                if number < first_row:
+                    continue
+                if number > last_row:
+                    break
+                while next_row < number:
+                    yield (None,) * width
+                    next_row += 1
+                row = [None] * width
+                for col, value in cells:
+                    row[col - first_col] = value
+                yield tuple(row)
+                next_row = number + 1
+
+    def read_formulas(
+        self, sheet_name: str, dates: str = "serial"
+    ) -> tuple[list[tuple[Any, ...]], list[tuple[str | None, ...]]]:
+        """Read a whole worksheet with the formulas of its cells, in one pass.
+
+        Unlike iter_rows(), the sheet is held in memory. Shared formulas are
+        expanded to the text each cell would show in Excel, by moving the
+        references of the first cell of the block.
+
+        Args:
+            sheet_name: Worksheet name
+            dates: Representation of date cells (one of ``DATE_MODES``)
+
+        Returns:
+            Rows of values and rows of formulas (``"=..."`` texts, None for
+            constant and empty cells), from A1 to the last row and column
+            holding data
+
+        Raises:
+            InvalidParameterError: If the worksheet does not exist
+        """
+        if sheet_name not in self._sheets:
+            raise InvalidParameterError("sheet_name", sheet_name, "Worksheet not found")
+        with zipfile.ZipFile(self.path) as archive, archive.open(self._sheets[sheet_name]) as f:
+            parsed = [
+                (number, cells)
+                for number, cells in self._parse_rows(f, 1, None, dates, formulas=True)
+                if cells
+            ]
+        width = max((cells[-1][0] for _, cells in parsed), default=1)
+        values: list[tuple[Any, ...]] = []
+        formulas: list[tuple[str | None, ...]] = []
+        empty = (None,) * width
+        for number, cells in parsed:
+            while len(values) < number - 1:
+                values.append(empty)
+                formulas.append(empty)
+            row_values, row_formulas = [None] * width, [None] * width
+            for col, (value, formula) in cells:
+                row_values[col - 1] = value
+                row_formulas[col - 1] = formula
+            values.append(tuple(row_values))
+            formulas.append(tuple(row_formulas))
+        return values, formulas
+
+    def dimensions(self, sheet_name: str) -> tuple[int, int]:
+        """Get the last row and column holding data (one pass over the sheet)."""
+        last_row = last_col = 1
+        with zipfile.ZipFile(self.path) as archive, archive.open(self._sheets[sheet_name]) as f:
+            # Formula cells without a cached value count too
+            for number, cells in self._parse_rows(f, 1, None, "serial", formulas=True):
+                if cells:
+                    last_row = number
+                    last_col = max(last_col, cells[-1][0])
+        return last_row, last_col
+
+    # -- parsing ------------------------------------------------------------------
+
+    def _parse_rows(
+        self,
+        f: IO[bytes],
+        first_col: int,
+        last_col: int | None,
+        dates: str,
+        formulas: bool = False,
+    ) -> Iterator[tuple[int, list[tuple[int, Any]]]]:
+        """Yield (row number, [(column, value)]) for each ``<row>`` of a sheet.
+
+        With ``formulas``, values are (value, formula) pairs.
+        """
+        sheet_data = None
+        number = 0
+        # Text and position of the first cell of each shared formula block
+        shared: dict[str, tuple[int, int, str]] = {}
+        for event, element in iterparse(f, events=("start", "end")):
+            if event == "start":
+                if element.tag == f"{_MAIN}sheetData":
+                    sheet_data = element
+                continue
+            if element.tag != f"{_MAIN}row":
+                continue
+
+            number = int(element.get("r") or number + 1)
+            cells = []
+            col = 0
+            for cell in element.iter(f"{_MAIN}c"):
+                ref = cell.get("r")
+                col = column_number(_CELL_REF.match(ref).group(1)) if ref else col + 1
+                if col < first_col or (last_col is not None and col > last_col):
+                    continue
+                value = self._cell_value(cell, dates)
+                if formulas:
+                    formula = _formula(cell, number, col, shared)
+                    if value is not None or formula is not None:
+                        cells.append((col, (value, formula)))
+                elif value is not None:
+                    cells.append((col, value))
+            yield number, cells
+
+            # Drop the rows already read to keep memory constant
+            if sheet_data is not None:
+                sheet_data.clear()
+
+    def _cell_value(self, cell: Any, dates: str) -> Any:
+        """Convert a ``<c>`` element to a value."""
+        kind = cell.get("t", "n")
+        if kind == "inlineStr":
+            inline = cell.find(f"{_MAIN}is")
+            return _text(inline) if inline is not None else None
+        v = cell.find(f"{_MAIN}v")
+        if v is None or v.text is None:
+            return None
+        if kind == "s":
+            return self._strings[int(v.text)]
+        if kind == "b":
+            return v.text == "1"
+        if kind in ("str", "e", "d"):
+            return v.text
+        number = float(v.text)
+        if dates != "serial" and int(cell.get("s", 0)) in self._date_styles:
+            return serial_to_iso(number) if dates == "iso" else serial_to_datetime(number)
+        return number
+
+    @staticmethod
+    def _read_workbook(archive: zipfile.ZipFile) -> tuple[dict[str, str], str | None]:
+        """Map the sheet names to their part in the archive."""
+        with archive.open("xl/_rels/workbook.xml.rels") as f:
+            targets = {
+                rel.get("Id"): rel.get("Target")
+                for _, rel in iterparse(f)
+                if rel.tag == f"{_PKG_REL}Relationship"
+            }
+        sheets: dict[str, str] = {}
+        active_tab = 0
+        with archive.open("xl/workbook.xml") as f:
+            for _, element in iterparse(f):
+                if element.tag == f"{_MAIN}workbookView":
+                    active_tab = int(element.get("activeTab", 0))
+                elif element.tag == f"{_MAIN}sheet":
+                    target = targets[element.get(f"{_REL}id")]
+                    part = target.lstrip("/") if target.startswith("/") else f"xl/{target}"
+                    sheets[element.get("name")] = posixpath.normpath(part)
+        names = list(sheets)
+        return sheets, names[active_tab] if active_tab < len(names) else None
+
+    @staticmethod
+    def _read_date_styles(archive: zipfile.ZipFile) -> frozenset[int]:
+        """Indexes of the cell styles (``s`` attribute) whose number format is a date."""
+        if "xl/styles.xml" not in archive.namelist():
+            return frozenset()
+        custom: dict[int, str] = {}
+        styles: list[int] = []
+        with archive.open("xl/styles.xml") as f:
+            in_cell_xfs = False
+            for event, element in iterparse(f, events=("start", "end")):
+                if element.tag == f"{_MAIN}cellXfs":
+                    in_cell_xfs = event == "start"
+                elif event == "end" and element.tag == f"{_MAIN}numFmt":
+                    custom[int(element.get("numFmtId"))] = element.get("formatCode", "")
+                elif event == "end" and element.tag == f"{_MAIN}xf" and in_cell_xfs:
+                    styles.append(int(element.get("numFmtId", 0)))
+        return frozenset(
+            index
+            for index, fmt_id in enumerate(styles)
+            if fmt_id in _BUILTIN_DATE_FORMATS or is_date_format(custom.get(fmt_id))
+        )
+
+    @staticmethod
+    def _read_shared_strings(archive: zipfile.ZipFile) -> list[str]:
+        """Load the shared string table."""
+        if "xl/sharedStrings.xml" not in archive.namelist():
+            return []
+        strings = []
+        with archive.open("xl/sharedStrings.xml") as f:
+            for _, element in iterparse(f):
+                if element.tag == f"{_MAIN}si":
+                    strings.append(_text(element))
+                    element.clear()
+        return strings
@@ -0,0 +1,362 @@
+"""Streaming .xlsx writer that needs neither Excel nor third-party packages.
+
+Rows are serialized to SpreadsheetML as they are added and streamed into the
+zip archive, so memory does not grow with the number of rows; only the table
+of distinct strings (shared by all sheets, unless strings are written
+inline) and the styles are kept until the workbook is closed. Dates are
+written as serial numbers with a date format, like Excel stores them.
+"""
+
+import math
+import re
+import zipfile
+from collections.abc import Iterable, Mapping, Sequence
+from datetime import date, datetime, time
+from decimal import Decimal
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any
+from xml.sax.saxutils import escape, quoteattr
+
+from ..core.exceptions import InvalidParameterError
+from ..utils.a1 import column_letters, column_number
+from .dates import EXCEL_EPOCH
+
+#: Number formats applied to date and datetime values without an explicit format
+DATE_FORMAT = "yyyy-mm-dd"
+DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+
+# Built-in number formats (no numFmt element needed)
+_BUILTIN_FORMATS = {"General": 0, "0": 1, "0.00": 2, "#,##0": 3, "#,##0.00": 4, "0%": 9}
+
+# Characters that are not allowed in XML 1.0
+_INVALID_XML = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_DATE_TYPES = (date, datetime, time)
+
+# Rows serialized before a write to the archive
+_FLUSH_ROWS = 1000
+
+_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+_XML = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+
+def _serial(value: date | datetime | time) -> float:
+    """Excel serial number of a date, datetime or time of day."""
+    if isinstance(value, time):
+        return (value.hour * 3600 + value.minute * 60 + value.second) / 86400
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    return (value.replace(tzinfo=None) - EXCEL_EPOCH).total_seconds() / 86400
+
+
+class XlsxWriter:
+    """Writes a workbook one row at a time.
+
+    Usage::
+
+        with XlsxWriter("report.xlsx") as writer:
+            writer.add_sheet("Data", column_formats={2: "0.00"})
+            writer.write_row(["name", "price"], bold=True)
+            writer.write_rows(rows)
+
+    Args:
+        path: Destination .xlsx file
+        compression: Deflate the parts of the archive (slower, smaller)
+        shared_strings: Store each distinct string once in the shared string
+            table (smaller files); when False, strings are written inline and
+            memory stays constant even with millions of distinct strings
+    """
+
+    def __init__(
+        self, path: str | Path, compression: bool = True, shared_strings: bool = True
+    ) -> None:
+        """Create the archive."""
+        self.path = Path(path)
+        self._shared_strings = shared_strings
+        self._archive = zipfile.ZipFile(
+            self.path, "w", zipfile.ZIP_DEFLATED if compression else zipfile.ZIP_STORED
+        )
+        self._sheets: list[str] = []
+        self._stream: IO[bytes] | None = None
+        self._buffer: list[str] = []
+        self._row = 0
+        self._column_styles: dict[int, int] = {}
+        self._strings: dict[str, int] = {}
+        self._string_count = 0
+        self._formats: dict[str, int] = {}
+        self._styles: dict[tuple[int, bool], int] = {(0, False): 0}
+        self._letters: list[str] = []
+        self.rows_written = 0
+
+    def __enter__(self) -> "XlsxWriter":
+        """Return the writer."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the workbook (an incomplete file is removed on errors)."""
+        if exc_type is None:
+            self.close()
+        else:
+            self._archive.close()
+            self.path.unlink(missing_ok=True)
+
+    # -- public API ---------------------------------------------------------------
+
+    def add_sheet(
+        self,
+        name: str,
+        column_formats: Mapping[int, str] | Sequence[str | None] | None = None,
+        column_widths: Mapping[int, float] | Sequence[float | None] | None = None,
+    ) -> None:
+        """Start a new worksheet (the previous one is finished).
+
+        Args:
+            name: Worksheet name (31 characters at most, no ``[]:*?/\\``)
+            column_formats: Number format per column (1-based number or
+                letter), or a list of formats in column order (None for General)
+            column_widths: Width per column, or a list in column order
+        """
+        if not name or len(name) > 31 or re.search(r"[\[\]:*?/\\]", name):
+            raise InvalidParameterError("sheet_name", name, "Invalid worksheet name")
+        if name in self._sheets:
+            raise InvalidParameterError("sheet_name", name, "Duplicate worksheet name")
+        self._finish_sheet()
+
+        self._sheets.append(name)
+        self._row = 0
+        self._column_styles = {
+            col: self._style(fmt, False)
+            for col, fmt in _by_column(column_formats).items()
+            if fmt is not None
+        }
+        self._stream = self._archive.open(
+            f"xl/worksheets/sheet{len(self._sheets)}.xml", "w", force_zip64=True
+        )
+        head = [_XML, f'<worksheet xmlns="{_MAIN}">']
+        widths = _by_column(column_widths)
+        if widths:
+            head.append("<cols>")
+            head.extend(
+                f'<col min="{c}" max="{c}" width="{w}" customWidth="1"/>'
+                for c, w in sorted(widths.items())
+                if w is not None
+            )
+            head.append("</cols>")
+        head.append("<sheetData>")
+        self._stream.write("".join(head).encode("utf-8"))
+
+    def write_row(self, values: Iterable[Any], bold: bool = False) -> None:
+        """Append a row to the current worksheet.
+
+        Args:
+            values: Cell values (None leaves the cell empty; strings starting
+                with ``=`` are written as text, not formulas)
+            bold: Write the row in bold (e.g. a header)
+        """
+        if self._stream is None:
+            self.add_sheet(f"Sheet{len(self._sheets) + 1}")
+        self._row += 1
+        row = self._row
+        cells = []
+        for col, value in enumerate(values, start=1):
+            if value is None:
+                continue
+            if col > len(self._letters):
+                self._letters.extend(
+                    column_letters(c) for c in range(len(self._letters) + 1, col + 1)
+                )
+            cells.append(self._cell(f"{self._letters[col - 1]}{row}", col, value, bold))
+        self._buffer.append(f'<row r="{row}">{"".join(cells)}</row>')
+        self.rows_written += 1
+        if len(self._buffer) >= _FLUSH_ROWS:
+            self._flush()
+
+    def write_rows(self, rows: Iterable[Iterable[Any]]) -> None:
+        """Append rows to the current worksheet."""
+        for values in rows:
+            self.write_row(values)
+
+    def close(self) -> None:
+        """Finish the last worksheet and write the workbook parts."""
+        if self._archive.fp is None:
+            return
+        if not self._sheets:
+            self.add_sheet("Sheet1")
+        self._finish_sheet()
+        parts = {
+            "[Content_Types].xml": self._content_types(),
+            "_rels/.rels": (
+                f'{_XML}<Relationships xmlns="{_PKG_REL}"><Relationship Id="rId1" '
+                f'Type="{_REL}/officeDocument" Target="xl/workbook.xml"/></Relationships>'
+            ),
+            "xl/workbook.xml": self._workbook(),
+            "xl/_rels/workbook.xml.rels": self._workbook_rels(),
+            "xl/styles.xml": self._stylesheet(),
+        }
+        for name, content in parts.items():
+            self._archive.writestr(name, content)
+        with self._archive.open("xl/sharedStrings.xml", "w", force_zip64=True) as f:
+            f.write(
+                f'{_XML}<sst xmlns="{_MAIN}" count="{self._string_count}" '
+                f'uniqueCount="{len(self._strings)}">'.encode()
+            )
+            for text in self._strings:
+                space = ' xml:space="preserve"' if text != text.strip() else ""
+                f.write(f"<si><t{space}>{escape(text)}</t></si>".encode())
+            f.write(b"</sst>")
+        self._archive.close()
+
+    # -- cells --------------------------------------------------------------------
+
+    def _cell(self, ref: str, col: int, value: Any, bold: bool) -> str:
+        """SpreadsheetML of one cell."""
+        style = self._column_styles.get(col, 0)
+        kind = type(value)
+        if bold and kind not in _DATE_TYPES:
+            style = self._bold(style)
+        attr = f' s="{style}"' if style else ""
+
+        # Fast paths for the common types, checked before the isinstance() chain
+        if kind is float and math.isfinite(value):
+            return f'<c r="{ref}"{attr}><v>{value!r}</v></c>'
+        if kind is int:
+            return f'<c r="{ref}"{attr}><v>{value}</v></c>'
+        if kind is not str:
+            if isinstance(value, bool):
+                return f'<c r="{ref}"{attr} t="b"><v>{int(value)}</v></c>'
+            if isinstance(value, (date, time)):
+                if style == 0:
+                    fmt = DATE_FORMAT if kind is date else DATETIME_FORMAT
+                    style = self._style(fmt, bold)
+                elif bold:
+                    style = self._bold(style)
+                return f'<c r="{ref}" s="{style}"><v>{_serial(value)!r}</v></c>'
+            if isinstance(value, (int, float, Decimal)) and math.isfinite(value):
+                number = value if isinstance(value, int) else float(value)
+                return f'<c r="{ref}"{attr}><v>{number!r}</v></c>'
+            value = str(value)
+
+        text = _INVALID_XML.sub("", value)
+        if not self._shared_strings:
+            space = ' xml:space="preserve"' if text != text.strip() else ""
+            return f'<c r="{ref}"{attr} t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
+        index = self._strings.setdefault(text, len(self._strings))
+        self._string_count += 1
+        return f'<c r="{ref}"{attr} t="s"><v>{index}</v></c>'
+
+    def _style(self, number_format: str | None, bold: bool) -> int:
+        """Index of the cell style with a number format and font."""
+        number_format = number_format or "General"
+        fmt_id = _BUILTIN_FORMATS.get(number_format)
+        if fmt_id is None:
+            fmt_id = self._formats.setdefault(number_format, 164 + len(self._formats))
+        return self._styles.setdefault((fmt_id, bold), len(self._styles))
+
+    def _bold(self, style: int) -> int:
+        """Bold variant of a cell style."""
+        fmt_id = next(f for (f, _), index in self._styles.items() if index == style)
+        return self._styles.setdefault((fmt_id, True), len(self._styles))
+
+    # -- parts --------------------------------------------------------------------
+
+    def _flush(self) -> None:
+        if self._buffer and self._stream is not None:
+            self._stream.write("".join(self._buffer).encode("utf-8"))
+            self._buffer.clear()
+
+    def _finish_sheet(self) -> None:
+        if self._stream is None:
+            return
+        self._flush()
+        self._stream.write(b"</sheetData></worksheet>")
+        self._stream.close()
+        self._stream = None
+
+    def _content_types(self) -> str:
+        ct = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+        overrides = "".join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" ContentType="{ct}.worksheet+xml"/>'
+            for i in range(1, len(self._sheets) + 1)
+        )
+        return (
+            f'{_XML}<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" '
+            'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            f'<Override PartName="/xl/workbook.xml" ContentType="{ct}.sheet.main+xml"/>'
+            f'<Override PartName="/xl/styles.xml" ContentType="{ct}.styles+xml"/>'
+            f'<Override PartName="/xl/sharedStrings.xml" ContentType="{ct}.sharedStrings+xml"/>'
+            f"{overrides}</Types>"
+        )
+
+    def _workbook(self) -> str:
+        sheets = "".join(
+            f'<sheet name={quoteattr(name)} sheetId="{i}" r:id="rId{i}"/>'
+            for i, name in enumerate(self._sheets, start=1)
+        )
+        return (
+            f'{_XML}<workbook xmlns="{_MAIN}" xmlns:r="{_REL}">'
+            f"<bookViews><workbookView/></bookViews><sheets>{sheets}</sheets></workbook>"
+        )
+
+    def _workbook_rels(self) -> str:
+        count = len(self._sheets)
+        rels = [
+            f'<Relationship Id="rId{i}" Type="{_REL}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+            for i in range(1, count + 1)
+        ]
+        rels.append(f'<Relationship Id="rId{count + 1}" Type="{_REL}/styles" Target="styles.xml"/>')
+        rels.append(
+            f'<Relationship Id="rId{count + 2}" Type="{_REL}/sharedStrings" '
+            'Target="sharedStrings.xml"/>'
+        )
+        return f'{_XML}<Relationships xmlns="{_PKG_REL}">{"".join(rels)}</Relationships>'
+
+    def _stylesheet(self) -> str:
+        formats = "".join(
+            f"<numFmt numFmtId={quoteattr(str(fmt_id))} formatCode={quoteattr(code)}/>"
+            for code, fmt_id in self._formats.items()
+        )
+        xfs = []
+        for (fmt_id, bold), _ in sorted(self._styles.items(), key=lambda item: item[1]):
+            apply = ' applyNumberFormat="1"' if fmt_id else ""
+            apply += ' applyFont="1"' if bold else ""
+            xfs.append(
+                f'<xf numFmtId="{fmt_id}" fontId="{int(bold)}" fillId="0" borderId="0" '
+                f'xfId="0"{apply}/>'
+            )
+        return (
+            f'{_XML}<styleSheet xmlns="{_MAIN}">'
+            f'<numFmts count="{len(self._formats)}">{formats}</numFmts>'
+            '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+            '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+            '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+            '<fill><patternFill patternType="gray125"/></fill></fills>'
+            '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border>'
+            "</borders>"
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>'
+            "</cellStyleXfs>"
+            f'<cellXfs count="{len(xfs)}">{"".join(xfs)}</cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+            "</styleSheet>"
+        )
+
+
+def _by_column(spec: Mapping[int, Any] | Sequence[Any] | None) -> dict[int, Any]:
+    """Normalize a per-column setting to a mapping of 1-based columns."""
+    if not spec:
+        return {}
+    if isinstance(spec, Mapping):
+        return {
+            int(col) if str(col).isdigit() else column_number(str(col)): value
+            for col, value in spec.items()
+        }
+    return dict(enumerate(spec, start=1))
@@ -0,0 +1,212 @@
+"""Building blocks of the simulated COM object models.
+
+Every fake object exposes its automation interface with PascalCase names, like
+the real Office type libraries. Each access to such a name (property get,
+property put or method lookup) stands for one IDispatch round trip: it is
+counted by the session and delayed by the configured latency. Lowercase names
+are in-process helpers (fixtures for tests, internal state) and cost nothing.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from typing import Any
+
+
+class FakeComSession:
+    """Shared state of the fake applications created by one factory.
+
+    Args:
+        latency: Simulated duration of one IDispatch call, in seconds
+    """
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """Initialize the session."""
+        self.latency = latency
+        self._calls = 0
+        self._lock = threading.Lock()
+        self._ids = 0
+        #: Snapshots of the documents saved during the session, by full path
+        self.files: dict[str, Any] = {}
+
+    @property
+    def calls(self) -> int:
+        """Number of IDispatch calls made since the last reset."""
+        return self._calls
+
+    def invoke(self) -> None:
+        """Account for one IDispatch call."""
+        with self._lock:
+            self._calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def reset(self) -> int:
+        """Reset the call counter.
+
+        Returns:
+            Number of calls counted before the reset
+        """
+        with self._lock:
+            calls, self._calls = self._calls, 0
+        return calls
+
+    def next_id(self) -> str:
+        """Generate a unique identifier (EntryID-like)."""
+        with self._lock:
+            self._ids += 1
+            return f"{self._ids:032X}"
+
+
+def is_dispatch_name(name: str) -> bool:
+    """Check whether an attribute name belongs to the automation interface."""
+    return name[:1].isupper()
+
+
+class FakeObject:
+    """Base class of the simulated automation objects.
+
+    Unknown PascalCase attributes resolve to permissive ``FakeDispatch``
+    children, so that the parts of the object models that are not simulated
+    still accept any call.
+    """
+
+    def __init__(self, session: FakeComSession) -> None:
+        """Initialize the object."""
+        object.__setattr__(self, "_session", session)
+        object.__setattr__(self, "_extras", {})
+
+    def __getattribute__(self, name: str) -> Any:
+        """Count PascalCase accesses as IDispatch calls."""
+        if is_dispatch_name(name):
+            object.__getattribute__(self, "_session").invoke()
+        return object.__getattribute__(self, name)
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolve attributes that are not simulated."""
+        if not is_dispatch_name(name):
+            raise AttributeError(name)
+        extras = object.__getattribute__(self, "_extras")
+        if name not in extras:
+            extras[name] = FakeDispatch(object.__getattribute__(self, "_session"), name)
+        return extras[name]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Count PascalCase assignments as IDispatch calls."""
+        if is_dispatch_name(name):
+            object.__getattribute__(self, "_session").invoke()
+            if not hasattr(type(self), name):
+                object.__getattribute__(self, "_extras")[name] = value
+                return
+        object.__setattr__(self, name, value)
+
+    def set(self, **properties: Any) -> "FakeObject":
+        """Set properties without simulating IDispatch calls (fixtures).
+
+        Returns:
+            The object itself
+        """
+        for name, value in properties.items():
+            if hasattr(type(self), name):
+                object.__setattr__(self, name, value)
+            else:
+                object.__getattribute__(self, "_extras")[name] = value
+        return self
+
+
+class FakeDispatch(FakeObject):
+    """Permissive object standing for a part of the model that is not simulated.
+
+    It records the properties assigned to it, returns a new permissive object
+    when called, and behaves as an empty collection.
+    """
+
+    def __init__(self, session: FakeComSession, name: str = "Object") -> None:
+        """Initialize the object."""
+        super().__init__(session)
+        object.__setattr__(self, "_name", name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> "FakeDispatch":
+        """Simulate a method call or an indexed access."""
+        return FakeDispatch(self._session, self._name)
+
+    @property
+    def Count(self) -> int:
+        """Number of items (always empty)."""
+        return 0
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over no items."""
+        return iter(())
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"<FakeDispatch {self._name}>"
+
+
+class FakeCollection(FakeObject):
+    """Base class of the simulated 1-based COM collections.
+
+    Subclasses provide ``_items()`` and may override ``_match`` to support
+    lookups by name.
+    """
+
+    def _items(self) -> list[Any]:
+        """Items of the collection, in order."""
+        raise NotImplementedError
+
+    def _match(self, item: Any, key: str) -> bool:
+        """Check whether an item matches a string key."""
+        return getattr(item, "_name", None) == key
+
+    @property
+    def Count(self) -> int:
+        """Number of items."""
+        return len(self._items())
+
+    def Item(self, index: int | str) -> Any:
+        """Get an item by 1-based index or name."""
+        return self._get(index)
+
+    def __call__(self, index: int | str) -> Any:
+        """Get an item by 1-based index or name (default member)."""
+        self._session.invoke()
+        return self._get(index)
+
+    def _get(self, index: int | str) -> Any:
+        """Resolve an item without accounting for a call."""
+        items = self._items()
+        if isinstance(index, str):
+            for item in items:
+                if self._match(item, index):
+                    return item
+            raise KeyError(f"Item '{index}' not found")
+        if not 1 <= int(index) <= len(items):
+            raise IndexError(f"Index {index} out of range")
+        return items[int(index) - 1]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the items, one IDispatch call per item."""
+        for item in list(self._items()):
+            self._session.invoke()
+            yield item
+
+    def __len__(self) -> int:
+        """Number of items (no IDispatch call)."""
+        return len(self._items())
+
+
+def unique_name(prefix: str, taken: Callable[[str], bool]) -> str:
+    """Generate the next free ``<prefix><n>`` name.
+
+    Args:
+        prefix: Name prefix such as ``"Sheet"``
+        taken: Predicate telling whether a name is already used
+
+    Returns:
+        First unused name
+    """
+    n = 1
+    while taken(f"{prefix}{n}"):
+        n += 1
+    return f"{prefix}{n}"
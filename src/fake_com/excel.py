@@ -0,0 +1,932 @@
+"""Simulated Excel object model.
+
+Covers the parts the services drive the most: Application, Workbooks,
+Worksheets, Range (Value, Value2, Formula, Cells, Rows, Columns, Resize,
+Offset, ClearContents, Replace, Copy) and range formatting (Interior, Font,
+Borders and the alignment/number-format properties), which also applies to
+multi-area ranges (``"A1:B2,D4"``). Everything else resolves to permissive
+placeholders.
+
+Cells hold the values COM would return: numbers come back as floats, dates as
+``datetime`` through ``Value`` and as serial numbers through ``Value2``. Formulas
+are stored but not evaluated.
+"""
+
+import copy
+import os
+import re
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from .base import FakeCollection, FakeComSession, FakeObject, unique_name
+
+MAX_ROWS = 1048576
+MAX_COLUMNS = 16384
+EXCEL_EPOCH = datetime(1899, 12, 30)
+#: Longest reference accepted by Worksheet.Range
+MAX_ADDRESS_LENGTH = 255
+
+_CELL_RE = re.compile(r"^\$?([A-Z]{1,3})?\$?(\d+)?$")
+
+FORMAT_DEFAULTS = {
+    "NumberFormat": "General",
+    "HorizontalAlignment": 1,  # xlGeneral
+    "VerticalAlignment": -4107,  # xlBottom
+    "WrapText": False,
+    "ColumnWidth": 8.43,
+    "RowHeight": 15.0,
+    "Locked": True,
+    "Font.Bold": False,
+    "Font.Italic": False,
+    "Font.Color": 0,
+    "Font.Size": 11.0,
+    "Font.Name": "Calibri",
+    "Interior.Color": 16777215,
+}
+
+
+def column_index(letters: str) -> int:
+    """Convert column letters to a 1-based index."""
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + ord(char) - 64
+    return index
+
+
+def column_letters(index: int) -> str:
+    """Convert a 1-based column index to letters."""
+    letters = ""
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def parse_address(address: str) -> tuple[int, int, int, int]:
+    """Parse an A1 reference (cell, range, whole rows or whole columns).
+
+    Args:
+        address: Reference such as ``"A1"``, ``"$A$1:C3"``, ``"B:B"`` or ``"2:4"``
+
+    Returns:
+        1-based ``(first_row, first_col, last_row, last_col)``
+
+    Raises:
+        ValueError: If the reference is invalid
+    """
+    address = address.split("!")[-1].replace("$", "").strip().upper()
+    parts = address.split(":")
+    if not 1 <= len(parts) <= 2:
+        raise ValueError(f"Invalid range reference: {address}")
+
+    bounds = []
+    for part in parts:
+        match = _CELL_RE.match(part)
+        if not match or not any(match.groups()):
+            raise ValueError(f"Invalid range reference: {address}")
+        bounds.append(match.groups())
+
+    (col1, row1), (col2, row2) = bounds[0], bounds[-1]
+    if (col1 is None) != (col2 is None) or (row1 is None) != (row2 is None):
+        raise ValueError(f"Invalid range reference: {address}")
+
+    r1, r2 = (int(row1), int(row2)) if row1 else (1, MAX_ROWS)
+    c1, c2 = (column_index(col1), column_index(col2)) if col1 else (1, MAX_COLUMNS)
+    return min(r1, r2), min(c1, c2), max(r1, r2), max(c1, c2)
+
+
+def to_com_value(value: Any) -> Any:
+    """Convert a Python value the way a COM VARIANT round trip would."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int | Decimal):
+        return float(value)
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def to_serial(value: Any) -> Any:
+    """Convert dates to Excel serial numbers (Value2 representation)."""
+    if isinstance(value, datetime):
+        return (value.replace(tzinfo=None) - EXCEL_EPOCH) / timedelta(days=1)
+    return value
+
+
+class ExcelWorksheetData:
+    """Cell storage of one worksheet."""
+
+    def __init__(self) -> None:
+        """Initialize empty storage."""
+        self.values: dict[tuple[int, int], Any] = {}
+        self.formulas: dict[tuple[int, int], str] = {}
+        # Formatting runs: (r1, c1, r2, c2, key, value), latest wins
+        self.formats: list[tuple[int, int, int, int, str, Any]] = []
+
+    def used_bounds(self) -> tuple[int, int, int, int]:
+        """Bounding box of the non-empty cells (A1 when empty)."""
+        cells = self.values.keys() | self.formulas.keys()
+        if not cells:
+            return 1, 1, 1, 1
+        rows = [r for r, _ in cells]
+        cols = [c for _, c in cells]
+        return min(rows), min(cols), max(rows), max(cols)
+
+    def format_value(self, row: int, col: int, key: str) -> Any:
+        """Get the formatting property of one cell."""
+        for r1, c1, r2, c2, k, value in reversed(self.formats):
+            if k == key and r1 <= row <= r2 and c1 <= col <= c2:
+                return value
+        return FORMAT_DEFAULTS.get(key)
+
+    def clear(self, r1: int, c1: int, r2: int, c2: int) -> None:
+        """Remove the values and formulas of a block."""
+        for store in (self.values, self.formulas):
+            for key in [k for k in store if r1 <= k[0] <= r2 and c1 <= k[1] <= c2]:
+                del store[key]
+
+
+class _FormatProxy(FakeObject):
+    """Formatting sub-object of a range (Font, Interior, Borders(i))."""
+
+    def __init__(self, rng: "ExcelRange", prefix: str) -> None:
+        """Initialize the proxy."""
+        super().__init__(rng._session)
+        object.__setattr__(self, "_range", rng)
+        object.__setattr__(self, "_prefix", prefix)
+
+    def __call__(self, index: Any) -> "_FormatProxy":
+        """Select an indexed sub-object, e.g. ``Borders(7)``."""
+        self._session.invoke()
+        return _FormatProxy(self._range, f"{self._prefix}({index})")
+
+    def __getattr__(self, name: str) -> Any:
+        """Read a formatting property of the top-left cell."""
+        if not name[:1].isupper():
+            raise AttributeError(name)
+        return self._range._format_value(f"{self._prefix}.{name}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Apply a formatting property to the whole range."""
+        self._session.invoke()
+        self._range._apply_format(f"{self._prefix}.{name}", value)
+
+
+class ExcelRange(FakeObject):
+    """A rectangular block of cells.
+
+    ``mode`` selects what the range enumerates, like the Range objects
+    returned by ``Rows`` and ``Columns``: cells, rows or columns.
+    """
+
+    def __init__(
+        self,
+        sheet: "ExcelWorksheet",
+        r1: int,
+        c1: int,
+        r2: int,
+        c2: int,
+        mode: str = "cells",
+        areas: list[tuple[int, int, int, int]] | None = None,
+    ) -> None:
+        """Initialize the range (``areas``: every block of a multi-area range)."""
+        super().__init__(sheet._session)
+        object.__setattr__(self, "_sheet", sheet)
+        object.__setattr__(self, "_bounds", (r1, c1, r2, c2))
+        object.__setattr__(self, "_mode", mode)
+        object.__setattr__(self, "_areas", areas or [(r1, c1, r2, c2)])
+
+    # -- helpers --------------------------------------------------------------
+
+    @property
+    def _data(self) -> ExcelWorksheetData:
+        return self._sheet._data
+
+    def _clipped(self) -> tuple[int, int, int, int]:
+        """Bounds limited to the used area for whole rows/columns."""
+        r1, c1, r2, c2 = self._bounds
+        if r2 == MAX_ROWS or c2 == MAX_COLUMNS:
+            _, _, used_r2, used_c2 = self._data.used_bounds()
+            if r2 == MAX_ROWS:
+                r2 = max(r1, min(r2, used_r2))
+            if c2 == MAX_COLUMNS:
+                c2 = max(c1, min(c2, used_c2))
+        return r1, c1, r2, c2
+
+    def _read(self, serial: bool) -> Any:
+        r1, c1, r2, c2 = self._clipped()
+        values = self._data.values
+        convert = to_serial if serial else None
+        if r1 == r2 and c1 == c2:
+            value = values.get((r1, c1))
+            return convert(value) if convert else value
+        if convert:
+            return tuple(
+                tuple(convert(values.get((r, c))) for c in range(c1, c2 + 1))
+                for r in range(r1, r2 + 1)
+            )
+        return tuple(
+            tuple(values.get((r, c)) for c in range(c1, c2 + 1)) for r in range(r1, r2 + 1)
+        )
+
+    def _write(self, value: Any) -> None:
+        r1, c1, r2, c2 = self._bounds
+        data = self._data
+        if isinstance(value, list | tuple):
+            grid = [list(row) if isinstance(row, list | tuple) else None for row in value]
+            if any(row is None for row in grid):
+                grid = [list(value)]  # 1-D arrays are written as a single row
+            if r2 == MAX_ROWS:
+                r2 = r1 + len(grid) - 1
+            if c2 == MAX_COLUMNS:
+                c2 = c1 + max(len(row) for row in grid) - 1
+            for i, r in enumerate(range(r1, r2 + 1)):
+                row = grid[i] if i < len(grid) else (grid[0] if len(grid) == 1 else None)
+                for j, c in enumerate(range(c1, c2 + 1)):
+                    if row is None or (j >= len(row) and len(row) != 1):
+                        cell = "#N/A"
+                    else:
+                        cell = row[j] if j < len(row) else row[0]
+                    self._store(data, r, c, cell)
+            return
+
+        r1, c1, r2, c2 = self._clipped() if value is None else self._bounds
+        for r in range(r1, r2 + 1):
+            for c in range(c1, c2 + 1):
+                self._store(data, r, c, value)
+
+    @staticmethod
+    def _store(data: ExcelWorksheetData, row: int, col: int, value: Any) -> None:
+        data.formulas.pop((row, col), None)
+        if isinstance(value, str) and value.startswith("="):
+            data.formulas[(row, col)] = value
+            data.values.pop((row, col), None)
+            return
+        value = to_com_value(value)
+        if value is None:
+            data.values.pop((row, col), None)
+        else:
+            data.values[(row, col)] = value
+
+    def _format_value(self, key: str) -> Any:
+        r1, c1, _, _ = self._bounds
+        return self._data.format_value(r1, c1, key)
+
+    def _apply_format(self, key: str, value: Any) -> None:
+        for area in self._areas:
+            self._data.formats.append((*area, key, value))
+
+    def _sub(self, r1: int, c1: int, r2: int, c2: int, mode: str = "cells") -> "ExcelRange":
+        return ExcelRange(self._sheet, r1, c1, r2, c2, mode)
+
+    def _item(self, row: Any, column: Any = None) -> "ExcelRange":
+        r1, c1, r2, c2 = self._bounds
+        if self._mode == "rows":
+            if isinstance(row, str):
+                first, _, last = parse_address(row)[::2]
+                return self._sub(first, c1, last, c2, "rows")
+            return self._sub(r1 + int(row) - 1, c1, r1 + int(row) - 1, c2)
+        if self._mode == "columns":
+            if isinstance(row, str):
+                _, first, _, last = parse_address(row if ":" in row else f"{row}:{row}")
+                return self._sub(r1, first, r2, last, "columns")
+            return self._sub(r1, c1 + int(row) - 1, r2, c1 + int(row) - 1)
+        if column is None:
+            # Single index: enumerate the cells row by row
+            width = c2 - c1 + 1
+            row_offset, col_offset = divmod(int(row) - 1, width)
+            return self._sub(r1 + row_offset, c1 + col_offset, r1 + row_offset, c1 + col_offset)
+        if isinstance(column, str):
+            column = column_index(column)
+        row, column = r1 + int(row) - 1, c1 + int(column) - 1
+        return self._sub(row, column, row, column)
+
+    # -- default member / enumeration ------------------------------------------
+
+    def __call__(self, row: Any, column: Any = None) -> "ExcelRange":
+        """Get a cell relative to the range (default ``Item`` member)."""
+        self._session.invoke()
+        return self._item(row, column)
+
+    def Item(self, RowIndex: Any, ColumnIndex: Any = None) -> "ExcelRange":
+        """Get a cell relative to the range."""
+        return self._item(RowIndex, ColumnIndex)
+
+    def __iter__(self) -> Iterator["ExcelRange"]:
+        """Enumerate cells, rows or columns, one IDispatch call per item."""
+        r1, c1, r2, c2 = self._clipped()
+        if self._mode == "rows":
+            items = (self._sub(r, c1, r, c2) for r in range(r1, r2 + 1))
+        elif self._mode == "columns":
+            items = (self._sub(r1, c, r2, c) for c in range(c1, c2 + 1))
+        else:
+            items = (self._sub(r, c, r, c) for r in range(r1, r2 + 1) for c in range(c1, c2 + 1))
+        for item in items:
+            self._session.invoke()
+            yield item
+
+    # -- values -----------------------------------------------------------------
+
+    @property
+    def Value(self) -> Any:
+        """Cell value(s); dates as datetime."""
+        return self._read(serial=False)
+
+    @Value.setter
+    def Value(self, value: Any) -> None:
+        self._write(value)
+
+    @property
+    def Value2(self) -> Any:
+        """Cell value(s); dates as serial numbers."""
+        return self._read(serial=True)
+
+    @Value2.setter
+    def Value2(self, value: Any) -> None:
+        self._write(value)
+
+    @property
+    def Formula(self) -> Any:
+        """Formula of the cell(s), or the constant value as text."""
+        r1, c1, r2, c2 = self._clipped()
+        data = self._data
+
+        def formula(r: int, c: int) -> str:
+            if (r, c) in data.formulas:
+                return data.formulas[(r, c)]
+            value = data.values.get((r, c))
+            return "" if value is None else str(to_serial(value))
+
+        if r1 == r2 and c1 == c2:
+            return formula(r1, c1)
+        return tuple(tuple(formula(r, c) for c in range(c1, c2 + 1)) for r in range(r1, r2 + 1))
+
+    @Formula.setter
+    def Formula(self, value: Any) -> None:
+        self._write(value)
+
+    @property
+    def FormulaArray(self) -> str:
+        """Array formula of the range."""
+        r1, c1, _, _ = self._bounds
+        return self._data.formulas.get((r1, c1), "")
+
+    @FormulaArray.setter
+    def FormulaArray(self, value: str) -> None:
+        r1, c1, r2, c2 = self._bounds
+        for r in range(r1, r2 + 1):
+            for c in range(c1, c2 + 1):
+                self._store(self._data, r, c, value)
+
+    @property
+    def HasFormula(self) -> bool | None:
+        """Whether all (True), none (False) or some (None) cells have formulas."""
+        r1, c1, r2, c2 = self._clipped()
+        flags = {
+            (r, c) in self._data.formulas for r in range(r1, r2 + 1) for c in range(c1, c2 + 1)
+        }
+        return flags.pop() if len(flags) == 1 else None
+
+    @property
+    def Text(self) -> str:
+        """Displayed text of the top-left cell."""
+        r1, c1, _, _ = self._bounds
+        value = self._data.values.get((r1, c1))
+        if value is None:
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
+
+    # -- geometry ----------------------------------------------------------------
+
+    @property
+    def Address(self) -> str:
+        """Absolute A1 address of the range."""
+        r1, c1, r2, c2 = self._bounds
+        if c1 == 1 and c2 == MAX_COLUMNS:
+            return f"${r1}:${r2}"
+        if r1 == 1 and r2 == MAX_ROWS:
+            return f"${column_letters(c1)}:${column_letters(c2)}"
+        first = f"${column_letters(c1)}${r1}"
+        if r1 == r2 and c1 == c2:
+            return first
+        return f"{first}:${column_letters(c2)}${r2}"
+
+    @property
+    def Row(self) -> int:
+        """First row number."""
+        return self._bounds[0]
+
+    @property
+    def Column(self) -> int:
+        """First column number."""
+        return self._bounds[1]
+
+    @property
+    def Count(self) -> int:
+        """Number of cells, rows or columns depending on the range kind."""
+        r1, c1, r2, c2 = self._bounds
+        if self._mode == "rows":
+            return r2 - r1 + 1
+        if self._mode == "columns":
+            return c2 - c1 + 1
+        return (r2 - r1 + 1) * (c2 - c1 + 1)
+
+    @property
+    def Rows(self) -> "ExcelRange":
+        """The range enumerated by rows."""
+        return self._sub(*self._bounds, "rows")
+
+    @property
+    def Columns(self) -> "ExcelRange":
+        """The range enumerated by columns."""
+        return self._sub(*self._bounds, "columns")
+
+    @property
+    def Cells(self) -> "ExcelRange":
+        """The range enumerated by cells."""
+        return self._sub(*self._bounds)
+
+    @property
+    def Worksheet(self) -> "ExcelWorksheet":
+        """Worksheet containing the range."""
+        return self._sheet
+
+    @property
+    def Parent(self) -> "ExcelWorksheet":
+        """Worksheet containing the range."""
+        return self._sheet
+
+    def Resize(self, RowSize: int | None = None, ColumnSize: int | None = None) -> "ExcelRange":
+        """Resize the range from its top-left cell."""
+        r1, c1, r2, c2 = self._bounds
+        rows = RowSize or r2 - r1 + 1
+        cols = ColumnSize or c2 - c1 + 1
+        return self._sub(r1, c1, r1 + rows - 1, c1 + cols - 1)
+
+    def Offset(self, RowOffset: int = 0, ColumnOffset: int = 0) -> "ExcelRange":
+        """Shift the range."""
+        r1, c1, r2, c2 = self._bounds
+        return self._sub(r1 + RowOffset, c1 + ColumnOffset, r2 + RowOffset, c2 + ColumnOffset)
+
+    # -- actions -------------------------------------------------------------------
+
+    def ClearContents(self) -> bool:
+        """Remove values and formulas."""
+        self._data.clear(*self._bounds)
+        return True
+
+    def Clear(self) -> bool:
+        """Remove values, formulas and formatting."""
+        r1, c1, r2, c2 = self._bounds
+        self._data.clear(r1, c1, r2, c2)
+        self._data.formats = [
+            run
+            for run in self._data.formats
+            if not (r1 <= run[0] and c1 <= run[1] and run[2] <= r2 and run[3] <= c2)
+        ]
+        return True
+
+    def Replace(
+        self, What: str, Replacement: str, LookAt: int = 2, MatchCase: bool = False, **_: Any
+    ) -> bool:
+        """Replace text in the cell values (xlPart by default)."""
+        r1, c1, r2, c2 = self._bounds
+        flags = 0 if MatchCase else re.IGNORECASE
+        pattern = re.compile(re.escape(str(What)), flags)
+        whole = LookAt == 1  # xlWhole
+        found = False
+        values = self._data.values
+        for (r, c), value in list(values.items()):
+            if not (r1 <= r <= r2 and c1 <= c <= c2) or not isinstance(value, str):
+                continue
+            if whole:
+                if pattern.fullmatch(value):
+                    values[(r, c)] = str(Replacement)
+                    found = True
+            elif pattern.search(value):
+                values[(r, c)] = pattern.sub(lambda _: str(Replacement), value)
+                found = True
+        return found
+
+    def Copy(self, Destination: "ExcelRange | None" = None) -> bool:
+        """Copy to a destination, or to the clipboard."""
+        if Destination is None:
+            self._sheet._workbook._app._clipboard = self
+        else:
+            self._copy_to(Destination)
+        return True
+
+    def PasteSpecial(self, *args: Any, **kwargs: Any) -> bool:
+        """Paste the clipboard range here."""
+        source = self._sheet._workbook._app._clipboard
+        if source is None:
+            raise RuntimeError("Nothing to paste")
+        source._copy_to(self)
+        return True
+
+    def _copy_to(self, destination: "ExcelRange") -> None:
+        r1, c1, r2, c2 = self._clipped()
+        dr, dc = destination._bounds[0] - r1, destination._bounds[1] - c1
+        src, dst = self._data, destination._data
+        dst.clear(r1 + dr, c1 + dc, r2 + dr, c2 + dc)
+        for store_src, store_dst in ((src.values, dst.values), (src.formulas, dst.formulas)):
+            for (r, c), value in list(store_src.items()):
+                if r1 <= r <= r2 and c1 <= c <= c2:
+                    store_dst[(r + dr, c + dc)] = value
+
+    def Calculate(self) -> bool:
+        """Recalculate the range (formulas are not evaluated)."""
+        return True
+
+    def Select(self) -> bool:
+        """Select the range."""
+        return True
+
+    # -- formatting ----------------------------------------------------------------
+
+    @property
+    def Font(self) -> _FormatProxy:
+        """Font of the range."""
+        return _FormatProxy(self, "Font")
+
+    @property
+    def Interior(self) -> _FormatProxy:
+        """Interior (fill) of the range."""
+        return _FormatProxy(self, "Interior")
+
+    @property
+    def Borders(self) -> _FormatProxy:
+        """Borders of the range; call with an index to select one edge."""
+        return _FormatProxy(self, "Borders")
+
+    def __getattr__(self, name: str) -> Any:
+        """Read a formatting property (NumberFormat, ColumnWidth...)."""
+        if name in FORMAT_DEFAULTS or any(run[4] == name for run in self._data.formats):
+            return self._format_value(name)
+        return super().__getattr__(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Write a formatting property to the whole range."""
+        if name[:1].isupper() and not hasattr(type(self), name):
+            self._session.invoke()
+            self._apply_format(name, value)
+            return
+        super().__setattr__(name, value)
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"<ExcelRange {self._sheet._name}!{object.__getattribute__(self, 'Address')}>"
+
+
+class ExcelWorksheet(FakeObject):
+    """A worksheet."""
+
+    def __init__(self, workbook: "ExcelWorkbook", name: str) -> None:
+        """Initialize an empty worksheet."""
+        super().__init__(workbook._session)
+        object.__setattr__(self, "_workbook", workbook)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_data", ExcelWorksheetData())
+        self.set(Visible=True)
+
+    @property
+    def data(self) -> ExcelWorksheetData:
+        """Cell storage (test helper, no IDispatch call)."""
+        return self._data
+
+    def range(self, address: str) -> ExcelRange:
+        """Get a range without simulating IDispatch calls (test helper)."""
+        return ExcelRange(self, *parse_address(address))
+
+    @property
+    def Name(self) -> str:
+        """Worksheet name."""
+        return self._name
+
+    @Name.setter
+    def Name(self, value: str) -> None:
+        for sheet in self._workbook._sheets:
+            if sheet is not self and sheet._name.lower() == str(value).lower():
+                raise ValueError(f"A sheet named '{value}' already exists")
+        object.__setattr__(self, "_name", str(value))
+
+    @property
+    def Index(self) -> int:
+        """1-based position in the workbook."""
+        return self._workbook._sheets.index(self) + 1
+
+    @property
+    def Parent(self) -> "ExcelWorkbook":
+        """Workbook containing the worksheet."""
+        return self._workbook
+
+    def Range(self, Cell1: Any, Cell2: Any = None) -> ExcelRange:
+        """Get a range from an A1 reference or two corner cells."""
+        if isinstance(Cell1, str) and "," in Cell1 and Cell2 is None:
+            if len(Cell1) > MAX_ADDRESS_LENGTH:
+                raise ValueError(f"Reference longer than {MAX_ADDRESS_LENGTH} characters")
+            areas = [parse_address(area) for area in Cell1.split(",")]
+            return ExcelRange(self, *areas[0], areas=areas)
+        first = Cell1._bounds if isinstance(Cell1, ExcelRange) else parse_address(str(Cell1))
+        if Cell2 is None:
+            return ExcelRange(self, *first)
+        last = Cell2._bounds if isinstance(Cell2, ExcelRange) else parse_address(str(Cell2))
+        return ExcelRange(
+            self,
+            min(first[0], last[0]),
+            min(first[1], last[1]),
+            max(first[2], last[2]),
+            max(first[3], last[3]),
+        )
+
+    @property
+    def Cells(self) -> ExcelRange:
+        """All the cells of the worksheet."""
+        return ExcelRange(self, 1, 1, MAX_ROWS, MAX_COLUMNS)
+
+    @property
+    def Rows(self) -> ExcelRange:
+        """All the rows of the worksheet."""
+        return ExcelRange(self, 1, 1, MAX_ROWS, MAX_COLUMNS, "rows")
+
+    @property
+    def Columns(self) -> ExcelRange:
+        """All the columns of the worksheet."""
+        return ExcelRange(self, 1, 1, MAX_ROWS, MAX_COLUMNS, "columns")
+
+    @property
+    def UsedRange(self) -> ExcelRange:
+        """Smallest range containing every non-empty cell."""
+        return ExcelRange(self, *self._data.used_bounds())
+
+    def Calculate(self) -> bool:
+        """Recalculate the worksheet (formulas are not evaluated)."""
+        return True
+
+    def Activate(self) -> bool:
+        """Make the worksheet active."""
+        object.__setattr__(self._workbook, "_active", self)
+        return True
+
+    def Select(self) -> bool:
+        """Select the worksheet."""
+        return self.Activate()
+
+    def Delete(self) -> bool:
+        """Remove the worksheet from its workbook."""
+        sheets = self._workbook._sheets
+        if len(sheets) == 1:
+            raise RuntimeError("A workbook must contain at least one visible worksheet")
+        sheets.remove(self)
+        if self._workbook._active is self:
+            object.__setattr__(self._workbook, "_active", sheets[0])
+        return True
+
+    def Copy(self, Before: "ExcelWorksheet | None" = None, After: Any = None) -> None:
+        """Copy the worksheet within its workbook."""
+        workbook = self._workbook
+        name = unique_name(f"{self._name} (", lambda n: workbook._has_sheet(n + ")")) + ")"
+        clone = ExcelWorksheet(workbook, name)
+        object.__setattr__(clone, "_data", copy.deepcopy(self._data))
+        workbook._insert(clone, Before, After)
+
+    def Move(self, Before: "ExcelWorksheet | None" = None, After: Any = None) -> None:
+        """Move the worksheet within its workbook."""
+        self._workbook._sheets.remove(self)
+        self._workbook._insert(self, Before, After)
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"<ExcelWorksheet {self._name}>"
+
+
+class ExcelWorksheets(FakeCollection):
+    """Worksheets collection of a workbook."""
+
+    def __init__(self, workbook: "ExcelWorkbook") -> None:
+        """Initialize the collection."""
+        super().__init__(workbook._session)
+        object.__setattr__(self, "_workbook", workbook)
+
+    def _items(self) -> list[Any]:
+        return self._workbook._sheets
+
+    def _match(self, item: Any, key: str) -> bool:
+        return item._name.lower() == key.lower()
+
+    def Add(
+        self, Before: ExcelWorksheet | None = None, After: Any = None, Count: int = 1, **_: Any
+    ) -> ExcelWorksheet:
+        """Add worksheets (before the active one by default)."""
+        workbook = self._workbook
+        if Before is None and After is None:
+            Before = workbook._active
+        sheet = None
+        for _ in range(Count):
+            sheet = ExcelWorksheet(workbook, unique_name("Sheet", workbook._has_sheet))
+            workbook._insert(sheet, Before, After)
+        object.__setattr__(workbook, "_active", sheet)
+        return sheet
+
+
+class ExcelWorkbook(FakeObject):
+    """A workbook."""
+
+    def __init__(self, app: "ExcelApplication", name: str, sheets: int = 1) -> None:
+        """Initialize a workbook with empty worksheets."""
+        super().__init__(app._session)
+        object.__setattr__(self, "_app", app)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_path", None)
+        object.__setattr__(self, "_saved", True)
+        object.__setattr__(self, "_sheets", [])
+        for index in range(1, sheets + 1):
+            self._sheets.append(ExcelWorksheet(self, f"Sheet{index}"))
+        object.__setattr__(self, "_active", self._sheets[0])
+
+    def _has_sheet(self, name: str) -> bool:
+        return any(sheet._name.lower() == name.lower() for sheet in self._sheets)
+
+    def _insert(self, sheet: ExcelWorksheet, before: Any, after: Any) -> None:
+        if before is not None:
+            self._sheets.insert(self._sheets.index(before), sheet)
+        elif after is not None:
+            self._sheets.insert(self._sheets.index(after) + 1, sheet)
+        else:
+            self._sheets.append(sheet)
+
+    def sheet(self, name: str) -> ExcelWorksheet:
+        """Get a worksheet without simulating IDispatch calls (test helper)."""
+        for sheet in self._sheets:
+            if sheet._name.lower() == name.lower():
+                return sheet
+        raise KeyError(name)
+
+    def snapshot(self) -> list[tuple[str, ExcelWorksheetData]]:
+        """Copy of the worksheets content, as saved to a file."""
+        return [(sheet._name, copy.deepcopy(sheet._data)) for sheet in self._sheets]
+
+    def restore(self, snapshot: list[tuple[str, ExcelWorksheetData]]) -> None:
+        """Replace the worksheets with a snapshot."""
+        self._sheets.clear()
+        for name, data in snapshot:
+            sheet = ExcelWorksheet(self, name)
+            object.__setattr__(sheet, "_data", copy.deepcopy(data))
+            self._sheets.append(sheet)
+        object.__setattr__(self, "_active", self._sheets[0])
+
+    @property
+    def Name(self) -> str:
+        """Workbook name."""
+        return self._name
+
+    @property
+    def FullName(self) -> str:
+        """Full path of the workbook (its name when never saved)."""
+        return self._path or self._name
+
+    @property
+    def Path(self) -> str:
+        """Directory of the workbook (empty when never saved)."""
+        return str(Path(self._path).parent) if self._path else ""
+
+    @property
+    def Saved(self) -> bool:
+        """Whether the workbook has no unsaved changes."""
+        return self._saved
+
+    @property
+    def Worksheets(self) -> ExcelWorksheets:
+        """Worksheets of the workbook."""
+        return ExcelWorksheets(self)
+
+    @property
+    def Sheets(self) -> ExcelWorksheets:
+        """Sheets of the workbook."""
+        return ExcelWorksheets(self)
+
+    @property
+    def ActiveSheet(self) -> ExcelWorksheet:
+        """Active worksheet."""
+        return self._active
+
+    def Save(self) -> None:
+        """Save the workbook to its current path."""
+        self._session.files[self._path or self._name] = self.snapshot()
+
+    def SaveAs(self, Filename: str, FileFormat: int | None = None, **_: Any) -> None:
+        """Save the workbook under a new path."""
+        object.__setattr__(self, "_path", str(Filename))
+        object.__setattr__(self, "_name", Path(str(Filename)).name)
+        self._session.files[self._path] = self.snapshot()
+
+    def SaveCopyAs(self, Filename: str) -> None:
+        """Save a copy of the workbook, which keeps its path."""
+        self._session.files[str(Filename)] = self.snapshot()
+
+    def Close(self, SaveChanges: bool = False, **_: Any) -> None:
+        """Close the workbook."""
+        if SaveChanges:
+            self._session.files[self._path or self._name] = self.snapshot()
+        if self in self._app._workbooks:
+            self._app._workbooks.remove(self)
+
+    def Activate(self) -> None:
+        """Make the workbook active."""
+        object.__setattr__(self._app, "_active", self)
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"<ExcelWorkbook {self._name}>"
+
+
+class ExcelWorkbooks(FakeCollection):
+    """Workbooks collection of the application."""
+
+    def __init__(self, app: "ExcelApplication") -> None:
+        """Initialize the collection."""
+        super().__init__(app._session)
+        object.__setattr__(self, "_app", app)
+
+    def _items(self) -> list[Any]:
+        return self._app._workbooks
+
+    def Add(self, Template: Any = None) -> ExcelWorkbook:
+        """Create a new workbook."""
+        app = self._app
+        name = unique_name("Book", lambda n: any(wb._name == n for wb in app._workbooks))
+        workbook = ExcelWorkbook(app, name)
+        if Template is not None and str(Template) in self._session.files:
+            workbook.restore(self._session.files[str(Template)])
+        app._open(workbook)
+        return workbook
+
+    def Open(self, Filename: str, **_: Any) -> ExcelWorkbook:
+        """Open a workbook saved during the session, or an existing file."""
+        path = str(Filename)
+        for workbook in self._app._workbooks:
+            if workbook._path == path:
+                return workbook
+        if path not in self._session.files and not os.path.exists(path):
+            raise FileNotFoundError(f"'{path}' could not be found")
+        workbook = ExcelWorkbook(self._app, Path(path).name)
+        object.__setattr__(workbook, "_path", path)
+        if path in self._session.files:
+            workbook.restore(self._session.files[path])
+        self._app._open(workbook)
+        return workbook
+
+
+class ExcelApplication(FakeObject):
+    """Excel.Application."""
+
+    def __init__(self, session: FakeComSession) -> None:
+        """Initialize the application without workbooks."""
+        super().__init__(session)
+        object.__setattr__(self, "_workbooks", [])
+        object.__setattr__(self, "_active", None)
+        object.__setattr__(self, "_clipboard", None)
+        self.set(
+            Name="Microsoft Excel",
+            Version="16.0",
+            Visible=False,
+            DisplayAlerts=True,
+            ScreenUpdating=True,
+            EnableEvents=True,
+            Calculation=-4105,  # xlCalculationAutomatic
+        )
+
+    def _open(self, workbook: ExcelWorkbook) -> None:
+        self._workbooks.append(workbook)
+        object.__setattr__(self, "_active", workbook)
+
+    @property
+    def Workbooks(self) -> ExcelWorkbooks:
+        """Open workbooks."""
+        return ExcelWorkbooks(self)
+
+    @property
+    def ActiveWorkbook(self) -> ExcelWorkbook | None:
+        """Active workbook."""
+        return self._active if self._active in self._workbooks else None
+
+    @property
+    def ActiveSheet(self) -> ExcelWorksheet | None:
+        """Active worksheet of the active workbook."""
+        workbook = self._active if self._active in self._workbooks else None
+        return workbook._active if workbook else None
+
+    def Calculate(self) -> None:
+        """Recalculate all open workbooks (formulas are not evaluated)."""
+
+    def Quit(self) -> None:
+        """Close every workbook without saving."""
+        self._workbooks.clear()
+        object.__setattr__(self, "_active", None)
@@ -0,0 +1,67 @@
+"""Application factory of the in-process fake COM backend.
+
+Plugs the simulated object models into the services instead of pywin32, so that
+the services can be tested and benchmarked without Windows or Office::
+
+    factory = FakeApplicationFactory(latency=0.0002)
+    excel = ExcelService(application_factory=factory)
+    excel.create_workbook()
+    ...
+    print(factory.session.calls)  # IDispatch round trips made so far
+"""
+
+from typing import Any
+
+from ..core.base_office import ApplicationFactory
+from ..core.types import ApplicationType
+from .base import FakeComSession, FakeDispatch
+from .excel import ExcelApplication
+from .outlook import OutlookApplication
+from .word import WordApplication
+
+
+class FakeApplicationFactory(ApplicationFactory):
+    """Creates simulated Office applications sharing one session.
+
+    PowerPoint is not simulated: it gets a permissive placeholder application
+    that accepts every call without keeping state.
+
+    Args:
+        latency: Simulated duration of one IDispatch call, in seconds
+        session: Existing session to share (a new one when None)
+    """
+
+    uses_com = False
+
+    def __init__(self, latency: float = 0.0, session: FakeComSession | None = None) -> None:
+        """Initialize the factory."""
+        self.session = session or FakeComSession(latency)
+        #: Last application created for each type
+        self.applications: dict[ApplicationType, Any] = {}
+
+    def create(self, app_type: ApplicationType) -> Any:
+        """Create a simulated application.
+
+        Args:
+            app_type: Type of Office application
+
+        Returns:
+            The simulated application object
+        """
+        if app_type is ApplicationType.EXCEL:
+            app = ExcelApplication(self.session)
+        elif app_type is ApplicationType.WORD:
+            app = WordApplication(self.session)
+        elif app_type is ApplicationType.OUTLOOK:
+            app = OutlookApplication(self.session)
+        else:
+            app = FakeDispatch(self.session, app_type.value)
+        self.applications[app_type] = app
+        return app
+
+    def create_instance(self, app_type: ApplicationType) -> Any:
+        """Create a simulated application (every application is a new instance)."""
+        return self.create(app_type)
+
+    def release(self, app_type: ApplicationType) -> None:
+        """Nothing to release: the fake applications hold no COM resources."""
@@ -0,0 +1,975 @@
+"""Simulated Outlook object model.
+
+Covers Application (CreateItem, GetNamespace), the MAPI Namespace (default
+folders, GetItemFromID, Accounts), Folders, Items (Restrict, Sort, Find,
+GetFirst/GetNext), mail/appointment/contact/task items with their
+attachments and recipients, and the Table API (GetTable, Columns, GetNextRow,
+GetArray).
+
+``Restrict``/``Find``/``GetTable`` filters accept both the Jet syntax
+(``[Subject] = 'x'``) and DASL (``@SQL="urn:schemas:httpmail:subject" LIKE
+'%x%'``), combined with AND/OR (AND binds tighter; parentheses are ignored).
+"""
+
+import operator
+import os
+import re
+import shutil
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .base import FakeCollection, FakeComSession, FakeDispatch, FakeObject
+
+OL_MAIL_ITEM = 0
+OL_APPOINTMENT_ITEM = 1
+OL_CONTACT_ITEM = 2
+OL_TASK_ITEM = 3
+
+DEFAULT_FOLDERS = {
+    3: ("Deleted Items", OL_MAIL_ITEM),
+    4: ("Outbox", OL_MAIL_ITEM),
+    5: ("Sent Items", OL_MAIL_ITEM),
+    6: ("Inbox", OL_MAIL_ITEM),
+    9: ("Calendar", OL_APPOINTMENT_ITEM),
+    10: ("Contacts", OL_CONTACT_ITEM),
+    12: ("Notes", OL_MAIL_ITEM),
+    13: ("Tasks", OL_TASK_ITEM),
+    16: ("Drafts", OL_MAIL_ITEM),
+    23: ("Junk Email", OL_MAIL_ITEM),
+}
+
+# Default folder receiving saved items of each type
+SAVE_FOLDERS = {OL_MAIL_ITEM: 16, OL_APPOINTMENT_ITEM: 9, OL_CONTACT_ITEM: 10, OL_TASK_ITEM: 13}
+
+ITEM_DEFAULTS: dict[int, dict[str, Any]] = {
+    OL_MAIL_ITEM: {
+        "Class": 43,
+        "MessageClass": "IPM.Note",
+        "To": "",
+        "CC": "",
+        "BCC": "",
+        "HTMLBody": "",
+        "SenderName": "",
+        "SenderEmailAddress": "",
+        "ReceivedTime": None,
+        "SentOn": None,
+        "UnRead": False,
+        "Sensitivity": 0,
+        "FlagStatus": 0,
+    },
+    OL_APPOINTMENT_ITEM: {
+        "Class": 26,
+        "MessageClass": "IPM.Appointment",
+        "Start": None,
+        "End": None,
+        "Location": "",
+        "BusyStatus": 2,
+        "ReminderSet": True,
+        "ReminderMinutesBeforeStart": 15,
+        "IsRecurring": False,
+        "AllDayEvent": False,
+        "Organizer": "",
+        "RequiredAttendees": "",
+        "OptionalAttendees": "",
+        "MeetingStatus": 0,
+    },
+    OL_CONTACT_ITEM: {
+        "Class": 40,
+        "MessageClass": "IPM.Contact",
+        "FullName": "",
+        "FirstName": "",
+        "LastName": "",
+        "Email1Address": "",
+        "CompanyName": "",
+        "JobTitle": "",
+        "BusinessTelephoneNumber": "",
+    },
+    OL_TASK_ITEM: {
+        "Class": 48,
+        "MessageClass": "IPM.Task",
+        "DueDate": None,
+        "Complete": False,
+        "Status": 0,
+        "DateCompleted": None,
+        "PercentComplete": 0,
+    },
+}
+
+COMMON_DEFAULTS = {"Subject": "", "Body": "", "Categories": "", "Importance": 1, "Size": 0}
+
+TABLE_DEFAULT_COLUMNS = (
+    "EntryID",
+    "Subject",
+    "CreationTime",
+    "LastModificationTime",
+    "MessageClass",
+)
+
+# DASL property name (last path segment) -> item property
+DASL_PROPERTIES: dict[str, Callable[["OutlookItem"], Any]] = {
+    "subject": lambda item: item.get("Subject"),
+    "fromname": lambda item: item.get("SenderName"),
+    "fromemail": lambda item: item.get("SenderEmailAddress"),
+    "senderemail": lambda item: item.get("SenderEmailAddress"),
+    "read": lambda item: not item.get("UnRead"),
+    "datereceived": lambda item: item.get("ReceivedTime"),
+    "textdescription": lambda item: item.get("Body"),
+    "importance": lambda item: item.get("Importance"),
+    "hasattachment": lambda item: bool(item._attachments),
+    "location": lambda item: item.get("Location"),
+    "dtstart": lambda item: item.get("Start"),
+    "dtend": lambda item: item.get("End"),
+    "fileas": lambda item: item.get("FileAs"),
+    "displayto": lambda item: item.get("To"),
+    "messageclass": lambda item: item.get("MessageClass"),
+}
+
+_CLAUSE_RE = re.compile(
+    r"""^(?:\[(?P<jet>[^\]]+)\]|"(?P<dasl>[^"]+)")\s*
+    (?P<op><>|>=|<=|=|<|>|LIKE\b|CI_STARTSWITH\b|CI_PHRASEMATCH\b)\s*
+    (?P<value>.+)$""",
+    re.IGNORECASE | re.VERBOSE,
+)
+_QUOTED_RE = re.compile(r"'(?:[^']|'')*'|\"[^\"]*\"")
+_OPERATORS = {
+    "=": operator.eq,
+    "<>": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+_DATE_FORMATS = ("%m/%d/%Y %H:%M", "%m/%d/%Y %I:%M %p", "%m/%d/%Y", "%d/%m/%Y %H:%M")
+
+
+def parse_date(text: str) -> datetime | None:
+    """Parse the date formats accepted in Outlook filters."""
+    try:
+        return datetime.fromisoformat(text.strip())
+    except ValueError:
+        pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(text.strip(), fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def property_getter(name: str) -> Callable[["OutlookItem"], Any]:
+    """Resolve a Jet or DASL property name to an item getter."""
+    if ":" in name or "/" in name:
+        key = re.split(r"[:/]", name)[-1].lower()
+        return DASL_PROPERTIES.get(key, lambda item: item.get(key))
+    if name.lower() == "fileas":
+        return DASL_PROPERTIES["fileas"]
+    return lambda item: item.get(name)
+
+
+def _parse_operand(text: str) -> Any:
+    text = text.strip()
+    if text[:1] == "'" and text[-1:] == "'":
+        return text[1:-1].replace("''", "'")
+    if text[:1] == '"' and text[-1:] == '"':
+        return text[1:-1]
+    if text.lower() in ("true", "false"):
+        return text.lower() == "true"
+    try:
+        return float(text) if "." in text else int(text)
+    except ValueError:
+        return text
+
+
+def _compare(value: Any, op: str, operand: Any) -> bool:
+    if op == "LIKE":
+        pattern = re.escape(str(operand)).replace("%", ".*").replace("_", ".")
+        return re.fullmatch(pattern, str(value or ""), re.IGNORECASE | re.DOTALL) is not None
+    if op == "CI_STARTSWITH":
+        return str(value or "").lower().startswith(str(operand).lower())
+    if op == "CI_PHRASEMATCH":
+        return str(operand).lower() in str(value or "").lower()
+
+    try:
+        if isinstance(value, datetime) and isinstance(operand, str):
+            operand = parse_date(operand)
+        elif isinstance(value, bool):
+            operand = operand if isinstance(operand, bool) else bool(int(operand))
+        elif isinstance(value, int | float) and isinstance(operand, str):
+            operand = float(operand)
+        elif isinstance(value, str) and isinstance(operand, str):
+            value, operand = value.lower(), operand.lower()
+        if value is None or operand is None:
+            return op == "<>" and value != operand
+        return _OPERATORS[op](value, operand)
+    except (TypeError, ValueError):
+        return False
+
+
+def compile_filter(text: str | None) -> Callable[["OutlookItem"], bool]:
+    """Compile an Items.Restrict filter into a predicate.
+
+    Args:
+        text: Jet or DASL filter (None or empty matches everything)
+
+    Returns:
+        Predicate taking an item
+
+    Raises:
+        ValueError: If a clause cannot be parsed
+    """
+    if not text or not text.strip():
+        return lambda item: True
+
+    quoted: list[str] = []
+
+    def mask(match: re.Match) -> str:
+        quoted.append(match.group(0))
+        return f"\x00{len(quoted) - 1}\x00"
+
+    def unmask(part: str) -> str:
+        return re.sub(r"\x00(\d+)\x00", lambda m: quoted[int(m.group(1))], part)
+
+    masked = _QUOTED_RE.sub(mask, text)
+    disjuncts = []
+    for alternative in re.split(r"\s+OR\s+", masked, flags=re.IGNORECASE):
+        clauses = []
+        for part in re.split(r"\s+AND\s+", alternative, flags=re.IGNORECASE):
+            part = part.strip().strip("()").strip()
+            part = re.sub(r"^@SQL=", "", part, flags=re.IGNORECASE).strip()
+            match = _CLAUSE_RE.match(unmask(part))
+            if match is None:
+                raise ValueError(f"Cannot parse filter clause: {unmask(part)}")
+            getter = property_getter(match.group("jet") or match.group("dasl"))
+            clauses.append(
+                (getter, match.group("op").upper(), _parse_operand(match.group("value")))
+            )
+        disjuncts.append(clauses)
+
+    def predicate(item: "OutlookItem") -> bool:
+        return any(
+            all(_compare(getter(item), op, operand) for getter, op, operand in clauses)
+            for clauses in disjuncts
+        )
+
+    return predicate
+
+
+class OutlookAttachment(FakeObject):
+    """An attachment (file copied when added)."""
+
+    def __init__(self, session: FakeComSession, source: str, display_name: str | None) -> None:
+        """Initialize the attachment."""
+        super().__init__(session)
+        object.__setattr__(self, "_source", source)
+        size = os.path.getsize(source) if os.path.exists(source) else 0
+        name = Path(source).name
+        self.set(FileName=name, DisplayName=display_name or name, Size=size, Type=1)
+
+    def SaveAsFile(self, Path: str) -> None:
+        """Write the attachment to a file."""
+        if os.path.exists(self._source):
+            shutil.copyfile(self._source, Path)
+        else:
+            open(Path, "wb").close()
+
+    def Delete(self) -> None:
+        """Remove the attachment from its item."""
+        self._owner._attachments.remove(self)
+
+
+class OutlookAttachments(FakeCollection):
+    """Attachments of an item."""
+
+    def __init__(self, item: "OutlookItem") -> None:
+        """Initialize the collection."""
+        super().__init__(item._session)
+        object.__setattr__(self, "_item", item)
+
+    def _items(self) -> list[Any]:
+        return self._item._attachments
+
+    def Add(
+        self,
+        Source: str,
+        Type: int = 1,
+        Position: int | None = None,
+        DisplayName: str | None = None,
+    ) -> OutlookAttachment:
+        """Attach a file."""
+        attachment = OutlookAttachment(self._session, str(Source), DisplayName)
+        object.__setattr__(attachment, "_owner", self._item)
+        self._item._attachments.append(attachment)
+        return attachment
+
+    def Remove(self, Index: int) -> None:
+        """Remove an attachment by 1-based index."""
+        del self._item._attachments[int(Index) - 1]
+
+
+class OutlookRecipient(FakeObject):
+    """A recipient."""
+
+    def __init__(self, session: FakeComSession, name: str, kind: int = 1) -> None:
+        """Initialize the recipient."""
+        super().__init__(session)
+        address = name if "@" in name else f"{name.replace(' ', '.').lower()}@example.com"
+        self.set(Name=name, Address=address, Type=kind, Resolved=True)
+
+    def Resolve(self) -> bool:
+        """Resolve the recipient (always succeeds)."""
+        return True
+
+
+class OutlookRecipients(FakeCollection):
+    """Recipients of an item."""
+
+    def __init__(self, item: "OutlookItem") -> None:
+        """Initialize the collection."""
+        super().__init__(item._session)
+        object.__setattr__(self, "_item", item)
+
+    def _items(self) -> list[Any]:
+        return self._item._recipients
+
+    def Add(self, Name: str) -> OutlookRecipient:
+        """Add a recipient."""
+        recipient = OutlookRecipient(self._session, str(Name))
+        self._item._recipients.append(recipient)
+        return recipient
+
+    def ResolveAll(self) -> bool:
+        """Resolve every recipient (always succeeds)."""
+        return True
+
+
+class OutlookItem(FakeObject):
+    """A mail, appointment, contact or task item."""
+
+    def __init__(self, app: "OutlookApplication", item_type: int = OL_MAIL_ITEM) -> None:
+        """Initialize an unsaved item."""
+        super().__init__(app._session)
+        now = datetime.now()
+        object.__setattr__(self, "_app", app)
+        object.__setattr__(self, "_type", item_type)
+        object.__setattr__(self, "_folder", None)
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_attachments", [])
+        object.__setattr__(self, "_recipients", [])
+        self.set(
+            EntryID="",
+            CreationTime=now,
+            LastModificationTime=now,
+            **COMMON_DEFAULTS,
+            **ITEM_DEFAULTS.get(item_type, {}),
+        )
+
+    def get(self, name: str) -> Any:
+        """Read a property without simulating an IDispatch call (filters, fixtures)."""
+        if name == "FileAs":
+            return self._extras.get("FileAs") or self._extras.get("FullName")
+        if name in self._extras:
+            return self._extras[name]
+        for key, value in self._extras.items():
+            if key.lower() == name.lower():
+                return value
+        return None
+
+    def _store(self, folder: "OutlookFolder") -> None:
+        if self._folder is not None:
+            self._folder._items.remove(self)
+        folder._items.append(self)
+        object.__setattr__(self, "_folder", folder)
+        if not self._extras["EntryID"]:
+            self._extras["EntryID"] = self._session.next_id()
+        self._app._index[self._extras["EntryID"]] = self
+        self._extras["LastModificationTime"] = datetime.now()
+
+    @property
+    def Attachments(self) -> OutlookAttachments:
+        """Attachments of the item."""
+        return OutlookAttachments(self)
+
+    @property
+    def Recipients(self) -> OutlookRecipients:
+        """Recipients of the item."""
+        return OutlookRecipients(self)
+
+    @property
+    def Parent(self) -> "OutlookFolder | None":
+        """Folder containing the item."""
+        return self._folder
+
+    def Save(self) -> None:
+        """Save the item (to the default folder of its type when new)."""
+        if self._folder is None:
+            namespace = self._app._namespace
+            self._store(self._target or namespace.default_folder(SAVE_FOLDERS.get(self._type, 16)))
+        else:
+            self._extras["LastModificationTime"] = datetime.now()
+
+    def Send(self) -> None:
+        """Send the item (moved to Sent Items)."""
+        extras = self._extras
+        if not (extras.get("To") or extras.get("CC") or extras.get("BCC") or self._recipients):
+            raise ValueError("There must be at least one name or contact group in the To box")
+        extras["SentOn"] = datetime.now()
+        extras["UnRead"] = False
+        self._store(self._app._namespace.default_folder(5))
+
+    def Delete(self) -> None:
+        """Delete the item (moved to Deleted Items, or removed from there)."""
+        deleted = self._app._namespace.default_folder(3)
+        if self._folder is deleted or self._folder is None:
+            if self._folder is not None:
+                self._folder._items.remove(self)
+            self._app._index.pop(self._extras["EntryID"], None)
+            object.__setattr__(self, "_folder", None)
+        else:
+            self._store(deleted)
+
+    def Move(self, DestFldr: "OutlookFolder") -> "OutlookItem":
+        """Move the item to another folder."""
+        self._store(DestFldr)
+        return self
+
+    def Copy(self) -> "OutlookItem":
+        """Duplicate the item in the same folder."""
+        clone = OutlookItem(self._app, self._type)
+        clone._extras.update({k: v for k, v in self._extras.items() if k != "EntryID"})
+        clone._extras["EntryID"] = ""
+        if self._folder is not None:
+            clone._store(self._folder)
+        return clone
+
+    def _response(self, prefix: str, to: str) -> "OutlookItem":
+        reply = OutlookItem(self._app, OL_MAIL_ITEM)
+        reply._extras.update(
+            Subject=f"{prefix}: {self._extras.get('Subject', '')}",
+            Body=self._extras.get("Body", ""),
+            To=to,
+        )
+        return reply
+
+    def Reply(self) -> "OutlookItem":
+        """Create a reply to the sender."""
+        return self._response("RE", self._extras.get("SenderEmailAddress", ""))
+
+    def ReplyAll(self) -> "OutlookItem":
+        """Create a reply to the sender and all recipients."""
+        recipients = [self._extras.get("SenderEmailAddress", ""), self._extras.get("CC", "")]
+        return self._response("RE", "; ".join(r for r in recipients if r))
+
+    def Forward(self) -> "OutlookItem":
+        """Create a forward of the item."""
+        reply = self._response("FW", "")
+        reply._attachments.extend(self._attachments)
+        return reply
+
+    def Display(self, Modal: bool = False) -> None:
+        """Display the item (no-op)."""
+
+    def Close(self, SaveMode: int = 0) -> None:
+        """Close the item inspector (no-op)."""
+
+    def GetRecurrencePattern(self) -> FakeDispatch:
+        """Get the recurrence pattern (marks the item as recurring)."""
+        self._extras["IsRecurring"] = True
+        if "_pattern" not in self._extras:
+            self._extras["_pattern"] = FakeDispatch(self._session, "RecurrencePattern")
+        return self._extras["_pattern"]
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"<OutlookItem {self._extras.get('MessageClass')} {self._extras.get('Subject')!r}>"
+
+
+class OutlookItems(FakeCollection):
+    """Items of a folder, or a restricted view of them."""
+
+    def __init__(
+        self,
+        folder: "OutlookFolder",
+        source: Callable[[], list["OutlookItem"]],
+    ) -> None:
+        """Initialize the view."""
+        super().__init__(folder._session)
+        object.__setattr__(self, "_folder", folder)
+        object.__setattr__(self, "_source", source)
+        object.__setattr__(self, "_sort", None)
+        object.__setattr__(self, "_cursor", 0)
+        object.__setattr__(self, "_find", None)
+        self.set(IncludeRecurrences=False)
+
+    def _items(self) -> list[Any]:
+        items = self._source()
+        if self._sort is not None:
+            getter, descending = self._sort
+            items = sorted(items, key=lambda item: _sort_key(getter(item)), reverse=descending)
+        return items
+
+    def Restrict(self, Filter: str) -> "OutlookItems":
+        """Get the items matching a filter."""
+        predicate = compile_filter(Filter)
+        matches = [item for item in self._items() if predicate(item)]
+        return OutlookItems(self._folder, lambda: [i for i in matches if i._folder is self._folder])
+
+    def Sort(self, Property: str, Descending: bool = False) -> None:
+        """Sort the view by a property (``"[ReceivedTime]"``)."""
+        object.__setattr__(self, "_sort", (property_getter(Property.strip("[]")), Descending))
+
+    def Find(self, Filter: str) -> "OutlookItem | None":
+        """Get the first item matching a filter."""
+        object.__setattr__(self, "_find", (compile_filter(Filter), 0))
+        return self._find_next()
+
+    def FindNext(self) -> "OutlookItem | None":
+        """Get the next item matching the last Find filter."""
+        return self._find_next() if self._find else None
+
+    def _find_next(self) -> "OutlookItem | None":
+        predicate, start = self._find
+        items = self._items()
+        for index in range(start, len(items)):
+            if predicate(items[index]):
+                object.__setattr__(self, "_find", (predicate, index + 1))
+                return items[index]
+        object.__setattr__(self, "_find", (predicate, len(items)))
+        return None
+
+    def _step(self, index: int) -> "OutlookItem | None":
+        items = self._items()
+        object.__setattr__(self, "_cursor", index)
+        return items[index] if 0 <= index < len(items) else None
+
+    def GetFirst(self) -> "OutlookItem | None":
+        """Get the first item."""
+        return self._step(0)
+
+    def GetNext(self) -> "OutlookItem | None":
+        """Get the next item."""
+        return self._step(self._cursor + 1)
+
+    def GetLast(self) -> "OutlookItem | None":
+        """Get the last item."""
+        return self._step(len(self._items()) - 1)
+
+    def GetPrevious(self) -> "OutlookItem | None":
+        """Get the previous item."""
+        return self._step(self._cursor - 1)
+
+    def Add(self, Type: int | None = None) -> "OutlookItem":
+        """Create a new item that is saved to this folder."""
+        item = OutlookItem(self._folder._app, self._folder._item_type if Type is None else Type)
+        object.__setattr__(item, "_target", self._folder)
+        return item
+
+
+def _sort_key(value: Any) -> tuple:
+    """Sort key tolerating missing values and mixed types."""
+    if value is None:
+        return (0, "")
+    if isinstance(value, datetime):
+        return (1, value.timestamp())
+    if isinstance(value, int | float):
+        return (1, value)
+    return (2, str(value).lower())
+
+
+class OutlookColumn(FakeObject):
+    """A column of a Table."""
+
+    def __init__(self, session: FakeComSession, name: str) -> None:
+        """Initialize the column."""
+        super().__init__(session)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_getter", property_getter(name))
+
+    @property
+    def Name(self) -> str:
+        """Column name."""
+        return self._name
+
+
+class OutlookColumns(FakeCollection):
+    """Columns of a Table."""
+
+    def __init__(self, table: "OutlookTable") -> None:
+        """Initialize the collection."""
+        super().__init__(table._session)
+        object.__setattr__(self, "_table", table)
+
+    def _items(self) -> list[Any]:
+        return self._table._columns
+
+    def Add(self, Name: str) -> OutlookColumn:
+        """Add a column."""
+        column = OutlookColumn(self._session, str(Name))
+        self._table._columns.append(column)
+        return column
+
+    def Remove(self, Index: int | str) -> None:
+        """Remove a column by index or name."""
+        self._table._columns.remove(self._get(Index))
+
+    def RemoveAll(self) -> None:
+        """Remove every column."""
+        self._table._columns.clear()
+
+
+class OutlookRow(FakeObject):
+    """A row of a Table."""
+
+    def __init__(self, table: "OutlookTable", item: OutlookItem) -> None:
+        """Initialize the row."""
+        super().__init__(table._session)
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_item", item)
+
+    def _value(self, index: int | str) -> Any:
+        columns = self._table._columns
+        if isinstance(index, str):
+            column = next(c for c in columns if c._name.lower() == index.lower())
+        else:
+            column = columns[int(index) - 1]
+        return column._getter(self._item)
+
+    def __call__(self, Index: int | str) -> Any:
+        """Value of a column (default ``Item`` member)."""
+        self._session.invoke()
+        return self._value(Index)
+
+    def Item(self, Index: int | str) -> Any:
+        """Value of a column."""
+        return self._value(Index)
+
+    def GetValues(self) -> tuple:
+        """Values of every column."""
+        return tuple(column._getter(self._item) for column in self._table._columns)
+
+
+class OutlookTable(FakeObject):
+    """Read-only, forward-only rowset over the items of a folder."""
+
+    def __init__(self, folder: "OutlookFolder", items: list[OutlookItem]) -> None:
+        """Initialize the table with the default columns."""
+        super().__init__(folder._session)
+        object.__setattr__(self, "_folder", folder)
+        object.__setattr__(self, "_rows", items)
+        object.__setattr__(self, "_position", 0)
+        object.__setattr__(
+            self, "_columns", [OutlookColumn(self._session, n) for n in TABLE_DEFAULT_COLUMNS]
+        )
+
+    @property
+    def Columns(self) -> OutlookColumns:
+        """Columns of the table."""
+        return OutlookColumns(self)
+
+    @property
+    def EndOfTable(self) -> bool:
+        """Whether every row has been read."""
+        return self._position >= len(self._rows)
+
+    def GetRowCount(self) -> int:
+        """Number of rows."""
+        return len(self._rows)
+
+    def GetNextRow(self) -> OutlookRow | None:
+        """Read the next row."""
+        if self._position >= len(self._rows):
+            return None
+        row = OutlookRow(self, self._rows[self._position])
+        object.__setattr__(self, "_position", self._position + 1)
+        return row
+
+    def GetArray(self, MaxRows: int) -> tuple:
+        """Read up to MaxRows rows at once, as a tuple of value tuples."""
+        start = self._position
+        rows = self._rows[start : start + int(MaxRows)]
+        object.__setattr__(self, "_position", start + len(rows))
+        return tuple(tuple(column._getter(item) for column in self._columns) for item in rows)
+
+    def MoveToStart(self) -> None:
+        """Rewind the table."""
+        object.__setattr__(self, "_position", 0)
+
+    def Restrict(self, Filter: str) -> "OutlookTable":
+        """Get a table of the rows matching a filter."""
+        predicate = compile_filter(Filter)
+        table = OutlookTable(self._folder, [item for item in self._rows if predicate(item)])
+        object.__setattr__(table, "_columns", list(self._columns))
+        return table
+
+    def Sort(self, SortProperty: str, Descending: bool = False) -> None:
+        """Sort the rows by a property."""
+        getter = property_getter(SortProperty.strip("[]"))
+        self._rows.sort(key=lambda item: _sort_key(getter(item)), reverse=Descending)
+
+
+class OutlookFolder(FakeObject):
+    """A mail, calendar, contacts or tasks folder."""
+
+    def __init__(
+        self,
+        app: "OutlookApplication",
+        name: str,
+        item_type: int = OL_MAIL_ITEM,
+        parent: "OutlookFolder | None" = None,
+    ) -> None:
+        """Initialize an empty folder."""
+        super().__init__(app._session)
+        object.__setattr__(self, "_app", app)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_item_type", item_type)
+        object.__setattr__(self, "_parent", parent)
+        object.__setattr__(self, "_items", [])
+        object.__setattr__(self, "_folders", [])
+        object.__setattr__(self, "_entry_id", self._session.next_id())
+        app._index[self._entry_id] = self
+
+    def add_item(self, item_type: int | None = None, **properties: Any) -> OutlookItem:
+        """Store a new item without simulating IDispatch calls (fixtures).
+
+        Args:
+            item_type: Item type (the folder default type when None)
+            **properties: Item properties, e.g. ``Subject="Hello"``
+
+        Returns:
+            The stored item
+        """
+        item = OutlookItem(self._app, self._item_type if item_type is None else item_type)
+        if item._type == OL_MAIL_ITEM:
+            item._extras["ReceivedTime"] = datetime.now()
+        item.set(**properties)
+        item._store(self)
+        return item
+
+    def folder(self, name: str) -> "OutlookFolder":
+        """Get or create a subfolder without simulating IDispatch calls (fixtures)."""
+        for folder in self._folders:
+            if folder._name.lower() == name.lower():
+                return folder
+        folder = OutlookFolder(self._app, name, self._item_type, self)
+        self._folders.append(folder)
+        return folder
+
+    @property
+    def Name(self) -> str:
+        """Folder name."""
+        return self._name
+
+    @Name.setter
+    def Name(self, value: str) -> None:
+        object.__setattr__(self, "_name", str(value))
+
+    @property
+    def EntryID(self) -> str:
+        """Folder identifier."""
+        return self._entry_id
+
+    @property
+    def FolderPath(self) -> str:
+        """Full path of the folder."""
+        parts = []
+        folder: OutlookFolder | None = self
+        while folder is not None:
+            parts.append(folder._name)
+            folder = folder._parent
+        return "\\\\" + "\\".join(reversed(parts))
+
+    @property
+    def Parent(self) -> "OutlookFolder | None":
+        """Parent folder."""
+        return self._parent
+
+    @property
+    def DefaultItemType(self) -> int:
+        """Type of the items created in the folder."""
+        return self._item_type
+
+    @property
+    def Items(self) -> OutlookItems:
+        """Items of the folder."""
+        return OutlookItems(self, lambda: list(self._items))
+
+    @property
+    def Folders(self) -> "OutlookFolders":
+        """Subfolders."""
+        return OutlookFolders(self)
+
+    @property
+    def UnReadItemCount(self) -> int:
+        """Number of unread items."""
+        return sum(1 for item in self._items if item._extras.get("UnRead"))
+
+    def GetTable(self, Filter: str | None = None, TableContents: int = 0) -> OutlookTable:
+        """Get a Table of the folder items matching a filter."""
+        predicate = compile_filter(Filter)
+        return OutlookTable(self, [item for item in self._items if predicate(item)])
+
+    def Delete(self) -> None:
+        """Delete the folder."""
+        if self._parent is None:
+            raise PermissionError("Cannot delete a store root folder")
+        self._parent._folders.remove(self)
+
+    def MoveTo(self, DestinationFolder: "OutlookFolder") -> None:
+        """Move the folder under another folder."""
+        if self._parent is not None:
+            self._parent._folders.remove(self)
+        DestinationFolder._folders.append(self)
+        object.__setattr__(self, "_parent", DestinationFolder)
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"<OutlookFolder {self._name}>"
+
+
+class OutlookFolders(FakeCollection):
+    """Subfolders of a folder."""
+
+    def __init__(self, folder: OutlookFolder) -> None:
+        """Initialize the collection."""
+        super().__init__(folder._session)
+        object.__setattr__(self, "_folder", folder)
+
+    def _items(self) -> list[Any]:
+        return self._folder._folders
+
+    def _match(self, item: Any, key: str) -> bool:
+        return item._name.lower() == key.lower()
+
+    def Add(self, Name: str, Type: int | None = None) -> OutlookFolder:
+        """Create a subfolder."""
+        parent = self._folder
+        if any(f._name.lower() == str(Name).lower() for f in parent._folders):
+            raise ValueError(f"A folder named '{Name}' already exists")
+        return parent.folder(str(Name))
+
+
+class _AccountList(FakeCollection):
+    """Accounts configured in the profile."""
+
+    def __init__(self, session: FakeComSession, accounts: list[Any]) -> None:
+        """Initialize the collection."""
+        super().__init__(session)
+        object.__setattr__(self, "_accounts", accounts)
+
+    def _items(self) -> list[Any]:
+        return self._accounts
+
+
+class _StoreList(FakeCollection):
+    """Top-level folders (stores) of the namespace."""
+
+    def __init__(self, session: FakeComSession, stores: list[OutlookFolder]) -> None:
+        """Initialize the collection."""
+        super().__init__(session)
+        object.__setattr__(self, "_stores", stores)
+
+    def _items(self) -> list[Any]:
+        return self._stores
+
+    def _match(self, item: Any, key: str) -> bool:
+        return item._name.lower() == key.lower()
+
+
+class OutlookNamespace(FakeObject):
+    """MAPI namespace with a single mailbox."""
+
+    def __init__(self, app: "OutlookApplication", user: str = "user@example.com") -> None:
+        """Create the mailbox and its default folders."""
+        super().__init__(app._session)
+        object.__setattr__(self, "_app", app)
+        root = OutlookFolder(app, "Mailbox")
+        object.__setattr__(self, "_root", root)
+        object.__setattr__(self, "_defaults", {})
+        for folder_id, (name, item_type) in DEFAULT_FOLDERS.items():
+            folder = OutlookFolder(app, name, item_type, root)
+            root._folders.append(folder)
+            self._defaults[folder_id] = folder
+        account = FakeDispatch(self._session, "Account").set(
+            DisplayName=user, SmtpAddress=user, UserName=user.split("@")[0]
+        )
+        object.__setattr__(self, "_accounts", [account])
+        object.__setattr__(self, "_user", OutlookRecipient(self._session, user))
+
+    def default_folder(self, folder_id: int) -> OutlookFolder:
+        """Get a default folder without simulating IDispatch calls (fixtures)."""
+        return self._defaults[folder_id]
+
+    def GetDefaultFolder(self, FolderType: int) -> OutlookFolder:
+        """Get a default folder (olFolder* constants)."""
+        if FolderType not in self._defaults:
+            raise ValueError(f"Unsupported default folder: {FolderType}")
+        return self._defaults[FolderType]
+
+    def GetItemFromID(self, EntryIDItem: str, EntryIDStore: str | None = None) -> Any:
+        """Get an item or folder by EntryID."""
+        try:
+            return self._app._index[EntryIDItem]
+        except KeyError:
+            raise LookupError(f"Could not open the item: {EntryIDItem}") from None
+
+    def GetFolderFromID(self, EntryIDFolder: str, EntryIDStore: str | None = None) -> Any:
+        """Get a folder by EntryID."""
+        return self.GetItemFromID(EntryIDFolder)
+
+    def CreateRecipient(self, RecipientName: str) -> OutlookRecipient:
+        """Create a recipient."""
+        return OutlookRecipient(self._session, str(RecipientName))
+
+    @property
+    def Folders(self) -> _StoreList:
+        """Stores of the profile."""
+        return _StoreList(self._session, [self._root])
+
+    @property
+    def Accounts(self) -> _AccountList:
+        """Accounts of the profile."""
+        return _AccountList(self._session, self._accounts)
+
+    @property
+    def CurrentUser(self) -> OutlookRecipient:
+        """Current user."""
+        return self._user
+
+
+class OutlookApplication(FakeObject):
+    """Outlook.Application."""
+
+    def __init__(self, session: FakeComSession) -> None:
+        """Initialize the application with an empty mailbox."""
+        super().__init__(session)
+        object.__setattr__(self, "_index", {})
+        object.__setattr__(self, "_namespace", OutlookNamespace(self))
+        self.set(Name="Outlook", Version="16.0")
+
+    @property
+    def namespace(self) -> OutlookNamespace:
+        """MAPI namespace (test helper, no IDispatch call)."""
+        return self._namespace
+
+    def GetNamespace(self, Type: str = "MAPI") -> OutlookNamespace:
+        """Get the MAPI namespace."""
+        return self._namespace
+
+    @property
+    def Session(self) -> OutlookNamespace:
+        """MAPI namespace of the session."""
+        return self._namespace
+
+    def CreateItem(self, ItemType: int) -> OutlookItem:
+        """Create an unsaved item (olMailItem, olAppointmentItem...)."""
+        return OutlookItem(self, int(ItemType))
+
+    def Quit(self) -> None:
+        """Quit the application (the mailbox is kept for the session)."""
+
+    def iter_items(self) -> Iterator[OutlookItem]:
+        """Every stored item (test helper)."""
+        for value in self._index.values():
+            if isinstance(value, OutlookItem):
+                yield value
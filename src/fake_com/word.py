@@ -0,0 +1,528 @@
+"""Simulated Word object model.
+
+Covers Application, Documents, Document, Range (Text, Start/End, Insert*,
+Delete, Collapse, Font), Paragraphs and Find/Replace. The document content is
+kept as a single string in which ``\\r`` ends every paragraph, as in Word; the
+final paragraph mark can never be removed. Everything else resolves to
+permissive placeholders.
+"""
+
+import os
+import re
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from .base import FakeCollection, FakeComSession, FakeObject, unique_name
+
+PARAGRAPH_MARK = "\r"
+
+WD_COLLAPSE_END = 0
+WD_COLLAPSE_START = 1
+WD_REPLACE_NONE = 0
+WD_REPLACE_ONE = 1
+WD_REPLACE_ALL = 2
+
+FONT_DEFAULTS = {"Bold": False, "Italic": False, "Underline": 0, "Color": 0, "Size": 11.0}
+
+
+class _FontProxy(FakeObject):
+    """Character formatting of a range."""
+
+    def __init__(self, rng: "WordRange") -> None:
+        """Initialize the proxy."""
+        super().__init__(rng._session)
+        object.__setattr__(self, "_range", rng)
+
+    def __getattr__(self, name: str) -> Any:
+        """Read a font property at the start of the range."""
+        if not name[:1].isupper():
+            raise AttributeError(name)
+        return self._range._document._font_value(self._range._start, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Apply a font property to the range."""
+        self._session.invoke()
+        rng = self._range
+        rng._document._fonts.append((rng._start, rng._end, name, value))
+
+
+class WordRange(FakeObject):
+    """A contiguous span of the document text."""
+
+    def __init__(self, document: "WordDocument", start: int, end: int) -> None:
+        """Initialize the range."""
+        super().__init__(document._session)
+        object.__setattr__(self, "_document", document)
+        object.__setattr__(self, "_start", start)
+        object.__setattr__(self, "_end", end)
+
+    def _move(self, start: int, end: int) -> None:
+        object.__setattr__(self, "_start", start)
+        object.__setattr__(self, "_end", end)
+
+    @property
+    def Text(self) -> str:
+        """Text of the range."""
+        return self._document._text[self._start : self._end]
+
+    @Text.setter
+    def Text(self, value: str) -> None:
+        end = self._document._replace(self._start, self._end, str(value))
+        self._move(self._start, end)
+
+    @property
+    def Start(self) -> int:
+        """Start position."""
+        return self._start
+
+    @Start.setter
+    def Start(self, value: int) -> None:
+        self._move(int(value), max(int(value), self._end))
+
+    @property
+    def End(self) -> int:
+        """End position."""
+        return self._end
+
+    @End.setter
+    def End(self, value: int) -> None:
+        self._move(min(self._start, int(value)), int(value))
+
+    @property
+    def Document(self) -> "WordDocument":
+        """Document containing the range."""
+        return self._document
+
+    @property
+    def Paragraphs(self) -> "WordParagraphs":
+        """Paragraphs overlapping the range."""
+        return WordParagraphs(self._document, self._start, self._end)
+
+    @property
+    def Find(self) -> "WordFind":
+        """Find object searching this range."""
+        return WordFind(self)
+
+    @property
+    def Font(self) -> _FontProxy:
+        """Character formatting of the range."""
+        return _FontProxy(self)
+
+    @property
+    def Style(self) -> Any:
+        """Paragraph style at the start of the range."""
+        return self._document._paragraph_format(self._start, "Style") or "Normal"
+
+    @Style.setter
+    def Style(self, value: Any) -> None:
+        self._document._set_paragraph_format(self._start, self._end, "Style", value)
+
+    def InsertAfter(self, Text: str) -> None:
+        """Insert text at the end of the range and extend it."""
+        self._document._replace(self._end, self._end, str(Text))
+        self._move(self._start, self._end + len(str(Text)))
+
+    def InsertBefore(self, Text: str) -> None:
+        """Insert text at the start of the range and extend it."""
+        self._document._replace(self._start, self._start, str(Text))
+        self._move(self._start, self._end + len(str(Text)))
+
+    def InsertParagraphAfter(self) -> None:
+        """Insert a paragraph mark at the end of the range."""
+        self.InsertAfter(PARAGRAPH_MARK)
+
+    def InsertParagraphBefore(self) -> None:
+        """Insert a paragraph mark at the start of the range."""
+        self.InsertBefore(PARAGRAPH_MARK)
+
+    def Delete(self) -> int:
+        """Delete the text of the range."""
+        deleted = self._end - self._start
+        self._document._replace(self._start, self._end, "")
+        self._move(self._start, self._start)
+        return deleted
+
+    def Collapse(self, Direction: int = WD_COLLAPSE_START) -> None:
+        """Collapse the range to its start or end."""
+        position = self._end if Direction == WD_COLLAPSE_END else self._start
+        self._move(position, position)
+
+    def Select(self) -> None:
+        """Select the range."""
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"<WordRange {self._start}:{self._end}>"
+
+
+class WordParagraph(FakeObject):
+    """A paragraph, i.e. the text up to and including a paragraph mark."""
+
+    def __init__(self, document: "WordDocument", start: int, end: int) -> None:
+        """Initialize the paragraph."""
+        super().__init__(document._session)
+        object.__setattr__(self, "_document", document)
+        object.__setattr__(self, "_start", start)
+        object.__setattr__(self, "_end", end)
+
+    @property
+    def Range(self) -> WordRange:
+        """Range of the paragraph, paragraph mark included."""
+        return WordRange(self._document, self._start, self._end)
+
+    def __getattr__(self, name: str) -> Any:
+        """Read a paragraph format property (Alignment, Style, LineSpacing...)."""
+        if name[:1].isupper():
+            value = self._document._paragraph_format(self._start, name)
+            if value is not None:
+                return value
+            if name == "Style":
+                return "Normal"
+        return super().__getattr__(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Write a paragraph format property."""
+        if name[:1].isupper() and not hasattr(type(self), name):
+            self._session.invoke()
+            self._document._set_paragraph_format(self._start, self._end, name, value)
+            return
+        super().__setattr__(name, value)
+
+
+class WordParagraphs(FakeCollection):
+    """Paragraphs of a document, or of a range."""
+
+    def __init__(self, document: "WordDocument", start: int = 0, end: int | None = None) -> None:
+        """Initialize the collection."""
+        super().__init__(document._session)
+        object.__setattr__(self, "_document", document)
+        object.__setattr__(self, "_start", start)
+        object.__setattr__(self, "_end", end)
+
+    def _items(self) -> list[Any]:
+        end = len(self._document._text) if self._end is None else self._end
+        return [
+            WordParagraph(self._document, s, e)
+            for s, e in self._document._paragraph_bounds()
+            if e > self._start and s < max(end, self._start + 1)
+        ]
+
+    @property
+    def First(self) -> WordParagraph:
+        """First paragraph."""
+        return self._get(1)
+
+    @property
+    def Last(self) -> WordParagraph:
+        """Last paragraph."""
+        return self._items()[-1]
+
+    def Add(self, Range: WordRange | None = None) -> WordParagraph:
+        """Add a new empty paragraph before the given range, or at the end."""
+        document = self._document
+        if Range is not None:
+            position = Range._start
+            document._replace(position, position, PARAGRAPH_MARK)
+            return WordParagraph(document, position, position + 1)
+        end = len(document._text) if self._end is None else self._end
+        document._replace(end, end, PARAGRAPH_MARK)
+        for start, stop in document._paragraph_bounds():
+            if start >= end:
+                return WordParagraph(document, start, stop)
+        return WordParagraph(document, end - 1, end)
+
+
+class WordReplacement(FakeObject):
+    """Replacement settings of a Find object."""
+
+    def __init__(self, session: FakeComSession) -> None:
+        """Initialize the settings."""
+        super().__init__(session)
+        self.set(Text="")
+
+    def ClearFormatting(self) -> None:
+        """Clear the formatting criteria."""
+
+
+class WordFind(FakeObject):
+    """Find object of a range.
+
+    As in Word, a successful search redefines the parent range to the match
+    (or to the replaced text), and repeated calls resume after it.
+    """
+
+    def __init__(self, rng: WordRange) -> None:
+        """Initialize the find settings."""
+        super().__init__(rng._session)
+        object.__setattr__(self, "_range", rng)
+        object.__setattr__(self, "_cursor", rng._start)
+        object.__setattr__(self, "_end", rng._end)
+        object.__setattr__(self, "_replacement", WordReplacement(rng._session))
+        self.set(Text="", MatchCase=False, MatchWholeWord=False, Forward=True, Wrap=0)
+
+    @property
+    def Replacement(self) -> WordReplacement:
+        """Replacement settings."""
+        return self._replacement
+
+    def ClearFormatting(self) -> None:
+        """Clear the formatting criteria."""
+
+    def Execute(
+        self,
+        FindText: str | None = None,
+        MatchCase: bool | None = None,
+        MatchWholeWord: bool | None = None,
+        ReplaceWith: str | None = None,
+        Replace: int = WD_REPLACE_NONE,
+        **_: Any,
+    ) -> bool:
+        """Run the search, optionally replacing one or all occurrences."""
+        extras = self._extras
+        text = extras["Text"] if FindText is None else FindText
+        if not text:
+            return False
+        match_case = extras["MatchCase"] if MatchCase is None else MatchCase
+        whole_word = extras["MatchWholeWord"] if MatchWholeWord is None else MatchWholeWord
+        replacement = self._replacement._extras["Text"] if ReplaceWith is None else ReplaceWith
+
+        pattern = re.escape(str(text))
+        if whole_word:
+            pattern = rf"\b{pattern}\b"
+        regex = re.compile(pattern, 0 if match_case else re.IGNORECASE)
+
+        document = self._range._document
+        cursor, end = self._cursor, min(self._end, len(document._text))
+        if Replace == WD_REPLACE_ALL:
+            segment = document._text[cursor:end]
+            new_segment, count = regex.subn(lambda _: str(replacement), segment)
+            if not count:
+                return False
+            new_end = document._replace(cursor, end, new_segment)
+            self._range._move(cursor, new_end)
+            object.__setattr__(self, "_cursor", new_end)
+            object.__setattr__(self, "_end", new_end)
+            return True
+
+        match = regex.search(document._text, cursor, end)
+        if match is None:
+            return False
+        found_end = match.end()
+        if Replace == WD_REPLACE_ONE:
+            found_end = document._replace(match.start(), match.end(), str(replacement))
+            object.__setattr__(self, "_end", end + found_end - match.end())
+        self._range._move(match.start(), found_end)
+        object.__setattr__(self, "_cursor", found_end)
+        return True
+
+
+class WordDocument(FakeObject):
+    """A document."""
+
+    def __init__(self, app: "WordApplication", name: str) -> None:
+        """Initialize an empty document."""
+        super().__init__(app._session)
+        object.__setattr__(self, "_app", app)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_path", None)
+        object.__setattr__(self, "_text", PARAGRAPH_MARK)
+        # Character formatting runs: (start, end, key, value), latest wins
+        object.__setattr__(self, "_fonts", [])
+        # Paragraph formatting: paragraph start -> {key: value}
+        object.__setattr__(self, "_paragraph_formats", {})
+
+    @property
+    def text(self) -> str:
+        """Document text (test helper, no IDispatch call)."""
+        return self._text
+
+    def _replace(self, start: int, end: int, text: str) -> int:
+        """Replace a span of text and return the end of the inserted text."""
+        start = max(0, min(start, len(self._text)))
+        end = max(start, min(end, len(self._text)))
+        content = self._text[:start] + text + self._text[end:]
+        if not content.endswith(PARAGRAPH_MARK):
+            content += PARAGRAPH_MARK  # the final paragraph mark cannot be deleted
+        object.__setattr__(self, "_text", content)
+        return start + len(text)
+
+    def _paragraph_bounds(self) -> Iterator[tuple[int, int]]:
+        start = 0
+        for index, char in enumerate(self._text):
+            if char == PARAGRAPH_MARK:
+                yield start, index + 1
+                start = index + 1
+
+    def _font_value(self, position: int, key: str) -> Any:
+        for start, end, k, value in reversed(self._fonts):
+            if k == key and start <= position < max(end, start + 1):
+                return value
+        return FONT_DEFAULTS.get(key)
+
+    def _paragraph_format(self, position: int, key: str) -> Any:
+        for start, end in self._paragraph_bounds():
+            if start <= position < end:
+                return self._paragraph_formats.get(start, {}).get(key)
+        return None
+
+    def _set_paragraph_format(self, start: int, end: int, key: str, value: Any) -> None:
+        for s, e in self._paragraph_bounds():
+            if e > start and s < max(end, start + 1):
+                self._paragraph_formats.setdefault(s, {})[key] = value
+
+    def _words(self) -> list[str]:
+        return re.findall(r"\w+", self._text)
+
+    @property
+    def Name(self) -> str:
+        """Document name."""
+        return self._name
+
+    @property
+    def FullName(self) -> str:
+        """Full path of the document (its name when never saved)."""
+        return self._path or self._name
+
+    @property
+    def Path(self) -> str:
+        """Directory of the document (empty when never saved)."""
+        return str(Path(self._path).parent) if self._path else ""
+
+    @property
+    def Saved(self) -> bool:
+        """Whether the document has no unsaved changes."""
+        return self._session.files.get(self._path or self._name) == self._text
+
+    @property
+    def Content(self) -> WordRange:
+        """Range covering the whole document."""
+        return WordRange(self, 0, len(self._text))
+
+    def Range(self, Start: int | None = None, End: int | None = None) -> WordRange:
+        """Range between two positions (the whole document by default)."""
+        start = 0 if Start is None else int(Start)
+        end = len(self._text) if End is None else int(End)
+        return WordRange(self, start, max(start, end))
+
+    @property
+    def Paragraphs(self) -> WordParagraphs:
+        """Paragraphs of the document."""
+        return WordParagraphs(self)
+
+    def ComputeStatistics(self, Statistic: int, IncludeFootnotesAndEndnotes: bool = False) -> int:
+        """Compute a document statistic (wdStatistic* constants)."""
+        text = self._text
+        statistics = {
+            0: lambda: len(self._words()),  # wdStatisticWords
+            1: lambda: text.count(PARAGRAPH_MARK),  # wdStatisticLines (approximation)
+            2: lambda: 1 + len(text) // 3000,  # wdStatisticPages (approximation)
+            3: lambda: len(text.replace(PARAGRAPH_MARK, "").replace(" ", "")),
+            4: lambda: sum(1 for s, e in self._paragraph_bounds() if text[s : e - 1].strip()),
+            5: lambda: len(text.replace(PARAGRAPH_MARK, "")),  # with spaces
+        }
+        return statistics.get(Statistic, lambda: 0)()
+
+    def Save(self) -> None:
+        """Save the document to its current path."""
+        self._session.files[self._path or self._name] = self._text
+
+    def SaveAs2(self, FileName: str, FileFormat: int | None = None, **_: Any) -> None:
+        """Save the document under a new path."""
+        object.__setattr__(self, "_path", str(FileName))
+        object.__setattr__(self, "_name", Path(str(FileName)).name)
+        self._session.files[self._path] = self._text
+
+    def SaveAs(self, FileName: str, FileFormat: int | None = None, **kwargs: Any) -> None:
+        """Save the document under a new path."""
+        self.SaveAs2(FileName, FileFormat, **kwargs)
+
+    def Close(self, SaveChanges: bool = False, **_: Any) -> None:
+        """Close the document."""
+        if SaveChanges:
+            self._session.files[self._path or self._name] = self._text
+        if self in self._app._documents:
+            self._app._documents.remove(self)
+
+    def Activate(self) -> None:
+        """Make the document active."""
+        object.__setattr__(self._app, "_active", self)
+
+    def __repr__(self) -> str:
+        """Debug representation."""
+        return f"<WordDocument {self._name}>"
+
+
+class WordDocuments(FakeCollection):
+    """Documents collection of the application."""
+
+    def __init__(self, app: "WordApplication") -> None:
+        """Initialize the collection."""
+        super().__init__(app._session)
+        object.__setattr__(self, "_app", app)
+
+    def _items(self) -> list[Any]:
+        return self._app._documents
+
+    def Add(self, Template: Any = None, **_: Any) -> WordDocument:
+        """Create a new document, optionally from a template saved in the session."""
+        app = self._app
+        name = unique_name("Document", lambda n: any(d._name == n for d in app._documents))
+        document = WordDocument(app, name)
+        if Template is not None and str(Template) in self._session.files:
+            object.__setattr__(document, "_text", self._session.files[str(Template)])
+        app._open(document)
+        return document
+
+    def Open(self, FileName: str, **_: Any) -> WordDocument:
+        """Open a document saved during the session, or an existing file."""
+        path = str(FileName)
+        for document in self._app._documents:
+            if document._path == path:
+                return document
+        if path not in self._session.files and not os.path.exists(path):
+            raise FileNotFoundError(f"'{path}' could not be found")
+        document = WordDocument(self._app, Path(path).name)
+        object.__setattr__(document, "_path", path)
+        if path in self._session.files:
+            object.__setattr__(document, "_text", self._session.files[path])
+        self._app._open(document)
+        return document
+
+
+class WordApplication(FakeObject):
+    """Word.Application."""
+
+    def __init__(self, session: FakeComSession) -> None:
+        """Initialize the application without documents."""
+        super().__init__(session)
+        object.__setattr__(self, "_documents", [])
+        object.__setattr__(self, "_active", None)
+        self.set(
+            Name="Microsoft Word",
+            Version="16.0",
+            Visible=False,
+            DisplayAlerts=0,
+            ScreenUpdating=True,
+        )
+
+    def _open(self, document: WordDocument) -> None:
+        self._documents.append(document)
+        object.__setattr__(self, "_active", document)
+
+    @property
+    def Documents(self) -> WordDocuments:
+        """Open documents."""
+        return WordDocuments(self)
+
+    @property
+    def ActiveDocument(self) -> WordDocument:
+        """Active document."""
+        if self._active not in self._documents:
+            raise RuntimeError("This command is not available because no document is open")
+        return self._active
+
+    def Quit(self, SaveChanges: bool = False, **_: Any) -> None:
+        """Close every document."""
+        self._documents.clear()
+        object.__setattr__(self, "_active", None)
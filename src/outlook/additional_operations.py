@@ -363,20 +363,23 @@ class ContactOperationsMixin:
         )
 
     @com_safe("list_all_contacts")
-    def list_all_contacts(self) -> dict[str, Any]:
-        """List all contacts."""
+    def list_all_contacts(self, page_size: int | None = None) -> dict[str, Any]:
+        """List all contacts (in pages of page_size when given)."""
         namespace = self.application.GetNamespace("MAPI")
         contacts_folder = namespace.GetDefaultFolder(10)
 
-        results = []
-        for contact in contacts_folder.Items:
-            results.append(
-                {
-                    "entry_id": contact.EntryID,
-                    "full_name": contact.FullName,
-                    "email": contact.Email1Address,
-                }
-            )
+        contacts = (
+            {
+                "entry_id": contact.EntryID,
+                "full_name": contact.FullName,
+                "email": contact.Email1Address,
+            }
+            for contact in contacts_folder.Items
+        )
+        if page_size:
+            return self.pages.page(contacts, page_size)
+
+        results = list(contacts)
 
         return dict_to_result(
             success=True,
@@ -593,8 +596,10 @@ class TaskOperationsMixin:
         )
 
     @com_safe("list_tasks")
-    def list_tasks(self, completed: bool | None = None) -> dict[str, Any]:
-        """List tasks."""
+    def list_tasks(
+        self, completed: bool | None = None, page_size: int | None = None
+    ) -> dict[str, Any]:
+        """List tasks (in pages of page_size when given)."""
         namespace = self.application.GetNamespace("MAPI")
         tasks_folder = namespace.GetDefaultFolder(13)  # 13 = olFolderTasks
 
@@ -604,17 +609,20 @@ class TaskOperationsMixin:
             filter_str = f"[Complete] = {completed}"
             items = items.Restrict(filter_str)
 
-        results = []
-        for task in items:
-            results.append(
-                {
-                    "entry_id": task.EntryID,
-                    "subject": task.Subject,
-                    "due_date": str(task.DueDate) if task.DueDate else None,
-                    "complete": task.Complete,
-                    "priority": task.Importance,
-                }
-            )
+        tasks = (
+            {
+                "entry_id": task.EntryID,
+                "subject": task.Subject,
+                "due_date": str(task.DueDate) if task.DueDate else None,
+                "complete": task.Complete,
+                "priority": task.Importance,
+            }
+            for task in items
+        )
+        if page_size:
+            return self.pages.page(tasks, page_size)
+
+        results = list(tasks)
 
         return dict_to_result(
             success=True,
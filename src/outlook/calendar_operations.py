@@ -3,6 +3,7 @@
 This module provides calendar-related functionality (10 methods).
 """
 
+import itertools
 from datetime import datetime
 from typing import Any
 
@@ -310,6 +311,7 @@ class CalendarOperationsMixin:
         start_date: str | None = None,
         end_date: str | None = None,
         max_results: int = 50,
+        page_size: int | None = None,
     ) -> dict[str, Any]:
         """Search for appointments.
 
@@ -318,7 +320,9 @@ class CalendarOperationsMixin:
             location: Location to filter by
             start_date: Start date for search (ISO format)
             end_date: End date for search (ISO format)
-            max_results: Maximum number of results
+            max_results: Maximum number of results (ignored when paginating)
+            page_size: Return the results in pages of this size, with a
+                cursor for server_next_page
 
         Returns:
             Dictionary with search results
@@ -354,22 +358,23 @@ class CalendarOperationsMixin:
             if filter_string:
                 items = items.Restrict(filter_string)
 
-            results = []
-            for item in items:
-                if len(results) >= max_results:
-                    break
-
-                results.append(
-                    {
-                        "entry_id": item.EntryID,
-                        "subject": item.Subject,
-                        "start_time": str(item.Start),
-                        "end_time": str(item.End),
-                        "location": item.Location,
-                        "is_recurring": item.IsRecurring,
-                        "busy_status": item.BusyStatus,
-                    }
-                )
+            # With IncludeRecurrences, Items has no reliable Count: iterate lazily
+            appointments = (
+                {
+                    "entry_id": item.EntryID,
+                    "subject": item.Subject,
+                    "start_time": str(item.Start),
+                    "end_time": str(item.End),
+                    "location": item.Location,
+                    "is_recurring": item.IsRecurring,
+                    "busy_status": item.BusyStatus,
+                }
+                for item in items
+            )
+            if page_size:
+                return self.pages.page(appointments, page_size)
+
+            results = list(itertools.islice(appointments, max_results))
 
             return dict_to_result(
                 success=True,
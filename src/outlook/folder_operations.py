@@ -210,12 +210,15 @@ class FolderOperationsMixin:
         self,
         parent_folder: str = "Inbox",
         recursive: bool = False,
+        page_size: int | None = None,
     ) -> dict[str, Any]:
         """List all folders in a parent folder.
 
         Args:
             parent_folder: Path to parent folder (default: Inbox)
             recursive: Whether to list folders recursively
+            page_size: Return the folders in pages of this size, with a
+                cursor for server_next_page
 
         Returns:
             Dictionary with folder list
@@ -234,8 +237,7 @@ class FolderOperationsMixin:
                 for part in parent_folder.split("/"):
                     folder = folder.Folders(part)
 
-            def list_subfolders(parent, path="", level=0):
-                folders = []
+            def iter_subfolders(parent, path="", level=0):
                 for subfolder in parent.Folders:
                     folder_info = {
                         "name": subfolder.Name,
@@ -244,19 +246,17 @@ class FolderOperationsMixin:
                         "unread_count": subfolder.UnReadItemCount,
                         "level": level,
                     }
-                    folders.append(folder_info)
+                    yield folder_info
 
                     if recursive:
-                        folders.extend(
-                            list_subfolders(
-                                subfolder,
-                                folder_info["path"],
-                                level + 1,
-                            )
-                        )
-                return folders
-
-            folders = list_subfolders(folder)
+                        yield from iter_subfolders(subfolder, folder_info["path"], level + 1)
+
+            if page_size:
+                return self.pages.page(
+                    iter_subfolders(folder), page_size, key="folders", parent_folder=parent_folder
+                )
+
+            folders = list(iter_subfolders(folder))
 
             return dict_to_result(
                 success=True,
@@ -3,6 +3,7 @@
 This module provides all email-related functionality (12 methods).
 """
 
+import itertools
 from typing import Any
 
 from ..core.exceptions import OutlookItemNotFoundError
@@ -534,6 +535,7 @@ class MailOperationsMixin:
         end_date: str | None = None,
         unread_only: bool = False,
         max_results: int = 50,
+        page_size: int | None = None,
     ) -> dict[str, Any]:
         """Search for emails with various criteria.
 
@@ -545,7 +547,9 @@ class MailOperationsMixin:
             start_date: Start date for search (ISO format)
             end_date: End date for search (ISO format)
             unread_only: Only return unread emails
-            max_results: Maximum number of results
+            max_results: Maximum number of results (ignored when paginating)
+            page_size: Return the results in pages of this size, with a
+                cursor for server_next_page
 
         Returns:
             Dictionary with search results
@@ -569,17 +573,16 @@ class MailOperationsMixin:
         )
         items = folder.Items.Restrict(filter_string) if filter_string else folder.Items
 
-        # Collect results
-        results = []
-        for item in items:
-            if len(results) >= max_results:
-                break
-
-            # Additional body search if specified
-            if body_contains and body_contains.lower() not in item.Body.lower():
-                continue
+        # Additional body search if specified; results are extracted lazily
+        matches = (
+            self._extract_email_data(item)
+            for item in items
+            if not body_contains or body_contains.lower() in item.Body.lower()
+        )
+        if page_size:
+            return self.pages.page(matches, page_size, folder_name=folder_name)
 
-            results.append(self._extract_email_data(item))
+        results = list(itertools.islice(matches, max_results))
 
         return dict_to_result(
             success=True,
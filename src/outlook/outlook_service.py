@@ -6,7 +6,7 @@ SOLID principles and design patterns.
 
 from typing import Any
 
-from ..core.base_office import BaseOfficeService
+from ..core.base_office import ApplicationFactory, BaseOfficeService
 from ..core.types import ApplicationType
 from ..utils.com_wrapper import com_safe
 from ..utils.helpers import dict_to_result
@@ -57,13 +57,16 @@ class OutlookService(
         True
     """
 
-    def __init__(self, visible: bool = False) -> None:
+    def __init__(
+        self, visible: bool = False, application_factory: ApplicationFactory | None = None
+    ) -> None:
         """Initialize Outlook service.
 
         Args:
             visible: Whether to make Outlook window visible (not typically used)
+            application_factory: Factory creating the application object
         """
-        super().__init__(ApplicationType.OUTLOOK, visible)
+        super().__init__(ApplicationType.OUTLOOK, visible, application_factory)
         self._namespace = None
 
     @property
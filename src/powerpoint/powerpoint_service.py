@@ -6,9 +6,7 @@ SOLID principles and design patterns.
 
 from typing import Any
 
-from win32com.client import constants as win_constants
-
-from ..core.base_office import BaseOfficeService, DocumentOperationMixin
+from ..core.base_office import ApplicationFactory, BaseOfficeService, DocumentOperationMixin
 from ..core.types import ApplicationType
 from ..utils.com_wrapper import COMConstants, com_safe, rgb_to_office_color
 from ..utils.helpers import dict_to_result, ensure_directory_exists
@@ -38,9 +36,11 @@ class PowerPointService(BaseOfficeService, DocumentOperationMixin):
     - Advanced features (11 methods)
     """
 
-    def __init__(self, visible: bool = False) -> None:
+    def __init__(
+        self, visible: bool = False, application_factory: ApplicationFactory | None = None
+    ) -> None:
         """Initialize PowerPoint service."""
-        super().__init__(ApplicationType.POWERPOINT, visible)
+        super().__init__(ApplicationType.POWERPOINT, visible, application_factory)
 
     def _close_document(self) -> None:
         """Close the current presentation."""
@@ -180,7 +180,7 @@ class PowerPointService(BaseOfficeService, DocumentOperationMixin):
         ensure_directory_exists(path)
 
         pres = self.current_document
-        pres.SaveAs(str(path), FileFormat=win_constants.ppSaveAsOpenXMLTemplate)
+        pres.SaveAs(str(path), FileFormat=COMConstants.PP_SAVE_AS_POTX)
 
         return dict_to_result(
             success=True,
@@ -15,28 +15,45 @@ Version: 3.0.0 - Complete Integration
 """
 
 import asyncio
+import inspect
 import logging
-from typing import Any, Callable, Dict, Optional
+import os
+from typing import Any, Dict, Optional
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
+from src.core.base_office import (
+    get_default_application_factory,
+    set_default_application_factory,
+)
+from src.core.catalog import ToolCatalog, ToolSpec, parse_tool_filter
+from src.core.com_profiler import get_com_profiler
+from src.core.dispatch import ToolDispatcher
 from src.core.exceptions import (
     COMInitializationError,
     DocumentNotFoundError,
     InvalidParameterError,
 )
+from src.core.metrics import UNSUCCESSFUL_RESULT, CallTimer, MetricsRegistry, error_class
+from src.core.serialization import DEFAULT_BUDGET, ResultSerializer
+from src.core.service_manager import ServiceManager, parse_service_list
+from src.core.sta_worker import STAWorker
 from src.excel.excel_service import ExcelService
+from src.fake_com.factory import FakeApplicationFactory
 from src.outlook.outlook_service import OutlookService
 from src.powerpoint.powerpoint_service import PowerPointService
+from src.server_tools import ServerToolsService
 from src.word.word_service import WordService
 
 # Import des configurations d'outils
 from tools_configs import (
     EXCEL_TOOLS_CONFIG,
+    OFFICE_TOOLS_CONFIG,
     OUTLOOK_TOOLS_CONFIG,
     POWERPOINT_TOOLS_CONFIG,
+    SERVER_TOOLS_CONFIG,
     WORD_TOOLS_CONFIG,
 )
 
@@ -50,33 +67,87 @@ logger = logging.getLogger("mcp_office")
 # Initialisation du serveur MCP
 app = Server("mcp-office-server")
 
-# Services Office
-word_service: Optional[WordService] = None
-excel_service: Optional[ExcelService] = None
-powerpoint_service: Optional[PowerPointService] = None
-outlook_service: Optional[OutlookService] = None
+# Backend des applications : "com" (Office via pywin32) ou "fake" (simulation en mémoire,
+# latence par appel IDispatch réglable via MCP_OFFICE_FAKE_LATENCY_MS)
+BACKEND = os.environ.get("MCP_OFFICE_BACKEND", "com").strip().lower()
+if BACKEND == "fake":
+    set_default_application_factory(
+        FakeApplicationFactory(
+            latency=float(os.environ.get("MCP_OFFICE_FAKE_LATENCY_MS", "0")) / 1000
+        )
+    )
 
+# Profilage des allers-retours COM par outil (MCP_OFFICE_COM_PROFILE=1) ; le rapport JSON
+# est écrit à l'arrêt du serveur si MCP_OFFICE_COM_PROFILE_REPORT est défini
+com_profiler = get_com_profiler()
+COM_PROFILE_REPORT = os.environ.get("MCP_OFFICE_COM_PROFILE_REPORT")
+com_profiler.enabled = os.environ.get("MCP_OFFICE_COM_PROFILE", "0") != "0" or bool(
+    COM_PROFILE_REPORT
+)
 
-# =============================================================================
-# UTILITY FUNCTIONS
-# =============================================================================
+# Métriques par outil et par service ; export JSON périodique optionnel
+# (MCP_OFFICE_METRICS_FILE, toutes les MCP_OFFICE_METRICS_INTERVAL secondes)
+metrics = MetricsRegistry()
+METRICS_FILE = os.environ.get("MCP_OFFICE_METRICS_FILE")
+METRICS_INTERVAL = float(os.environ.get("MCP_OFFICE_METRICS_INTERVAL", "60"))
 
+# Résultats sérialisés en JSON dans un budget d'octets par réponse ; la suite d'un
+# résultat tronqué s'obtient avec server_next_page et le curseur retourné
+result_serializer = ResultSerializer(
+    budget=int(os.environ.get("MCP_OFFICE_MAX_RESULT_BYTES", DEFAULT_BUDGET))
+)
 
-def format_result(result: Dict[str, Any]) -> str:
-    """Formate un résultat pour l'affichage."""
-    if not result.get("success", False):
-        error_msg = result.get("error", "Unknown error")
-        return f"❌ Erreur: {error_msg}"
+# Services Office : créés et démarrés à la demande, chacun sur son thread STA dédié
+services = ServiceManager(
+    {
+        "word": WordService,
+        "excel": ExcelService,
+        "powerpoint": PowerPointService,
+        "outlook": OutlookService,
+    },
+    worker_factory=lambda prefix: STAWorker(
+        prefix, com_apartment=get_default_application_factory().uses_com
+    ),
+)
 
-    lines = ["✅ Opération réussie"]
-    for key, value in result.items():
-        if key not in ["success", "error"] and value is not None:
-            if isinstance(value, (list, dict)) and len(str(value)) > 200:
-                lines.append(f"  • {key}: [données volumineuses - {len(value)} éléments]")
-            else:
-                lines.append(f"  • {key}: {value}")
+# Table de dispatch compilée (name -> méthode liée + arguments précalculés)
+dispatcher = ToolDispatcher()
+
+# Configurations d'outils par préfixe de service
+SERVICE_CONFIGS = {
+    "word": WORD_TOOLS_CONFIG,
+    "excel": EXCEL_TOOLS_CONFIG,
+    "powerpoint": POWERPOINT_TOOLS_CONFIG,
+    "outlook": OUTLOOK_TOOLS_CONFIG,
+    "server": SERVER_TOOLS_CONFIG,
+    "office": OFFICE_TOOLS_CONFIG,
+}
+SERVICE_PREFIXES = tuple(SERVICE_CONFIGS)
+
+# Outils servis depuis un fichier sans démarrer l'application quand l'argument
+# indiqué est donné (un fichier ouvert dans l'application déjà démarrée y est lu)
+OFFLINE_TOOLS = {
+    "excel_read_cell": "file_path",
+    "excel_read_range": "file_path",
+    "excel_export_to_json": "file_path",
+    "excel_convert_to_csv": "file_path",
+    "excel_create_workbook_offline": "output_path",
+    "excel_compare_workbooks": "old_path",
+    "excel_aggregate_range": "file_path",
+}
+
+# Démarrage : services démarrés au boot (ex: MCP_OFFICE_EAGER="excel,word" ou "all")
+EAGER_SERVICES = parse_service_list(os.environ.get("MCP_OFFICE_EAGER"), services.prefixes)
+PARALLEL_START = os.environ.get("MCP_OFFICE_PARALLEL_START", "1") != "0"
+
+# Catalogue d'outils précalculé et filtre optionnel (ex: MCP_OFFICE_TOOLS="excel,word_insert")
+tool_catalog: Optional[ToolCatalog[Tool]] = None
+TOOL_FILTER = parse_tool_filter(os.environ.get("MCP_OFFICE_TOOLS"))
 
-    return "\n".join(lines)
+
+# =============================================================================
+# UTILITY FUNCTIONS
+# =============================================================================
 
 
 def validate_parameters(params: Dict[str, Any], required: list[str]) -> None:
@@ -86,49 +157,25 @@ def validate_parameters(params: Dict[str, Any], required: list[str]) -> None:
         raise InvalidParameterError(f"Paramètres manquants: {', '.join(missing)}")
 
 
-def generate_tool(service_prefix: str, name: str, config: dict) -> Tool:
-    """Génère un outil MCP à partir de sa configuration."""
-    properties = {}
-
-    # Ajouter tous les paramètres (requis et optionnels)
-    for param in config.get("required", []) + config.get("optional", []):
-        properties[param] = {"type": "string"}  # Type par défaut
-
+def generate_tool(spec: ToolSpec) -> Tool:
+    """Génère un outil MCP à partir de sa spécification précalculée."""
     return Tool(
-        name=f"{service_prefix}_{name}",
-        description=config["desc"],
-        inputSchema={
-            "type": "object",
-            "properties": properties,
-            "required": config.get("required", []),
-        },
+        name=spec.name,
+        description=spec.description,
+        inputSchema=dict(spec.input_schema),
     )
 
 
-def build_handlers(service: Any, service_config: Dict, service_prefix: str) -> Dict[str, Callable]:
-    """Construit le mapping des handlers de manière dynamique."""
-
-    def create_handler(method_name: str, config: dict):
-        """Crée un handler dynamique pour une méthode."""
-        method = getattr(service, method_name)
-
-        def handler(args: dict):
-            # Extraire tous les arguments (requis + optionnels)
-            kwargs = {}
-            for param in config.get("required", []) + config.get("optional", []):
-                if param in args:
-                    kwargs[param] = args[param]
-            return method(**kwargs)
-
-        return handler
+def get_tool_catalog() -> ToolCatalog[Tool]:
+    """Retourne le catalogue d'outils, construit une seule fois."""
+    global tool_catalog
 
-    # Générer tous les handlers automatiquement
-    handlers = {}
-    for method_name, config in service_config.items():
-        tool_name = f"{service_prefix}_{method_name}"
-        handlers[tool_name] = create_handler(method_name, config)
-
-    return handlers
+    if tool_catalog is None:
+        tool_catalog = ToolCatalog(SERVICE_CONFIGS, factory=generate_tool)
+        logger.info(f"Tool catalog built: {len(tool_catalog)} tools")
+        for prefix, count in tool_catalog.counts.items():
+            logger.info(f"  - {prefix}: {count} tools")
+    return tool_catalog
 
 
 # =============================================================================
@@ -138,32 +185,8 @@ def build_handlers(service: Any, service_config: Dict, service_prefix: str) -> D
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
-    """Liste tous les outils disponibles (271 outils)."""
-    tools = []
-
-    # Générer les outils Word
-    for method_name, config in WORD_TOOLS_CONFIG.items():
-        tools.append(generate_tool("word", method_name, config))
-
-    # Générer les outils Excel
-    for method_name, config in EXCEL_TOOLS_CONFIG.items():
-        tools.append(generate_tool("excel", method_name, config))
-
-    # Générer les outils PowerPoint
-    for method_name, config in POWERPOINT_TOOLS_CONFIG.items():
-        tools.append(generate_tool("powerpoint", method_name, config))
-
-    # Générer les outils Outlook
-    for method_name, config in OUTLOOK_TOOLS_CONFIG.items():
-        tools.append(generate_tool("outlook", method_name, config))
-
-    logger.info(f"Loaded {len(tools)} tools total")
-    logger.info(f"  - Word: {len(WORD_TOOLS_CONFIG)} tools")
-    logger.info(f"  - Excel: {len(EXCEL_TOOLS_CONFIG)} tools")
-    logger.info(f"  - PowerPoint: {len(POWERPOINT_TOOLS_CONFIG)} tools")
-    logger.info(f"  - Outlook: {len(OUTLOOK_TOOLS_CONFIG)} tools")
-
-    return tools
+    """Liste les outils disponibles (filtrés via MCP_OFFICE_TOOLS si défini)."""
+    return list(get_tool_catalog().tools(**TOOL_FILTER))
 
 
 def route_to_service(service_prefix: str, service_instance, config, name: str, arguments: dict):
@@ -171,11 +194,19 @@ def route_to_service(service_prefix: str, service_instance, config, name: str, a
     if service_instance is None:
         raise COMInitializationError(f"{service_prefix.capitalize()} service not initialized")
 
-    handlers = build_handlers(service_instance, config, service_prefix)
-    if name in handlers:
-        return handlers[name](arguments)
-    else:
+    # No-op si l'instance est déjà compilée ; recompile seulement si recréée
+    dispatcher.bind_service(service_prefix, service_instance, config)
+    if name not in dispatcher:
         raise NotImplementedError(f"Outil {service_prefix} non implémenté: {name}")
+    return dispatcher.dispatch(name, arguments)
+
+
+def execute_tool(service_instance, name: str, arguments: dict):
+    """Exécute un outil sur son service (appelé sur le thread du worker)."""
+    service_prefix = get_service_prefix(name)
+    config = SERVICE_CONFIGS.get(service_prefix, {})
+    with com_profiler.tool(name):
+        return route_to_service(service_prefix, service_instance, config, name, arguments)
 
 
 def handle_tool_error(name: str, error: Exception) -> list[TextContent]:
@@ -198,17 +229,35 @@ def handle_tool_error(name: str, error: Exception) -> list[TextContent]:
 
 def get_service_prefix(name: str) -> Optional[str]:
     """Identifie le préfixe de service à partir du nom de l'outil."""
-    service_mapping = {
-        "word": (word_service, WORD_TOOLS_CONFIG, "word"),
-        "excel": (excel_service, EXCEL_TOOLS_CONFIG, "excel"),
-        "powerpoint": (powerpoint_service, POWERPOINT_TOOLS_CONFIG, "powerpoint"),
-        "outlook": (outlook_service, OUTLOOK_TOOLS_CONFIG, "outlook"),
-    }
+    prefix = name.split("_", 1)[0]
+    return prefix if prefix in SERVICE_PREFIXES and "_" in name else None
+
+
+def needs_application(name: str, arguments: dict) -> bool:
+    """Indique si un outil doit démarrer l'application de son service avant de s'exécuter."""
+    argument = OFFLINE_TOOLS.get(name)
+    return argument is None or not arguments.get(argument)
 
-    for prefix in service_mapping:
-        if name.startswith(f"{prefix}_"):
-            return prefix
-    return None
+
+def compile_dispatch_table() -> None:
+    """Compile (ou met à jour) la table de dispatch pour les services démarrés."""
+    for prefix in services.prefixes:
+        dispatcher.bind_service(prefix, services.service(prefix), SERVICE_CONFIGS[prefix])
+    logger.info(f"Dispatch table compiled: {len(dispatcher)} tools")
+
+
+# Outils serveur (server_*, office_batch)
+server_tools = ServerToolsService(
+    services,
+    execute_tool,
+    dispatcher.dispatch,
+    com_profiler,
+    metrics,
+    result_serializer,
+    needs_application,
+)
+dispatcher.bind_service("server", server_tools, SERVER_TOOLS_CONFIG)
+dispatcher.bind_service("office", server_tools, OFFICE_TOOLS_CONFIG)
 
 
 @app.call_tool()
@@ -216,36 +265,46 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """Exécute un outil MCP avec routing automatique."""
     logger.info(f"Calling tool: {name}")
 
+    # Identifier le service cible
+    service_prefix = get_service_prefix(name)
+    if not service_prefix:
+        return [TextContent(type="text", text=f"❌ Outil inconnu: {name}")]
+
+    # Attente dans la file du worker et exécution mesurées séparément
+    timer = CallTimer()
     try:
         # Convertir arguments en dictionnaire
         if not isinstance(arguments, dict):
             arguments = {}
 
-        # Identifier le service cible
-        service_prefix = get_service_prefix(name)
-        if not service_prefix:
-            return [TextContent(type="text", text=f"❌ Outil inconnu: {name}")]
-
-        # Mapping des services
-        service_mapping = {
-            "word": (word_service, WORD_TOOLS_CONFIG, "word"),
-            "excel": (excel_service, EXCEL_TOOLS_CONFIG, "excel"),
-            "powerpoint": (powerpoint_service, POWERPOINT_TOOLS_CONFIG, "powerpoint"),
-            "outlook": (outlook_service, OUTLOOK_TOOLS_CONFIG, "outlook"),
-        }
+        if service_prefix in services.prefixes:
+            # Exécution sur le thread STA du service, démarré au premier appel
+            # (sauf pour les outils hors ligne, qui lisent le fichier directement)
+            result = await services.run(
+                service_prefix,
+                timer.wrap(execute_tool),
+                name,
+                arguments,
+                start=needs_application(name, arguments),
+            )
+        else:
+            # Outils serveur : exécutés directement, sans attendre les workers COM
+            result = dispatcher.dispatch(name, arguments)
+            if inspect.isawaitable(result):
+                result = await result
 
-        service_instance, config, _ = service_mapping[service_prefix]
-        result = route_to_service(service_prefix, service_instance, config, name, arguments)
+    except Exception as e:
+        metrics.record(name, service_prefix, timer, error=error_class(e))
+        return handle_tool_error(name, e)
 
-        # Formater et retourner le résultat
-        if result is None:
-            return [TextContent(type="text", text="❌ Aucun résultat retourné")]
+    failed = isinstance(result, dict) and result.get("success") is False
+    metrics.record(name, service_prefix, timer, error=UNSUCCESSFUL_RESULT if failed else None)
 
-        formatted = format_result(result)
-        return [TextContent(type="text", text=formatted)]
+    # Formater et retourner le résultat
+    if result is None:
+        return [TextContent(type="text", text="❌ Aucun résultat retourné")]
 
-    except Exception as e:
-        return handle_tool_error(name, e)
+    return [TextContent(type="text", text=result_serializer.serialize(result))]
 
 
 # =============================================================================
@@ -254,64 +313,36 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
 
 
 async def initialize_services():
-    """Initialise tous les services Office."""
-    global word_service, excel_service, powerpoint_service, outlook_service
-
+    """Prépare les services Office (démarrage à la demande + liste de démarrage anticipé)."""
     logger.info("Initializing Office services...")
 
-    try:
-        # Initialiser Word
-        word_service = WordService()
-        word_service.initialize()
-        logger.info(f"✅ Word service initialized ({len(WORD_TOOLS_CONFIG)} tools)")
-
-        # Initialiser Excel
-        excel_service = ExcelService()
-        excel_service.initialize()
-        logger.info(f"✅ Excel service initialized ({len(EXCEL_TOOLS_CONFIG)} tools)")
-
-        # Initialiser PowerPoint
-        powerpoint_service = PowerPointService()
-        powerpoint_service.initialize()
-        logger.info(f"✅ PowerPoint service initialized ({len(POWERPOINT_TOOLS_CONFIG)} tools)")
-
-        # Initialiser Outlook
-        outlook_service = OutlookService()
-        outlook_service.initialize()
-        logger.info(f"✅ Outlook service initialized ({len(OUTLOOK_TOOLS_CONFIG)} tools)")
-
-        total_tools = (
-            len(WORD_TOOLS_CONFIG)
-            + len(EXCEL_TOOLS_CONFIG)
-            + len(POWERPOINT_TOOLS_CONFIG)
-            + len(OUTLOOK_TOOLS_CONFIG)
-        )
+    if EAGER_SERVICES:
+        mode = "parallel" if PARALLEL_START else "sequential"
+        logger.info(f"Eager start ({mode}): {', '.join(EAGER_SERVICES)}")
+        errors = await services.start_many(EAGER_SERVICES, parallel=PARALLEL_START)
+        for prefix, error in errors.items():
+            if error:
+                logger.error(f"Failed to start {prefix} service: {error}")
+    else:
+        logger.info("Lazy start: each application starts on its first tool call")
 
-        logger.info("🚀 All Office services ready!")
-        logger.info(f"📊 Total tools available: {total_tools}")
+    compile_dispatch_table()
 
-    except Exception as e:
-        logger.error(f"Failed to initialize services: {e}")
-        raise
+    total_tools = sum(len(config) for config in SERVICE_CONFIGS.values())
+    logger.info("🚀 MCP Office server ready!")
+    logger.info(f"📊 Total tools available: {total_tools}")
 
 
 async def cleanup_services():
     """Nettoie tous les services Office."""
     logger.info("Cleaning up Office services...")
-
-    try:
-        if word_service:
-            word_service.cleanup()
-        if excel_service:
-            excel_service.cleanup()
-        if powerpoint_service:
-            powerpoint_service.cleanup()
-        if outlook_service:
-            outlook_service.cleanup()
-
-        logger.info("✅ All services cleaned up")
-    except Exception as e:
-        logger.error(f"Error during cleanup: {e}")
+    await services.shutdown()
+    if METRICS_FILE:
+        metrics.save(METRICS_FILE)
+    if COM_PROFILE_REPORT:
+        path = com_profiler.save(COM_PROFILE_REPORT)
+        logger.info(f"COM profile written to {path}")
+    logger.info("✅ All services cleaned up")
 
 
 async def main():
@@ -321,10 +352,16 @@ async def main():
     logger.info("MCP Office - Complete Office Automation Server")
     logger.info("=" * 80)
 
+    metrics_dump = None
     try:
         # Initialiser les services
         await initialize_services()
 
+        if METRICS_FILE:
+            metrics_dump = asyncio.create_task(
+                metrics.dump_periodically(METRICS_FILE, METRICS_INTERVAL)
+            )
+
         # Démarrer le serveur MCP
         async with stdio_server() as (read_stream, write_stream):
             await app.run(
@@ -339,6 +376,8 @@ async def main():
         logger.exception("Fatal error in server")
         raise
     finally:
+        if metrics_dump is not None:
+            metrics_dump.cancel()
         # Nettoyer les services
         await cleanup_services()
         logger.info("Server stopped")
@@ -0,0 +1,242 @@
+"""Server-level tools (``server_*`` and ``office_*``).
+
+These tools report on or orchestrate the server itself rather than driving a
+single Office application. They run directly on the event loop; the ones that
+need an application (``office_batch``) hand their work to the service workers.
+"""
+
+import inspect
+from collections.abc import Callable
+from contextlib import nullcontext
+from typing import Any
+
+from src.core.batch import (
+    BatchStep,
+    group_consecutive,
+    parse_batch,
+    run_steps,
+    step_error,
+    summarize,
+)
+from src.core.com_profiler import SORT_KEYS, ComProfiler, get_com_profiler
+from src.core.exceptions import InvalidParameterError
+from src.core.metrics import MetricsRegistry
+from src.core.serialization import JSONText, ResultSerializer
+from src.core.service_manager import ServiceManager
+from src.utils.helpers import dict_to_result
+from src.utils.validators import (
+    validate_bool,
+    validate_choice,
+    validate_positive_number,
+    validate_string_not_empty,
+)
+
+#: Settings left on while a batch runs: under manual calculation, a step reading
+#: cells that depend on an earlier write of the batch would get stale values
+BATCH_KEPT_SETTINGS = ("Calculation",)
+
+
+class ServerToolsService:
+    """Implementation of the SERVER_TOOLS_CONFIG and OFFICE_TOOLS_CONFIG tools.
+
+    Args:
+        services: Manager of the Office services
+        execute_tool: Runs a tool on a started service, on its worker thread:
+            ``execute_tool(service, name, arguments)``
+        dispatch_local: Runs a server-level tool: ``dispatch_local(name, arguments)``
+        profiler: COM round-trip profiler (the default profiler when None)
+        metrics: Registry of the tool call metrics
+        serializer: Serializer of the tool results, keeping truncated remainders
+        needs_application: Whether a tool call must start the application of
+            its service: ``needs_application(name, arguments)`` (always by default)
+    """
+
+    def __init__(
+        self,
+        services: ServiceManager,
+        execute_tool: Callable[[Any, str, dict[str, Any]], Any],
+        dispatch_local: Callable[[str, dict[str, Any]], Any],
+        profiler: ComProfiler | None = None,
+        metrics: MetricsRegistry | None = None,
+        serializer: ResultSerializer | None = None,
+        needs_application: Callable[[str, dict[str, Any]], bool] | None = None,
+    ) -> None:
+        """Initialize the server tools."""
+        self._services = services
+        self._execute_tool = execute_tool
+        self._dispatch_local = dispatch_local
+        self._profiler = profiler or get_com_profiler()
+        self._metrics = metrics or MetricsRegistry()
+        self._serializer = serializer or ResultSerializer()
+        self._needs_application = needs_application or (lambda name, arguments: True)
+
+    def service_stats(self) -> dict[str, Any]:
+        """Report state, cold-start time and worker queue stats per application."""
+        stats = self._services.stats()
+        started = [prefix for prefix, s in stats.items() if s["state"] == "started"]
+        return dict_to_result(
+            success=True,
+            message=f"{len(started)}/{len(stats)} Office applications started",
+            **stats,
+        )
+
+    async def next_page(self, cursor: str) -> dict[str, Any] | JSONText:
+        """Get the next page of a paginated or truncated result.
+
+        Cursors of paginated tools (``outlook:...``) are resumed on the worker
+        of their service, which owns the pending iterator; the other cursors
+        continue a result truncated to the response budget.
+
+        Args:
+            cursor: Cursor of the previous page (``cursor`` or ``continuation``)
+
+        Returns:
+            The next page, with its own cursor if more results remain
+        """
+        cursor = validate_string_not_empty("cursor", cursor)
+        prefix, _, _ = cursor.partition(":")
+        if prefix in self._services.prefixes:
+            return await self._services.run(prefix, self._resume_page, cursor)
+        return self._serializer.resume(cursor)
+
+    @staticmethod
+    def _resume_page(service: Any, cursor: str) -> dict[str, Any]:
+        """Resume a paginated tool on its service (worker thread)."""
+        return service.pages.resume(cursor)
+
+    def stats(self, tool: str | None = None, reset: Any = False) -> dict[str, Any]:
+        """Report call counts, errors and latency percentiles per service and tool.
+
+        Args:
+            tool: Only report the tools starting with this prefix (``excel_``)
+            reset: Clear the metrics after reporting
+
+        Returns:
+            Dictionary with the metrics of every service and tool called so far
+        """
+        reset = validate_bool("reset", reset)
+        snapshot = self._metrics.snapshot(tool_prefix=tool)
+        if reset:
+            self._metrics.reset()
+        return dict_to_result(
+            success=True,
+            message=(
+                f"{snapshot['calls']} tool calls ({snapshot['errors']} errors) "
+                f"in {snapshot['uptime_s']} s"
+            ),
+            **snapshot,
+        )
+
+    def com_profile(
+        self,
+        top: Any = 20,
+        sort_by: str = "calls_per_invocation",
+        reset: Any = False,
+        output_path: str | None = None,
+    ) -> dict[str, Any]:
+        """Rank the tools by number of (or time spent in) COM round trips.
+
+        Args:
+            top: Number of tools to return
+            sort_by: Ranking key (calls_per_invocation, com_calls, com_ms,
+                ms_per_invocation)
+            reset: Clear the recorded round trips after reporting
+            output_path: Also write the full report as JSON to this file
+
+        Returns:
+            Dictionary with the ranked tools and their chattiest COM members
+        """
+        top = validate_positive_number("top", int(top))
+        sort_by = validate_choice("sort_by", sort_by, list(SORT_KEYS))
+        reset = validate_bool("reset", reset)
+
+        if not self._profiler.enabled:
+            return dict_to_result(
+                success=True,
+                message="COM profiling is disabled (set MCP_OFFICE_COM_PROFILE=1)",
+                enabled=False,
+            )
+
+        report = self._profiler.report(top=top, sort_by=sort_by)
+        if output_path:
+            path = self._profiler.save(
+                validate_string_not_empty("output_path", output_path), sort_by=sort_by
+            )
+            report["output_path"] = str(path)
+        if reset:
+            self._profiler.reset()
+
+        return dict_to_result(
+            success=True,
+            message=(
+                f"{report['total_com_calls']} COM calls recorded over {len(report['tools'])} tools"
+            ),
+            **report,
+        )
+
+    async def batch(self, steps: Any, stop_on_error: Any = False) -> dict[str, Any]:
+        """Execute an ordered list of tool calls in-process.
+
+        Consecutive steps of the same application run as one job on its worker,
+        i.e. with a single acquisition of the application, in fast mode
+        (repainting, and in Excel events, suspended until the last step of
+        the run). Recalculation stays automatic so that each step sees the
+        results of the previous ones; bulk tools still suspend it while they
+        run. A run made only of offline steps does not start the application.
+
+        Args:
+            steps: List (or JSON text) of ``{"tool": ..., "arguments": {...}}``
+            stop_on_error: Stop at the first failing step
+
+        Returns:
+            Dictionary with one compact result entry per executed step
+        """
+        parsed = parse_batch(steps)
+        stop = validate_bool("stop_on_error", stop_on_error)
+
+        results: list[dict[str, Any]] = []
+        for prefix, group in group_consecutive(parsed, lambda tool: tool.split("_", 1)[0]):
+            if prefix in self._services.prefixes:
+                try:
+                    start = any(self._needs_application(s.tool, s.arguments) for s in group)
+                    group_results = await self._services.run(
+                        prefix, self._run_group, group, stop, start=start
+                    )
+                except Exception as e:
+                    group_results = [step_error(step, e) for step in (group[:1] if stop else group)]
+            else:
+                group_results = run_steps(group, self._execute_local, stop)
+
+            results.extend(group_results)
+            if stop and any(not r["ok"] for r in group_results):
+                break
+
+        counts = summarize(results, len(parsed))
+        return dict_to_result(
+            success=True,
+            message=f"Batch: {counts['succeeded']}/{len(parsed)} steps succeeded",
+            steps=results,
+            **counts,
+        )
+
+    def _run_group(
+        self, service: Any, group: list[BatchStep], stop_on_error: bool
+    ) -> list[dict[str, Any]]:
+        """Run a group of steps on a started service (worker thread), in fast mode."""
+        fast_mode = getattr(service, "fast_mode", None)
+        with fast_mode(keep=BATCH_KEPT_SETTINGS) if fast_mode else nullcontext():
+            return run_steps(
+                group,
+                lambda tool, arguments: self._execute_tool(service, tool, arguments),
+                stop_on_error,
+            )
+
+    def _execute_local(self, tool: str, arguments: dict[str, Any]) -> Any:
+        """Run a server-level step of a batch."""
+        if tool == "office_batch":
+            raise InvalidParameterError("tool", tool, "Nested batches are not supported")
+        result = self._dispatch_local(tool, arguments)
+        if inspect.isawaitable(result):
+            result.close()
+            raise InvalidParameterError("tool", tool, "Not supported in a batch")
+        return result
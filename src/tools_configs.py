@@ -1,5 +1,5 @@
 """
-Configurations des outils MCP pour Word, Excel et PowerPoint.
+Configurations des outils MCP pour Word, Excel, PowerPoint, Outlook et le serveur.
 Généré automatiquement.
 """
 
@@ -257,6 +257,14 @@ WORD_TOOLS_CONFIG = {
         "optional": ["range_start", "range_end"],
         "desc": "Insert hyperlink.",
     },
+    "set_fast_mode": {
+        "required": [],
+        "optional": ["enabled"],
+        "desc": (
+            "Keep screen updating off between calls (enabled: false restores it). "
+            "Bulk tools and batches already suspend it for their own duration."
+        ),
+    },
 }
 
 EXCEL_TOOLS_CONFIG = {
@@ -276,6 +284,25 @@ EXCEL_TOOLS_CONFIG = {
         "optional": ["save_changes"],
         "desc": "Close the current workbook.",
     },
+    "create_workbook_offline": {
+        "required": ["output_path"],
+        "optional": [
+            "values",
+            "source_path",
+            "sheet_name",
+            "header",
+            "column_formats",
+            "column_widths",
+            "data_format",
+            "inline_strings",
+            "open_after",
+        ],
+        "desc": (
+            "Write an .xlsx workbook from tabular data (values, or a .csv/JSON Lines "
+            "source_path) without Excel, streaming rows in constant memory; "
+            "open_after opens it in Excel for finishing touches."
+        ),
+    },
     "export_to_pdf": {
         "required": ["output_path"],
         "optional": [],
@@ -283,8 +310,11 @@ EXCEL_TOOLS_CONFIG = {
     },
     "convert_to_csv": {
         "required": ["output_path"],
-        "optional": [],
-        "desc": "Convert workbook to CSV.",
+        "optional": ["file_path", "sheet_name"],
+        "desc": (
+            "Convert workbook to CSV. file_path: convert an .xlsx directly, without "
+            "Excel, unless it is open."
+        ),
     },
     "create_from_template": {
         "required": ["template_path"],
@@ -334,15 +364,40 @@ EXCEL_TOOLS_CONFIG = {
         "optional": [],
         "desc": "Write values to a range.",
     },
+    "write_range_bulk": {
+        "required": ["sheet_name", "start_cell", "values"],
+        "optional": ["data_format", "chunk_bytes"],
+        "desc": (
+            "Write a large 2D payload (rows, columns, JSON or CSV text) from its "
+            "top-left cell, in chunks with recalculation suspended."
+        ),
+    },
     "read_cell": {
         "required": ["sheet_name", "cell"],
-        "optional": [],
-        "desc": "Read value from a cell.",
+        "optional": ["raw", "file_path"],
+        "desc": (
+            "Read value from a cell. raw: read Value2, dates as ISO strings; "
+            "file_path: read an .xlsx directly, without Excel, unless it is open."
+        ),
     },
     "read_range": {
         "required": ["sheet_name", "range_addr"],
-        "optional": [],
-        "desc": "Read values from a range.",
+        "optional": [
+            "page_size",
+            "block_rows",
+            "spill_path",
+            "raw",
+            "date_columns",
+            "file_path",
+        ],
+        "desc": (
+            "Read values from a range. page_size: rows per page (see server_next_page); "
+            "block_rows: stream large ranges in row blocks (raw Value2); "
+            "spill_path: stream the rows to a .csv or JSON Lines file; "
+            "raw: read Value2 and convert date columns (date_columns, or sampled from "
+            "NumberFormat) to ISO strings; file_path: read an .xlsx directly, without "
+            "Excel, unless it is open."
+        ),
     },
     "copy_paste_cells": {
         "required": ["sheet_name", "source_range", "dest_range"],
@@ -359,6 +414,23 @@ EXCEL_TOOLS_CONFIG = {
         "optional": [],
         "desc": "Find and replace in worksheet.",
     },
+    "bulk_find_replace": {
+        "required": ["path", "pairs"],
+        "optional": ["match_case", "engine", "workers", "output_dir"],
+        "desc": (
+            "Find and replace in every sheet of the workbooks of a directory or glob "
+            "(.xlsx rewritten without Excel when no formula matches, "
+            "other files spread over several Excel processes)."
+        ),
+    },
+    "compare_workbooks": {
+        "required": ["old_path", "new_path"],
+        "optional": ["sheets", "max_changes"],
+        "desc": (
+            "Compare the values and formulas of two workbooks cell by cell "
+            "(.xlsx parsed without Excel); returns change counts and a (cell, old, new) list."
+        ),
+    },
     "write_formula": {
         "required": ["sheet_name", "cell", "formula"],
         "optional": [],
@@ -409,6 +481,15 @@ EXCEL_TOOLS_CONFIG = {
         "optional": ["horizontal", "vertical"],
         "desc": "Set cell alignment.",
     },
+    "apply_formatting_batch": {
+        "required": ["sheet_name", "entries"],
+        "optional": [],
+        "desc": (
+            'Apply many formats at once. entries is a JSON list of {"range": "A1:D1", '
+            '"style": {"fill": "#DDEBF7", "bold": true, "number_format": "0.00", ...}}; '
+            "identical styles are merged and set once per multi-area range."
+        ),
+    },
     "set_wrap_text": {
         "required": ["sheet_name", "range_addr"],
         "optional": ["wrap"],
@@ -544,6 +625,14 @@ EXCEL_TOOLS_CONFIG = {
         "optional": [],
         "desc": "Refresh pivot table data.",
     },
+    "aggregate_range": {
+        "required": ["sheet_name", "range_addr", "aggregations"],
+        "optional": ["group_by", "has_headers", "dest_sheet", "dest_cell", "file_path"],
+        "desc": (
+            "Group a range by columns and compute sum, count, mean, min, max or distinct "
+            "counts in one bulk read, without a pivot table (optionally written back)."
+        ),
+    },
     "sort_ascending": {
         "required": ["sheet_name", "range_addr"],
         "optional": ["key_column"],
@@ -647,7 +736,30 @@ EXCEL_TOOLS_CONFIG = {
         "optional": [],
         "desc": "Perform goal seek.",
     },
-    "use_solver": {"required": ["sheet_name"], "optional": [], "desc": "Use Solver add-in."},
+    "parameter_sweep": {
+        "required": ["sheet_name", "inputs", "outputs"],
+        "optional": ["calc_range", "workers"],
+        "desc": (
+            "Evaluate output cells over every combination of input values in one loop "
+            "under manual calculation (optionally split over several Excel processes)."
+        ),
+    },
+    "use_solver": {
+        "required": ["sheet_name", "objective_cell", "variable_cells"],
+        "optional": [
+            "goal",
+            "target",
+            "bounds",
+            "max_evaluations",
+            "tolerance",
+            "calc_range",
+            "keep_solution",
+        ],
+        "desc": (
+            "Minimize, maximize or reach a target for an objective cell by changing "
+            "variable cells within bounds (derivative-free search, no Solver add-in)."
+        ),
+    },
     "consolidate_data": {
         "required": ["dest_sheet", "dest_range", "source_ranges"],
         "optional": ["function"],
@@ -660,8 +772,11 @@ EXCEL_TOOLS_CONFIG = {
     },
     "import_csv": {
         "required": ["sheet_name", "csv_path"],
-        "optional": ["dest_cell"],
-        "desc": "Import CSV data.",
+        "optional": ["dest_cell", "delimiter", "encoding", "chunk_bytes", "convert_types"],
+        "desc": (
+            "Import a CSV file by streaming it in block writes "
+            "(delimiter and encoding detected, numbers, booleans and ISO dates converted)."
+        ),
     },
     "insert_hyperlink": {
         "required": ["sheet_name", "cell", "url"],
@@ -680,8 +795,28 @@ EXCEL_TOOLS_CONFIG = {
     },
     "export_to_json": {
         "required": ["sheet_name", "range_addr", "output_path"],
-        "optional": [],
-        "desc": "Export range to JSON.",
+        "optional": ["raw", "date_columns", "file_path"],
+        "desc": (
+            "Export range to JSON. raw: read Value2, date columns as ISO strings; "
+            "file_path: read an .xlsx directly, without Excel, unless it is open."
+        ),
+    },
+    "export_range_columnar": {
+        "required": ["sheet_name", "output_path"],
+        "optional": ["range_addr", "file_format", "compression", "header", "block_rows"],
+        "desc": (
+            "Export a range (the used range by default) to a typed columnar file: "
+            "Arrow IPC (.arrow), Parquet (.parquet) or NumPy (.npz)."
+        ),
+    },
+    "set_fast_mode": {
+        "required": [],
+        "optional": ["enabled"],
+        "desc": (
+            "Keep screen updating, automatic recalculation and events off between calls "
+            "(enabled: false restores them). Bulk tools and batches already suspend them "
+            "for their own duration."
+        ),
     },
 }
 
@@ -1071,6 +1206,7 @@ OUTLOOK_TOOLS_CONFIG = {
             "end_date",
             "unread_only",
             "max_results",
+            "page_size",
         ],
         "desc": "Recherche des emails",
     },
@@ -1113,7 +1249,7 @@ OUTLOOK_TOOLS_CONFIG = {
     },
     "list_folders": {
         "required": [],
-        "optional": ["parent_folder", "recursive"],
+        "optional": ["parent_folder", "recursive", "page_size"],
         "desc": "Liste les dossiers",
     },
     "get_folder_item_count": {
@@ -1153,7 +1289,14 @@ OUTLOOK_TOOLS_CONFIG = {
     },
     "search_appointments": {
         "required": [],
-        "optional": ["subject", "location", "start_date", "end_date", "max_results"],
+        "optional": [
+            "subject",
+            "location",
+            "start_date",
+            "end_date",
+            "max_results",
+            "page_size",
+        ],
         "desc": "Recherche des rendez-vous",
     },
     "get_appointments_by_date": {
@@ -1238,7 +1381,11 @@ OUTLOOK_TOOLS_CONFIG = {
         "desc": "Supprime un contact",
     },
     "search_contact": {"required": ["search_term"], "optional": [], "desc": "Recherche un contact"},
-    "list_all_contacts": {"required": [], "optional": [], "desc": "Liste tous les contacts"},
+    "list_all_contacts": {
+        "required": [],
+        "optional": ["page_size"],
+        "desc": "Liste tous les contacts",
+    },
     "create_contact_group": {
         "required": ["group_name"],
         "optional": [],
@@ -1281,7 +1428,11 @@ OUTLOOK_TOOLS_CONFIG = {
         "optional": [],
         "desc": "Définit l'échéance",
     },
-    "list_tasks": {"required": [], "optional": ["completed"], "desc": "Liste les tâches"},
+    "list_tasks": {
+        "required": [],
+        "optional": ["completed", "page_size"],
+        "desc": "Liste les tâches",
+    },
     "list_accounts": {"required": [], "optional": [], "desc": "Liste les comptes"},
     "get_default_account": {"required": [], "optional": [], "desc": "Obtient le compte par défaut"},
     "get_inbox_count": {"required": [], "optional": [], "desc": "Compte les messages inbox"},
@@ -1298,3 +1449,46 @@ OUTLOOK_TOOLS_CONFIG = {
         "desc": "Opération COM personnalisée",
     },
 }
+
+SERVER_TOOLS_CONFIG = {
+    "next_page": {
+        "required": ["cursor"],
+        "optional": [],
+        "desc": (
+            "Get the next page of a paginated tool (cursor of its result) or of a result "
+            "truncated to the response size budget (cursor of its 'continuation' member)."
+        ),
+    },
+    "service_stats": {
+        "required": [],
+        "optional": [],
+        "desc": "Report Office application state, cold-start time and worker queue stats.",
+    },
+    "stats": {
+        "required": [],
+        "optional": ["tool", "reset"],
+        "desc": (
+            "Per-service and per-tool call counts, errors by class and latency "
+            "percentiles (p50/p95/p99), with queue wait separated from execution."
+        ),
+    },
+    "com_profile": {
+        "required": [],
+        "optional": ["top", "sort_by", "reset", "output_path"],
+        "desc": (
+            "Rank tools by COM round trips (property gets/sets, method calls) and time per "
+            "member. Requires MCP_OFFICE_COM_PROFILE=1; output_path also saves a JSON report."
+        ),
+    },
+}
+
+OFFICE_TOOLS_CONFIG = {
+    "batch": {
+        "required": ["steps"],
+        "optional": ["stop_on_error"],
+        "desc": (
+            "Run an ordered list of tool calls in one request. steps is a JSON list of "
+            '{"tool": "excel_write_cell", "arguments": {...}}; returns one result per step.'
+        ),
+    },
+}
@@ -0,0 +1,306 @@
+"""Worksheet reference algebra.
+
+References (``A1``, ``$B$2:D10``, ``'Q1 Sales'!A:C``, ``3:5``, ``R2C1:R10C4``)
+are parsed once with compiled patterns into ``Ref`` tuples of 1-based integer
+coordinates, and parsed references are cached, so code handling the same
+addresses over and over pays for the parsing only once. ``Ref`` supports the
+operations range code needs without going through Excel: size, containment,
+intersection, union, difference and tiling into blocks of at most N cells.
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import NamedTuple
+
+#: Size of a worksheet (Excel 2007 and later)
+MAX_ROWS = 1_048_576
+MAX_COLUMNS = 16_384
+
+_CELLS = re.compile(r"\$?([A-Z]{1,3})\$?(\d+)(?::\$?([A-Z]{1,3})\$?(\d+))?", re.IGNORECASE)
+_COLUMNS = re.compile(r"\$?([A-Z]{1,3}):\$?([A-Z]{1,3})", re.IGNORECASE)
+_ROWS = re.compile(r"\$?(\d+):\$?(\d+)")
+_R1C1 = re.compile(r"R(\d+)C(\d+)(?::R(\d+)C(\d+))?", re.IGNORECASE)
+
+# Sheet names that can be written without quotes
+_PLAIN_SHEET = re.compile(r"[A-Za-z_][A-Za-z0-9_.]*")
+
+# Cell references inside a formula (not part of a name, a function or a sheet name)
+_FORMULA_CELL = re.compile(r"(?<![A-Za-z0-9_.$])(\$?)([A-Z]{1,3})(\$?)(\d+)(?![A-Za-z0-9_(!])")
+# String literals and quoted sheet names, left untouched
+_FORMULA_QUOTED = re.compile(r"(\"(?:[^\"]|\"\")*\"|'(?:[^']|'')*')")
+
+
+@lru_cache(maxsize=4096)
+def column_number(letters: str) -> int:
+    """Convert column letters to a 1-based column number (``"AA"`` -> 27)."""
+    number = 0
+    for char in letters.upper():
+        number = number * 26 + ord(char) - 64
+    return number
+
+
+@lru_cache(maxsize=4096)
+def column_letters(number: int) -> str:
+    """Convert a 1-based column number to its letters (27 -> ``"AA"``)."""
+    letters = ""
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+class Ref(NamedTuple):
+    """A rectangular block of cells, with 1-based inclusive bounds.
+
+    Attributes:
+        first_row: Top row
+        first_col: Left column
+        last_row: Bottom row
+        last_col: Right column
+        sheet: Worksheet name, None when the reference is not qualified
+    """
+
+    first_row: int
+    first_col: int
+    last_row: int
+    last_col: int
+    sheet: str | None = None
+
+    @property
+    def rows(self) -> int:
+        """Number of rows."""
+        return self.last_row - self.first_row + 1
+
+    @property
+    def columns(self) -> int:
+        """Number of columns."""
+        return self.last_col - self.first_col + 1
+
+    @property
+    def size(self) -> int:
+        """Number of cells."""
+        return self.rows * self.columns
+
+    @property
+    def is_cell(self) -> bool:
+        """Whether the reference is a single cell."""
+        return self.first_row == self.last_row and self.first_col == self.last_col
+
+    def address(self, absolute: bool = False, qualified: bool = True) -> str:
+        """Format the reference in A1 notation.
+
+        Whole columns are written ``A:C`` and whole rows ``3:5``.
+
+        Args:
+            absolute: Write ``$`` before the column letters and row numbers
+            qualified: Prefix the sheet name when there is one
+
+        Returns:
+            The address, such as ``"B2:D10"`` or ``"'Q1 Sales'!$A$1"``
+        """
+        d = "$" if absolute else ""
+        if self.first_row == 1 and self.last_row == MAX_ROWS:
+            text = f"{d}{column_letters(self.first_col)}:{d}{column_letters(self.last_col)}"
+        elif self.first_col == 1 and self.last_col == MAX_COLUMNS:
+            text = f"{d}{self.first_row}:{d}{self.last_row}"
+        else:
+            text = f"{d}{column_letters(self.first_col)}{d}{self.first_row}"
+            if not self.is_cell:
+                text += f":{d}{column_letters(self.last_col)}{d}{self.last_row}"
+        if qualified and self.sheet is not None:
+            sheet = self.sheet
+            if not _PLAIN_SHEET.fullmatch(sheet):
+                sheet = "'{}'".format(sheet.replace("'", "''"))
+            text = f"{sheet}!{text}"
+        return text
+
+    def __str__(self) -> str:
+        """The A1 address of the reference."""
+        return self.address()
+
+    def _same_sheet(self, other: "Ref") -> bool:
+        return self.sheet is None or other.sheet is None or self.sheet == other.sheet
+
+    def contains(self, other: "Ref") -> bool:
+        """Whether every cell of another reference is in this one."""
+        return (
+            self._same_sheet(other)
+            and self.first_row <= other.first_row
+            and self.first_col <= other.first_col
+            and other.last_row <= self.last_row
+            and other.last_col <= self.last_col
+        )
+
+    def intersect(self, other: "Ref") -> "Ref | None":
+        """Get the cells shared with another reference (None when disjoint)."""
+        if not self._same_sheet(other):
+            return None
+        first_row = max(self.first_row, other.first_row)
+        first_col = max(self.first_col, other.first_col)
+        last_row = min(self.last_row, other.last_row)
+        last_col = min(self.last_col, other.last_col)
+        if first_row > last_row or first_col > last_col:
+            return None
+        return Ref(first_row, first_col, last_row, last_col, self.sheet or other.sheet)
+
+    def hull(self, other: "Ref") -> "Ref":
+        """Get the smallest reference holding both references."""
+        return Ref(
+            min(self.first_row, other.first_row),
+            min(self.first_col, other.first_col),
+            max(self.last_row, other.last_row),
+            max(self.last_col, other.last_col),
+            self.sheet or other.sheet,
+        )
+
+    def subtract(self, other: "Ref") -> list["Ref"]:
+        """Get the cells not in another reference, as at most 4 disjoint blocks."""
+        common = self.intersect(other)
+        if common is None:
+            return [self]
+        parts = []
+        if self.first_row < common.first_row:  # band above
+            parts.append(self._replace(last_row=common.first_row - 1))
+        if common.last_row < self.last_row:  # band below
+            parts.append(self._replace(first_row=common.last_row + 1))
+        middle = self._replace(first_row=common.first_row, last_row=common.last_row)
+        if self.first_col < common.first_col:  # left of the common block
+            parts.append(middle._replace(last_col=common.first_col - 1))
+        if common.last_col < self.last_col:  # right of the common block
+            parts.append(middle._replace(first_col=common.last_col + 1))
+        return parts
+
+    def tiles(self, max_cells: int) -> Iterator["Ref"]:
+        """Split the reference into blocks of at most ``max_cells`` cells.
+
+        Blocks are made of whole rows of the reference when a row fits,
+        otherwise each row is cut into column segments.
+
+        Args:
+            max_cells: Maximum number of cells per block
+
+        Yields:
+            Blocks, top to bottom then left to right
+
+        Raises:
+            ValueError: If max_cells is not positive
+        """
+        if max_cells < 1:
+            msg = f"Invalid tile size: {max_cells}"
+            raise ValueError(msg)
+        if self.columns <= max_cells:
+            step = max_cells // self.columns
+            for row in range(self.first_row, self.last_row + 1, step):
+                yield self._replace(first_row=row, last_row=min(row + step - 1, self.last_row))
+            return
+        for row in range(self.first_row, self.last_row + 1):
+            for col in range(self.first_col, self.last_col + 1, max_cells):
+                yield Ref(row, col, row, min(col + max_cells - 1, self.last_col), self.sheet)
+
+
+def _bounds(
+    first_row: int, first_col: int, last_row: int, last_col: int, text: str
+) -> tuple[int, int, int, int]:
+    """Normalize the corners of a reference and check they are on the sheet."""
+    first_row, last_row = sorted((first_row, last_row))
+    first_col, last_col = sorted((first_col, last_col))
+    if first_row < 1 or last_row > MAX_ROWS or first_col < 1 or last_col > MAX_COLUMNS:
+        msg = f"Reference out of the worksheet: {text}"
+        raise ValueError(msg)
+    return first_row, first_col, last_row, last_col
+
+
+@lru_cache(maxsize=4096)
+def parse_ref(text: str) -> Ref:
+    """Parse a reference to integer coordinates.
+
+    Accepted forms: ``A1``, ``A1:C10``, absolute markers (``$A$1``), whole
+    columns (``A:C``), whole rows (``3:5``), absolute R1C1 (``R1C1:R10C3``),
+    each optionally qualified by a sheet name (``Data!A1``, ``'Q1 Sales'!A:C``).
+
+    Args:
+        text: Reference text
+
+    Returns:
+        The parsed reference (cached: the same text returns the same object)
+
+    Raises:
+        ValueError: If the reference is malformed or out of the worksheet
+    """
+    sheet = None
+    body = text.strip()
+    if "!" in body:
+        sheet, _, body = body.rpartition("!")
+        if len(sheet) > 1 and sheet[0] == sheet[-1] == "'":
+            sheet = sheet[1:-1].replace("''", "'")
+        if not sheet:
+            msg = f"Invalid reference: {text}"
+            raise ValueError(msg)
+
+    if match := _CELLS.fullmatch(body):
+        col1, row1, col2, row2 = match.groups()
+        col2, row2 = (col2, row2) if col2 else (col1, row1)
+        bounds = (int(row1), column_number(col1), int(row2), column_number(col2))
+    elif match := _COLUMNS.fullmatch(body):
+        bounds = (1, column_number(match[1]), MAX_ROWS, column_number(match[2]))
+    elif match := _ROWS.fullmatch(body):
+        bounds = (int(match[1]), 1, int(match[2]), MAX_COLUMNS)
+    elif match := _R1C1.fullmatch(body):
+        row1, col1, row2, col2 = match.groups()
+        row2, col2 = (row2, col2) if row2 else (row1, col1)
+        bounds = (int(row1), int(col1), int(row2), int(col2))
+    else:
+        msg = f"Invalid reference: {text}"
+        raise ValueError(msg)
+    return Ref(*_bounds(*bounds, text), sheet)
+
+
+def union(refs: Iterable[Ref]) -> list[Ref]:
+    """Get the cells of several references as disjoint blocks.
+
+    Args:
+        refs: References, possibly overlapping
+
+    Returns:
+        Blocks covering every cell once (sum of their sizes = cells covered)
+    """
+    blocks: list[Ref] = []
+    for ref in refs:
+        pieces = [ref]
+        for block in blocks:
+            pieces = [part for piece in pieces for part in piece.subtract(block)]
+            if not pieces:
+                break
+        blocks.extend(pieces)
+    return blocks
+
+
+def shift_formula(formula: str, rows: int, columns: int) -> str:
+    """Move the relative cell references of a formula, as copying it would.
+
+    Used to expand the shared formulas of .xlsx files, where only the first
+    cell of a block stores the formula text. Absolute (``$``) parts are kept;
+    whole-row and whole-column references are not moved.
+
+    Args:
+        formula: Formula text (with or without the leading ``=``)
+        rows: Row offset of the destination
+        columns: Column offset of the destination
+
+    Returns:
+        The formula with its references moved
+    """
+
+    def shift(match: re.Match) -> str:
+        col_abs, letters, row_abs, row = match.groups()
+        col = column_number(letters) + (0 if col_abs else columns)
+        number = int(row) + (0 if row_abs else rows)
+        if not (1 <= col <= MAX_COLUMNS and 1 <= number <= MAX_ROWS):
+            return "#REF!"
+        return f"{col_abs}{column_letters(col)}{row_abs}{number}"
+
+    parts = _FORMULA_QUOTED.split(formula)
+    for i in range(0, len(parts), 2):
+        parts[i] = _FORMULA_CELL.sub(shift, parts[i])
+    return "".join(parts)
@@ -65,6 +65,20 @@ class COMConstants:
     WD_SAVE_FORMAT_PDF = 17
     WD_SAVE_FORMAT_DOCX = 16
     WD_SAVE_FORMAT_DOC = 0
+    WD_SAVE_FORMAT_DOTX = 14
+
+    WD_STYLE_TYPE_PARAGRAPH = 1
+
+    WD_ORIENT_PORTRAIT = 0
+    WD_ORIENT_LANDSCAPE = 1
+
+    WD_STATISTIC_WORDS = 0
+    WD_STATISTIC_PAGES = 2
+    WD_STATISTIC_CHARACTERS = 3
+    WD_STATISTIC_PARAGRAPHS = 4
+
+    WD_COLLAPSE_END = 0
+    WD_COLLAPSE_START = 1
 
     # Excel constants
     XL_HALIGN_LEFT = -4131
@@ -86,6 +100,10 @@ class COMConstants:
     XL_FILE_FORMAT_PDF = 57
     XL_FILE_FORMAT_XLSX = 51
     XL_FILE_FORMAT_CSV = 6
+    XL_FILE_FORMAT_XLTX = 54
+
+    XL_CALCULATION_AUTOMATIC = -4105
+    XL_CALCULATION_MANUAL = -4135
 
     # PowerPoint constants
     PP_SLIDE_LAYOUT_TITLE = 1
@@ -94,6 +112,7 @@ class COMConstants:
 
     PP_SAVE_AS_PDF = 32
     PP_SAVE_AS_PPTX = 24
+    PP_SAVE_AS_POTX = 26
 
     PP_EFFECT_FADE = 1
     PP_EFFECT_FLY = 2
@@ -8,6 +8,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from .a1 import column_letters, column_number, parse_ref
+
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize a filename by removing invalid characters.
@@ -111,10 +113,7 @@ def column_letter_to_number(column: str) -> int:
     Examples:
         A -> 1, B -> 2, Z -> 26, AA -> 27
     """
-    number = 0
-    for char in column.upper():
-        number = number * 26 + (ord(char) - ord("A") + 1)
-    return number
+    return column_number(column)
 
 
 def column_number_to_letter(number: int) -> str:
@@ -129,11 +128,7 @@ def column_number_to_letter(number: int) -> str:
     Examples:
         1 -> A, 2 -> B, 26 -> Z, 27 -> AA
     """
-    letter = ""
-    while number > 0:
-        number, remainder = divmod(number - 1, 26)
-        letter = chr(65 + remainder) + letter
-    return letter
+    return column_letters(number)
 
 
 def parse_cell_address(address: str) -> tuple[str, int]:
@@ -145,14 +140,15 @@ def parse_cell_address(address: str) -> tuple[str, int]:
     Returns:
         Tuple of (column_letter, row_number)
     """
-    import re
-
-    match = re.match(r"([A-Z]+)([0-9]+)", address.upper())
-    if not match:
+    try:
+        ref = parse_ref(address)
+    except ValueError:
+        ref = None
+    if ref is None or not ref.is_cell or ref.sheet is not None:
         msg = f"Invalid cell address: {address}"
         raise ValueError(msg)
 
-    return match.group(1), int(match.group(2))
+    return column_letters(ref.first_col), ref.first_row
 
 
 def points_to_pixels(points: float, dpi: int = 96) -> int:
@@ -4,12 +4,16 @@ This module provides validation functions following the Fail-Fast principle
 and providing clear error messages.
 """
 
+import json
 import re
 from pathlib import Path
 from typing import Any
 
 from ..core.exceptions import InvalidParameterError
 
+_CELL_ADDRESS = re.compile(r"[A-Z]{1,3}[0-9]+")
+_RANGE_ADDRESS = re.compile(r"[A-Z]{1,3}[0-9]+:[A-Z]{1,3}[0-9]+")
+
 
 def validate_file_path(
     file_path: str | Path,
@@ -62,9 +66,8 @@ def validate_cell_address(address: str) -> str:
     if not address:
         raise InvalidParameterError("address", address, "Cell address cannot be empty")
 
-    # Pattern: Column letters followed by row number
-    pattern = r"^[A-Z]{1,3}[0-9]+$"
-    if not re.match(pattern, address.upper()):
+    # Column letters followed by row number
+    if not _CELL_ADDRESS.fullmatch(address.upper()):
         raise InvalidParameterError(
             "address",
             address,
@@ -89,9 +92,8 @@ def validate_range_address(range_address: str) -> str:
     if not range_address:
         raise InvalidParameterError("range_address", range_address, "Range address cannot be empty")
 
-    # Pattern: Cell:Cell
-    pattern = r"^[A-Z]{1,3}[0-9]+:[A-Z]{1,3}[0-9]+$"
-    if not re.match(pattern, range_address.upper()):
+    # Cell:Cell
+    if not _RANGE_ADDRESS.fullmatch(range_address.upper()):
         raise InvalidParameterError(
             "range_address",
             range_address,
@@ -256,3 +258,57 @@ def validate_choice(name: str, value: Any, choices: list[Any]) -> Any:
         )
 
     return value
+
+
+def validate_bool(name: str, value: Any) -> bool:
+    """Validate a boolean flag, accepting the string forms sent by MCP clients.
+
+    Args:
+        name: Parameter name for error messages
+        value: Boolean, number or string ("true", "false", "1", "0", "yes", "no")
+
+    Returns:
+        Validated boolean
+
+    Raises:
+        InvalidParameterError: If the value is not a recognizable boolean
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("true", "1", "yes", "on"):
+            return True
+        if lowered in ("false", "0", "no", "off", ""):
+            return False
+    raise InvalidParameterError(name, value, "Value must be a boolean")
+
+
+def validate_json_argument(name: str, value: Any, expected_type: type = list) -> Any:
+    """Validate a structured argument that MCP clients may send as JSON text.
+
+    Args:
+        name: Parameter name for error messages
+        value: Already-decoded value, or a JSON string
+        expected_type: Type the decoded value must have (list, dict, ...)
+
+    Returns:
+        Decoded value
+
+    Raises:
+        InvalidParameterError: If the JSON is invalid or has the wrong type
+    """
+    if isinstance(value, str) and expected_type is not str:
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError as e:
+            raise InvalidParameterError(name, value[:100], f"Invalid JSON: {e}") from e
+
+    if not isinstance(value, expected_type):
+        raise InvalidParameterError(
+            name, type(value).__name__, f"Value must be a JSON {expected_type.__name__}"
+        )
+
+    return value
@@ -7,9 +7,12 @@ SOLID principles and design patterns.
 from pathlib import Path
 from typing import Any
 
-from win32com.client import constants as win_constants
-
-from ..core.base_office import BaseOfficeService, DocumentOperationMixin
+from ..core.base_office import (
+    ApplicationFactory,
+    BaseOfficeService,
+    DocumentOperationMixin,
+    in_fast_mode,
+)
 from ..core.types import ApplicationType
 from ..utils.com_wrapper import COMConstants, com_safe, rgb_to_office_color
 from ..utils.helpers import dict_to_result, ensure_directory_exists
@@ -38,13 +41,20 @@ class WordService(BaseOfficeService, DocumentOperationMixin):
     - Advanced features (10 methods)
     """
 
-    def __init__(self, visible: bool = False) -> None:
+    def __init__(
+        self, visible: bool = False, application_factory: ApplicationFactory | None = None
+    ) -> None:
         """Initialize Word service.
 
         Args:
             visible: Whether to make Word window visible
+            application_factory: Factory creating the application object
         """
-        super().__init__(ApplicationType.WORD, visible)
+        super().__init__(ApplicationType.WORD, visible, application_factory)
+
+    def _fast_mode_settings(self) -> dict[str, Any]:
+        """Suspend repainting (Word has no recalculation or event switch)."""
+        return {"ScreenUpdating": False}
 
     def _close_document(self) -> None:
         """Close the current document (internal method)."""
@@ -173,7 +183,7 @@ class WordService(BaseOfficeService, DocumentOperationMixin):
         ensure_directory_exists(path)
 
         doc = self.current_document
-        doc.SaveAs2(str(path), FileFormat=win_constants.wdFormatXMLTemplate)
+        doc.SaveAs2(str(path), FileFormat=COMConstants.WD_SAVE_FORMAT_DOTX)
 
         return dict_to_result(
             success=True,
@@ -236,6 +246,7 @@ class WordService(BaseOfficeService, DocumentOperationMixin):
         )
 
     @com_safe("find_and_replace")
+    @in_fast_mode
     def find_and_replace(
         self, find_text: str, replace_text: str, match_case: bool = False
     ) -> dict[str, Any]:
@@ -368,7 +379,7 @@ class WordService(BaseOfficeService, DocumentOperationMixin):
     ) -> dict[str, Any]:
         """Create custom style."""
         doc = self.current_document
-        style = doc.Styles.Add(Name=style_name, Type=win_constants.wdStyleTypeParagraph)
+        style = doc.Styles.Add(Name=style_name, Type=COMConstants.WD_STYLE_TYPE_PARAGRAPH)
         style.BaseStyle = base_style
 
         if "font_name" in formatting:
@@ -610,6 +621,7 @@ class WordService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message="Page numbers inserted")
 
     @com_safe("create_table_of_contents")
+    @in_fast_mode
     def create_table_of_contents(self) -> dict[str, Any]:
         """Create table of contents."""
         doc = self.current_document
@@ -657,9 +669,9 @@ class WordService(BaseOfficeService, DocumentOperationMixin):
 
         if orientation:
             if orientation.lower() == "landscape":
-                page_setup.Orientation = win_constants.wdOrientLandscape
+                page_setup.Orientation = COMConstants.WD_ORIENT_LANDSCAPE
             else:
-                page_setup.Orientation = win_constants.wdOrientPortrait
+                page_setup.Orientation = COMConstants.WD_ORIENT_PORTRAIT
 
         if page_width:
             page_setup.PageWidth = page_width
@@ -698,6 +710,7 @@ class WordService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message="Comment added")
 
     @com_safe("accept_all_revisions")
+    @in_fast_mode
     def accept_all_revisions(self) -> dict[str, Any]:
         """Accept all revisions."""
         doc = self.current_document
@@ -706,6 +719,7 @@ class WordService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message="All revisions accepted")
 
     @com_safe("reject_all_revisions")
+    @in_fast_mode
     def reject_all_revisions(self) -> dict[str, Any]:
         """Reject all revisions."""
         doc = self.current_document
@@ -761,10 +775,10 @@ class WordService(BaseOfficeService, DocumentOperationMixin):
         doc = self.current_document
 
         stats = {
-            "pages": doc.ComputeStatistics(win_constants.wdStatisticPages),
-            "words": doc.ComputeStatistics(win_constants.wdStatisticWords),
-            "characters": doc.ComputeStatistics(win_constants.wdStatisticCharacters),
-            "paragraphs": doc.ComputeStatistics(win_constants.wdStatisticParagraphs),
+            "pages": doc.ComputeStatistics(COMConstants.WD_STATISTIC_PAGES),
+            "words": doc.ComputeStatistics(COMConstants.WD_STATISTIC_WORDS),
+            "characters": doc.ComputeStatistics(COMConstants.WD_STATISTIC_CHARACTERS),
+            "paragraphs": doc.ComputeStatistics(COMConstants.WD_STATISTIC_PARAGRAPHS),
         }
 
         return dict_to_result(success=True, message="Statistics retrieved", statistics=stats)
@@ -840,6 +854,7 @@ class WordService(BaseOfficeService, DocumentOperationMixin):
     # ========================================================================
 
     @com_safe("mail_merge_with_data")
+    @in_fast_mode
     def mail_merge_with_data(self, data_source: str) -> dict[str, Any]:
         """Perform mail merge."""
         path = validate_file_path(data_source, must_exist=True)
@@ -862,11 +877,12 @@ class WordService(BaseOfficeService, DocumentOperationMixin):
         return dict_to_result(success=True, message="Bookmark inserted", name=name)
 
     @com_safe("create_index")
+    @in_fast_mode
     def create_index(self) -> dict[str, Any]:
         """Create index."""
         doc = self.current_document
         index_range = doc.Range()
-        index_range.Collapse(Direction=win_constants.wdCollapseEnd)
+        index_range.Collapse(Direction=COMConstants.WD_COLLAPSE_END)
         doc.Indexes.Add(Range=index_range)
 
         return dict_to_result(success=True, message="Index created")
@@ -883,7 +899,7 @@ class WordService(BaseOfficeService, DocumentOperationMixin):
 
         # Insert bibliography
         bib_range = doc.Range()
-        bib_range.Collapse(Direction=win_constants.wdCollapseEnd)
+        bib_range.Collapse(Direction=COMConstants.WD_COLLAPSE_END)
         doc.Bibliography.Add(Range=bib_range)
 
         return dict_to_result(success=True, message="Bibliography inserted")
@@ -0,0 +1,128 @@
+"""Unit tests for the worksheet reference algebra."""
+
+import pytest
+
+from src.utils.a1 import (
+    MAX_COLUMNS,
+    MAX_ROWS,
+    Ref,
+    column_letters,
+    column_number,
+    parse_ref,
+    shift_formula,
+    union,
+)
+
+
+class TestParseRef:
+    """Tests for parse_ref."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("A1", Ref(1, 1, 1, 1)),
+            ("b2:d10", Ref(2, 2, 10, 4)),
+            ("$B$2:$D$10", Ref(2, 2, 10, 4)),
+            ("D10:B2", Ref(2, 2, 10, 4)),
+            ("A:C", Ref(1, 1, MAX_ROWS, 3)),
+            ("3:5", Ref(3, 1, 5, MAX_COLUMNS)),
+            ("R2C1:R10C4", Ref(2, 1, 10, 4)),
+            ("Data!A1", Ref(1, 1, 1, 1, "Data")),
+            ("'Q1 Sales'!A1:B2", Ref(1, 1, 2, 2, "Q1 Sales")),
+            ("'O''Brien'!C3", Ref(3, 3, 3, 3, "O'Brien")),
+        ],
+    )
+    def test_forms(self, text: str, expected: Ref) -> None:
+        """Test every supported form parses to integer coordinates."""
+        assert parse_ref(text) == expected
+
+    @pytest.mark.parametrize("text", ["", "1A", "A1:B", "A0", "XFE1", "A1048577", "!A1", "R1C"])
+    def test_invalid(self, text: str) -> None:
+        """Test malformed and out-of-sheet references are rejected."""
+        with pytest.raises(ValueError):
+            parse_ref(text)
+
+    def test_cached(self) -> None:
+        """Test the same text returns the same parsed reference."""
+        assert parse_ref("C3:D4") is parse_ref("C3:D4")
+
+    @pytest.mark.parametrize("text", ["A1", "B2:D10", "A:C", "3:5", "'Q1 Sales'!A1:B2", "Data!C3"])
+    def test_address_round_trip(self, text: str) -> None:
+        """Test address() writes back the canonical text."""
+        assert parse_ref(text).address() == text
+
+    def test_absolute_address(self) -> None:
+        """Test absolute addresses mark columns and rows."""
+        assert parse_ref("Data!B2:D10").address(absolute=True, qualified=False) == "$B$2:$D$10"
+
+    def test_columns(self) -> None:
+        """Test column letters and numbers convert both ways."""
+        assert [column_number(c) for c in ("A", "z", "AA", "XFD")] == [1, 26, 27, MAX_COLUMNS]
+        assert column_letters(MAX_COLUMNS) == "XFD"
+
+
+class TestAlgebra:
+    """Tests for the Ref operations."""
+
+    def test_size(self) -> None:
+        """Test the dimensions of a reference."""
+        ref = parse_ref("B2:D10")
+
+        assert (ref.rows, ref.columns, ref.size, ref.is_cell) == (9, 3, 27, False)
+
+    def test_intersect(self) -> None:
+        """Test overlapping references share a block, disjoint ones nothing."""
+        assert parse_ref("A1:C3").intersect(parse_ref("B2:D4")) == parse_ref("B2:C3")
+        assert parse_ref("A1:A2").intersect(parse_ref("B1:B2")) is None
+        assert parse_ref("X!A1").intersect(parse_ref("Y!A1")) is None
+
+    def test_contains_and_hull(self) -> None:
+        """Test containment and the smallest enclosing reference."""
+        assert parse_ref("A:C").contains(parse_ref("B5:C9"))
+        assert parse_ref("A1").hull(parse_ref("C3")) == parse_ref("A1:C3")
+
+    def test_subtract(self) -> None:
+        """Test a hole leaves disjoint blocks covering the remaining cells."""
+        parts = parse_ref("A1:C3").subtract(parse_ref("B2"))
+
+        assert sum(part.size for part in parts) == 8
+        assert all(part.intersect(parse_ref("B2")) is None for part in parts)
+
+    def test_union_counts_cells_once(self) -> None:
+        """Test overlapping references are merged into disjoint blocks."""
+        blocks = union([parse_ref("A1:C3"), parse_ref("B2:D4"), parse_ref("B2")])
+
+        assert sum(block.size for block in blocks) == 9 + 9 - 4
+        for i, block in enumerate(blocks):
+            assert all(block.intersect(other) is None for other in blocks[i + 1 :])
+
+    def test_tiles_of_whole_rows(self) -> None:
+        """Test tiles are made of whole rows when a row fits."""
+        tiles = list(parse_ref("A1:D10").tiles(12))
+
+        assert [t.address() for t in tiles] == ["A1:D3", "A4:D6", "A7:D9", "A10:D10"]
+
+    def test_tiles_of_wide_rows(self) -> None:
+        """Test rows wider than a tile are cut into column segments."""
+        tiles = list(parse_ref("A1:E2").tiles(2))
+
+        assert [t.address() for t in tiles] == ["A1:B1", "C1:D1", "E1", "A2:B2", "C2:D2", "E2"]
+        assert sum(t.size for t in tiles) == 10
+
+
+class TestShiftFormula:
+    """Tests for shift_formula."""
+
+    def test_relative_references_move(self) -> None:
+        """Test relative parts move and absolute parts stay."""
+        assert shift_formula("=SUM(A1:B2)*$C$3+D$4", 2, 1) == "=SUM(B3:C4)*$C$3+E$4"
+
+    def test_names_and_literals_untouched(self) -> None:
+        """Test functions, quoted sheet names and strings are not references."""
+        formula = "=LOG10(A1)&\"A1\"&'Q1 2024'!B2"
+
+        assert shift_formula(formula, 1, 0) == "=LOG10(A2)&\"A1\"&'Q1 2024'!B3"
+
+    def test_out_of_sheet(self) -> None:
+        """Test references moved off the sheet become #REF!."""
+        assert shift_formula("=A1", -1, 0) == "=#REF!"
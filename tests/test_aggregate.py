@@ -0,0 +1,187 @@
+"""Unit tests for the group-by aggregation."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.core.exceptions import COMOperationError, InvalidParameterError
+from src.excel import aggregate as aggregate_module
+from src.excel.aggregate import ResultCache, aggregate, data_digest, parse_spec
+from src.excel.excel_service import ExcelService
+from src.excel.xlsx_writer import XlsxWriter
+from src.fake_com.factory import FakeApplicationFactory
+
+HEADER = ("Region", "Product", "Amount", "Customer")
+ROWS = [
+    ("North", "A", 10.0, "c1"),
+    ("South", "B", 5.0, "c2"),
+    ("North", "B", 2.5, "c1"),
+    ("North", "A", "n/a", "c3"),
+    (None, None, None, None),
+    ("South", "A", 7.0, None),
+]
+SUMS = [{"column": "Amount", "function": "sum"}]
+
+
+@pytest.fixture
+def excel() -> Iterator[ExcelService]:
+    """Excel on the fake backend with the sales table in A1:D7."""
+    excel = ExcelService(application_factory=FakeApplicationFactory())
+    excel.create_workbook()
+    excel.current_document.Worksheets("Sheet1").Range("A1:D7").Value = (HEADER, *ROWS)
+    yield excel
+    excel.cleanup()
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run with NumPy (when installed) and with the pure-Python reduction."""
+    if request.param == "python":
+        monkeypatch.setattr(aggregate_module, "np", None)
+    elif aggregate_module.np is None:
+        pytest.skip("numpy is not installed")
+    return request.param
+
+
+class TestAggregate:
+    """Tests for parse_spec and aggregate."""
+
+    def test_functions(self, backend: str) -> None:
+        """Test every function, numbers only for sums, means and extremes."""
+        functions = ("sum", "count", "mean", "min", "max")
+        spec = parse_spec(
+            ["Region"],
+            [{"column": "C", "function": f} for f in functions]
+            + [{"column": "customer", "function": "distinct"}],
+            HEADER,
+            1,
+            4,
+        )
+
+        header, rows = aggregate(ROWS, spec)
+
+        assert header == [
+            "Region",
+            "sum(Amount)",
+            "count(Amount)",
+            "mean(Amount)",
+            "min(Amount)",
+            "max(Amount)",
+            "distinct(Customer)",
+        ]
+        assert rows == [
+            ["North", 12.5, 3, 6.25, 2.5, 10.0, 2],
+            ["South", 12.0, 2, 6.0, 5.0, 7.0, 1],
+        ]
+
+    def test_several_keys_sorted(self, backend: str) -> None:
+        """Test groups on several columns, sorted with numbers before text and blanks last."""
+        rows = [(2.0, "b", 1.0), ("x", "a", 1.0), (1.0, None, 1.0), (2.0, "b", 3.0)]
+        spec = parse_spec("1,2", [{"column": 3}], None, 1, 3)
+
+        assert aggregate(rows, spec)[1] == [
+            [1.0, None, 1.0],
+            [2.0, "b", 4.0],
+            ["x", "a", 1.0],
+        ]
+
+    def test_grand_total(self, backend: str) -> None:
+        """Test no group column gives one row of totals."""
+        spec = parse_spec(None, [{"column": "Amount", "function": "max"}], HEADER, 1, 4)
+
+        assert aggregate(ROWS, spec) == (["max(Amount)"], [[10.0]])
+
+    def test_invalid(self) -> None:
+        """Test unknown columns and functions are rejected."""
+        for group_by, aggregations in (
+            (["Nope"], SUMS),
+            (["Region"], [{"column": "Amount", "function": "median"}]),
+            (["Region"], []),
+            (["E"], SUMS),
+        ):
+            with pytest.raises(InvalidParameterError):
+                parse_spec(group_by, aggregations, HEADER, 1, 4)
+
+    def test_cache_eviction(self) -> None:
+        """Test the least recently used result is evicted."""
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    def test_data_digest(self) -> None:
+        """Test values equal in Python but different in Excel give different digests."""
+        digests = {data_digest(rows) for rows in ([(1.0,)], [(True,)], [("1.0",)], [(1.0, None)])}
+
+        assert len(digests) == 4
+        assert data_digest([(1.0, "a")]) == data_digest([[1.0, "a"]])
+
+
+class TestAggregateRange:
+    """Tests for ExcelService.aggregate_range."""
+
+    def test_live_range(self, excel: ExcelService) -> None:
+        """Test a range of the open workbook is aggregated without modifying it."""
+        result = excel.aggregate_range("Sheet1", "A1:D7", SUMS, group_by=["Region"])
+
+        assert result["columns"] == ["Region", "sum(Amount)"]
+        assert result["rows"] == [["North", 12.5], ["South", 12.0]]
+        assert (result["source_rows"], result["cached"]) == (6, False)
+        assert excel.current_document.Worksheets.Count == 1
+
+    def test_cached_until_data_changes(self, excel: ExcelService) -> None:
+        """Test a repeated query is served from the cache until the range changes."""
+        excel.aggregate_range("Sheet1", "A1:D7", SUMS, group_by="Region")
+        again = excel.aggregate_range("Sheet1", "A1:D7", SUMS, group_by="Region")
+        excel.current_document.Worksheets("Sheet1").Range("C2").Value = 20.0
+        changed = excel.aggregate_range("Sheet1", "A1:D7", SUMS, group_by="Region")
+
+        assert again["cached"]
+        assert not changed["cached"]
+        assert changed["rows"][0] == ["North", 22.5]
+
+    def test_number_replaced_by_equal_boolean(self, excel: ExcelService) -> None:
+        """Test a change invisible to Python equality (1.0 -> True) is not served from the cache."""
+        ws = excel.current_document.Worksheets("Sheet1")
+        ws.Range("C2").Value = 1.0
+        before = excel.aggregate_range("Sheet1", "A1:D7", SUMS, group_by="Region")
+        ws.Range("C2").Value = True
+        after = excel.aggregate_range("Sheet1", "A1:D7", SUMS, group_by="Region")
+
+        assert not after["cached"]
+        assert after["rows"][0][1] == before["rows"][0][1] - 1.0
+
+    def test_write_back(self, excel: ExcelService) -> None:
+        """Test the result is written below the destination cell in one block."""
+        excel.application_factory.session.reset()
+
+        result = excel.aggregate_range(
+            "Sheet1", "A1:D7", SUMS, group_by='["Region", "Product"]', dest_cell="F1"
+        )
+
+        ws = excel.current_document.Worksheets("Sheet1")
+        assert result["written_range"] == "F1:H5"
+        assert ws.Range("F1:H2").Value == (
+            ("Region", "Product", "sum(Amount)"),
+            ("North", "A", 10.0),
+        )
+
+    def test_offline_file(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test an .xlsx file is aggregated without Excel, and re-read once it changes."""
+        path = tmp_path / "sales.xlsx"
+        with XlsxWriter(path) as writer:
+            writer.write_rows([HEADER, *ROWS])
+
+        first = excel.aggregate_range("Sheet1", "A1:D7", SUMS, "Product", file_path=str(path))
+        second = excel.aggregate_range("Sheet1", "A1:D7", SUMS, "Product", file_path=str(path))
+
+        assert first["rows"] == [["A", 17.0], ["B", 7.5]]
+        assert second["cached"]
+        with pytest.raises(COMOperationError, match="dest_cell"):
+            excel.aggregate_range(
+                "Sheet1", "A1:D7", SUMS, "Product", dest_cell="F1", file_path=str(path)
+            )
@@ -0,0 +1,199 @@
+"""Unit tests for batched tool execution."""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from src.core.batch import BatchStep, group_consecutive, parse_batch, run_steps, summarize
+from src.core.dispatch import ToolDispatcher
+from src.core.exceptions import InvalidParameterError
+from src.core.service_manager import ServiceManager
+from src.core.sta_worker import STAWorker
+from src.server_tools import ServerToolsService
+
+EXCEL_CONFIG = {
+    "write_cell": {"required": ["cell", "value"], "optional": [], "desc": "w"},
+    "fail": {"required": [], "optional": [], "desc": "f"},
+}
+WORD_CONFIG = {"add_paragraph": {"required": ["text"], "optional": [], "desc": "p"}}
+
+
+class RecordingService:
+    """Service recording calls and the thread they ran on."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Any]] = []
+        self.threads: set[int] = set()
+
+    def write_cell(self, cell: str, value: Any) -> dict[str, Any]:
+        self.threads.add(threading.get_ident())
+        self.calls.append((cell, value))
+        return {"success": True, "message": "ok", "timestamp": "t", "cell": cell}
+
+    def add_paragraph(self, text: str) -> dict[str, Any]:
+        self.calls.append(("paragraph", text))
+        return {"success": True, "message": "ok"}
+
+    def fail(self) -> dict[str, Any]:
+        raise RuntimeError("COM error")
+
+
+class TestParseBatch:
+    """Tests for parse_batch function."""
+
+    def test_parse_batch_from_json(self) -> None:
+        """Test steps sent as JSON text."""
+        steps = parse_batch('[{"tool": "excel_write_cell", "arguments": {"cell": "A1"}}]')
+        assert steps == [BatchStep(0, "excel_write_cell", {"cell": "A1"})]
+
+    def test_parse_batch_default_arguments(self) -> None:
+        """Test a step without arguments."""
+        assert parse_batch([{"tool": "server_service_stats"}])[0].arguments == {}
+
+    def test_parse_batch_invalid_step(self) -> None:
+        """Test steps without a tool name are rejected."""
+        with pytest.raises(InvalidParameterError):
+            parse_batch([{"arguments": {}}])
+
+
+class TestBatchHelpers:
+    """Tests for grouping and sequential execution."""
+
+    def test_group_consecutive(self) -> None:
+        """Test only adjacent steps of the same service are grouped."""
+        steps = parse_batch(
+            [{"tool": "excel_a"}, {"tool": "excel_b"}, {"tool": "word_c"}, {"tool": "excel_d"}]
+        )
+        groups = group_consecutive(steps, lambda tool: tool.split("_")[0])
+
+        assert [(key, [s.index for s in group]) for key, group in groups] == [
+            ("excel", [0, 1]),
+            ("word", [2]),
+            ("excel", [3]),
+        ]
+
+    def test_run_steps_compacts_results(self) -> None:
+        """Test result entries drop noise keys."""
+        results = run_steps(
+            parse_batch([{"tool": "t"}]),
+            lambda tool, args: {"success": True, "timestamp": "x", "value": 3, "note": None},
+        )
+        assert results == [{"index": 0, "tool": "t", "ok": True, "value": 3}]
+
+    def test_run_steps_stop_on_error(self) -> None:
+        """Test execution stops at the first failing step."""
+
+        def execute(tool: str, args: dict) -> dict:
+            if tool == "bad":
+                raise ValueError("nope")
+            return {"success": True}
+
+        steps = parse_batch([{"tool": "ok"}, {"tool": "bad"}, {"tool": "ok"}])
+        results = run_steps(steps, execute, stop_on_error=True)
+
+        assert [r["ok"] for r in results] == [True, False]
+        assert summarize(results, len(steps)) == {
+            "executed": 2,
+            "succeeded": 1,
+            "failed": 1,
+            "skipped": 1,
+        }
+
+
+@pytest.fixture
+def server_tools() -> Iterator[tuple[ServerToolsService, dict[str, RecordingService]]]:
+    """ServerToolsService wired to two recording services."""
+    instances = {"excel": RecordingService(), "word": RecordingService()}
+    configs = {"excel": EXCEL_CONFIG, "word": WORD_CONFIG}
+    dispatcher = ToolDispatcher()
+    services = ServiceManager(
+        {prefix: (lambda s=s: s) for prefix, s in instances.items()},
+        worker_factory=lambda prefix: STAWorker(prefix, com_apartment=False),
+    )
+
+    def execute(service: Any, name: str, arguments: dict) -> Any:
+        prefix = name.split("_", 1)[0]
+        dispatcher.bind_service(prefix, service, configs[prefix])
+        return dispatcher.dispatch(name, arguments)
+
+    tools = ServerToolsService(
+        services,
+        execute,
+        dispatcher.dispatch,
+        needs_application=lambda name, arguments: name != "excel_write_cell",
+    )
+    dispatcher.bind_service("server", tools, {"service_stats": {"required": [], "desc": "s"}})
+    yield tools, instances
+    asyncio.run(services.shutdown())
+
+
+class TestOfficeBatch:
+    """Tests for ServerToolsService.batch."""
+
+    def test_batch_runs_steps_in_order(self, server_tools: Any) -> None:
+        """Test steps across services execute in order on their workers."""
+        tools, instances = server_tools
+        steps = [
+            {"tool": "excel_write_cell", "arguments": {"cell": "A1", "value": 1}},
+            {"tool": "excel_write_cell", "arguments": {"cell": "A2", "value": 2}},
+            {"tool": "word_add_paragraph", "arguments": {"text": "hi"}},
+            {"tool": "server_service_stats"},
+        ]
+
+        result = asyncio.run(tools.batch(steps))
+
+        assert result["succeeded"] == 4
+        assert [s["index"] for s in result["steps"]] == [0, 1, 2, 3]
+        assert instances["excel"].calls == [("A1", 1), ("A2", 2)]
+        assert instances["word"].calls == [("paragraph", "hi")]
+        assert threading.get_ident() not in instances["excel"].threads
+
+    def test_batch_stop_on_error(self, server_tools: Any) -> None:
+        """Test stop_on_error skips the remaining steps."""
+        tools, instances = server_tools
+        steps = [
+            {"tool": "excel_fail"},
+            {"tool": "excel_write_cell", "arguments": {"cell": "A1", "value": 1}},
+        ]
+
+        result = asyncio.run(tools.batch(steps, stop_on_error="true"))
+
+        assert result["failed"] == 1
+        assert result["skipped"] == 1
+        assert "COM error" in result["steps"][0]["error"]
+        assert not instances["excel"].calls
+
+    def test_batch_continues_by_default(self, server_tools: Any) -> None:
+        """Test failures do not stop the batch unless requested."""
+        tools, _ = server_tools
+        steps = [
+            {"tool": "unknown_tool"},
+            {"tool": "word_add_paragraph", "arguments": {"text": "x"}},
+        ]
+
+        result = asyncio.run(tools.batch(steps))
+
+        assert [s["ok"] for s in result["steps"]] == [False, True]
+
+    def test_batch_rejects_nesting(self, server_tools: Any) -> None:
+        """Test office_batch cannot call itself."""
+        tools, _ = server_tools
+        result = asyncio.run(tools.batch([{"tool": "office_batch", "arguments": {"steps": []}}]))
+
+        assert result["failed"] == 1
+
+    def test_batch_offline_steps_do_not_start(self, server_tools: Any) -> None:
+        """Test a run of offline steps only leaves the application stopped."""
+        tools, instances = server_tools
+        offline = {"tool": "excel_write_cell", "arguments": {"cell": "A1", "value": 1}}
+
+        assert asyncio.run(tools.batch([offline]))["succeeded"] == 1
+        assert instances["excel"].calls == [("A1", 1)]
+        assert tools.service_stats()["excel"]["state"] == "stopped"
+
+        asyncio.run(tools.batch([offline, {"tool": "excel_fail"}]))
+
+        assert tools.service_stats()["excel"]["state"] == "started"
@@ -0,0 +1,330 @@
+"""Unit tests for the multi-workbook find and replace."""
+
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.core.exceptions import COMOperationError, InvalidParameterError
+from src.excel.bulk_replace import (
+    apply_pairs,
+    full_calc_on_load,
+    parse_pairs,
+    replace_in_xlsx,
+    resolve_files,
+)
+from src.excel.excel_service import ExcelService
+from src.excel.xlsx_reader import XlsxReader
+from src.excel.xlsx_writer import XlsxWriter
+from src.fake_com.factory import FakeApplicationFactory
+
+PAIRS = [{"find": "Acme", "replace": "Globex"}, {"find": "Ltd", "replace": "Inc"}]
+
+
+@pytest.fixture
+def excel() -> Iterator[ExcelService]:
+    """Excel on the fake backend with an empty workbook."""
+    excel = ExcelService(application_factory=FakeApplicationFactory())
+    excel.create_workbook()
+    yield excel
+    excel.cleanup()
+
+
+def make_xlsx(path: Path, rows: list[list], shared_strings: bool = True) -> Path:
+    """Write a two-sheet workbook with the same rows on both sheets."""
+    with XlsxWriter(path, shared_strings=shared_strings) as writer:
+        for name in ("One", "Two"):
+            writer.add_sheet(name)
+            writer.write_rows(rows)
+    return path
+
+
+def with_formula(path: Path, formula: str, result: str | None = None) -> Path:
+    """Add a formula cell to the first sheet of a workbook, with its cached text result."""
+    with zipfile.ZipFile(path) as archive:
+        parts = {name: archive.read(name) for name in archive.namelist()}
+    sheet = parts["xl/worksheets/sheet1.xml"].decode()
+    cell = (
+        f'<c r="A99"><f>{formula}</f></c>'
+        if result is None
+        else f'<c r="A99" t="str"><f>{formula}</f><v>{result}</v></c>'
+    )
+    parts["xl/worksheets/sheet1.xml"] = sheet.replace(
+        "</sheetData>", f'<row r="99">{cell}</row></sheetData>'
+    ).encode()
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, data in parts.items():
+            archive.writestr(name, data)
+    return path
+
+
+class TestPairs:
+    """Tests for the pair helpers."""
+
+    def test_forms_and_order(self) -> None:
+        """Test the accepted forms and that pairs apply in order."""
+        pairs = parse_pairs([["a", "b"], {"find": "b", "replace": "c"}])
+
+        assert parse_pairs({"a": "b", "b": "c"}) == pairs
+        assert apply_pairs("A a", pairs) == ("c c", [2, 2])
+
+    def test_match_case(self) -> None:
+        """Test case-sensitive pairs leave other cases alone."""
+        assert apply_pairs("Acme acme", parse_pairs(PAIRS, match_case=True)) == (
+            "Globex acme",
+            [1, 0],
+        )
+
+    def test_invalid(self) -> None:
+        """Test empty find texts and empty lists are rejected."""
+        for pairs in ([], [{"find": "", "replace": "x"}], [["only"]], "text"):
+            with pytest.raises(InvalidParameterError):
+                parse_pairs(pairs)
+
+    def test_resolve_files(self, tmp_path: Path) -> None:
+        """Test directories are searched recursively and lock files skipped."""
+        (tmp_path / "sub").mkdir()
+        for name in ("a.xlsx", "sub/b.xls", "notes.txt", "~$a.xlsx"):
+            (tmp_path / name).write_bytes(b"")
+
+        assert [p.name for p in resolve_files(str(tmp_path))] == ["a.xlsx", "b.xls"]
+        assert [p.name for p in resolve_files(str(tmp_path / "*.xlsx"))] == ["a.xlsx"]
+        with pytest.raises(InvalidParameterError):
+            resolve_files(str(tmp_path / "*.xlsm"))
+
+
+class TestReplaceInXlsx:
+    """Tests for the XML engine."""
+
+    def test_shared_strings(self, tmp_path: Path) -> None:
+        """Test shared strings are rewritten and counted once per cell."""
+        path = make_xlsx(tmp_path / "a.xlsx", [["Acme Ltd", 1.5], ["acme", "Acme <Ltd>"]])
+
+        counts, reason = replace_in_xlsx(path, parse_pairs(PAIRS), path)
+
+        assert reason is None
+        assert counts == [6, 4]
+        assert list(XlsxReader(path).iter_rows("Two")) == [
+            ("Globex Inc", 1.5),
+            ("Globex", "Globex <Inc>"),
+        ]
+
+    def test_inline_strings(self, tmp_path: Path) -> None:
+        """Test inline strings are rewritten, keeping surrounding spaces."""
+        path = make_xlsx(tmp_path / "a.xlsx", [["x", " Ltd "]], shared_strings=False)
+
+        counts, _ = replace_in_xlsx(path, parse_pairs(PAIRS), path)
+
+        assert counts == [0, 2]
+        assert list(XlsxReader(path).iter_rows("One")) == [("x", " Inc ")]
+
+    def test_output_copy(self, tmp_path: Path) -> None:
+        """Test the source is left unchanged when an output is given."""
+        path = make_xlsx(tmp_path / "a.xlsx", [["Acme"]])
+        before = path.read_bytes()
+
+        replace_in_xlsx(path, parse_pairs(PAIRS), tmp_path / "b.xlsx")
+
+        assert path.read_bytes() == before
+        assert list(XlsxReader(tmp_path / "b.xlsx").iter_rows("One")) == [("Globex",)]
+
+    def test_matching_formula_needs_excel(self, tmp_path: Path) -> None:
+        """Test a formula containing the text leaves the file to Excel."""
+        path = with_formula(make_xlsx(tmp_path / "a.xlsx", [["Acme"]]), '"Acme"&amp;"!"')
+        before = path.read_bytes()
+
+        counts, reason = replace_in_xlsx(path, parse_pairs(PAIRS), path)
+
+        assert counts == [0, 0]
+        assert "formula in A99" in reason
+        assert path.read_bytes() == before
+
+    def test_dependent_formula(self, tmp_path: Path) -> None:
+        """Test a formula over changed strings needs Excel, or a recalculation on load."""
+        path = with_formula(make_xlsx(tmp_path / "a.xlsx", [["Acme"]]), 'A1&amp;" Inc"', "Acme Inc")
+        before = path.read_bytes()
+
+        _, reason = replace_in_xlsx(path, parse_pairs(PAIRS), path)
+        assert "formulas may depend" in reason
+        assert path.read_bytes() == before
+
+        counts, reason = replace_in_xlsx(path, parse_pairs(PAIRS), path, recalculate_on_load=True)
+        assert (counts, reason) == ([2, 0], None)
+        with zipfile.ZipFile(path) as archive:
+            assert 'fullCalcOnLoad="1"' in archive.read("xl/workbook.xml").decode()
+        assert list(XlsxReader(path).iter_rows("Two")) == [("Globex",)]
+
+    def test_table_column_needs_excel(self, tmp_path: Path) -> None:
+        """Test a table whose column name contains the text leaves the file to Excel."""
+        path = make_xlsx(tmp_path / "a.xlsx", [["Acme & Co", "Total"], ["x", 1]])
+        with zipfile.ZipFile(path, "a") as archive:
+            archive.writestr(
+                "xl/tables/table1.xml",
+                '<table ref="A1:B2"><tableColumns count="2">'
+                '<tableColumn id="1" name="Acme &amp; Co"/><tableColumn id="2" name="Total"/>'
+                "</tableColumns></table>",
+            )
+        before = path.read_bytes()
+
+        _, reason = replace_in_xlsx(path, parse_pairs(PAIRS), path)
+        counts, other = replace_in_xlsx(path, parse_pairs([["x", "y"]]), path)
+
+        assert "table column name in xl/tables/table1.xml" in reason
+        assert (counts, other) == ([2], None)
+        assert path.read_bytes() != before
+
+    def test_formulas_without_changes(self, tmp_path: Path) -> None:
+        """Test a workbook with formulas but nothing to replace stays with the XML engine."""
+        path = with_formula(make_xlsx(tmp_path / "a.xlsx", [["x"]]), "1+1")
+
+        assert replace_in_xlsx(path, parse_pairs(PAIRS), path) == ([0, 0], None)
+
+    def test_full_calc_on_load(self) -> None:
+        """Test the flag is set on an existing calcPr, or inserted in schema order."""
+        assert (
+            full_calc_on_load('<workbook><calcPr calcId="1" fullCalcOnLoad="0"/></workbook>')
+            == '<workbook><calcPr fullCalcOnLoad="1" calcId="1"/></workbook>'
+        )
+        assert full_calc_on_load("<workbook><sheets/><extLst/></workbook>") == (
+            '<workbook><sheets/><calcPr fullCalcOnLoad="1"/><extLst/></workbook>'
+        )
+        assert full_calc_on_load("<workbook><sheets/></workbook>") == (
+            '<workbook><sheets/><calcPr fullCalcOnLoad="1"/></workbook>'
+        )
+
+    def test_matching_number_needs_excel(self, tmp_path: Path) -> None:
+        """Test a number containing the find text leaves the file to Excel."""
+        path = make_xlsx(tmp_path / "a.xlsx", [[2024, "FY2024"]])
+
+        _, reason = replace_in_xlsx(path, parse_pairs([["2024", "2025"]]), path)
+
+        assert "value of A1" in reason
+
+    def test_not_a_workbook(self, tmp_path: Path) -> None:
+        """Test unreadable files are reported instead of raising."""
+        path = tmp_path / "a.xlsx"
+        path.write_bytes(b"not a zip")
+
+        _, reason = replace_in_xlsx(path, parse_pairs(PAIRS), path)
+
+        assert "BadZipFile" in reason
+
+
+class TestBulkFindReplace:
+    """Tests for ExcelService.bulk_find_replace."""
+
+    def test_xml_engine(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test .xlsx files are processed without starting Excel."""
+        for name in ("a", "b", "c"):
+            make_xlsx(tmp_path / f"{name}.xlsx", [["Acme Ltd"]])
+        excel.application_factory.session.reset()
+
+        result = excel.bulk_find_replace(str(tmp_path), PAIRS)
+
+        assert result["replacements"] == 3 * 2 * 2
+        assert [f["engine"] for f in result["files"]] == ["xml"] * 3
+        assert result["counts"][0] == {"find": "Acme", "replace": "Globex", "replacements": 6}
+        assert excel.application_factory.session.calls == 0
+
+    def test_excel_pool(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test workbooks are spread over Excel workers and saved."""
+        paths = []
+        for i in range(4):
+            ws = excel.current_document.Worksheets("Sheet1")
+            ws.Range("A1:B2").Value = (("Acme Ltd", i), ('=A1&" Ltd"', "acme"))
+            path = tmp_path / f"book{i}.xls"
+            path.write_bytes(b"")
+            excel.current_document.SaveAs(str(path))
+            paths.append(path)
+
+        result = excel.bulk_find_replace(str(tmp_path), PAIRS, workers=2)
+
+        assert result["success"]
+        assert result["excel_files"] == 4
+        assert [f["counts"] for f in result["files"]] == [[2, 2]] * 4
+        files = excel.application_factory.session.files
+        name, data = files[str(paths[0])][0]
+        assert (name, data.values[(1, 1)]) == ("Sheet1", "Globex Inc")
+
+    def test_auto_falls_back_to_excel(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test files the XML engine cannot handle go to Excel or are reported."""
+        with_formula(make_xlsx(tmp_path / "a.xlsx", [["Acme"]]), '"Acme"')
+        make_xlsx(tmp_path / "b.xlsx", [["Acme"]])
+
+        xml = excel.bulk_find_replace(str(tmp_path), PAIRS, engine="xml")
+        auto = excel.bulk_find_replace(str(tmp_path), PAIRS)
+
+        assert not xml["success"]
+        assert "formula" in xml["files"][0]["error"]
+        assert [f["engine"] for f in auto["files"]] == ["excel", "xml"]
+        assert auto["excel_files"] == 1
+
+    def test_dependent_formula_goes_to_excel(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test a workbook whose formulas may use the changed strings is recalculated by Excel."""
+        with_formula(make_xlsx(tmp_path / "a.xlsx", [["Acme"]]), 'A1&amp;" Inc"', "Acme Inc")
+
+        result = excel.bulk_find_replace(str(tmp_path), PAIRS)
+
+        assert result["files"][0]["engine"] == "excel"
+
+    def test_excel_not_starting(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test files are reported, not raised, when Excel does not start in some workers."""
+
+        class FailingFactory(FakeApplicationFactory):
+            def __init__(self, failures: int) -> None:
+                super().__init__()
+                self.failures = failures
+
+            def create_instance(self, app_type: Any) -> Any:
+                if self.failures:
+                    self.failures -= 1
+                    raise RuntimeError("Excel not installed")
+                return super().create_instance(app_type)
+
+        make_xlsx(tmp_path / "a.xlsx", [["Acme"]])
+        for name in ("b", "c", "d"):
+            with_formula(make_xlsx(tmp_path / f"{name}.xlsx", [["Acme"]]), '"Acme"')
+
+        excel._factory = FailingFactory(failures=1)
+        one_failed = excel.bulk_find_replace(str(tmp_path), PAIRS, engine="excel", workers=2)
+        excel._factory = FailingFactory(failures=2)
+        all_failed = excel.bulk_find_replace(str(tmp_path), PAIRS, workers=2)
+
+        assert one_failed["success"]
+        assert [f.get("error") for f in one_failed["files"]] == [None] * 4
+        assert not all_failed["success"]
+        assert [f["engine"] for f in all_failed["files"]] == ["xml", "excel", "excel", "excel"]
+        assert all("Excel not installed" in f["error"] for f in all_failed["files"][1:])
+
+    def test_output_dir(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test copies keep the layout of the sources under the output directory."""
+        (tmp_path / "in" / "sub").mkdir(parents=True)
+        make_xlsx(tmp_path / "in" / "sub" / "a.xlsx", [["Ltd"]])
+
+        excel.bulk_find_replace(str(tmp_path / "in"), PAIRS, output_dir=str(tmp_path / "out"))
+
+        copy = tmp_path / "out" / "sub" / "a.xlsx"
+        assert list(XlsxReader(copy).iter_rows("One")) == [("Inc",)]
+
+    def test_invalid_engine(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test an unknown engine is rejected."""
+        with pytest.raises(COMOperationError, match="engine"):
+            excel.bulk_find_replace(str(tmp_path), PAIRS, engine="fast")
+
+
+class TestFindAndReplace:
+    """Tests for the replacement count of find_and_replace."""
+
+    def test_count(self, excel: ExcelService) -> None:
+        """Test the number of replacements is reported."""
+        excel.current_document.Worksheets("Sheet1").Range("A1:A3").Value = (
+            ("Acme",),
+            ("acme acme",),
+            (3,),
+        )
+
+        result = excel.find_and_replace("Sheet1", "acme", "Globex")
+
+        assert result["replacements"] == 3
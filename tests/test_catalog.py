@@ -0,0 +1,97 @@
+"""Unit tests for the precomputed tool catalog."""
+
+import pytest
+
+from src.core.catalog import ToolCatalog, build_spec, parse_tool_filter
+from src.tools_configs import EXCEL_TOOLS_CONFIG, WORD_TOOLS_CONFIG
+
+CONFIGS = {"word": WORD_TOOLS_CONFIG, "excel": EXCEL_TOOLS_CONFIG}
+
+
+class TestBuildSpec:
+    """Tests for build_spec function."""
+
+    def test_build_spec_schema(self) -> None:
+        """Test the schema lists required and optional parameters."""
+        spec = build_spec(
+            "excel", "read_cell", {"required": ["cell"], "optional": ["raw"], "desc": "Read."}
+        )
+
+        assert spec.name == "excel_read_cell"
+        assert spec.input_schema["required"] == ["cell"]
+        assert set(spec.input_schema["properties"]) == {"cell", "raw"}
+
+    def test_build_spec_schema_is_read_only(self) -> None:
+        """Test the cached schema cannot be mutated."""
+        spec = build_spec("excel", "read_cell", {"required": [], "desc": "Read."})
+
+        with pytest.raises(TypeError):
+            spec.input_schema["type"] = "array"  # type: ignore[index]
+
+
+class TestParseToolFilter:
+    """Tests for parse_tool_filter function."""
+
+    def test_parse_tool_filter_empty(self) -> None:
+        """Test empty filters select everything."""
+        assert parse_tool_filter(None) == {"services": None, "prefixes": None}
+        assert parse_tool_filter(" ") == {"services": None, "prefixes": None}
+
+    def test_parse_tool_filter_mixed(self) -> None:
+        """Test services and prefixes are separated."""
+        parsed = parse_tool_filter("Excel, word_insert")
+        assert parsed == {"services": ("excel",), "prefixes": ("word_insert",)}
+
+
+class TestToolCatalog:
+    """Tests for ToolCatalog class."""
+
+    def test_catalog_contains_all_tools(self) -> None:
+        """Test every configured tool is in the catalog."""
+        catalog = ToolCatalog(CONFIGS)
+
+        assert len(catalog) == len(WORD_TOOLS_CONFIG) + len(EXCEL_TOOLS_CONFIG)
+        assert catalog.counts["excel"] == len(EXCEL_TOOLS_CONFIG)
+
+    def test_catalog_filter_by_service(self) -> None:
+        """Test filtering on a single service."""
+        tools = ToolCatalog(CONFIGS).tools(services=["excel"])
+
+        assert len(tools) == len(EXCEL_TOOLS_CONFIG)
+        assert all(spec.name.startswith("excel_") for spec in tools)
+
+    def test_catalog_filter_by_prefix(self) -> None:
+        """Test filtering on a tool name prefix."""
+        tools = ToolCatalog(CONFIGS).tools(prefixes=["excel_read"])
+
+        assert {spec.name for spec in tools} == {"excel_read_cell", "excel_read_range"}
+
+    def test_catalog_mixed_filter(self) -> None:
+        """Test services and prefixes combine as a union, as in MCP_OFFICE_TOOLS."""
+        tools = ToolCatalog(CONFIGS).tools(**parse_tool_filter("excel,word_insert"))
+
+        word = {f"word_{name}" for name in WORD_TOOLS_CONFIG if name.startswith("insert")}
+        assert word
+        assert {spec.name for spec in tools} == {
+            *(f"excel_{name}" for name in EXCEL_TOOLS_CONFIG),
+            *word,
+        }
+
+    def test_catalog_views_are_memoized(self) -> None:
+        """Test equal filters return the same cached object."""
+        catalog = ToolCatalog(CONFIGS)
+
+        assert catalog.tools() is catalog.tools()
+        assert catalog.tools(services=["excel"]) is catalog.tools(services=("excel",))
+
+    def test_catalog_factory_called_once_per_tool(self) -> None:
+        """Test the factory runs at build time only."""
+        calls = []
+        catalog = ToolCatalog(CONFIGS, factory=lambda spec: calls.append(spec) or spec.name)
+        built = len(calls)
+
+        catalog.tools()
+        catalog.tools(services=["word"])
+
+        assert built == len(catalog)
+        assert len(calls) == built
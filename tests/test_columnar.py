@@ -0,0 +1,113 @@
+"""Unit tests for the columnar export of worksheet ranges."""
+
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.core.exceptions import COMOperationError, InvalidParameterError
+from src.excel import columnar
+from src.excel.columnar import build_columns, detect_header, infer_dtype, resolve_format
+from src.excel.excel_service import ExcelService
+from src.fake_com.factory import FakeApplicationFactory
+
+
+class TestInference:
+    """Tests for header detection and type inference."""
+
+    def test_detect_header(self) -> None:
+        """Test a row of names above data is a header."""
+        assert detect_header([("name", "qty"), ("a", 1.0)])
+        assert not detect_header([("name", "qty"), ("a", "b")])
+        assert not detect_header([(1.0, "qty"), (2.0, 1.0)])
+
+    @pytest.mark.parametrize(
+        ("values", "is_date", "dtype"),
+        [
+            ([1.0, None, 3.0], False, "int64"),
+            ([1.0, 2.5], False, "float64"),
+            ([True, False, None], False, "bool"),
+            ([1.0, "x"], False, "string"),
+            ([45293.0, 45293.5], True, "timestamp[ms]"),
+            ([None, None], False, "string"),
+        ],
+    )
+    def test_infer_dtype(self, values: list, is_date: bool, dtype: str) -> None:
+        """Test one type is inferred per column."""
+        assert infer_dtype(values, is_date) == dtype
+
+    def test_build_columns_across_blocks(self) -> None:
+        """Test blocks are accumulated below unique column names."""
+        blocks = [(("id", "id", ""), (1.0, "a", 45293.0)), ((2.0, "b", 45294.0),)]
+
+        columns = build_columns(blocks, header=True, date_columns=[2])
+
+        assert [c.name for c in columns] == ["id", "id_2", "column_3"]
+        assert [c.dtype for c in columns] == ["int64", "string", "timestamp[ms]"]
+        assert columns[0].values == [1.0, 2.0]
+
+    def test_unknown_format(self) -> None:
+        """Test unknown extensions are rejected."""
+        with pytest.raises(InvalidParameterError):
+            resolve_format(Path("out.xlsx"))
+
+    def test_missing_dependency(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a clear error when the library of the format is not installed."""
+        monkeypatch.setattr(columnar, "pa", None)
+
+        with pytest.raises(InvalidParameterError, match="pyarrow"):
+            resolve_format(Path("out.parquet"))
+
+
+class TestExportRangeColumnar:
+    """Tests for ExcelService.export_range_columnar."""
+
+    @pytest.fixture
+    def excel(self) -> Iterator[ExcelService]:
+        """Sheet with a header row and 30 rows of typed data."""
+        excel = ExcelService(application_factory=FakeApplicationFactory())
+        excel.create_workbook()
+        rows = [["id", "price", "day", "label"]]
+        rows += [[i, i * 1.5, datetime(2024, 1, 1 + i % 28), f"item {i}"] for i in range(30)]
+        excel.write_range("Sheet1", "A1:D31", rows)
+        excel.set_number_format("Sheet1", "C2:C31", "yyyy-mm-dd")
+        yield excel
+        excel.cleanup()
+
+    def test_npz(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test NPZ archives hold one typed array per column."""
+        np = pytest.importorskip("numpy")
+        path = tmp_path / "snapshot.npz"
+
+        result = excel.export_range_columnar("Sheet1", str(path), block_rows=7)
+
+        assert result["rows"] == 30
+        with np.load(path) as data:
+            assert data["id"].dtype == np.int64
+            assert str(data["day"][1]) == "2024-01-02T00:00:00.000"
+            assert data["label"][29] == "item 29"
+
+    def test_parquet(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test Parquet files keep the inferred schema."""
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "snapshot.parquet"
+        excel.export_range_columnar("Sheet1", str(path), compression="zstd")
+
+        table = pq.read_table(path)
+        assert table.column_names == ["id", "price", "day", "label"]
+        assert str(table.schema.field("day").type) == "timestamp[ms]"
+
+    def test_unavailable_format(
+        self, excel: ExcelService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the format is checked before the range is read."""
+        monkeypatch.setattr(columnar, "np", None)
+        session = excel.application_factory.session
+        session.reset()
+
+        with pytest.raises(COMOperationError, match="numpy"):
+            excel.export_range_columnar("Sheet1", str(tmp_path / "out.npz"))
+        assert session.calls == 0
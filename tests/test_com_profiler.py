@@ -0,0 +1,174 @@
+"""Unit tests for the COM round-trip profiler."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.core.com_profiler import NO_TOOL, ComProfiler, ComProxy, unwrap
+from src.core.service_manager import ServiceManager
+from src.excel.excel_service import ExcelService
+from src.fake_com.base import FakeComSession
+from src.fake_com.excel import ExcelApplication
+from src.fake_com.factory import FakeApplicationFactory
+from src.server_tools import ServerToolsService
+
+
+@pytest.fixture
+def profiler() -> ComProfiler:
+    """Enabled profiler."""
+    return ComProfiler(enabled=True)
+
+
+@pytest.fixture
+def session() -> FakeComSession:
+    """Session without latency."""
+    return FakeComSession()
+
+
+def tool_entry(report: dict[str, Any], name: str) -> dict[str, Any]:
+    """Get the report entry of a tool."""
+    return next(tool for tool in report["tools"] if tool["tool"] == name)
+
+
+class TestComProxy:
+    """Tests for the recording proxy."""
+
+    def test_disabled_profiler_does_not_wrap(self, session: FakeComSession) -> None:
+        """Test wrap returns the application itself when disabled."""
+        app = ExcelApplication(session)
+
+        assert ComProfiler().wrap(app) is app
+
+    def test_counts_match_the_simulated_calls(
+        self, profiler: ComProfiler, session: FakeComSession
+    ) -> None:
+        """Test every IDispatch call of the fake backend is recorded."""
+        app = profiler.wrap(ExcelApplication(session))
+        with profiler.tool("excel_write_cell"):
+            workbook = app.Workbooks.Add()
+            sheet = workbook.Worksheets("Sheet1")
+            sheet.Range("A1").Value = 1
+
+        entry = tool_entry(profiler.report(), "excel_write_cell")
+
+        assert entry["com_calls"] == session.calls == 6
+        assert (entry["gets"], entry["sets"], entry["calls"]) == (2, 1, 3)
+        members = {(m["member"], m["kind"]): m["count"] for m in entry["top_members"]}
+        assert members[("Range.Value", "set")] == 1
+        assert members[("Worksheets()", "call")] == 1
+
+    def test_results_are_wrapped_and_arguments_unwrapped(
+        self, profiler: ComProfiler, session: FakeComSession
+    ) -> None:
+        """Test automation objects stay proxied and plain values do not."""
+        app = profiler.wrap(ExcelApplication(session))
+        sheet = app.Workbooks.Add().ActiveSheet
+        sheet.Range("A1").Value = 2
+        sheet.Range("A1").Copy()
+        sheet.Range("B1").PasteSpecial()
+
+        assert isinstance(sheet, ComProxy)
+        assert sheet.Range("B1").Value == 2.0
+        assert sheet == unwrap(sheet)
+        assert [s.Name for s in app.ActiveWorkbook.Worksheets] == ["Sheet1"]
+
+    def test_calls_outside_tools(self, profiler: ComProfiler, session: FakeComSession) -> None:
+        """Test calls made outside a tool are reported apart from the ranking."""
+        app = profiler.wrap(ExcelApplication(session))
+        app.ScreenUpdating = False
+
+        report = profiler.report()
+
+        assert report["tools"] == []
+        assert report["outside_tools"]["tool"] == NO_TOOL
+        assert report["outside_tools"]["com_calls"] == report["total_com_calls"] == 1
+
+
+class TestComProfiler:
+    """Tests for the aggregation and the report."""
+
+    def test_ranking(self, profiler: ComProfiler, session: FakeComSession) -> None:
+        """Test tools are ranked by round trips per invocation."""
+        sheet = profiler.wrap(ExcelApplication(session)).Workbooks.Add().ActiveSheet
+        for _ in range(2):
+            with profiler.tool("excel_read_cell"):
+                _ = sheet.Range("A1").Value
+        with profiler.tool("excel_set_borders"):
+            for index in (7, 8, 9, 10):
+                sheet.Range("A1").Borders(index).LineStyle = 1
+
+        report = profiler.report(top=2)
+
+        assert [t["tool"] for t in report["tools"]] == ["excel_set_borders", "excel_read_cell"]
+        read = tool_entry(report, "excel_read_cell")
+        assert (read["invocations"], read["calls_per_invocation"], read["max_calls"]) == (2, 2, 2)
+
+    def test_nested_tools_are_recorded_once(
+        self, profiler: ComProfiler, session: FakeComSession
+    ) -> None:
+        """Test a tool run inside another tool counts for the outer one."""
+        app = profiler.wrap(ExcelApplication(session))
+        with profiler.tool("office_batch"), profiler.tool("excel_create_workbook"):
+            app.Workbooks.Add()
+
+        assert [t["tool"] for t in profiler.report()["tools"]] == ["office_batch"]
+
+    def test_invalid_sort_key(self, profiler: ComProfiler) -> None:
+        """Test an unknown ranking key is rejected."""
+        with pytest.raises(ValueError):
+            profiler.report(sort_by="nope")
+
+    def test_save_and_reset(
+        self, profiler: ComProfiler, session: FakeComSession, tmp_path: Path
+    ) -> None:
+        """Test the JSON report and reset."""
+        app = profiler.wrap(ExcelApplication(session))
+        with profiler.tool("excel_create_workbook"):
+            app.Workbooks.Add()
+
+        path = profiler.save(tmp_path / "profile" / "com.json")
+        profiler.reset()
+
+        assert json.loads(path.read_text())["tools"][0]["tool"] == "excel_create_workbook"
+        assert profiler.report()["tools"] == []
+
+
+class TestComProfileTool:
+    """Tests for the server_com_profile tool on the fake backend."""
+
+    @pytest.fixture
+    def excel(
+        self, profiler: ComProfiler, monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[ExcelService]:
+        """Excel service whose application is profiled."""
+        monkeypatch.setattr("src.core.base_office.get_com_profiler", lambda: profiler)
+        excel = ExcelService(application_factory=FakeApplicationFactory())
+        excel.initialize()
+        yield excel
+        excel.cleanup()
+
+    def test_report(self, profiler: ComProfiler, excel: ExcelService, tmp_path: Path) -> None:
+        """Test the tool ranks real service methods and saves the report."""
+        with profiler.tool("excel_create_workbook"):
+            excel.create_workbook()
+        with profiler.tool("excel_write_range"):
+            excel.write_range("Sheet1", "A1:B2", [[1, 2], [3, 4]])
+        tools = ServerToolsService(ServiceManager({}), None, None, profiler)
+
+        result = tools.com_profile(top=1, sort_by="com_calls", output_path=str(tmp_path / "r.json"))
+
+        assert result["success"]
+        assert len(result["tools"]) == 1
+        assert (tmp_path / "r.json").exists()
+
+    def test_disabled(self) -> None:
+        """Test the tool explains how to enable profiling."""
+        tools = ServerToolsService(ServiceManager({}), None, None, ComProfiler())
+
+        result = tools.com_profile()
+
+        assert result["enabled"] is False
+        assert "MCP_OFFICE_COM_PROFILE" in result["message"]
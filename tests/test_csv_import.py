@@ -0,0 +1,151 @@
+"""Unit tests for the streaming CSV import."""
+
+import codecs
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.core.exceptions import COMOperationError
+from src.excel.csv_import import CsvSource, convert_field, detect_encoding, sniff_dialect
+from src.excel.excel_service import ExcelService
+from src.fake_com.factory import FakeApplicationFactory
+
+
+@pytest.fixture
+def excel() -> Iterator[ExcelService]:
+    """Excel on the fake backend with an empty workbook."""
+    excel = ExcelService(application_factory=FakeApplicationFactory())
+    excel.create_workbook()
+    yield excel
+    excel.cleanup()
+
+
+class TestDetection:
+    """Tests for encoding and dialect detection."""
+
+    def test_encodings(self) -> None:
+        """Test BOMs win, then UTF-8, then the Windows code page."""
+        assert detect_encoding(codecs.BOM_UTF8 + b"a;b") == "utf-8-sig"
+        assert detect_encoding(codecs.BOM_UTF16_LE + "a".encode("utf-16-le")) == "utf-16"
+        assert detect_encoding("prénom,âge\n".encode()) == "utf-8"
+        assert detect_encoding("prénom,âge\n".encode("cp1252")) == "cp1252"
+
+    def test_cut_multibyte_character_is_utf8(self) -> None:
+        """Test a sample ending inside a UTF-8 character is still UTF-8."""
+        assert detect_encoding("abc,é".encode()[:-1]) == "utf-8"
+
+    @pytest.mark.parametrize("delimiter", [";", "\t", "|", ","])
+    def test_sniff_delimiter(self, delimiter: str) -> None:
+        """Test the delimiter is detected from the sample."""
+        text = "\n".join(delimiter.join(row) for row in [["a", "b", "c"], ["1", "2", "3"]] * 3)
+
+        assert sniff_dialect(text + "\n").delimiter == delimiter
+
+    def test_explicit_delimiter(self) -> None:
+        """Test an explicit delimiter skips detection."""
+        assert sniff_dialect("a,b;c\n", ";").delimiter == ";"
+
+
+class TestConvertField:
+    """Tests for convert_field."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("", None),
+            ("42", 42),
+            ("-1.5", -1.5),
+            ("007", "007"),
+            ("true", True),
+            ("FALSE", False),
+            ("2024-03-01", datetime(2024, 3, 1)),
+            ("2024-03-01T08:30:00", datetime(2024, 3, 1, 8, 30)),
+            ("2024-13-01", "2024-13-01"),
+            ("=SUM(A1:A2)", "'=SUM(A1:A2)"),
+            ("@cmd", "'@cmd"),
+            ("text", "text"),
+        ],
+    )
+    def test_values(self, text: str, expected: object) -> None:
+        """Test numbers, booleans and dates are typed and formulas neutralized."""
+        assert convert_field(text) == expected
+
+    def test_text_mode_keeps_strings(self, tmp_path: Path) -> None:
+        """Test fields stay text without conversion, formulas still neutralized."""
+        path = tmp_path / "data.csv"
+        path.write_text("007,=1+1,\n")
+
+        rows = list(CsvSource(path, convert_types=False).rows())
+
+        assert rows == [["007", "'=1+1", None]]
+
+
+class TestImportCsv:
+    """Tests for ExcelService.import_csv."""
+
+    def test_streams_in_chunks(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test a semicolon file is written in chunks with updates restored."""
+        path = tmp_path / "data.csv"
+        lines = ["id;name;amount"] + [f"{i};item {i};{i * 1.5}" for i in range(200)]
+        path.write_text("\n".join(lines) + "\n", encoding="cp1252")
+
+        result = excel.import_csv("Sheet1", str(path), "B2", chunk_bytes=400)
+
+        assert result["range"] == "B2:D202"
+        assert (result["rows"], result["columns"], result["delimiter"]) == (201, 3, ";")
+        assert result["chunks"] > 1
+        assert excel.read_range("Sheet1", "B202:D202")["values"] == ((199.0, "item 199", 298.5),)
+        app = excel.application
+        assert (app.ScreenUpdating, app.Calculation, app.EnableEvents) == (True, -4105, True)
+
+    def test_ragged_rows_padded(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test short rows are padded to the widest row."""
+        path = tmp_path / "data.csv"
+        path.write_text("a,b,c\n1\n2,3\n")
+
+        result = excel.import_csv("Sheet1", str(path))
+
+        assert result["range"] == "A1:C3"
+        assert excel.read_range("Sheet1", "A2:C2")["values"] == ((1.0, None, None),)
+
+    def test_utf8_bom(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test the byte order mark does not end up in the first cell."""
+        path = tmp_path / "data.csv"
+        path.write_bytes(codecs.BOM_UTF8 + "prénom\nÉlodie\n".encode())
+
+        result = excel.import_csv("Sheet1", str(path))
+
+        assert result["encoding"] == "utf-8-sig"
+        assert excel.read_cell("Sheet1", "A1")["value"] == "prénom"
+
+    @pytest.mark.parametrize("content", ["", "\n\n\n"])
+    def test_empty_file(self, excel: ExcelService, tmp_path: Path, content: str) -> None:
+        """Test an empty or blank-lines file writes nothing."""
+        path = tmp_path / "data.csv"
+        path.write_text(content)
+
+        result = excel.import_csv("Sheet1", str(path))
+
+        assert result["success"]
+        assert result["rows"] == 0
+        assert "range" not in result
+
+    def test_chunk_of_blank_lines(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test a chunk holding only blank lines is skipped."""
+        path = tmp_path / "data.csv"
+        path.write_text("a,b\n\n\n")
+
+        result = excel.import_csv("Sheet1", str(path), chunk_bytes=16)
+
+        assert (result["range"], result["chunks"]) == ("A1:B3", 1)
+        assert excel.read_range("Sheet1", "A1:B1")["values"] == (("a", "b"),)
+
+    def test_invalid_delimiter(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test a multi-character delimiter is rejected."""
+        path = tmp_path / "data.csv"
+        path.write_text("a\n")
+
+        with pytest.raises(COMOperationError, match="single character"):
+            excel.import_csv("Sheet1", str(path), delimiter=";;")
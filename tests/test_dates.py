@@ -0,0 +1,130 @@
+"""Unit tests for the conversion of Excel date serials."""
+
+import json
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.excel import dates
+from src.excel.dates import convert_date_columns, is_date_format, serials_to_iso
+from src.excel.excel_service import ExcelService
+from src.fake_com.factory import FakeApplicationFactory
+
+
+class TestIsDateFormat:
+    """Tests for is_date_format."""
+
+    @pytest.mark.parametrize(
+        "number_format", ["yyyy-mm-dd", "m/d/yyyy h:mm", "[h]:mm:ss", "[$-409]mmm d", "dd/mm"]
+    )
+    def test_date_formats(self, number_format: str) -> None:
+        """Test date and time formats are recognized."""
+        assert is_date_format(number_format)
+
+    @pytest.mark.parametrize(
+        "number_format", ["General", "0.00", "[Red]0.00", '"days" 0', "0.00E+00", "@", None]
+    )
+    def test_other_formats(self, number_format: str | None) -> None:
+        """Test numbers, text, literals and mixed formats are not dates."""
+        assert not is_date_format(number_format)
+
+
+class TestSerialsToIso:
+    """Tests for serials_to_iso."""
+
+    def test_dates_and_times(self) -> None:
+        """Test whole days become dates and the rest datetimes."""
+        assert serials_to_iso([45293.0, 45293.5, "Header", None, True]) == [
+            "2024-01-02",
+            "2024-01-02T12:00:00",
+            "Header",
+            None,
+            True,
+        ]
+
+    def test_pure_python_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the fallback gives the same results without NumPy."""
+        column = [45293.0, 45293.12783564815, "x"]
+        expected = serials_to_iso(column)
+        monkeypatch.setattr(dates, "np", None)
+
+        assert serials_to_iso(column) == expected == ["2024-01-02", "2024-01-02T03:04:05", "x"]
+
+    def test_1900_leap_year_bug(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test dates are exact from 1900-03-01; earlier serials convert one day early."""
+        column = [61.0, 60.0, 1.0]
+        expected = ["1900-03-01", "1900-02-28", "1899-12-31"]
+        assert serials_to_iso(column) == expected
+        monkeypatch.setattr(dates, "np", None)
+        assert serials_to_iso(column) == expected
+
+    def test_convert_columns(self) -> None:
+        """Test only the selected columns are converted."""
+        rows = (("when", "n"), (45293.0, 45293.0))
+
+        assert convert_date_columns(rows, [0]) == (("when", "n"), ("2024-01-02", 45293.0))
+        assert convert_date_columns(rows, []) is rows
+
+
+class TestRawReads:
+    """Tests for the raw (Value2) mode of the Excel read tools."""
+
+    @pytest.fixture
+    def excel(self) -> Iterator[ExcelService]:
+        """Sheet with a date column (A), a number column (B) and a datetime column (C)."""
+        excel = ExcelService(application_factory=FakeApplicationFactory())
+        excel.create_workbook()
+        excel.write_range(
+            "Sheet1",
+            "A1:C3",
+            [
+                ["when", "n", "at"],
+                [datetime(2024, 1, 2), 1, datetime(2024, 1, 2, 3, 4, 5)],
+                [datetime(2024, 3, 1), 2, None],
+            ],
+        )
+        excel.set_number_format("Sheet1", "A2:A3", "yyyy-mm-dd")
+        excel.set_number_format("Sheet1", "C2:C3", "m/d/yyyy h:mm")
+        yield excel
+        excel.cleanup()
+
+    def test_sampled_date_columns(self, excel: ExcelService) -> None:
+        """Test date columns are found from their NumberFormat."""
+        values = excel.read_range("Sheet1", "A1:C3", raw=True)["values"]
+
+        assert values[1] == ("2024-01-02", 1.0, "2024-01-02T03:04:05")
+        assert values[0] == ("when", "n", "at")
+
+    def test_marked_date_columns(self, excel: ExcelService) -> None:
+        """Test date_columns replaces the sampling."""
+        values = excel.read_range("Sheet1", "B1:C3", raw=True, date_columns="C")["values"]
+        same = excel.read_range("Sheet1", "B1:C3", raw=True, date_columns=[2])["values"]
+
+        assert values[2] == (2.0, None)
+        assert values[1] == same[1] == (1.0, "2024-01-02T03:04:05")
+
+    def test_column_outside_range(self, excel: ExcelService) -> None:
+        """Test date columns outside the range are rejected."""
+        with pytest.raises(Exception, match="read_range"):
+            excel.read_range("Sheet1", "A1:B3", raw=True, date_columns="D")
+
+    def test_streaming(self, excel: ExcelService) -> None:
+        """Test block reads convert each block."""
+        values = excel.read_range("Sheet1", "A1:C3", raw=True, block_rows=2)["values"]
+
+        assert [row[0] for row in values] == ["when", "2024-01-02", "2024-03-01"]
+
+    def test_read_cell(self, excel: ExcelService) -> None:
+        """Test raw cell reads convert dates only for date formats."""
+        assert excel.read_cell("Sheet1", "A2", raw=True)["value"] == "2024-01-02"
+        assert excel.read_cell("Sheet1", "B2", raw=True)["value"] == 1.0
+
+    def test_export_to_json(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test raw exports are JSON-serializable."""
+        path = tmp_path / "out.json"
+
+        excel.export_to_json("Sheet1", "A1:C3", str(path), raw=True)
+
+        assert json.loads(path.read_text())[2] == ["2024-03-01", 2.0, None]
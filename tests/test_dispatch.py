@@ -0,0 +1,107 @@
+"""Unit tests for the compiled tool dispatch registry."""
+
+from typing import Any
+
+import pytest
+
+from src.core.dispatch import ToolDispatcher, compile_entries
+
+CONFIG = {
+    "write_cell": {"required": ["sheet_name", "cell", "value"], "optional": [], "desc": "w"},
+    "read_cell": {"required": ["sheet_name", "cell"], "optional": ["raw"], "desc": "r"},
+}
+
+
+class StubService:
+    """Minimal service recording its calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    def write_cell(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls.append(("write_cell", kwargs))
+        return {"success": True}
+
+    def read_cell(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls.append(("read_cell", kwargs))
+        return {"success": True, "value": 42}
+
+
+class TestCompileEntries:
+    """Tests for compile_entries function."""
+
+    def test_compile_entries_names(self) -> None:
+        """Test tools are named with the service prefix."""
+        entries = compile_entries(StubService(), CONFIG, "excel")
+        assert set(entries) == {"excel_write_cell", "excel_read_cell"}
+
+    def test_compile_entries_params(self) -> None:
+        """Test required and optional parameters are precomputed in order."""
+        entries = compile_entries(StubService(), CONFIG, "excel")
+        assert entries["excel_read_cell"].params == ("sheet_name", "cell", "raw")
+
+
+class TestToolDispatcher:
+    """Tests for ToolDispatcher class."""
+
+    def test_dispatch_calls_bound_method(self) -> None:
+        """Test dispatch invokes the service method with its arguments."""
+        service = StubService()
+        dispatcher = ToolDispatcher()
+        dispatcher.bind_service("excel", service, CONFIG)
+
+        result = dispatcher.dispatch("excel_read_cell", {"sheet_name": "S", "cell": "A1"})
+
+        assert result["value"] == 42
+        assert service.calls == [("read_cell", {"sheet_name": "S", "cell": "A1"})]
+
+    def test_dispatch_drops_unknown_arguments(self) -> None:
+        """Test arguments not declared in the config are filtered out."""
+        service = StubService()
+        dispatcher = ToolDispatcher()
+        dispatcher.bind_service("excel", service, CONFIG)
+
+        dispatcher.dispatch("excel_read_cell", {"sheet_name": "S", "cell": "A1", "junk": 1})
+
+        assert service.calls[0][1] == {"sheet_name": "S", "cell": "A1"}
+
+    def test_dispatch_unknown_tool(self) -> None:
+        """Test unknown tools raise NotImplementedError."""
+        dispatcher = ToolDispatcher()
+        dispatcher.bind_service("excel", StubService(), CONFIG)
+
+        with pytest.raises(NotImplementedError):
+            dispatcher.dispatch("excel_missing", {})
+
+    def test_bind_same_instance_is_noop(self) -> None:
+        """Test rebinding the same instance does not recompile."""
+        service = StubService()
+        dispatcher = ToolDispatcher()
+
+        assert dispatcher.bind_service("excel", service, CONFIG) is True
+        assert dispatcher.bind_service("excel", service, CONFIG) is False
+
+    def test_bind_new_instance_recompiles(self) -> None:
+        """Test a re-created service replaces the compiled entries."""
+        old, new = StubService(), StubService()
+        dispatcher = ToolDispatcher()
+        dispatcher.bind_service("excel", old, CONFIG)
+
+        assert dispatcher.bind_service("excel", new, CONFIG) is True
+        dispatcher.dispatch("excel_write_cell", {"sheet_name": "S", "cell": "A1", "value": 1})
+
+        assert not old.calls
+        assert len(new.calls) == 1
+        assert dispatcher.service_for("excel") is new
+
+    def test_bind_none_unbinds(self) -> None:
+        """Test binding None removes the prefix tools."""
+        dispatcher = ToolDispatcher()
+        dispatcher.bind_service("excel", StubService(), CONFIG)
+        dispatcher.bind_service("word", StubService(), {"write_cell": CONFIG["write_cell"]})
+
+        dispatcher.bind_service("excel", None, CONFIG)
+
+        assert "excel_read_cell" not in dispatcher
+        assert "word_write_cell" in dispatcher
+        assert len(dispatcher) == 1
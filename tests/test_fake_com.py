@@ -0,0 +1,317 @@
+"""Unit tests for the in-process fake COM backend."""
+
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+from src.core.base_office import (
+    ApplicationFactory,
+    get_default_application_factory,
+    set_default_application_factory,
+)
+from src.core.types import ApplicationType
+from src.excel.excel_service import ExcelService
+from src.fake_com.base import FakeComSession
+from src.fake_com.excel import ExcelApplication, parse_address
+from src.fake_com.factory import FakeApplicationFactory
+from src.fake_com.outlook import OutlookApplication, compile_filter
+from src.fake_com.word import WordApplication
+from src.outlook.outlook_service import OutlookService
+from src.word.word_service import WordService
+
+
+@pytest.fixture
+def session() -> FakeComSession:
+    """Session without latency."""
+    return FakeComSession()
+
+
+class TestFakeComSession:
+    """Tests for IDispatch call accounting."""
+
+    def test_calls_counted_per_dispatch_access(self, session: FakeComSession) -> None:
+        """Test each property get, put and method lookup counts once."""
+        app = ExcelApplication(session)
+        workbook = app.Workbooks.Add()  # Workbooks + Add
+        sheet = workbook.Worksheets("Sheet1")  # Worksheets + Item
+        sheet.Range("A1").Value = 1  # Range + Value put
+
+        assert session.reset() == 6
+        assert session.calls == 0
+
+    def test_helpers_are_free(self, session: FakeComSession) -> None:
+        """Test lowercase helpers do not simulate calls."""
+        app = ExcelApplication(session)
+        workbook = app.Workbooks.Add()
+        session.reset()
+
+        sheet = workbook.sheet("Sheet1")
+        sheet.range("A1:B2")
+        sheet.data.values[(1, 1)] = 1.0
+
+        assert session.calls == 0
+
+    def test_unknown_members_are_permissive(self, session: FakeComSession) -> None:
+        """Test parts of the model that are not simulated accept calls."""
+        sheet = ExcelApplication(session).Workbooks.Add().ActiveSheet
+        chart = sheet.ChartObjects().Add(Left=0, Top=0, Width=10, Height=10)
+        chart.Chart.HasTitle = True
+
+        assert chart.Chart.HasTitle is True
+
+
+class TestExcelModel:
+    """Tests for the simulated Excel object model."""
+
+    @pytest.fixture
+    def sheet(self, session: FakeComSession) -> Any:
+        """Active worksheet of a new workbook."""
+        return ExcelApplication(session).Workbooks.Add().ActiveSheet
+
+    def test_parse_address(self) -> None:
+        """Test A1 references, whole columns and whole rows."""
+        assert parse_address("$B$2:A1") == (1, 1, 2, 2)
+        assert parse_address("Sheet1!C3") == (3, 3, 3, 3)
+        assert parse_address("B:C")[1::2] == (2, 3)
+        assert parse_address("2:4")[::2] == (2, 4)
+        with pytest.raises(ValueError):
+            parse_address("A1:B")
+
+    def test_value_round_trip(self, sheet: Any) -> None:
+        """Test values come back as COM would return them."""
+        sheet.Range("A1:B2").Value = [[1, "x"], [datetime(2024, 1, 2), None]]
+
+        assert sheet.Range("A1:B2").Value == ((1.0, "x"), (datetime(2024, 1, 2), None))
+        assert sheet.Range("A2").Value2 == 45293.0
+        assert sheet.Range("B1").Value == "x"
+
+    def test_array_replication(self, sheet: Any) -> None:
+        """Test one-row arrays fill every row and oversized ranges get #N/A."""
+        sheet.Range("A1:B2").Value = [1, 2]
+        sheet.Range("D1:F1").Value = [[1, 2]]
+
+        assert sheet.Range("A1:B2").Value == ((1.0, 2.0), (1.0, 2.0))
+        assert sheet.Range("F1").Value == "#N/A"
+
+    def test_used_range_and_cells(self, sheet: Any) -> None:
+        """Test UsedRange bounds and relative cell access."""
+        sheet.Cells(3, 2).Value = "b3"
+        sheet.Range("D5").Formula = "=B3"
+
+        assert sheet.UsedRange.Address == "$B$3:$D$5"
+        assert sheet.Range("B3:D5")(1, 1).Value == "b3"
+        assert sheet.Range("D5").Formula == "=B3"
+        assert sheet.Range("B3:D5").Rows.Count == 3
+
+    def test_formatting(self, sheet: Any) -> None:
+        """Test formatting properties are stored per range."""
+        rng = sheet.Range("A1:B2")
+        rng.Interior.Color = 255
+        rng.Borders(7).LineStyle = 1
+        rng.NumberFormat = "0.00"
+
+        assert sheet.Range("B2").Interior.Color == 255
+        assert sheet.Range("A1").Borders(7).LineStyle == 1
+        assert sheet.Range("C3").NumberFormat == "General"
+        assert sheet.Range("A2").NumberFormat == "0.00"
+
+    def test_replace_and_clear(self, sheet: Any) -> None:
+        """Test Replace and ClearContents."""
+        sheet.Range("A1:A2").Value = [["Foo bar"], ["other"]]
+        sheet.Cells.Replace(What="foo", Replacement="baz")
+        assert sheet.Range("A1").Value == "baz bar"
+
+        sheet.Range("A1:A2").ClearContents()
+        assert sheet.Range("A1:A2").Value == ((None,), (None,))
+
+    def test_save_and_reopen(self, session: FakeComSession, tmp_path: Any) -> None:
+        """Test workbooks saved in the session can be opened again."""
+        app = ExcelApplication(session)
+        workbook = app.Workbooks.Add()
+        workbook.ActiveSheet.Range("A1").Value = 42
+        path = str(tmp_path / "book.xlsx")
+        workbook.SaveAs(path)
+        workbook.Close()
+
+        reopened = app.Workbooks.Open(path)
+
+        assert reopened.Name == "book.xlsx"
+        assert reopened.Worksheets(1).Range("A1").Value == 42.0
+
+    def test_open_missing_file(self, session: FakeComSession, tmp_path: Any) -> None:
+        """Test opening an unknown file fails like Excel."""
+        with pytest.raises(FileNotFoundError):
+            ExcelApplication(session).Workbooks.Open(str(tmp_path / "missing.xlsx"))
+
+
+class TestWordModel:
+    """Tests for the simulated Word object model."""
+
+    @pytest.fixture
+    def document(self, session: FakeComSession) -> Any:
+        """New document."""
+        return WordApplication(session).Documents.Add()
+
+    def test_paragraphs(self, document: Any) -> None:
+        """Test adding paragraphs keeps the final paragraph mark."""
+        document.Content.Text = "First"
+        document.Content.InsertParagraphAfter()
+        paragraph = document.Content.Paragraphs.Add()
+        paragraph.Range.Text = "Second"
+
+        assert document.text == "First\r\rSecond\r"
+        assert document.Paragraphs.Count == 3
+        assert document.Paragraphs(3).Range.Text == "Second\r"
+
+    def test_find_walks_through_matches(self, document: Any) -> None:
+        """Test a Find without replacement redefines the range to each match."""
+        document.Content.Text = "a cat and a Cat"
+        rng = document.Content
+        find = rng.Find
+        find.Text = "cat"
+
+        starts = []
+        while find.Execute():
+            starts.append(rng.Start)
+
+        assert starts == [2, 12]
+
+    def test_find_replace_all(self, document: Any) -> None:
+        """Test wdReplaceAll with match case."""
+        document.Content.Text = "a cat and a Cat"
+        document.Content.Find.Execute(FindText="cat", MatchCase=True, ReplaceWith="dog", Replace=2)
+
+        assert document.text == "a dog and a Cat\r"
+
+    def test_font_and_statistics(self, document: Any) -> None:
+        """Test character formatting and statistics."""
+        document.Content.Text = "Hello brave world"
+        document.Range(0, 5).Font.Bold = True
+
+        assert document.Range(0, 5).Font.Bold is True
+        assert document.Range(6, 11).Font.Bold is False
+        assert document.ComputeStatistics(0) == 3
+
+
+class TestOutlookModel:
+    """Tests for the simulated Outlook object model."""
+
+    @pytest.fixture
+    def app(self, session: FakeComSession) -> OutlookApplication:
+        """Outlook with a few inbox messages."""
+        app = OutlookApplication(session)
+        inbox = app.namespace.default_folder(6)
+        for i in range(4):
+            inbox.add_item(
+                Subject=f"Report {i}",
+                SenderName="Boss" if i % 2 else "Alice",
+                UnRead=i < 2,
+                ReceivedTime=datetime(2024, 1, i + 1),
+            )
+        return app
+
+    def test_compile_filter(self, app: OutlookApplication) -> None:
+        """Test Jet and DASL clauses combined with AND/OR."""
+        items = list(app.namespace.default_folder(6)._items)
+        jet = compile_filter("[UnRead] = True AND [Subject] = 'report 1'")
+        dasl = compile_filter(
+            "@SQL=\"urn:schemas:httpmail:fromname\" LIKE '%boss%' OR "
+            "[ReceivedTime] < '01/02/2024 00:00'"
+        )
+
+        assert [i.get("Subject") for i in items if jet(i)] == ["Report 1"]
+        assert [i.get("Subject") for i in items if dasl(i)] == ["Report 0", "Report 1", "Report 3"]
+
+    def test_restrict_and_sort(self, app: OutlookApplication) -> None:
+        """Test Items.Restrict and Items.Sort."""
+        items = app.GetNamespace("MAPI").GetDefaultFolder(6).Items
+        items.Sort("[ReceivedTime]", True)
+        unread = items.Restrict('@SQL="urn:schemas:httpmail:read" = 0')
+
+        assert [item.Subject for item in items][0] == "Report 3"
+        assert unread.Count == 2
+
+    def test_get_table(self, app: OutlookApplication) -> None:
+        """Test the Table API returns rows in blocks."""
+        table = app.GetNamespace("MAPI").GetDefaultFolder(6).GetTable("[UnRead] = False")
+        table.Columns.RemoveAll()
+        table.Columns.Add("Subject")
+        table.Columns.Add("SenderName")
+
+        rows = table.GetArray(10)
+
+        assert rows == (("Report 2", "Alice"), ("Report 3", "Boss"))
+        assert table.EndOfTable is True
+
+    def test_send_and_get_item(self, app: OutlookApplication) -> None:
+        """Test sent items are stored and retrievable by EntryID."""
+        mail = app.CreateItem(0)
+        mail.To = "a@example.com"
+        mail.Subject = "Hi"
+        mail.Send()
+
+        namespace = app.GetNamespace("MAPI")
+        assert namespace.GetDefaultFolder(5).Items.Count == 1
+        assert namespace.GetItemFromID(mail.EntryID).Subject == "Hi"
+
+
+class TestFakeBackendServices:
+    """Tests of the services running on the fake backend."""
+
+    @pytest.fixture
+    def factory(self) -> FakeApplicationFactory:
+        """Fake application factory."""
+        return FakeApplicationFactory()
+
+    def test_excel_service(self, factory: FakeApplicationFactory) -> None:
+        """Test ExcelService reads back what it wrote."""
+        excel = ExcelService(application_factory=factory)
+        excel.create_workbook()
+        excel.write_range("Sheet1", "A1:B2", [[1, 2], [3, 4]])
+
+        result = excel.read_range("Sheet1", "A1:B2")
+
+        assert result["values"] == ((1.0, 2.0), (3.0, 4.0))
+        assert factory.session.calls > 0
+        excel.cleanup()
+
+    def test_word_service(self, factory: FakeApplicationFactory) -> None:
+        """Test WordService paragraphs and find/replace."""
+        word = WordService(application_factory=factory)
+        word.initialize()
+        word.create_document()
+        word.add_paragraph("Hello world")
+
+        result = word.find_and_replace("world", "there")
+
+        assert result["replacements"] == 1
+        assert "Hello there" in word.current_document.text
+        word.cleanup()
+
+    def test_outlook_service(self, factory: FakeApplicationFactory) -> None:
+        """Test OutlookService search on a seeded inbox."""
+        outlook = OutlookService(application_factory=factory)
+        outlook.initialize()
+        inbox = factory.applications[ApplicationType.OUTLOOK].namespace.default_folder(6)
+        inbox.add_item(Subject="Quarterly report", SenderName="Boss", UnRead=True)
+        inbox.add_item(Subject="Lunch", SenderName="Bob")
+
+        result = outlook.search_emails(subject="report", unread_only=True)
+
+        assert [r["subject"] for r in result["results"]] == ["Quarterly report"]
+        outlook.cleanup()
+
+    def test_default_factory(self) -> None:
+        """Test services created without a factory use the default one."""
+        factory = FakeApplicationFactory()
+        set_default_application_factory(factory)
+        try:
+            excel = ExcelService()
+            excel.initialize()
+            assert excel.application is factory.applications[ApplicationType.EXCEL]
+            excel.cleanup()
+        finally:
+            set_default_application_factory(None)
+
+        assert type(get_default_application_factory()) is ApplicationFactory
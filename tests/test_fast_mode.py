@@ -0,0 +1,161 @@
+"""Unit tests for the fast mode of the Office services."""
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from src.core.base_office import in_fast_mode
+from src.core.batch import parse_batch
+from src.core.exceptions import COMOperationError
+from src.core.service_manager import ServiceManager
+from src.excel.excel_service import ExcelService
+from src.fake_com.factory import FakeApplicationFactory
+from src.server_tools import ServerToolsService
+from src.word.word_service import WordService
+
+AUTOMATIC, MANUAL = -4105, -4135
+
+
+class ProbeService(ExcelService):
+    """Excel service reporting the application settings seen by a bulk method."""
+
+    @in_fast_mode
+    def probe(self) -> tuple[Any, ...]:
+        return state(self)
+
+    @in_fast_mode
+    def fail(self) -> None:
+        raise RuntimeError("boom")
+
+
+def state(service: ExcelService) -> tuple[Any, ...]:
+    """ScreenUpdating, Calculation and EnableEvents of the application."""
+    app = service.application
+    return app.ScreenUpdating, app.Calculation, app.EnableEvents
+
+
+@pytest.fixture
+def excel() -> Iterator[ProbeService]:
+    """Excel on the fake backend with an empty workbook."""
+    excel = ProbeService(application_factory=FakeApplicationFactory())
+    excel.create_workbook()
+    yield excel
+    excel.cleanup()
+
+
+class TestFastMode:
+    """Tests for BaseOfficeService.fast_mode and in_fast_mode."""
+
+    def test_bulk_method_suspends_and_restores(self, excel: ProbeService) -> None:
+        """Test a decorated method runs with updates suspended, restored after."""
+        assert excel.probe() == (False, MANUAL, False)
+        assert state(excel) == (True, AUTOMATIC, True)
+
+    def test_restored_on_error(self, excel: ProbeService) -> None:
+        """Test the settings are restored when the method raises."""
+        with pytest.raises(RuntimeError):
+            excel.fail()
+
+        assert state(excel) == (True, AUTOMATIC, True)
+
+    def test_restores_values_found_on_entry(self, excel: ProbeService) -> None:
+        """Test non-default settings come back as they were, not as defaults."""
+        excel.application.Calculation = -4135
+        excel.application.EnableEvents = False
+
+        excel.probe()
+
+        assert state(excel) == (True, MANUAL, False)
+
+    def test_nested_contexts_restore_once(self, excel: ProbeService) -> None:
+        """Test only the outermost context restores the settings."""
+        with excel.fast_mode():
+            excel.probe()
+            assert state(excel) == (False, MANUAL, False)
+
+        assert state(excel) == (True, AUTOMATIC, True)
+
+    def test_kept_setting_suspended_by_inner_context(self, excel: ProbeService) -> None:
+        """Test a kept setting is only suspended while an inner context needs it."""
+        with excel.fast_mode(keep=("Calculation",)):
+            assert state(excel) == (False, AUTOMATIC, False)
+            assert excel.probe() == (False, MANUAL, False)
+            assert state(excel) == (False, AUTOMATIC, False)
+
+        assert state(excel) == (True, AUTOMATIC, True)
+
+    def test_batch_keeps_recalculation(self, excel: ProbeService) -> None:
+        """Test batch steps run with automatic recalculation, so reads are up to date."""
+        seen = []
+        tools = ServerToolsService(
+            ServiceManager({}), lambda service, tool, arguments: seen.append(state(service)), None
+        )
+
+        tools._run_group(excel, parse_batch([{"tool": "excel_probe"}] * 2), False)
+
+        assert seen == [(False, AUTOMATIC, False)] * 2
+        assert state(excel) == (True, AUTOMATIC, True)
+
+    def test_refused_setting_is_skipped(self, excel: ProbeService) -> None:
+        """Test a setting the application refuses does not prevent the others."""
+        settings = {**ExcelService._fast_mode_settings(excel), "Missing": 1}
+        excel._fast_mode_settings = lambda: settings
+
+        assert excel.probe() == (False, MANUAL, False)
+        assert state(excel) == (True, AUTOMATIC, True)
+
+    def test_no_op_before_initialization(self) -> None:
+        """Test fast mode does nothing while the application is not started."""
+        excel = ExcelService(application_factory=FakeApplicationFactory())
+
+        with excel.fast_mode():
+            assert not excel.is_initialized
+
+
+class TestSetFastMode:
+    """Tests for the set_fast_mode session toggle."""
+
+    def test_session_spans_calls(self, excel: ProbeService) -> None:
+        """Test bulk methods leave the settings suspended while the session is on."""
+        result = excel.set_fast_mode(True)
+        excel.probe()
+
+        assert result["settings"] == {
+            "ScreenUpdating": False,
+            "Calculation": MANUAL,
+            "EnableEvents": False,
+        }
+        assert state(excel) == (False, MANUAL, False)
+
+        excel.set_fast_mode("false")
+
+        assert state(excel) == (True, AUTOMATIC, True)
+
+    def test_toggle_is_idempotent(self, excel: ProbeService) -> None:
+        """Test enabling twice then disabling once restores the settings."""
+        excel.set_fast_mode(True)
+        excel.set_fast_mode(True)
+        excel.set_fast_mode(False)
+
+        assert state(excel) == (True, AUTOMATIC, True)
+
+    def test_requires_application(self) -> None:
+        """Test the toggle fails before the application is started."""
+        excel = ExcelService(application_factory=FakeApplicationFactory())
+
+        with pytest.raises(COMOperationError):
+            excel.set_fast_mode(True)
+
+    def test_word_screen_updating(self) -> None:
+        """Test Word only suspends ScreenUpdating."""
+        word = WordService(application_factory=FakeApplicationFactory())
+        word.create_document()
+        try:
+            result = word.set_fast_mode(True)
+            assert result["settings"] == {"ScreenUpdating": False}
+
+            word.set_fast_mode(False)
+            assert word.application.ScreenUpdating is True
+        finally:
+            word.cleanup()
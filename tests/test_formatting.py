@@ -0,0 +1,123 @@
+"""Unit tests for coalesced range formatting."""
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from src.core.exceptions import COMOperationError, InvalidParameterError
+from src.excel.excel_service import ExcelService
+from src.excel.formatting import (
+    MAX_ADDRESS_LENGTH,
+    join_addresses,
+    merge_blocks,
+    parse_entries,
+    plan_calls,
+)
+from src.fake_com.factory import FakeApplicationFactory
+from src.utils.a1 import parse_ref
+
+HEADER = {"fill": "#DDEBF7", "bold": True}
+MONEY = {"number_format": "#,##0.00"}
+
+
+@pytest.fixture
+def excel() -> Iterator[ExcelService]:
+    """Excel on the fake backend with an empty workbook."""
+    excel = ExcelService(application_factory=FakeApplicationFactory())
+    excel.create_workbook()
+    yield excel
+    excel.cleanup()
+
+
+def cell_format(excel: ExcelService, cell: str) -> tuple[Any, ...]:
+    """Fill, bold and number format of a cell."""
+    rng = excel.current_document.Worksheets("Sheet1").Range(cell)
+    return rng.Interior.Color, rng.Font.Bold, rng.NumberFormat
+
+
+class TestPlanCalls:
+    """Tests for parse_entries and plan_calls."""
+
+    def test_identical_styles_coalesced(self) -> None:
+        """Test 100 rows with two styles become one call per property value."""
+        entries = [
+            {"range": f"A{r}:F{r}", "style": HEADER if r % 10 == 1 else MONEY}
+            for r in range(1, 101)
+        ]
+
+        calls = plan_calls(parse_entries(entries, "Sheet1"))
+
+        assert len(calls) == 2
+        assert sum(len(call.properties) for call in calls) == 3
+
+    def test_adjacent_blocks_merged(self) -> None:
+        """Test touching blocks are merged into rectangles."""
+        blocks = [parse_ref(a) for a in ("A1:B1", "A2:B2", "C1:C2", "E5")]
+
+        assert [b.address() for b in merge_blocks(blocks)] == ["A1:C2", "E5"]
+
+    def test_later_entries_win(self) -> None:
+        """Test an overlapping later entry overrides an earlier value."""
+        entries = [
+            {"range": "A1:C3", "style": {"bold": True}},
+            {"range": "B2", "style": {"bold": False}},
+        ]
+
+        calls = {call.properties: call.address for call in plan_calls(parse_entries(entries, "S"))}
+
+        bold = [parse_ref(a) for a in calls[(("bold", True),)].split(",")]
+        assert sum(ref.size for ref in bold) == 8
+        assert calls[(("bold", False),)] == "B2"
+
+    def test_address_length_limit(self) -> None:
+        """Test multi-area addresses stay under Excel's limit."""
+        refs = [parse_ref(f"A{r}") for r in range(1, 400, 2)]
+
+        addresses = join_addresses(refs)
+
+        assert len(addresses) > 1
+        assert all(len(a) <= MAX_ADDRESS_LENGTH for a in addresses)
+        assert sum(len(a.split(",")) for a in addresses) == len(refs)
+
+    def test_invalid_entries(self) -> None:
+        """Test unknown style keys, bad colors and bad ranges are rejected."""
+        for entry in (
+            {"range": "A1", "style": {"blink": True}},
+            {"range": "A1", "style": {"fill": "red"}},
+            {"range": "A1:", "style": {"bold": True}},
+            {"range": "Other!A1", "style": {"bold": True}},
+        ):
+            with pytest.raises(InvalidParameterError):
+                parse_entries([entry], "Sheet1")
+
+
+class TestApplyFormattingBatch:
+    """Tests for ExcelService.apply_formatting_batch."""
+
+    def test_same_result_as_sequential_calls(self, excel: ExcelService) -> None:
+        """Test the batch formats cells like the individual entries would."""
+        entries = [{"range": "A1:F1", "style": HEADER}]
+        entries += [{"range": f"B{r}:F{r}", "style": MONEY} for r in range(2, 50)]
+        entries += [{"range": "C10", "style": {"bold": True, "fill": [255, 0, 0]}}]
+
+        result = excel.apply_formatting_batch("Sheet1", entries)
+
+        assert result["range_calls"] < 10
+        assert result["property_sets_requested"] == 2 + 48 + 2
+        assert cell_format(excel, "A1") == (0xF7EBDD, True, "General")
+        assert cell_format(excel, "F49") == (16777215, False, "#,##0.00")
+        assert cell_format(excel, "C10") == (255, True, "#,##0.00")
+
+    def test_json_text_and_fast_mode(self, excel: ExcelService) -> None:
+        """Test JSON text entries are accepted and the application state restored."""
+        excel.apply_formatting_batch("Sheet1", '[{"range": "A1:A3,C1", "style": {"wrap": true}}]')
+
+        ws = excel.current_document.Worksheets("Sheet1")
+        assert ws.Range("C1").WrapText is True
+        assert excel.application.ScreenUpdating is True
+
+    def test_invalid_entries(self, excel: ExcelService) -> None:
+        """Test a malformed entry fails before anything is formatted."""
+        with pytest.raises(COMOperationError, match="entries"):
+            excel.apply_formatting_batch("Sheet1", [{"range": "A1"}])
@@ -0,0 +1,172 @@
+"""Unit tests for the tool call metrics."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from src.core.exceptions import COMOperationError
+from src.core.metrics import (
+    UNSUCCESSFUL_RESULT,
+    CallTimer,
+    LatencyHistogram,
+    MetricsRegistry,
+    error_class,
+)
+from src.core.service_manager import ServiceManager
+from src.excel.excel_service import ExcelService
+from src.fake_com.factory import FakeApplicationFactory
+from src.server_tools import ServerToolsService
+
+
+def make_timer(wait: float, execution: float) -> CallTimer:
+    """Timer of a finished call with the given durations."""
+    timer = CallTimer()
+    timer.started = timer.submitted + wait
+    timer.finished = timer.started + execution
+    return timer
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_empty(self) -> None:
+        """Test an empty histogram reports zeros."""
+        assert LatencyHistogram().to_dict() == {
+            "count": 0,
+            "mean_ms": 0.0,
+            "p50_ms": 0.0,
+            "p95_ms": 0.0,
+            "p99_ms": 0.0,
+            "max_ms": 0.0,
+        }
+
+    def test_percentiles_within_bucket_precision(self) -> None:
+        """Test percentiles are within 10% of the exact values."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        for q, exact in ((50, 0.5), (95, 0.95), (99, 0.99)):
+            assert exact <= histogram.percentile(q) <= exact * LatencyHistogram.GROWTH
+        assert histogram.percentile(100) == histogram.max == 1.0
+        assert histogram.count == 1000
+
+    def test_fixed_memory(self) -> None:
+        """Test extreme durations land in the first and last buckets."""
+        histogram = LatencyHistogram()
+        histogram.record(0.0)
+        histogram.record(1e9)
+
+        assert len(histogram._counts) == LatencyHistogram.BUCKETS
+        assert histogram._counts[0] == histogram._counts[-1] == 1
+
+
+class TestCallTimer:
+    """Tests for CallTimer."""
+
+    def test_wrap_splits_wait_and_execution(self) -> None:
+        """Test the wrapped function marks the execution window."""
+        timer = CallTimer()
+        assert timer.wrap(lambda x: x * 2)(21) == 42
+
+        wait, execution, total = timer.split()
+
+        assert wait >= 0 and execution >= 0
+        assert total >= wait + execution
+
+    def test_unwrapped_call_is_all_execution(self) -> None:
+        """Test a call without worker has no queue wait."""
+        wait, execution, total = CallTimer().split()
+
+        assert wait == 0.0
+        assert execution == total
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    @pytest.fixture
+    def registry(self) -> MetricsRegistry:
+        """Registry with a few calls."""
+        registry = MetricsRegistry()
+        registry.record("excel_read_range", "excel", make_timer(0.002, 0.010))
+        registry.record("excel_read_range", "excel", make_timer(0.0, 0.020), "COMOperationError")
+        registry.record("word_save", "word", make_timer(0.0, 0.005), UNSUCCESSFUL_RESULT)
+        return registry
+
+    def test_snapshot(self, registry: MetricsRegistry) -> None:
+        """Test counts, errors by class and latencies per tool and service."""
+        snapshot = registry.snapshot()
+
+        assert (snapshot["calls"], snapshot["errors"]) == (3, 2)
+        read = snapshot["tools"]["excel_read_range"]
+        assert read["errors_by_class"] == {"COMOperationError": 1}
+        assert read["queue_wait"]["max_ms"] == pytest.approx(2, rel=0.01)
+        assert read["execution"]["max_ms"] == pytest.approx(20, rel=0.01)
+        assert snapshot["services"]["word"]["errors_by_class"] == {UNSUCCESSFUL_RESULT: 1}
+
+    def test_tool_prefix_and_reset(self, registry: MetricsRegistry) -> None:
+        """Test filtering tools and resetting."""
+        assert list(registry.snapshot("word_")["tools"]) == ["word_save"]
+
+        registry.reset()
+
+        assert registry.snapshot()["calls"] == 0
+
+    def test_save(self, registry: MetricsRegistry, tmp_path: Path) -> None:
+        """Test the JSON dump."""
+        path = registry.save(tmp_path / "metrics" / "stats.json")
+
+        assert json.loads(path.read_text())["calls"] == 3
+        assert not path.with_name("stats.json.tmp").exists()
+
+    def test_dump_periodically(self, registry: MetricsRegistry, tmp_path: Path) -> None:
+        """Test the periodic dump writes until cancelled."""
+        path = tmp_path / "stats.json"
+
+        async def run() -> None:
+            task = asyncio.create_task(registry.dump_periodically(path, 0.01))
+            await asyncio.sleep(0.05)
+            task.cancel()
+
+        asyncio.run(run())
+
+        assert json.loads(path.read_text())["calls"] == 3
+
+
+class TestErrorClass:
+    """Tests for error_class."""
+
+    def test_plain_error(self) -> None:
+        """Test an unwrapped error is recorded under its own class."""
+        assert error_class(ValueError("bad")) == "ValueError"
+
+    def test_com_safe_error_records_cause(self) -> None:
+        """Test an error wrapped by @com_safe is recorded under its cause."""
+        service = ExcelService(application_factory=FakeApplicationFactory())
+        service.initialize()
+        try:
+            with pytest.raises(COMOperationError) as raised:
+                service.read_cell("Sheet1", "!!bad")
+        finally:
+            service.cleanup()
+
+        assert error_class(raised.value) == "InvalidParameterError"
+
+
+class TestServerStatsTool:
+    """Tests for the server_stats tool."""
+
+    def test_report_and_reset(self) -> None:
+        """Test the tool reports the registry and can reset it."""
+        registry = MetricsRegistry()
+        registry.record("excel_read_range", "excel", make_timer(0.0, 0.001))
+        tools = ServerToolsService(ServiceManager({}), None, None, metrics=registry)
+
+        result = tools.stats(tool="excel", reset=True)
+
+        assert result["success"]
+        assert result["tools"]["excel_read_range"]["calls"] == 1
+        assert registry.snapshot()["calls"] == 0
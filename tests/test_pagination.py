@@ -0,0 +1,179 @@
+"""Unit tests for cursor-based pagination."""
+
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from src.core.exceptions import InvalidParameterError
+from src.core.pagination import CursorStore, Paginator
+from src.core.service_manager import ServiceManager
+from src.core.sta_worker import STAWorker
+from src.excel.excel_service import ExcelService
+from src.fake_com.factory import FakeApplicationFactory
+from src.outlook.outlook_service import OutlookService
+from src.server_tools import ServerToolsService
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Current time."""
+        return self.now
+
+
+class TestCursorStore:
+    """Tests for CursorStore."""
+
+    def test_put_and_pop(self) -> None:
+        """Test state is returned once per cursor."""
+        store: CursorStore[str] = CursorStore()
+        cursor = store.put("state")
+
+        assert store.pop(cursor) == "state"
+        assert len(store) == 0
+        with pytest.raises(InvalidParameterError):
+            store.pop(cursor)
+
+    def test_lru_eviction(self) -> None:
+        """Test the oldest cursors are evicted past the capacity."""
+        store: CursorStore[int] = CursorStore(max_entries=2)
+        cursors = [store.put(i) for i in range(3)]
+
+        assert len(store) == 2
+        with pytest.raises(InvalidParameterError):
+            store.pop(cursors[0])
+        assert store.pop(cursors[2]) == 2
+
+    def test_ttl_expiry(self) -> None:
+        """Test cursors expire after their time-to-live."""
+        clock = FakeClock()
+        store: CursorStore[int] = CursorStore(ttl=10, clock=clock)
+        old = store.put(1)
+        clock.now = 5
+        recent = store.put(2)
+        clock.now = 12
+
+        with pytest.raises(InvalidParameterError):
+            store.pop(old)
+        assert store.pop(recent) == 2
+
+
+class TestPaginator:
+    """Tests for Paginator."""
+
+    def test_pages_consume_the_iterator_once(self) -> None:
+        """Test pages resume the same iterator, which is never restarted."""
+        produced = []
+
+        def items() -> Iterator[int]:
+            for i in range(5):
+                produced.append(i)
+                yield i
+
+        pages = Paginator("outlook")
+        first = pages.page(items(), 2, source="inbox")
+        second = pages.resume(first["cursor"])
+        third = pages.resume(second["cursor"])
+
+        assert [first["results"], second["results"], third["results"]] == [[0, 1], [2, 3], [4]]
+        assert (third["offset"], third["has_more"], third["cursor"]) == (4, False, None)
+        assert second["source"] == "inbox"
+        assert produced == [0, 1, 2, 3, 4]
+        assert first["cursor"].startswith("outlook:")
+
+    def test_exact_last_page(self) -> None:
+        """Test a result filling its last page exactly has no cursor."""
+        page = Paginator("excel").page([1, 2], 2, key="values")
+
+        assert page["values"] == [1, 2]
+        assert page["has_more"] is False
+
+    def test_foreign_cursor(self) -> None:
+        """Test cursors of another service are rejected."""
+        with pytest.raises(InvalidParameterError):
+            Paginator("excel").resume("outlook:abc")
+
+
+class TestPaginatedTools:
+    """Tests of paginated tools on the fake backend."""
+
+    @pytest.fixture
+    def outlook(self) -> Iterator[OutlookService]:
+        """Outlook with 7 inbox messages."""
+        factory = FakeApplicationFactory()
+        outlook = OutlookService(application_factory=factory)
+        outlook.initialize()
+        inbox = outlook.application.namespace.default_folder(6)
+        for i in range(7):
+            inbox.add_item(Subject=f"Report {i}", SenderName="Boss")
+        yield outlook
+        outlook.cleanup()
+
+    def test_search_emails_pages(self, outlook: OutlookService) -> None:
+        """Test search_emails pages do not re-run the query."""
+        session = outlook.application_factory.session
+        session.reset()
+        first = outlook.search_emails(subject="report", page_size=3)
+        first_calls = session.reset()
+        second = outlook.pages.resume(first["cursor"])
+
+        assert [r["subject"] for r in first["results"]] == ["Report 0", "Report 1", "Report 2"]
+        assert (second["offset"], len(second["results"])) == (3, 3)
+        # Resuming skips the GetNamespace/GetDefaultFolder/Items/Restrict round trips
+        assert session.calls < first_calls
+
+    def test_unpaginated_call_unchanged(self, outlook: OutlookService) -> None:
+        """Test max_results still caps the results without page_size."""
+        result = outlook.search_emails(max_results=2)
+
+        assert result["count"] == 2
+        assert "cursor" not in result
+
+    def test_read_range_snapshot(self) -> None:
+        """Test read_range pages rows of a single snapshot."""
+        excel = ExcelService(application_factory=FakeApplicationFactory())
+        excel.create_workbook()
+        excel.write_range("Sheet1", "A1:A5", [[1], [2], [3], [4], [5]])
+
+        first = excel.read_range("Sheet1", "A1:A5", page_size=2)
+        excel.write_range("Sheet1", "A1:A5", [[0]] * 5)
+        rest = excel.pages.resume(first["cursor"])
+
+        assert first["values"] == [(1.0,), (2.0,)]
+        assert rest["values"] == [(3.0,), (4.0,)]
+        assert rest["range"] == "A1:A5"
+        excel.cleanup()
+
+    def test_next_page_routed_to_service_worker(self) -> None:
+        """Test server_next_page resumes tool cursors on the service worker."""
+        factory = FakeApplicationFactory()
+        services = ServiceManager(
+            {"outlook": lambda: OutlookService(application_factory=factory)},
+            worker_factory=lambda prefix: STAWorker(prefix, com_apartment=False),
+        )
+        tools = ServerToolsService(services, None, None)
+
+        async def run() -> tuple[dict[str, Any], dict[str, Any]]:
+            outlook = await services.start("outlook")
+            inbox = outlook.application.namespace.default_folder(6)
+            for i in range(3):
+                inbox.add_item(Subject=f"Mail {i}")
+            page = await services.run("outlook", lambda s: s.search_emails(page_size=2))
+            rest = await tools.next_page(page["cursor"])
+            await services.shutdown()
+            return page, rest
+
+        page, rest = asyncio.run(run())
+
+        assert [r["subject"] for r in page["results"] + rest["results"]] == [
+            "Mail 0",
+            "Mail 1",
+            "Mail 2",
+        ]
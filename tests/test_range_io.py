@@ -0,0 +1,201 @@
+"""Unit tests for block-wise Excel range transfers."""
+
+import json
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.core.exceptions import InvalidParameterError
+from src.excel.excel_service import ExcelService
+from src.excel.range_io import (
+    block_address,
+    chunk_rows,
+    iter_range_rows,
+    parse_payload,
+    range_bounds,
+    row_blocks,
+)
+from src.fake_com.factory import FakeApplicationFactory
+
+
+@pytest.fixture
+def excel() -> Iterator[ExcelService]:
+    """Excel on the fake backend, with 25 rows of data in A1:C25."""
+    excel = ExcelService(application_factory=FakeApplicationFactory())
+    excel.create_workbook()
+    excel.write_range("Sheet1", "A1:C25", [[r, f"r{r}", r * 1.5] for r in range(1, 26)])
+    yield excel
+    excel.cleanup()
+
+
+def sheet(excel: ExcelService) -> Any:
+    """Active worksheet."""
+    return excel.current_document.Worksheets("Sheet1")
+
+
+class TestHelpers:
+    """Tests for the address helpers."""
+
+    def test_range_bounds(self) -> None:
+        """Test bounds are normalized."""
+        assert range_bounds("C10:A2") == (2, 1, 10, 3)
+        assert block_address(2, 1, 10, 28) == "A2:AB10"
+
+    def test_row_blocks(self) -> None:
+        """Test the last block is partial."""
+        assert list(row_blocks(1, 25, 10)) == [(1, 10), (11, 20), (21, 25)]
+        assert list(row_blocks(5, 4, 10)) == []
+
+
+class TestIterRangeRows:
+    """Tests for iter_range_rows."""
+
+    def test_rows_in_blocks(self, excel: ExcelService) -> None:
+        """Test rows come back in order, one Value2 call per block."""
+        session = excel.application_factory.session
+        ws = sheet(excel)
+        session.reset()
+
+        rows = list(iter_range_rows(ws, "A1:C25", 10))
+
+        assert [row[0] for row in rows] == [float(r) for r in range(1, 26)]
+        assert rows[0] == (1.0, "r1", 1.5)
+        # UsedRange (Row, Rows, Count) + 3 blocks x (Range, Value2)
+        assert session.calls == 4 + 3 * 2
+
+    def test_lazy(self, excel: ExcelService) -> None:
+        """Test blocks are only read when consumed."""
+        session = excel.application_factory.session
+        rows = iter_range_rows(sheet(excel), "A1:C25", 10)
+        session.reset()
+
+        next(rows)
+        calls = session.reset()
+        for _ in range(9):
+            next(rows)
+
+        assert session.calls == 0
+        assert calls == 4 + 2
+
+    def test_clipped_to_used_range(self, excel: ExcelService) -> None:
+        """Test whole-sheet ranges stop at the last used row."""
+        rows = list(iter_range_rows(sheet(excel), "A1:C1048576", 1000))
+
+        assert len(rows) == 25
+
+    def test_dates_are_serials(self, excel: ExcelService) -> None:
+        """Test Value2 returns dates as serial numbers."""
+        ws = sheet(excel)
+        ws.Range("A1").Value = datetime(2024, 1, 2)
+
+        assert next(iter_range_rows(ws, "A1:A1", 10)) == (45293.0,)
+
+
+class TestStreamingReadRange:
+    """Tests for the streaming modes of ExcelService.read_range."""
+
+    def test_block_rows(self, excel: ExcelService) -> None:
+        """Test block_rows returns every row."""
+        result = excel.read_range("Sheet1", "A1:C25", block_rows=7)
+
+        assert len(result["values"]) == 25
+
+    def test_pages_read_blocks_on_demand(self, excel: ExcelService) -> None:
+        """Test pages pull blocks lazily from the worksheet."""
+        first = excel.read_range("Sheet1", "A1:C25", page_size=10, block_rows=5)
+        second = excel.pages.resume(first["cursor"])
+
+        assert first["values"][0][0] == 1.0
+        assert second["values"][0][0] == 11.0
+        assert second["has_more"] is True
+
+    @pytest.mark.parametrize("name", ["rows.csv", "rows.jsonl"])
+    def test_spill(self, excel: ExcelService, tmp_path: Path, name: str) -> None:
+        """Test spilling the rows to CSV and JSON Lines files."""
+        path = tmp_path / "out" / name
+
+        result = excel.read_range("Sheet1", "A1:C25", spill_path=str(path), block_rows=10)
+
+        assert result["rows"] == 25
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 25
+        if name.endswith(".jsonl"):
+            assert json.loads(lines[1]) == [2.0, "r2", 3.0]
+        else:
+            assert lines[1] == "2.0,r2,3.0"
+
+
+class TestParsePayload:
+    """Tests for parse_payload."""
+
+    def test_json_text_padded(self) -> None:
+        """Test JSON text is decoded and short rows are padded."""
+        assert parse_payload("[[1, 2], [3]]") == [[1, 2], [3, None]]
+
+    def test_csv_text(self) -> None:
+        """Test text that is not JSON is read as CSV."""
+        assert parse_payload("a,b\n1,2") == [["a", "b"], ["1", "2"]]
+
+    def test_columns(self) -> None:
+        """Test columnar payloads are transposed below their names."""
+        assert parse_payload({"x": [1, 2], "y": [3]}) == [["x", "y"], [1, 3], [2, None]]
+
+    def test_flat_list(self) -> None:
+        """Test a flat list is written as a column."""
+        assert parse_payload([1, 2]) == [[1], [2]]
+
+    @pytest.mark.parametrize("values", ["[", [], [[]], "{bad"])
+    def test_invalid(self, values: Any) -> None:
+        """Test empty or undecodable payloads are rejected."""
+        with pytest.raises(InvalidParameterError):
+            parse_payload(values)
+
+
+class TestChunkRows:
+    """Tests for chunk_rows."""
+
+    def test_budget(self) -> None:
+        """Test chunks stay under the budget (16 bytes per numeric cell)."""
+        chunks = list(chunk_rows([[1, 2]] * 5, 64))
+
+        assert [len(c) for c in chunks] == [2, 2, 1]
+
+    def test_oversized_row(self) -> None:
+        """Test a row larger than the budget still gets its own chunk."""
+        chunks = list(chunk_rows([["x" * 100], [1]], 16))
+
+        assert [len(c) for c in chunks] == [1, 1]
+
+
+class TestWriteRangeBulk:
+    """Tests for ExcelService.write_range_bulk."""
+
+    def test_infers_range_and_chunks(self, excel: ExcelService) -> None:
+        """Test the range comes from the payload shape, one Value2 call per chunk."""
+        rows = [[r, r * 2] for r in range(100)]
+        session = excel.application_factory.session
+        session.reset()
+
+        result = excel.write_range_bulk("Sheet1", "E3", rows, chunk_bytes=320)
+
+        assert (result["range"], result["rows"], result["chunks"]) == ("E3:F102", 100, 10)
+        assert excel.read_range("Sheet1", "E102:F102")["values"] == ((99.0, 198.0),)
+
+    def test_columnar_json(self, excel: ExcelService) -> None:
+        """Test columnar JSON text is written below its column names."""
+        result = excel.write_range_bulk("Sheet1", "A1", '{"name": ["a", "b"]}')
+
+        assert result["range"] == "A1:A3"
+        assert excel.read_cell("Sheet1", "A3")["value"] == "b"
+
+    def test_application_state_restored(self, excel: ExcelService) -> None:
+        """Test the write runs in fast mode, with the settings restored after it."""
+        excel.application.Calculation = -4135
+
+        excel.write_range_bulk("Sheet1", "A1", [[1, 2]])
+
+        app = excel.application
+        assert (app.ScreenUpdating, app.Calculation, app.EnableEvents) == (True, -4135, True)
@@ -0,0 +1,126 @@
+"""Unit tests for the size-bounded result serialization."""
+
+import asyncio
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from src.core.exceptions import InvalidParameterError
+from src.core.serialization import (
+    JSONText,
+    ResultSerializer,
+    ResumePoint,
+    encode_bounded,
+    serialize_members,
+)
+from src.core.service_manager import ServiceManager
+from src.server_tools import ServerToolsService
+
+
+def read_all(serializer: ResultSerializer, result: Any) -> list[dict[str, Any]]:
+    """Serialize a result and follow its continuations."""
+    pages = [json.loads(serializer.serialize(result))]
+    while "continuation" in pages[-1]:
+        pages.append(json.loads(serializer.resume(pages[-1]["continuation"]["cursor"])))
+    return pages
+
+
+class TestEncodeBounded:
+    """Tests for encode_bounded."""
+
+    def test_com_values(self) -> None:
+        """Test dates, decimals, bytes and tuples are encoded."""
+        value = (datetime(2024, 1, 2, 3, 4), Decimal("1.5"), b"\x00\x01", {"é": None})
+
+        assert encode_bounded(value, None) == '["2024-01-02T03:04:00",1.5,"AAE=",{"é":null}]'
+
+    def test_gives_up_over_limit(self) -> None:
+        """Test encoding stops once the limit is exceeded."""
+        assert encode_bounded(list(range(1000)), 50) is None
+        assert encode_bounded([1, 2], 5) == "[1,2]"
+
+
+class TestSerializeMembers:
+    """Tests for serialize_members."""
+
+    def test_complete(self) -> None:
+        """Test a small result fits in one page."""
+        members, resume = serialize_members({"success": True, "values": ((1, 2),)}, 1000)
+
+        assert members == ['"success":true', '"values":[[1,2]]']
+        assert resume is None
+
+    def test_split_between_items(self) -> None:
+        """Test sequences are cut between items, within the budget."""
+        result = {"success": True, "values": [[i] * 10 for i in range(100)], "count": 100}
+
+        members, resume = serialize_members(result, 200)
+
+        assert len(",".join(members).encode()) <= 200
+        assert resume.key == "values"
+        page = json.loads("{" + ",".join(members) + "}")
+        assert page["values"] == result["values"][: resume.offset]
+
+    def test_progress_with_oversized_item(self) -> None:
+        """Test the first item is written even when larger than the budget."""
+        members, resume = serialize_members({"values": ["x" * 100, "y"]}, 10)
+
+        assert members == ['"values":["' + "x" * 100 + '"]']
+        assert resume == ResumePoint("values", 1)
+
+    def test_atomic_member_deferred(self) -> None:
+        """Test a non-sequence member that does not fit moves to the next page."""
+        members, resume = serialize_members({"a": 1, "big": {"k": "x" * 100}}, 20)
+
+        assert members == ['"a":1']
+        assert resume == ResumePoint("big", 0)
+
+
+class TestResultSerializer:
+    """Tests for ResultSerializer."""
+
+    def test_pages_rebuild_the_result(self) -> None:
+        """Test following the cursors yields every item exactly once."""
+        rows = tuple((i, f"row {i}", datetime(2024, 1, 1)) for i in range(500))
+        serializer = ResultSerializer(budget=2048)
+
+        pages = read_all(serializer, {"success": True, "values": rows, "rows": 500})
+
+        assert len(pages) > 2
+        assert all(len(json.dumps(p, separators=(",", ":"))) <= 2048 for p in pages)
+        values = [row for page in pages for row in page.get("values", [])]
+        assert [row[0] for row in values] == list(range(500))
+        assert pages[1]["continued_from"] == {"key": "values", "offset": len(pages[0]["values"])}
+        assert pages[-1]["rows"] == 500
+
+    def test_non_mapping_and_passthrough(self) -> None:
+        """Test non-dict results are wrapped and JSON text passes through."""
+        serializer = ResultSerializer()
+        text = serializer.serialize([1, 2])
+
+        assert json.loads(text) == {"result": [1, 2]}
+        assert serializer.serialize(text) is text
+        assert isinstance(text, JSONText)
+
+    def test_cursor_is_single_use(self) -> None:
+        """Test a cursor cannot be resumed twice."""
+        serializer = ResultSerializer(budget=300)
+        first = json.loads(serializer.serialize({"values": list(range(200))}))
+        cursor = first["continuation"]["cursor"]
+        serializer.resume(cursor)
+
+        with pytest.raises(InvalidParameterError):
+            serializer.resume(cursor)
+
+    def test_next_page_tool(self) -> None:
+        """Test server_next_page resumes a truncated result."""
+        serializer = ResultSerializer(budget=300)
+        first = json.loads(serializer.serialize({"values": list(range(200))}))
+        tools = ServerToolsService(ServiceManager({}), None, None, serializer=serializer)
+
+        page = json.loads(asyncio.run(tools.next_page(first["continuation"]["cursor"])))
+
+        assert page["values"][0] == first["continuation"]["offset"]
@@ -309,3 +309,26 @@ class TestServiceSingletons:
             service2 = get_powerpoint_service()
 
             assert service1 is service2
+
+
+class TestOfflineTools:
+    """Tests for the tools served without starting their application."""
+
+    def test_offline_tools_exist(self) -> None:
+        """Test every offline tool is a real tool whose schema has the file argument."""
+        from src.server import OFFLINE_TOOLS, SERVICE_CONFIGS
+
+        for name, argument in OFFLINE_TOOLS.items():
+            prefix, method = name.split("_", 1)
+            config = SERVICE_CONFIGS[prefix].get(method)
+            assert config is not None, name
+            assert argument in config["required"] + config["optional"], name
+
+    def test_needs_application(self) -> None:
+        """Test only offline tools given their file argument skip the application start."""
+        from src.server import OFFLINE_TOOLS, needs_application
+
+        for name, argument in OFFLINE_TOOLS.items():
+            assert not needs_application(name, {argument: "book.xlsx"})
+            assert needs_application(name, {})
+        assert needs_application("excel_write_cell", {"file_path": "book.xlsx"})
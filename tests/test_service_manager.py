@@ -0,0 +1,169 @@
+"""Unit tests for the service lifecycle manager."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from src.core.exceptions import COMInitializationError
+from src.core.service_manager import ServiceManager, parse_service_list
+from src.core.sta_worker import STAWorker
+
+
+class FakeService:
+    """Service recording the thread it was initialized on."""
+
+    startup_delay = 0.0
+    instances = 0
+
+    def __init__(self) -> None:
+        FakeService.instances += 1
+        self.init_thread: int | None = None
+        self.cleaned = False
+
+    @property
+    def is_initialized(self) -> bool:
+        return self.init_thread is not None
+
+    def initialize(self) -> None:
+        time.sleep(self.startup_delay)
+        self.init_thread = threading.get_ident()
+
+    def cleanup(self) -> None:
+        self.cleaned = True
+
+
+class BrokenService(FakeService):
+    """Service whose application cannot start."""
+
+    def initialize(self) -> None:
+        raise RuntimeError("Office not installed")
+
+
+def make_manager(**factories: Any) -> ServiceManager:
+    """Create a manager with COM-free workers."""
+    return ServiceManager(
+        factories, worker_factory=lambda prefix: STAWorker(prefix, com_apartment=False)
+    )
+
+
+@pytest.fixture
+def manager() -> Iterator[ServiceManager]:
+    """Manager with two healthy services and one broken service."""
+    m = make_manager(word=FakeService, excel=FakeService, outlook=BrokenService)
+    yield m
+    asyncio.run(m.shutdown())
+
+
+class TestParseServiceList:
+    """Tests for parse_service_list function."""
+
+    def test_parse_service_list_subset(self) -> None:
+        """Test selection keeps the canonical order and ignores unknown names."""
+        assert parse_service_list("excel, WORD,visio", ("word", "excel")) == ("word", "excel")
+
+    def test_parse_service_list_all(self) -> None:
+        """Test the 'all' keyword."""
+        assert parse_service_list("all", ("word", "excel")) == ("word", "excel")
+
+    def test_parse_service_list_empty(self) -> None:
+        """Test an unset variable selects nothing."""
+        assert parse_service_list(None, ("word",)) == ()
+
+
+class TestServiceManager:
+    """Tests for ServiceManager class."""
+
+    def test_services_are_not_started_eagerly(self, manager: ServiceManager) -> None:
+        """Test nothing is created before the first call."""
+        assert manager.service("excel") is None
+        assert manager.stats()["excel"]["state"] == "stopped"
+
+    def test_run_starts_service_on_first_call(self, manager: ServiceManager) -> None:
+        """Test lazy start on the service worker thread."""
+        service = asyncio.run(manager.run("excel", lambda svc: svc))
+
+        assert service is manager.service("excel")
+        assert service.init_thread == manager.worker("excel").thread_id
+        stats = manager.stats()["excel"]
+        assert stats["state"] == "started"
+        assert stats["mode"] == "lazy"
+        assert stats["cold_start_ms"] is not None
+
+    def test_service_started_only_once(self, manager: ServiceManager) -> None:
+        """Test subsequent calls reuse the same instance."""
+        first = asyncio.run(manager.run("word", lambda svc: svc))
+        second = asyncio.run(manager.run("word", lambda svc: svc))
+
+        assert first is second
+        assert manager.slot("word").start_attempts == 1
+
+    def test_run_passes_arguments(self, manager: ServiceManager) -> None:
+        """Test extra arguments are forwarded after the service."""
+        result = asyncio.run(manager.run("word", lambda svc, a, b: (a, b), 1, 2))
+        assert result == (1, 2)
+
+    def test_run_without_start(self, manager: ServiceManager) -> None:
+        """Test start=False gives the service unstarted, and starting it reuses it."""
+        unstarted = asyncio.run(manager.run("word", lambda svc: svc, start=False))
+
+        assert not unstarted.is_initialized
+        assert manager.stats()["word"]["state"] == "stopped"
+        assert asyncio.run(manager.run("word", lambda svc: svc)) is unstarted
+        assert unstarted.is_initialized
+
+    def test_run_without_start_records_self_start(self, manager: ServiceManager) -> None:
+        """Test a service initializing itself during a no-start call is recorded as started."""
+        service = asyncio.run(
+            manager.run("excel", lambda svc: svc.initialize() or svc, start=False)
+        )
+
+        assert manager.service("excel") is service
+        assert manager.stats()["excel"]["state"] == "started"
+
+    def test_failed_start_raises(self, manager: ServiceManager) -> None:
+        """Test a broken application raises COMInitializationError."""
+        with pytest.raises(COMInitializationError):
+            asyncio.run(manager.run("outlook", lambda svc: svc))
+
+        stats = manager.stats()["outlook"]
+        assert stats["state"] == "failed"
+        assert "Office not installed" in stats["error"]
+
+    def test_start_many_isolates_failures(self, manager: ServiceManager) -> None:
+        """Test one failing application does not abort the others."""
+        errors = asyncio.run(manager.start_many(["word", "excel", "outlook"]))
+
+        assert errors["word"] is None
+        assert errors["excel"] is None
+        assert errors["outlook"] is not None
+        assert manager.stats()["word"]["mode"] == "eager"
+
+    def test_start_many_parallel_is_concurrent(self) -> None:
+        """Test parallel eager start overlaps the cold starts."""
+
+        class SlowService(FakeService):
+            startup_delay = 0.2
+
+        manager = make_manager(word=SlowService, excel=SlowService, powerpoint=SlowService)
+        try:
+            start = time.perf_counter()
+            asyncio.run(manager.start_many(manager.prefixes, parallel=True))
+            elapsed = time.perf_counter() - start
+        finally:
+            asyncio.run(manager.shutdown())
+
+        assert elapsed < 0.5
+
+    def test_shutdown_cleans_started_services(self, manager: ServiceManager) -> None:
+        """Test shutdown cleans up and stops the workers."""
+        service = asyncio.run(manager.run("word", lambda svc: svc))
+
+        asyncio.run(manager.shutdown())
+
+        assert service.cleaned
+        assert manager.service("word") is None
+        assert not manager.worker("word").is_alive
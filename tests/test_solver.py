@@ -0,0 +1,151 @@
+"""Unit tests for the workbook optimizer."""
+
+import math
+from collections.abc import Iterator
+
+import pytest
+
+from src.core.exceptions import COMOperationError, InvalidParameterError
+from src.excel.excel_service import ExcelService
+from src.excel.solver import parse_bounds, pattern_search, variable_blocks
+from src.fake_com.excel import ExcelApplication, ExcelWorksheetData
+from src.fake_com.factory import FakeApplicationFactory
+
+
+def _recalculate(data: ExcelWorksheetData) -> None:
+    """Evaluate the model of the tests: C1 = (A1 - 3)^2 + (A2 + 1)^2 + 5."""
+    x, y = data.values.get((1, 1)), data.values.get((2, 1))
+    if isinstance(x, float) and isinstance(y, float):
+        data.values[(1, 3)] = (x - 3) ** 2 + (y + 1) ** 2 + 5
+    else:
+        data.values[(1, 3)] = "#VALUE!"
+
+
+@pytest.fixture
+def excel(monkeypatch: pytest.MonkeyPatch) -> Iterator[ExcelService]:
+    """Excel on the fake backend, with the model evaluated by Calculate."""
+
+    def calculate_all(app: ExcelApplication) -> None:
+        for wb in app._workbooks:
+            _recalculate(wb.sheet("Sheet1")._data)
+
+    monkeypatch.setattr(ExcelApplication, "Calculate", calculate_all)
+    excel = ExcelService(application_factory=FakeApplicationFactory())
+    excel.create_workbook()
+    excel.current_document.Worksheets("Sheet1").Range("A1:A2").Value = ((0.0,), (0.0,))
+    yield excel
+    excel.cleanup()
+
+
+class TestPatternSearch:
+    """Tests for pattern_search and the argument parsing."""
+
+    def test_minimum(self) -> None:
+        """Test a smooth function is minimized within the tolerance."""
+        result = pattern_search(
+            lambda x: (x[0] - 1.5) ** 2 + 10 * (x[1] - x[0]) ** 2,
+            [0.0, 0.0],
+            parse_bounds(None, 2),
+        )
+
+        assert result.converged
+        assert result.x == pytest.approx((1.5, 1.5), abs=1e-4)
+
+    def test_bounds_and_undefined_points(self) -> None:
+        """Test the search stays within bounds and avoids undefined points."""
+        result = pattern_search(
+            lambda x: math.nan if x[0] < 0.5 else -x[0], [1.0], parse_bounds([0, 4], 1)
+        )
+
+        assert result.x == (4.0,)
+
+    def test_max_evaluations(self) -> None:
+        """Test the search stops after the allowed evaluations."""
+        calls = []
+        result = pattern_search(
+            lambda x: calls.append(x) or x[0] ** 2, [100.0], [(-1e9, 1e9)], 1e-9, 20
+        )
+
+        assert len(calls) == 20
+        assert not result.converged
+
+    def test_invalid(self) -> None:
+        """Test invalid variable cells and bounds are rejected."""
+        assert variable_blocks("A1:A2, C3") == [(1, 1, 2, 1), (3, 3, 3, 3)]
+        assert parse_bounds([[0, None], [1, 2]], 2) == [(0.0, math.inf), (1.0, 2.0)]
+        for call in (
+            lambda: variable_blocks(""),
+            lambda: variable_blocks(["A1", "nope"]),
+            lambda: parse_bounds([[0, 1]], 2),
+            lambda: parse_bounds([2, 1], 1),
+        ):
+            with pytest.raises(InvalidParameterError):
+                call()
+
+
+class TestUseSolver:
+    """Tests for ExcelService.use_solver."""
+
+    def test_minimize(self, excel: ExcelService) -> None:
+        """Test the minimum is found and left in the variable cells."""
+        result = excel.use_solver("Sheet1", "C1", "A1:A2")
+
+        ws = excel.current_document.Worksheets("Sheet1")
+        assert result["success"] and result["converged"]
+        assert result["objective"] == pytest.approx(5.0)
+        assert result["variables"]["A1"] == pytest.approx(3.0, abs=1e-4)
+        assert result["variables"]["A2"] == pytest.approx(-1.0, abs=1e-4)
+        assert ws.Range("A1").Value2 == result["variables"]["A1"]
+        assert result["cache_hits"] > 0
+        assert result["evaluations_per_second"] > 0
+
+    def test_maximize_within_bounds(self, excel: ExcelService) -> None:
+        """Test maximizing ends on the bounds, given per variable."""
+        result = excel.use_solver(
+            "Sheet1", "C1", ["A1", "A2"], goal="max", bounds="[[4, 10], [-5, -2]]"
+        )
+
+        assert result["variables"] == pytest.approx({"A1": 10.0, "A2": -5.0})
+        assert result["objective"] == pytest.approx(70.0)
+
+    def test_target_value_without_keeping(self, excel: ExcelService) -> None:
+        """Test reaching a target value, then restoring the starting values."""
+        result = excel.use_solver(
+            "Sheet1",
+            "C1",
+            "A1:A2",
+            goal="value",
+            target=9,
+            bounds=[-10, None],
+            keep_solution=False,
+        )
+
+        assert result["objective"] == pytest.approx(9.0, abs=1e-5)
+        assert excel.current_document.Worksheets("Sheet1").Range("A1:A2").Value2 == (
+            (0.0,),
+            (0.0,),
+        )
+
+    def test_calls_per_evaluation(self, excel: ExcelService) -> None:
+        """Test each evaluation writes the vector once and reads the objective once."""
+        session = excel.application_factory.session
+        session.reset()
+        result = excel.use_solver("Sheet1", "C1", "A1:A2", max_evaluations=50)
+
+        assert result["evaluations"] == 50
+        # Fast mode, range lookups, start values and the final write stay within 20 calls
+        assert session.reset() <= 2 * 50 + 20
+
+    def test_objective_without_number(self, excel: ExcelService) -> None:
+        """Test an objective cell holding an error reports a failure."""
+        excel.current_document.Worksheets("Sheet1").Range("A1").Value = "text"
+
+        result = excel.use_solver("Sheet1", "C1", "A2", max_evaluations=10)
+
+        assert not result["success"]
+        assert result["objective"] is None
+
+    def test_invalid(self, excel: ExcelService) -> None:
+        """Test the value goal needs a target."""
+        with pytest.raises(COMOperationError, match="target"):
+            excel.use_solver("Sheet1", "C1", "A1:A2", goal="value")
@@ -0,0 +1,132 @@
+"""Unit tests for STA worker threads."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from src.core.sta_worker import STAWorker
+
+
+@pytest.fixture
+def worker() -> Iterator[STAWorker]:
+    """Create a worker without COM apartment (runs on any platform)."""
+    w = STAWorker("test", com_apartment=False, pump_interval=0.01)
+    yield w
+    w.stop()
+
+
+class TestSTAWorker:
+    """Tests for STAWorker class."""
+
+    def test_submit_runs_on_worker_thread(self, worker: STAWorker) -> None:
+        """Test calls execute on the dedicated thread."""
+        thread_id = worker.submit(threading.get_ident).result(timeout=5)
+
+        assert thread_id == worker.thread_id
+        assert thread_id != threading.get_ident()
+
+    def test_submit_propagates_exceptions(self, worker: STAWorker) -> None:
+        """Test exceptions are set on the future."""
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            worker.submit(fail).result(timeout=5)
+
+        assert worker.stats()["failed"] == 1
+
+    def test_calls_run_in_order(self, worker: STAWorker) -> None:
+        """Test queued calls execute sequentially in submission order."""
+        seen: list[int] = []
+        futures = [worker.submit(seen.append, i) for i in range(20)]
+        for future in futures:
+            future.result(timeout=5)
+
+        assert seen == list(range(20))
+
+    def test_run_awaits_result(self, worker: STAWorker) -> None:
+        """Test the asyncio entry point."""
+        result = asyncio.run(worker.run(lambda a, b: a + b, 2, b=3))
+        assert result == 5
+
+    def test_run_does_not_block_event_loop(self) -> None:
+        """Test two workers make progress concurrently."""
+        slow = STAWorker("slow", com_apartment=False)
+        fast = STAWorker("fast", com_apartment=False)
+
+        async def scenario() -> list[str]:
+            order: list[str] = []
+
+            async def call(w: STAWorker, delay: float, label: str) -> None:
+                await w.run(time.sleep, delay)
+                order.append(label)
+
+            await asyncio.gather(call(slow, 0.3, "slow"), call(fast, 0.01, "fast"))
+            return order
+
+        try:
+            assert asyncio.run(scenario()) == ["fast", "slow"]
+        finally:
+            slow.stop()
+            fast.stop()
+
+    def test_call_from_worker_thread_runs_inline(self, worker: STAWorker) -> None:
+        """Test nested calls do not deadlock."""
+        result = worker.submit(lambda: worker.call(lambda: "nested")).result(timeout=5)
+        assert result == "nested"
+
+    def test_stats_track_queue_and_wait(self, worker: STAWorker) -> None:
+        """Test queue depth and wait time counters."""
+        gate = threading.Event()
+        blocker = worker.submit(gate.wait, 5)
+        queued = [worker.submit(lambda: None) for _ in range(3)]
+
+        assert worker.stats()["queue_depth"] == 4
+        time.sleep(0.05)
+        gate.set()
+        for future in [blocker, *queued]:
+            future.result(timeout=5)
+
+        stats = worker.stats()
+        assert stats["queue_depth"] == 0
+        assert stats["max_queue_depth"] == 4
+        assert stats["completed"] == 4
+        assert stats["wait_ms_max"] >= 40
+
+    def test_stop_and_restart(self, worker: STAWorker) -> None:
+        """Test a stopped worker restarts on the next submission."""
+        worker.submit(lambda: None).result(timeout=5)
+        worker.stop()
+        assert not worker.is_alive
+
+        assert worker.submit(lambda: 1).result(timeout=5) == 1
+        assert worker.is_alive
+
+    def test_failed_initialization_fails_calls(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test calls fail with the error when COM cannot be initialized."""
+        release = threading.Event()
+
+        def co_initialize() -> None:
+            release.wait(5)
+            raise OSError("CoInitialize failed")
+
+        monkeypatch.setattr("src.core.sta_worker._co_initialize", co_initialize)
+        worker = STAWorker("broken", pump_interval=0.01)
+        queued = [worker.submit(lambda: 1), worker.submit(lambda: 2)]
+        release.set()
+
+        for future in queued:
+            with pytest.raises(OSError, match="CoInitialize"):
+                future.result(timeout=5)
+        later = worker.submit(lambda: 3)
+        assert later.done()
+        with pytest.raises(OSError, match="CoInitialize"):
+            later.result()
+        assert not worker.is_alive
+        stats = worker.stats()
+        assert (stats["queue_depth"], stats["failed"]) == (0, 3)
+        assert "CoInitialize failed" in stats["error"]
@@ -0,0 +1,143 @@
+"""Unit tests for the what-if parameter sweep."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from src.core.exceptions import COMOperationError, InvalidParameterError
+from src.excel.excel_service import ExcelService
+from src.excel.sweep import parse_inputs, sweep_points
+from src.fake_com.excel import ExcelApplication, ExcelRange, ExcelWorksheetData
+from src.fake_com.factory import FakeApplicationFactory
+
+
+def _recalculate(data: ExcelWorksheetData) -> None:
+    """Evaluate the model of the tests: C1 = A1 * B1 and C2 = C1 + 1."""
+    a, b = data.values.get((1, 1)), data.values.get((1, 2))
+    if isinstance(a, float) and isinstance(b, float):
+        data.values[(1, 3)] = a * b
+        data.values[(2, 3)] = a * b + 1
+
+
+@pytest.fixture
+def calculated() -> list[str]:
+    """Recalculations made, ``"application"`` or ``"range"``."""
+    return []
+
+
+@pytest.fixture
+def excel(monkeypatch: pytest.MonkeyPatch, calculated: list[str]) -> Iterator[ExcelService]:
+    """Excel on the fake backend, with formulas evaluated by Calculate."""
+
+    def calculate_all(app: ExcelApplication) -> None:
+        calculated.append("application")
+        for wb in app._workbooks:
+            _recalculate(wb.sheet("Sheet1")._data)
+
+    def calculate_range(rng: ExcelRange) -> bool:
+        calculated.append("range")
+        _recalculate(rng._data)
+        return True
+
+    monkeypatch.setattr(ExcelApplication, "Calculate", calculate_all)
+    monkeypatch.setattr(ExcelRange, "Calculate", calculate_range)
+    excel = ExcelService(application_factory=FakeApplicationFactory())
+    excel.create_workbook()
+    ws = excel.current_document.Worksheets("Sheet1")
+    ws.Range("A1:C2").Value = ((2.0, 3.0, "=A1*B1"), ("=1+1", None, "=C1+1"))
+    yield excel
+    excel.cleanup()
+
+
+class TestParseInputs:
+    """Tests for parse_inputs and sweep_points."""
+
+    def test_values_and_ranges(self) -> None:
+        """Test value lists and start/stop/step ranges, stop included."""
+        inputs = parse_inputs(
+            [{"cell": "a1", "values": [1, 2]}, {"cell": "B1", "start": 0, "stop": 0.3, "step": 0.1}]
+        )
+
+        assert inputs[0] == ("A1", (1, 2))
+        assert inputs[1].values == (0.0, 0.1, 0.2, 0.3)
+        assert sweep_points(inputs)[:5] == [(1, 0.0), (1, 0.1), (1, 0.2), (1, 0.3), (2, 0.0)]
+
+    def test_invalid(self) -> None:
+        """Test invalid entries and grids too large are rejected."""
+        for inputs in (
+            [],
+            [{"values": [1]}],
+            [{"cell": "A1", "values": []}],
+            [{"cell": "A1", "start": 1, "stop": 0}],
+            [{"cell": "A1", "values": [1]}, {"cell": "a1", "values": [2]}],
+            [{"cell": "A1", "start": 1, "stop": 1000}, {"cell": "B1", "start": 1, "stop": 1000}],
+        ):
+            with pytest.raises(InvalidParameterError):
+                parse_inputs(inputs)
+
+
+class TestParameterSweep:
+    """Tests for ExcelService.parameter_sweep."""
+
+    def test_sweep(self, excel: ExcelService, calculated: list[str]) -> None:
+        """Test every point is evaluated and the inputs are restored."""
+        result = excel.parameter_sweep(
+            "Sheet1",
+            [{"cell": "A1", "values": [1, 2]}, {"cell": "B1", "start": 10, "stop": 30, "step": 10}],
+            "C1, C2",
+        )
+
+        ws = excel.current_document.Worksheets("Sheet1")
+        assert result["columns"] == ["A1", "B1", "C1", "C2"]
+        assert result["rows"] == [
+            [1, 10.0, 10.0, 11.0],
+            [1, 20.0, 20.0, 21.0],
+            [1, 30.0, 30.0, 31.0],
+            [2, 10.0, 20.0, 21.0],
+            [2, 20.0, 40.0, 41.0],
+            [2, 30.0, 60.0, 61.0],
+        ]
+        assert ws.Range("A1:B1").Value2 == ((2.0, 3.0),)
+        assert excel.application.Calculation == -4105
+        assert set(calculated) == {"application"}
+
+    def test_calc_range_and_formula_inputs(
+        self, excel: ExcelService, calculated: list[str]
+    ) -> None:
+        """Test Range.Calculate is used when given, and input formulas are restored."""
+        result = excel.parameter_sweep(
+            "Sheet1", '[{"cell": "A2", "values": [5]}]', ["C1"], calc_range="C1:C2"
+        )
+
+        assert result["rows"] == [[5, 6.0]]
+        assert excel.current_document.Worksheets("Sheet1").Range("A2").Formula == "=1+1"
+        assert set(calculated) == {"range"}
+
+    def test_calls_per_point(self, excel: ExcelService) -> None:
+        """Test each point costs one write per input, a recalculation and one read."""
+        session = excel.application_factory.session
+        sweep = [
+            {"cell": "A1", "values": [1.0, 2.0]},
+            {"cell": "B1", "start": 1, "stop": 50},
+            {"cell": "A2", "values": [0.0, 1.0]},
+        ]
+        session.reset()
+        excel.parameter_sweep("Sheet1", sweep, ["C1", "C2"])
+
+        # 200 points of 3 inputs: 3 writes and 1 read each, plus the setup and restore
+        assert session.reset() < 200 * (3 + 2)
+
+    def test_workers(self, excel: ExcelService) -> None:
+        """Test the points are split over Excel processes opening a copy."""
+        sweep = [{"cell": "A1", "start": 1, "stop": 10}, {"cell": "B1", "values": [1.0, 2.0]}]
+        single = excel.parameter_sweep("Sheet1", sweep, ["C1"])
+        pooled = excel.parameter_sweep("Sheet1", sweep, ["C1"], workers=3)
+
+        assert pooled["workers"] == 3
+        assert pooled["rows"] == single["rows"]
+        assert excel.current_document.Worksheets("Sheet1").Range("A1").Value2 == 2.0
+
+    def test_invalid_outputs(self, excel: ExcelService) -> None:
+        """Test a sweep without output cells is rejected."""
+        with pytest.raises(COMOperationError, match="outputs"):
+            excel.parameter_sweep("Sheet1", [{"cell": "A1", "values": [1]}], "")
@@ -6,10 +6,12 @@ import pytest
 
 from src.core.exceptions import InvalidParameterError
 from src.utils.validators import (
+    validate_bool,
     validate_cell_address,
     validate_choice,
     validate_dimensions,
     validate_file_path,
+    validate_json_argument,
     validate_percentage,
     validate_positive_number,
     validate_range_address,
@@ -313,3 +315,46 @@ class TestValidateChoice:
         choices = ["Option1", "Option2"]
         with pytest.raises(InvalidParameterError):
             validate_choice("param", "option1", choices)
+
+
+class TestValidateBool:
+    """Tests for validate_bool function."""
+
+    def test_validate_bool_native(self) -> None:
+        """Test with native booleans."""
+        assert validate_bool("flag", True) is True
+        assert validate_bool("flag", False) is False
+
+    def test_validate_bool_strings(self) -> None:
+        """Test with string forms sent by MCP clients."""
+        assert validate_bool("flag", "true") is True
+        assert validate_bool("flag", "False") is False
+        assert validate_bool("flag", "1") is True
+
+    def test_validate_bool_invalid(self) -> None:
+        """Test with an unrecognizable value."""
+        with pytest.raises(InvalidParameterError):
+            validate_bool("flag", "maybe")
+
+
+class TestValidateJsonArgument:
+    """Tests for validate_json_argument function."""
+
+    def test_validate_json_argument_decoded(self) -> None:
+        """Test an already-decoded value is returned as is."""
+        assert validate_json_argument("values", [[1, 2]]) == [[1, 2]]
+
+    def test_validate_json_argument_string(self) -> None:
+        """Test a JSON string is decoded."""
+        assert validate_json_argument("values", "[[1, 2]]") == [[1, 2]]
+        assert validate_json_argument("style", '{"bold": true}', dict) == {"bold": True}
+
+    def test_validate_json_argument_invalid_json(self) -> None:
+        """Test malformed JSON raises an error."""
+        with pytest.raises(InvalidParameterError):
+            validate_json_argument("values", "[[1, 2]")
+
+    def test_validate_json_argument_wrong_type(self) -> None:
+        """Test a value of the wrong type raises an error."""
+        with pytest.raises(InvalidParameterError):
+            validate_json_argument("values", '{"a": 1}', list)
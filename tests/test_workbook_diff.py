@@ -0,0 +1,204 @@
+"""Unit tests for the workbook comparison."""
+
+import asyncio
+import zipfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from src.core.exceptions import COMOperationError
+from src.core.service_manager import ServiceManager
+from src.core.sta_worker import STAWorker
+from src.excel.excel_service import ExcelService
+from src.excel.workbook_diff import SheetGrid, compare_sheets, diff_positions
+from src.excel.xlsx_writer import XlsxWriter
+from src.fake_com.factory import FakeApplicationFactory
+
+
+@pytest.fixture
+def excel() -> Iterator[ExcelService]:
+    """Excel on the fake backend with an empty workbook."""
+    excel = ExcelService(application_factory=FakeApplicationFactory())
+    excel.create_workbook()
+    yield excel
+    excel.cleanup()
+
+
+def make_xlsx(path: Path, sheets: dict[str, list[list]]) -> Path:
+    """Write a workbook with the given rows per sheet."""
+    with XlsxWriter(path) as writer:
+        for name, rows in sheets.items():
+            writer.add_sheet(name)
+            writer.write_rows(rows)
+    return path
+
+
+def grid(rows: list[tuple], first_row: int = 1, first_col: int = 1) -> SheetGrid:
+    """Grid of constants."""
+    return SheetGrid(first_row, first_col, rows, [(None,) * len(rows[0])] * len(rows))
+
+
+class TestCompareSheets:
+    """Tests for the grid comparison."""
+
+    def test_diff_positions(self) -> None:
+        """Test only the differing cells of the differing rows are returned."""
+        old = [(1.0, "a", None), (2.0, "b", None)]
+        new = [(1.0, "A", None), (2.0, "b", 3.0)]
+
+        assert diff_positions(old, new) == [(0, 1), (1, 2)]
+
+    def test_kinds(self) -> None:
+        """Test changed, added and removed cells are told apart."""
+        summary, changes = compare_sheets(
+            "S", grid([(1.0, "x"), (2.0, None)]), grid([(1.5, None), (2.0, "y")])
+        )
+
+        assert [(c.cell, c.kind, c.old, c.new) for c in changes] == [
+            ("A1", "value", 1.0, 1.5),
+            ("B1", "removed", "x", None),
+            ("B2", "added", None, "y"),
+        ]
+        assert summary.counts == {"value": 1, "formula": 0, "added": 1, "removed": 1}
+
+    def test_aligned_on_addresses(self) -> None:
+        """Test used ranges starting at different cells are aligned."""
+        old = grid([(1.0, 2.0)], first_row=3, first_col=2)
+        new = grid([(None, None, None), (None, 1.0, 2.0), (None, None, 5.0)], 2, 1)
+
+        summary, changes = compare_sheets("S", old, new)
+
+        assert [(c.cell, c.kind) for c in changes] == [("C4", "added")]
+        assert summary.cells == 3 * 3
+
+    def test_formula_changes(self) -> None:
+        """Test a formula change is reported with the formula texts."""
+        old = SheetGrid(1, 1, [(2.0, 4.0)], [(None, "=A1*2")])
+        new = SheetGrid(1, 1, [(2.0, 4.0)], [(None, "=A1+2")])
+
+        _, changes = compare_sheets("S", old, new)
+
+        assert [(c.cell, c.kind, c.old, c.new) for c in changes] == [
+            ("B1", "formula", "=A1*2", "=A1+2")
+        ]
+
+
+class TestCompareWorkbooks:
+    """Tests for ExcelService.compare_workbooks."""
+
+    def test_offline(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test .xlsx files are compared without Excel, sheet by sheet."""
+        old = make_xlsx(
+            tmp_path / "old.xlsx",
+            {"Data": [["id", "name"], [1, "Ann"], [2, "Bob"]], "Gone": [["x"]]},
+        )
+        new = make_xlsx(
+            tmp_path / "new.xlsx",
+            {"Data": [["id", "name"], [1, "Ann"], [2, "Rob"], [3, "Cy"]], "New": [["y"]]},
+        )
+
+        result = excel.compare_workbooks(str(old), str(new))
+
+        assert excel.application.Workbooks.Count == 1
+        assert not result["identical"]
+        assert [(s["sheet"], s["status"]) for s in result["sheets"]] == [
+            ("Data", "changed"),
+            ("Gone", "removed"),
+            ("New", "added"),
+        ]
+        assert [(c["cell"], c["kind"], c["new"]) for c in result["changes"]] == [
+            ("B3", "value", "Rob"),
+            ("A4", "added", 3.0),
+            ("B4", "added", "Cy"),
+        ]
+        assert (result["value"], result["added"], result["cells_compared"]) == (1, 2, 8)
+
+    def test_through_service_manager(self, tmp_path: Path) -> None:
+        """Test a no-start call of the service manager compares files without an application."""
+        old = make_xlsx(tmp_path / "old.xlsx", {"Data": [[1, 2]]})
+        new = make_xlsx(tmp_path / "new.xlsx", {"Data": [[1, 3]]})
+        factory = FakeApplicationFactory()
+        manager = ServiceManager(
+            {"excel": lambda: ExcelService(application_factory=factory)},
+            worker_factory=lambda prefix: STAWorker(prefix, com_apartment=False),
+        )
+        try:
+            result = asyncio.run(
+                manager.run(
+                    "excel", lambda excel: excel.compare_workbooks(str(old), str(new)), start=False
+                )
+            )
+        finally:
+            asyncio.run(manager.shutdown())
+
+        assert result["total_changes"] == 1
+        assert factory.applications == {}
+
+    def test_identical(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test identical workbooks report no change."""
+        rows = {"Data": [[r, f"row {r}"] for r in range(100)]}
+        old = make_xlsx(tmp_path / "old.xlsx", rows)
+        new = make_xlsx(tmp_path / "new.xlsx", rows)
+
+        result = excel.compare_workbooks(str(old), str(new))
+
+        assert result["identical"]
+        assert result["changes"] == []
+        assert result["total_changes"] == 0
+
+    def test_shared_formulas(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test shared formulas compare equal to the same formulas written per cell."""
+        old = make_xlsx(tmp_path / "old.xlsx", {"S": [[1], [2]]})
+        new = make_xlsx(tmp_path / "new.xlsx", {"S": [[1], [2]]})
+        formulas = {
+            old: '<c r="B1"><f t="shared" ref="B1:B2" si="0">A1*2</f></c>'
+            '</row><row r="2"><c r="B2"><f t="shared" si="0"/></c>',
+            new: '<c r="B1"><f>A1*2</f></c></row><row r="2"><c r="B2"><f>A2*3</f></c>',
+        }
+        for path, cells in formulas.items():
+            with zipfile.ZipFile(path) as archive:
+                parts = {name: archive.read(name) for name in archive.namelist()}
+            sheet = parts["xl/worksheets/sheet1.xml"].decode()
+            head, tail = sheet.split('<row r="2"')
+            first_row_end = head.rindex("</row>")
+            sheet = head[:first_row_end] + cells + tail.split(">", 1)[1]
+            parts["xl/worksheets/sheet1.xml"] = sheet.encode()
+            with zipfile.ZipFile(path, "w") as archive:
+                for name, data in parts.items():
+                    archive.writestr(name, data)
+
+        result = excel.compare_workbooks(str(old), str(new))
+
+        assert [(c["cell"], c["old"], c["new"]) for c in result["changes"]] == [
+            ("B2", "=A2*2", "=A2*3")
+        ]
+
+    def test_open_workbook_read_from_excel(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test a workbook open in Excel is compared with its unsaved changes."""
+        old = make_xlsx(tmp_path / "old.xlsx", {"Sheet1": [[1, 2]]})
+        new = tmp_path / "new.xlsx"
+        new.write_bytes(b"")
+        ws = excel.current_document.Worksheets("Sheet1")
+        ws.Range("A1:B1").Value = ((1.0, 2.0),)
+        excel.current_document.SaveAs(str(new))
+        ws.Range("C1").Formula = "=A1+B1"
+
+        result = excel.compare_workbooks(str(old), str(new))
+
+        assert result["changes"] == [
+            {"sheet": "Sheet1", "cell": "C1", "kind": "formula", "old": None, "new": "=A1+B1"}
+        ]
+
+    def test_max_changes_and_sheets(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test the change list is truncated and sheets can be selected."""
+        old = make_xlsx(tmp_path / "old.xlsx", {"A": [[i] for i in range(50)], "B": [[1]]})
+        new = make_xlsx(tmp_path / "new.xlsx", {"A": [[-i] for i in range(50)], "B": [[2]]})
+
+        result = excel.compare_workbooks(str(old), str(new), sheets=["A"], max_changes=10)
+
+        assert (len(result["changes"]), result["total_changes"]) == (10, 49)
+        assert result["truncated"]
+        assert [s["sheet"] for s in result["sheets"]] == ["A"]
+        with pytest.raises(COMOperationError, match="sheets"):
+            excel.compare_workbooks(str(old), str(new), sheets=["C"])
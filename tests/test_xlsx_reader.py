@@ -0,0 +1,213 @@
+"""Unit tests for the offline .xlsx reader."""
+
+import asyncio
+import json
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.core.exceptions import COMOperationError, InvalidParameterError
+from src.core.service_manager import ServiceManager
+from src.core.sta_worker import STAWorker
+from src.excel.excel_service import ExcelService
+from src.excel.xlsx_reader import XlsxReader
+from src.fake_com.factory import FakeApplicationFactory
+
+MAIN = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+REL = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+PKG = 'xmlns="http://schemas.openxmlformats.org/package/2006/relationships"'
+
+SHEET1 = f"""<?xml version="1.0" encoding="UTF-8"?>
+<worksheet {MAIN}><sheetData>
+<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c><c r="C1" t="s"><v>2</v></c></row>
+<row r="2"><c r="A2"><v>1</v></c><c r="B2" s="1"><v>45293</v></c><c r="C2" t="b"><v>1</v></c></row>
+<row r="4"><c r="A4"><v>2.5</v></c><c r="B4" s="2"><v>45293.5</v></c>
+<c r="C4" t="inlineStr"><is><t>inline</t></is></c></row>
+</sheetData></worksheet>"""
+
+SHEET2 = f"""<?xml version="1.0" encoding="UTF-8"?>
+<worksheet {MAIN}><sheetData><row><c><v>7</v></c><c t="s"><v>3</v></c></row></sheetData></worksheet>"""
+
+PARTS = {
+    "xl/workbook.xml": f"""<workbook {MAIN} {REL}><bookViews><workbookView activeTab="1"/>
+</bookViews><sheets><sheet name="Data" sheetId="1" r:id="rId1"/>
+<sheet name="Other" sheetId="2" r:id="rId2"/></sheets></workbook>""",
+    "xl/_rels/workbook.xml.rels": f"""<Relationships {PKG}>
+<Relationship Id="rId1" Target="worksheets/sheet1.xml"/>
+<Relationship Id="rId2" Target="/xl/worksheets/sheet2.xml"/></Relationships>""",
+    "xl/styles.xml": f"""<styleSheet {MAIN}>
+<numFmts count="1"><numFmt numFmtId="164" formatCode="yyyy-mm-dd hh:mm"/></numFmts>
+<cellXfs count="3"><xf numFmtId="0"/><xf numFmtId="14"/><xf numFmtId="164"/></cellXfs>
+</styleSheet>""",
+    "xl/sharedStrings.xml": f"""<sst {MAIN}><si><t>id</t></si><si><t>day</t></si>
+<si><t>flag</t></si><si><r><t>rich </t></r><r><t>text</t></r></si></sst>""",
+    "xl/worksheets/sheet1.xml": SHEET1,
+    "xl/worksheets/sheet2.xml": SHEET2,
+}
+
+
+@pytest.fixture
+def workbook(tmp_path: Path) -> Path:
+    """Small .xlsx file with two sheets."""
+    path = tmp_path / "book.xlsx"
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, content in PARTS.items():
+            archive.writestr(name, content)
+    return path
+
+
+class TestXlsxReader:
+    """Tests for XlsxReader."""
+
+    def test_sheets(self, workbook: Path) -> None:
+        """Test sheet names and the active sheet come from the workbook part."""
+        reader = XlsxReader(workbook)
+
+        assert reader.sheet_names == ["Data", "Other"]
+        assert reader.active_sheet == "Other"
+
+    def test_rows(self, workbook: Path) -> None:
+        """Test cell types, missing rows and date styles."""
+        rows = list(XlsxReader(workbook).iter_rows("Data"))
+
+        assert rows == [
+            ("id", "day", "flag"),
+            (1.0, datetime(2024, 1, 2), True),
+            (None, None, None),
+            (2.5, datetime(2024, 1, 2, 12), "inline"),
+        ]
+
+    def test_bounds_and_date_modes(self, workbook: Path) -> None:
+        """Test reads are limited to the bounds, with dates in the requested form."""
+        reader = XlsxReader(workbook)
+
+        assert list(reader.iter_rows("Data", (2, 2, 9, 2), "iso")) == [
+            ("2024-01-02",),
+            (None,),
+            ("2024-01-02T12:00:00",),
+        ]
+        assert list(reader.iter_rows("Data", (2, 2, 2, 2), "serial")) == [(45293.0,)]
+
+    def test_cells_without_references(self, workbook: Path) -> None:
+        """Test rows and cells without r attributes are numbered in order."""
+        assert list(XlsxReader(workbook).iter_rows("Other")) == [(7.0, "rich text")]
+
+    def test_formula_rows(self, tmp_path: Path) -> None:
+        """Test formulas are returned with the values, shared formulas expanded."""
+        sheet = f"""<worksheet {MAIN}><sheetData>
+<row r="1"><c r="A1"><v>1</v></c><c r="B1"><f t="shared" ref="B1:B3" si="0">A1*2</f><v>2</v></c></row>
+<row r="2"><c r="A2"><v>2</v></c><c r="B2"><f t="shared" si="0"/><v>4</v></c></row>
+<row r="3"><c r="B3"><f t="shared" si="0"/></c></row>
+</sheetData></worksheet>"""
+        path = tmp_path / "formulas.xlsx"
+        with zipfile.ZipFile(path, "w") as archive:
+            for name, content in {**PARTS, "xl/worksheets/sheet1.xml": sheet}.items():
+                archive.writestr(name, content)
+
+        values, formulas = XlsxReader(path).read_formulas("Data")
+
+        assert values == [(1.0, 2.0), (2.0, 4.0), (None, None)]
+        assert formulas == [(None, "=A1*2"), (None, "=A2*2"), (None, "=A3*2")]
+
+    def test_invalid_file(self, tmp_path: Path) -> None:
+        """Test files that are not workbooks are rejected."""
+        path = tmp_path / "bad.xlsx"
+        path.write_text("not a zip")
+
+        with pytest.raises(InvalidParameterError):
+            XlsxReader(path)
+
+
+class TestOfflineTools:
+    """Tests of the read-only Excel tools on a file that Excel has not opened."""
+
+    @pytest.fixture
+    def excel(self) -> ExcelService:
+        """Excel service that is never initialized."""
+        return ExcelService(application_factory=FakeApplicationFactory())
+
+    def test_read_range_without_excel(self, excel: ExcelService, workbook: Path) -> None:
+        """Test read_range parses the file without starting Excel."""
+        result = excel.read_range("Data", "A1:C2", file_path=str(workbook))
+
+        assert result["values"] == (("id", "day", "flag"), (1.0, datetime(2024, 1, 2), True))
+        assert result["engine"] == "xlsx"
+        assert not excel.is_initialized
+
+    def test_read_range_through_service_manager(self, workbook: Path) -> None:
+        """Test a no-start call of the service manager reads the file without an application."""
+        factory = FakeApplicationFactory()
+        manager = ServiceManager(
+            {"excel": lambda: ExcelService(application_factory=factory)},
+            worker_factory=lambda prefix: STAWorker(prefix, com_apartment=False),
+        )
+        try:
+            result = asyncio.run(
+                manager.run(
+                    "excel",
+                    lambda excel: excel.read_range("Data", "A1:A2", file_path=str(workbook)),
+                    start=False,
+                )
+            )
+            stats = manager.stats()["excel"]
+        finally:
+            asyncio.run(manager.shutdown())
+
+        assert result["values"] == (("id",), (1.0,))
+        assert factory.applications == {}
+        assert stats["state"] == "stopped"
+
+    def test_read_range_pages(self, excel: ExcelService, workbook: Path) -> None:
+        """Test offline reads can be paginated."""
+        first = excel.read_range("Data", "A1:A4", page_size=3, raw=True, file_path=str(workbook))
+        rest = excel.pages.resume(first["cursor"])
+
+        assert [row[0] for row in first["values"] + rest["values"]] == ["id", 1.0, None, 2.5]
+
+    def test_read_cell(self, excel: ExcelService, workbook: Path) -> None:
+        """Test read_cell, including a cell past the data."""
+        assert excel.read_cell("Data", "B4", raw=True, file_path=str(workbook))["value"] == (
+            "2024-01-02T12:00:00"
+        )
+        assert excel.read_cell("Data", "Z99", file_path=str(workbook))["value"] is None
+
+    def test_export_to_json(self, excel: ExcelService, workbook: Path, tmp_path: Path) -> None:
+        """Test offline JSON exports write dates as ISO strings."""
+        path = tmp_path / "out.json"
+
+        excel.export_to_json("Data", "A1:C2", str(path), file_path=str(workbook))
+
+        assert json.loads(path.read_text())[1] == [1.0, "2024-01-02", True]
+
+    def test_convert_to_csv(self, excel: ExcelService, workbook: Path, tmp_path: Path) -> None:
+        """Test offline CSV conversion of the active sheet and of a named sheet."""
+        active, data = tmp_path / "active.csv", tmp_path / "data.csv"
+
+        excel.convert_to_csv(str(active), file_path=str(workbook))
+        excel.convert_to_csv(str(data), file_path=str(workbook), sheet_name="Data")
+
+        assert active.read_text(encoding="utf-8").splitlines() == ["7,rich text"]
+        assert data.read_text(encoding="utf-8").splitlines()[1:] == [
+            "1,2024-01-02,True",
+            ",,",
+            "2.5,2024-01-02T12:00:00,inline",
+        ]
+
+    def test_unknown_sheet(self, excel: ExcelService, workbook: Path) -> None:
+        """Test unknown worksheets are reported."""
+        with pytest.raises(COMOperationError, match="Worksheet not found"):
+            excel.read_range("Missing", "A1:B2", file_path=str(workbook))
+
+    def test_open_workbook_read_through_excel(self, excel: ExcelService, workbook: Path) -> None:
+        """Test a file open in Excel is read from the live workbook."""
+        excel.create_workbook()
+        excel.write_cell("Sheet1", "A1", "live")
+        excel.save_workbook(str(workbook))
+
+        result = excel.read_cell("Sheet1", "A1", file_path=str(workbook))
+
+        assert result["value"] == "live"
+        assert "engine" not in result
+        excel.cleanup()
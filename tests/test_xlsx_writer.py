@@ -0,0 +1,163 @@
+"""Unit tests for the streaming .xlsx writer."""
+
+import asyncio
+import zipfile
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from src.core.exceptions import COMOperationError, InvalidParameterError
+from src.core.service_manager import ServiceManager
+from src.core.sta_worker import STAWorker
+from src.excel.excel_service import ExcelService
+from src.excel.xlsx_reader import XlsxReader
+from src.excel.xlsx_writer import XlsxWriter
+from src.fake_com.factory import FakeApplicationFactory
+
+
+class TestXlsxWriter:
+    """Tests for XlsxWriter (read back with XlsxReader)."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test values, dates and sheets survive a round trip."""
+        path = tmp_path / "out.xlsx"
+        with XlsxWriter(path) as writer:
+            writer.add_sheet("Data", column_formats={"C": "0.00"})
+            writer.write_row(["name", "day", "price", "ok"], bold=True)
+            writer.write_rows(
+                [
+                    ["a <&>", date(2024, 1, 2), 1.5, True],
+                    [" padded ", datetime(2024, 1, 2, 3, 4, 5), 2, None],
+                ]
+            )
+            writer.add_sheet("Other")
+            writer.write_row([1, "a <&>"])
+
+        reader = XlsxReader(path)
+        assert reader.sheet_names == ["Data", "Other"]
+        assert list(reader.iter_rows("Data")) == [
+            ("name", "day", "price", "ok"),
+            ("a <&>", datetime(2024, 1, 2), 1.5, True),
+            (" padded ", datetime(2024, 1, 2, 3, 4, 5), 2.0, None),
+        ]
+        assert list(reader.iter_rows("Other")) == [(1.0, "a <&>")]
+
+    def test_shared_strings(self, tmp_path: Path) -> None:
+        """Test repeated strings are stored once."""
+        path = tmp_path / "out.xlsx"
+        with XlsxWriter(path) as writer:
+            writer.write_rows([["same", "same"]] * 100)
+
+        with zipfile.ZipFile(path) as archive:
+            strings = archive.read("xl/sharedStrings.xml").decode()
+        assert strings.count("<si>") == 1
+        assert 'count="200"' in strings
+
+    def test_inline_strings(self, tmp_path: Path) -> None:
+        """Test strings can be written inline, without a shared string table."""
+        path = tmp_path / "out.xlsx"
+        with XlsxWriter(path, shared_strings=False) as writer:
+            writer.write_row(["a", " b "])
+
+        with zipfile.ZipFile(path) as archive:
+            assert 't="inlineStr"' in archive.read("xl/worksheets/sheet1.xml").decode()
+        assert list(XlsxReader(path).iter_rows("Sheet1")) == [("a", " b ")]
+
+    def test_styles(self, tmp_path: Path) -> None:
+        """Test custom number formats and the bold font are declared."""
+        path = tmp_path / "out.xlsx"
+        with XlsxWriter(path) as writer:
+            writer.add_sheet("Data", column_formats=[None, "0.000%"])
+            writer.write_row(["a", "b"], bold=True)
+            writer.write_row([1, 0.5])
+
+        with zipfile.ZipFile(path) as archive:
+            styles = archive.read("xl/styles.xml").decode()
+        assert 'formatCode="0.000%"' in styles
+        assert "<b/>" in styles
+
+    def test_invalid_sheet_name(self, tmp_path: Path) -> None:
+        """Test invalid worksheet names are rejected and the file removed."""
+        path = tmp_path / "out.xlsx"
+
+        with pytest.raises(InvalidParameterError), XlsxWriter(path) as writer:
+            writer.add_sheet("a/b")
+        assert not path.exists()
+
+
+class TestCreateWorkbookOffline:
+    """Tests for ExcelService.create_workbook_offline."""
+
+    @pytest.fixture
+    def excel(self) -> ExcelService:
+        """Excel service on the fake backend."""
+        return ExcelService(application_factory=FakeApplicationFactory())
+
+    def test_from_values(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test a workbook is written from a columnar payload without Excel."""
+        path = tmp_path / "report.xlsx"
+
+        result = excel.create_workbook_offline(
+            str(path), values='{"id": [1, 2], "name": ["a", "b"]}', header=True
+        )
+
+        assert result["rows"] == 3
+        assert not excel.is_initialized
+        assert list(XlsxReader(path).iter_rows("Sheet1"))[2] == (2.0, "b")
+
+    def test_from_csv_source(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test CSV sources are streamed with numbers converted."""
+        source = tmp_path / "data.csv"
+        source.write_text("code,qty\n00123,4\nabc,2.5\n", encoding="utf-8")
+        path = tmp_path / "report.xlsx"
+
+        excel.create_workbook_offline(str(path), source_path=str(source), sheet_name="Import")
+
+        assert list(XlsxReader(path).iter_rows("Import")) == [
+            ("code", "qty"),
+            ("00123", 4.0),
+            ("abc", 2.5),
+        ]
+
+    def test_open_after(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test the workbook can be opened in Excel afterwards."""
+        path = tmp_path / "report.xlsx"
+
+        result = excel.create_workbook_offline(str(path), values=[[1]], open_after=True)
+
+        assert result["opened"] is True
+        assert excel.current_document.FullName == str(path)
+        excel.cleanup()
+
+    def test_through_service_manager(self, tmp_path: Path) -> None:
+        """Test no-start calls only start Excel to open the workbook afterwards."""
+        factory = FakeApplicationFactory()
+        manager = ServiceManager(
+            {"excel": lambda: ExcelService(application_factory=factory)},
+            worker_factory=lambda prefix: STAWorker(prefix, com_apartment=False),
+        )
+
+        def create(open_after: bool) -> dict:
+            return asyncio.run(
+                manager.run(
+                    "excel",
+                    lambda excel: excel.create_workbook_offline(
+                        str(tmp_path / f"{open_after}.xlsx"), values=[[1]], open_after=open_after
+                    ),
+                    start=False,
+                )
+            )
+
+        try:
+            create(False)
+            assert factory.applications == {}
+            create(True)
+            assert manager.stats()["excel"]["state"] == "started"
+        finally:
+            asyncio.run(manager.shutdown())
+
+    def test_values_or_source(self, excel: ExcelService, tmp_path: Path) -> None:
+        """Test exactly one data source is required."""
+        with pytest.raises(COMOperationError):
+            excel.create_workbook_offline(str(tmp_path / "out.xlsx"))